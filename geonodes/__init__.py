@@ -99,6 +99,8 @@ d360   = tau
 e      = np.e
 
 
+import bpy
+
 if True:
     from .core import Boolean, Float, Integer, Vector, Rotation, Matrix, Color, String
     from .core import Texture, Collection, Object, Image, Material
@@ -112,20 +114,68 @@ if True:
 
     from .core import GeoNodes
 
-    from .core import gnmath, nd
-
     from .core.pyswitch import If, Else, Elif
 
-
 # ----------------------------------------------------------------------------------------------------
-# Shader
-
-if True:
-    from .core import snd, Shader, VolumeShader, ShaderNodes
+# Loaded at first access
+#
+# Libraries, shader nodes and sub packages are imported when used:
+# a process loading prebuilt trees doesn't pay for them
+
+from .core.lazyload import lazy_attributes
+
+LAZY = {
+    'gnmath'         : ('.core', 'gnmath'),
+    'nd'             : ('.core', 'nd'),
+    'build_parallel' : ('.core', 'build_parallel'),
+
+    # ===== Shader
+
+    'snd'            : ('.core', 'snd'),
+    'Shader'         : ('.core', 'Shader'),
+    'VolumeShader'   : ('.core', 'VolumeShader'),
+    'ShaderNodes'    : ('.core', 'ShaderNodes'),
+
+    # ===== Sub packages
+
+    'macros'         : ('.macros', None),
+    'demos'          : ('.demos', None),
+    'generation'     : ('.generation', None),
+    }
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY)
+
+# Names exported by 'from geonodes import *'
+# The lazy names are loaded by the star import, except the sub packages
+
+__all__ = [
+    'np', 'pi', 'tau', 'halfpi', 'd30', 'd45', 'd60', 'd90', 'd180', 'd270', 'd360', 'e',
+    'Boolean', 'Float', 'Integer', 'Vector', 'Rotation', 'Matrix', 'Color', 'String',
+    'Texture', 'Collection', 'Object', 'Image', 'Material',
+    'Menu',
+    'Geometry', 'Domain',
+    'Point', 'Vertex', 'Face', 'Edge', 'Corner', 'SplinePoint', 'Spline', 'CloudPoint', 'Instance', 'Layer',
+    'Mesh', 'Curve', 'Cloud', 'Instances', 'GreasePencil', 'Volume',
+    'Layout', 'Panel', 'Break', 'Tree', 'Node', 'Group', 'GroupF', 'G', 'ColorRamp',
+    'Zone', 'Repeat', 'Simulation', 'ForEachElement',
+    'GeoNodes', 'build_parallel',
+    'If', 'Else', 'Elif',
+    'gnmath', 'nd',
+    'snd', 'Shader', 'VolumeShader', 'ShaderNodes',
+    ]
 
 # ----------------------------------------------------------------------------------------------------
 # Register
+#
+# The operators and the panel arranging the nodes are useful only with a user interface
 
-if True:
+def register():
     from .core import treearrange
     treearrange.register()
+
+def unregister():
+    from .core import treearrange
+    treearrange.unregister()
+
+if not bpy.app.background:
+    register()
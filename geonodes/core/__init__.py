@@ -13,10 +13,6 @@ d360   = tau
 e      = np.e
 
 if True:
-    from .generated import nd
-    from .generated import snd
-    from .generated import gnmath
-
     from .sock_boolean import Boolean
     from .sock_float import Float
     from .sock_integer import Integer
@@ -44,7 +40,23 @@ if True:
 
     from .geonodes import GeoNodes
 
+# ----------------------------------------------------------------------------------------------------
+# Loaded at first access
+
+from .lazyload import lazy_attributes
+
+LAZY = {
+    'nd'             : ('.generated', 'nd'),
+    'snd'            : ('.generated', 'snd'),
+    'gnmath'         : ('.generated', 'gnmath'),
+
+    'build_parallel' : ('.treeparallel', 'build_parallel'),
+
     # ===== Shader
 
-    from .sock_shader import Shader, VolumeShader
-    from .shadernodes import ShaderNodes
+    'Shader'         : ('.sock_shader', 'Shader'),
+    'VolumeShader'   : ('.sock_shader', 'VolumeShader'),
+    'ShaderNodes'    : ('.shadernodes', 'ShaderNodes'),
+    }
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY)
@@ -332,6 +332,12 @@ VALID_SOCKET_TYPES = {
     'ShaderNodeTree': ['CUSTOM', 'RGBA', 'ROTATION', 'SHADER', 'STRING', 'VALUE', 'VECTOR'],
 }
 
+# =============================================================================================================================
+# Socket types which can only be linked to a socket of the same type
+# The conversions between the other types are left to Blender
+
+LINK_EXCLUSIVE = ('GEOMETRY', 'SHADER', 'OBJECT', 'COLLECTION', 'MATERIAL', 'IMAGE', 'TEXTURE')
+
 # =============================================================================================================================
 # Array type combination
 
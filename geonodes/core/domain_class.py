@@ -119,6 +119,8 @@ class Domain(GeoBase, NodeCache, PropLocker):
     # ----- Jump
 
     def _jump(self, socket, reset=True):
+        if reset:
+            self._cache_reset()
         return self._geo._jump(socket, reset=reset)
 
     @property
@@ -0,0 +1,817 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : fieldeval
+------------------
+- NumPy interpreter for the field nodes of a tree
+
+The interpreter evaluates the value of a socket on arrays of positions, indices and named attributes
+without evaluating the modifier. It is intended to check formulas and to profile them:
+
+``` python
+from geonodes.core import fieldeval
+
+with GeoNodes("Test impulsion"):
+    v = macros.impulsion(nd.position.x, from_min=0, from_max=1)
+
+    positions = np.random.uniform(-2, 2, (1_000_000, 3))
+    a = fieldeval.evaluate(v, position=positions)
+```
+
+Supported nodes are listed in <!NODES>. The operation tables <!FLOAT_OPS>, <!VECTOR_OPS>, <!INT_OPS> and
+<!BOOLEAN_OPS> use the same operation names as the functions of <!gnmath>. <!coverage> gives the
+operations used by <!gnmath> which are not implemented.
+
+The module doesn't import bpy : it only reads the nodes, sockets and links of the tree.
+
+updates
+-------
+- creation : 2025/02/12
+- update :   2025/02/17 # group inputs resolved per socket
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+from pathlib import Path
+import re
+
+import numpy as np
+
+from .scripterror import NodeError
+
+EPSILON = 1.19209290e-07 # FLT_EPSILON
+
+# Luminance coefficients used to convert a color to a float
+LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+
+# =============================================================================================================================
+# Safe functions with Blender semantics
+
+def _safe_divide(a, b):
+    b = np.asarray(b)
+    return np.where(b == 0, 0., np.divide(a, np.where(b == 0, 1, b)))
+
+def _safe_modulo(a, b):
+    b = np.asarray(b)
+    return np.where(b == 0, 0., np.fmod(a, np.where(b == 0, 1, b)))
+
+def _floored_modulo(a, b):
+    b = np.asarray(b)
+    c = np.where(b == 0, 1, b)
+    return np.where(b == 0, 0., a - np.floor(a/c)*c)
+
+def _safe_power(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    ok = (a >= 0) | (np.floor(b) == b)
+    return np.where(ok, np.power(np.where(ok, a, 1), b), 0.)
+
+def _safe_log(a, b):
+    ok = (np.asarray(a) > 0) & (np.asarray(b) > 0)
+    return np.where(ok, np.log(np.where(ok, a, 2))/np.log(np.where(ok, b, 2)), 0.)
+
+def _safe_sqrt(a):
+    a = np.asarray(a)
+    return np.where(a > 0, np.sqrt(np.abs(a)), 0.)
+
+def _safe_inverse_sqrt(a):
+    a = np.asarray(a)
+    return np.where(a > 0, 1/np.sqrt(np.where(a > 0, a, 1)), 0.)
+
+def _smooth_min(a, b, c):
+    c = np.asarray(c)
+    h = np.maximum(c - np.abs(np.subtract(a, b)), 0)/np.where(c == 0, 1, c)
+    return np.where(c == 0, np.minimum(a, b), np.minimum(a, b) - h*h*h*c/6)
+
+def _wrap(a, b, c):
+    rng = np.subtract(b, c)
+    safe = np.where(rng == 0, 1, rng)
+    return np.where(rng == 0, c, a - safe*np.floor(np.subtract(a, c)/safe))
+
+def _snap(a, b):
+    b = np.asarray(b)
+    return np.where(b == 0, 0., np.floor(_safe_divide(a, b))*b)
+
+def _pingpong(a, b):
+    b = np.asarray(b)
+    safe = np.where(b == 0, 1, b)
+    x = np.subtract(a, b)/(safe*2)
+    return np.where(b == 0, 0., np.abs((x - np.floor(x))*safe*2 - b))
+
+def _dot(a, b):
+    return np.sum(np.multiply(a, b), axis=-1)
+
+def _length(a):
+    return np.sqrt(_dot(a, a))
+
+def _normalize(a):
+    l = _length(a)[..., None]
+    return np.where(l == 0, 0., a/np.where(l == 0, 1, l))
+
+def _project(a, b):
+    bb = _dot(b, b)[..., None]
+    return np.where(bb == 0, 0., b*_dot(a, b)[..., None]/np.where(bb == 0, 1, bb))
+
+def _reflect(a, b):
+    n = _normalize(b)
+    return a - 2*_dot(n, a)[..., None]*n
+
+def _refract(a, b, ior):
+    n = _normalize(b)
+    ior = np.asarray(ior)[..., None]
+    d = _dot(n, a)[..., None]
+    k = 1 - ior*ior*(1 - d*d)
+    return np.where(k < 0, 0., ior*a - (ior*d + np.sqrt(np.abs(k)))*n)
+
+def _faceforward(a, b, c):
+    return np.where((_dot(c, b) < 0)[..., None], a, np.negative(a))
+
+def _int_divide(a, b):
+    # C like integer division : truncation toward zero
+    b = np.asarray(b)
+    c = np.where(b == 0, 1, b)
+    return np.where(b == 0, 0, np.trunc(np.divide(a, c))).astype(np.int64)
+
+def _int_op(f):
+    def op(a, b):
+        b = np.asarray(b)
+        c = np.where(b == 0, 1, b)
+        return np.where(b == 0, 0, f(np.divide(a, c))).astype(np.int64)
+    return op
+
+def _int_modulo(a, b):
+    b = np.asarray(b)
+    return np.where(b == 0, 0, np.fmod(a, np.where(b == 0, 1, b))).astype(np.int64)
+
+def _int_floored_modulo(a, b):
+    b = np.asarray(b)
+    return np.where(b == 0, 0, np.mod(a, np.where(b == 0, 1, b))).astype(np.int64)
+
+def _int_power(a, b):
+    return np.power(np.asarray(a, dtype=float), b).astype(np.int64)
+
+def _int(f):
+    return lambda *args: np.asarray(f(*args)).astype(np.int64)
+
+# =============================================================================================================================
+# Operation tables
+#
+# operation : (function, number of arguments)
+
+FLOAT_OPS = {
+    'ADD'            : (np.add, 2),
+    'SUBTRACT'       : (np.subtract, 2),
+    'MULTIPLY'       : (np.multiply, 2),
+    'DIVIDE'         : (_safe_divide, 2),
+    'MULTIPLY_ADD'   : (lambda a, b, c: a*b + c, 3),
+    'POWER'          : (_safe_power, 2),
+    'LOGARITHM'      : (_safe_log, 2),
+    'SQRT'           : (_safe_sqrt, 1),
+    'INVERSE_SQRT'   : (_safe_inverse_sqrt, 1),
+    'ABSOLUTE'       : (np.abs, 1),
+    'EXPONENT'       : (np.exp, 1),
+    'MINIMUM'        : (np.minimum, 2),
+    'MAXIMUM'        : (np.maximum, 2),
+    'LESS_THAN'      : (lambda a, b: np.less(a, b).astype(float), 2),
+    'GREATER_THAN'   : (lambda a, b: np.greater(a, b).astype(float), 2),
+    'SIGN'           : (np.sign, 1),
+    'COMPARE'        : (lambda a, b, c: (np.abs(np.subtract(a, b)) <= np.maximum(c, EPSILON)).astype(float), 3),
+    'SMOOTH_MIN'     : (_smooth_min, 3),
+    'SMOOTH_MAX'     : (lambda a, b, c: -_smooth_min(np.negative(a), np.negative(b), c), 3),
+    'ROUND'          : (lambda a: np.floor(np.add(a, .5)), 1),
+    'FLOOR'          : (np.floor, 1),
+    'CEIL'           : (np.ceil, 1),
+    'TRUNC'          : (np.trunc, 1),
+    'FRACT'          : (lambda a: a - np.floor(a), 1),
+    'MODULO'         : (_safe_modulo, 2),
+    'FLOORED_MODULO' : (_floored_modulo, 2),
+    'WRAP'           : (_wrap, 3),
+    'SNAP'           : (_snap, 2),
+    'PINGPONG'       : (_pingpong, 2),
+    'SINE'           : (np.sin, 1),
+    'COSINE'         : (np.cos, 1),
+    'TANGENT'        : (np.tan, 1),
+    'ARCSINE'        : (lambda a: np.arcsin(np.clip(a, -1, 1)), 1),
+    'ARCCOSINE'      : (lambda a: np.arccos(np.clip(a, -1, 1)), 1),
+    'ARCTANGENT'     : (np.arctan, 1),
+    'ARCTAN2'        : (np.arctan2, 2),
+    'SINH'           : (np.sinh, 1),
+    'COSH'           : (np.cosh, 1),
+    'TANH'           : (np.tanh, 1),
+    'RADIANS'        : (np.radians, 1),
+    'DEGREES'        : (np.degrees, 1),
+}
+
+# Vector Math : the arguments are Vector, Vector_001, Vector_002 and Scale
+# The operations returning a float are listed in VECTOR_FLOAT_OPS
+
+VECTOR_OPS = {
+    'ADD'           : (lambda a, b, c, s: np.add(a, b)),
+    'SUBTRACT'      : (lambda a, b, c, s: np.subtract(a, b)),
+    'MULTIPLY'      : (lambda a, b, c, s: np.multiply(a, b)),
+    'DIVIDE'        : (lambda a, b, c, s: _safe_divide(a, b)),
+    'MULTIPLY_ADD'  : (lambda a, b, c, s: a*b + c),
+    'CROSS_PRODUCT' : (lambda a, b, c, s: np.cross(a, b)),
+    'PROJECT'       : (lambda a, b, c, s: _project(a, b)),
+    'REFLECT'       : (lambda a, b, c, s: _reflect(a, b)),
+    'REFRACT'       : (lambda a, b, c, s: _refract(a, b, s)),
+    'FACEFORWARD'   : (lambda a, b, c, s: _faceforward(a, b, c)),
+    'DOT_PRODUCT'   : (lambda a, b, c, s: _dot(a, b)),
+    'DISTANCE'      : (lambda a, b, c, s: _length(np.subtract(a, b))),
+    'LENGTH'        : (lambda a, b, c, s: _length(a)),
+    'SCALE'         : (lambda a, b, c, s: a*np.asarray(s)[..., None]),
+    'NORMALIZE'     : (lambda a, b, c, s: _normalize(a)),
+    'ABSOLUTE'      : (lambda a, b, c, s: np.abs(a)),
+    'MINIMUM'       : (lambda a, b, c, s: np.minimum(a, b)),
+    'MAXIMUM'       : (lambda a, b, c, s: np.maximum(a, b)),
+    'FLOOR'         : (lambda a, b, c, s: np.floor(a)),
+    'CEIL'          : (lambda a, b, c, s: np.ceil(a)),
+    'FRACTION'      : (lambda a, b, c, s: a - np.floor(a)),
+    'MODULO'        : (lambda a, b, c, s: _safe_modulo(a, b)),
+    'WRAP'          : (lambda a, b, c, s: _wrap(a, b, c)),
+    'SNAP'          : (lambda a, b, c, s: _snap(a, b)),
+    'SINE'          : (lambda a, b, c, s: np.sin(a)),
+    'COSINE'        : (lambda a, b, c, s: np.cos(a)),
+    'TANGENT'       : (lambda a, b, c, s: np.tan(a)),
+}
+
+VECTOR_FLOAT_OPS = ('DOT_PRODUCT', 'DISTANCE', 'LENGTH')
+
+INT_OPS = {
+    'ADD'            : (_int(np.add), 2),
+    'SUBTRACT'       : (_int(np.subtract), 2),
+    'MULTIPLY'       : (_int(np.multiply), 2),
+    'DIVIDE'         : (_int_divide, 2),
+    'MULTIPLY_ADD'   : (_int(lambda a, b, c: a*b + c), 3),
+    'ABSOLUTE'       : (_int(np.abs), 1),
+    'NEGATE'         : (_int(np.negative), 1),
+    'POWER'          : (_int_power, 2),
+    'MINIMUM'        : (_int(np.minimum), 2),
+    'MAXIMUM'        : (_int(np.maximum), 2),
+    'SIGN'           : (_int(np.sign), 1),
+    'DIVIDE_ROUND'   : (_int_op(lambda x: np.floor(x + .5)), 2),
+    'DIVIDE_FLOOR'   : (_int_op(np.floor), 2),
+    'DIVIDE_CEIL'    : (_int_op(np.ceil), 2),
+    'FLOORED_MODULO' : (_int_floored_modulo, 2),
+    'MODULO'         : (_int_modulo, 2),
+    'GCD'            : (_int(np.gcd), 2),
+    'LCM'            : (_int(np.lcm), 2),
+}
+
+BOOLEAN_OPS = {
+    'AND'    : (np.logical_and, 2),
+    'OR'     : (np.logical_or, 2),
+    'NOT'    : (np.logical_not, 1),
+    'NAND'   : (lambda a, b: ~np.logical_and(a, b), 2),
+    'NOR'    : (lambda a, b: ~np.logical_or(a, b), 2),
+    'XNOR'   : (lambda a, b: ~np.logical_xor(a, b), 2),
+    'XOR'    : (np.logical_xor, 2),
+    'IMPLY'  : (lambda a, b: np.logical_or(np.logical_not(a), b), 2),
+    'NIMPLY' : (lambda a, b: np.logical_and(a, np.logical_not(b)), 2),
+}
+
+COMPARE_OPS = {
+    'LESS_THAN'     : np.less,
+    'LESS_EQUAL'    : np.less_equal,
+    'GREATER_THAN'  : np.greater,
+    'GREATER_EQUAL' : np.greater_equal,
+}
+
+def coverage():
+    """ > Operations used by gnmath which are not implemented
+
+    The source code of <!generated/gnmath.py> is scanned to get the operations
+    of the math nodes it creates.
+
+    Returns
+    -------
+    - list of (node name, operation)
+    """
+    tables = {
+        'Math'         : FLOAT_OPS,
+        'Vector Math'  : VECTOR_OPS,
+        'Integer Math' : INT_OPS,
+        'Boolean Math' : BOOLEAN_OPS,
+    }
+    source = (Path(__file__).parent / 'generated' / 'gnmath.py').read_text()
+    missing = set()
+    for name, op in re.findall(r"Node\('([^']+)'.*operation='(\w+)'", source):
+        if name in tables and op not in tables[name]:
+            missing.add((name, op))
+    return sorted(missing)
+
+# =============================================================================================================================
+# Type conversion
+
+def convert(value, from_type, to_type):
+    """ > Implicit conversion between socket types
+
+    Arguments
+    ---------
+    - value (array) : value to convert
+    - from_type (str) : socket type of the value
+    - to_type (str) : target socket type
+
+    Returns
+    -------
+    - array
+    """
+    if from_type == to_type:
+        return value
+
+    # Rotations are stored as euler vectors
+    if {from_type, to_type} == {'VECTOR', 'ROTATION'}:
+        return value
+
+    value = np.asarray(value)
+
+    # ----- To scalar
+
+    if from_type == 'VECTOR':
+        scalar = np.mean(value, axis=-1)
+    elif from_type == 'RGBA':
+        scalar = value[..., :3] @ LUMINANCE
+    else:
+        scalar = value
+
+    if to_type == 'VALUE':
+        return scalar.astype(float)
+    elif to_type == 'INT':
+        return np.trunc(scalar).astype(np.int64)
+    elif to_type == 'BOOLEAN':
+        if from_type in ('VECTOR', 'RGBA'):
+            return np.any(value[..., :3] != 0, axis=-1)
+        return scalar != 0
+
+    # ----- To vector
+
+    if from_type == 'RGBA':
+        vector = value[..., :3]
+    elif from_type == 'VECTOR':
+        vector = value
+    else:
+        vector = np.repeat(value.astype(float)[..., None], 3, axis=-1)
+
+    if to_type == 'VECTOR':
+        return vector
+    elif to_type == 'RGBA':
+        return np.concatenate((vector, np.ones(vector.shape[:-1] + (1,))), axis=-1)
+
+    raise NodeError(f"Field evaluation: impossible to convert socket type '{from_type}' to '{to_type}'")
+
+# =============================================================================================================================
+# Node evaluators
+#
+# Each evaluator returns a dict output socket name -> value
+
+def _enabled(bsockets, name, rank=0):
+    for bsocket in bsockets:
+        if bsocket.enabled and bsocket.name == name:
+            if rank == 0:
+                return bsocket
+            rank -= 1
+    raise NodeError(f"Field evaluation: no enabled socket named '{name}'")
+
+def _math(ev, bnode):
+    f, nargs = FLOAT_OPS[bnode.operation]
+    res = f(*[ev.input(bnode.inputs[i]) for i in range(nargs)])
+    if bnode.use_clamp:
+        res = np.clip(res, 0, 1)
+    return {'Value': np.asarray(res, dtype=float)}
+
+def _vector_math(ev, bnode):
+    f = VECTOR_OPS[bnode.operation]
+    res = f(*[ev.input(bsocket) for bsocket in bnode.inputs[:4]])
+    if bnode.operation in VECTOR_FLOAT_OPS:
+        return {'Value': res, 'Vector': np.zeros(3)}
+    return {'Vector': res, 'Value': np.zeros(())}
+
+def _integer_math(ev, bnode):
+    f, nargs = INT_OPS[bnode.operation]
+    return {'Value': f(*[ev.input(bnode.inputs[i]) for i in range(nargs)])}
+
+def _boolean_math(ev, bnode):
+    f, nargs = BOOLEAN_OPS[bnode.operation]
+    return {'Boolean': f(*[ev.input(bnode.inputs[i]) for i in range(nargs)])}
+
+def _compare(ev, bnode):
+    a = ev.input(_enabled(bnode.inputs, 'A'))
+    b = ev.input(_enabled(bnode.inputs, 'B'))
+    op = bnode.operation
+    data_type = bnode.data_type
+
+    if data_type == 'VECTOR':
+        mode = bnode.mode
+        if mode == 'ELEMENT':
+            pass
+        elif mode == 'LENGTH':
+            a, b = _length(a), _length(b)
+        elif mode == 'AVERAGE':
+            a, b = np.mean(a, axis=-1), np.mean(b, axis=-1)
+        elif mode == 'DOT_PRODUCT':
+            a, b = _dot(a, b), ev.input(_enabled(bnode.inputs, 'C'))
+        elif mode == 'DIRECTION':
+            cos = _safe_divide(_dot(a, b), _length(a)*_length(b))
+            a, b = np.arccos(np.clip(cos, -1, 1)), ev.input(_enabled(bnode.inputs, 'Angle'))
+        else:
+            raise NodeError(f"Field evaluation: Compare mode '{mode}' not supported")
+
+    elif data_type == 'RGBA' and op in ('BRIGHTER', 'DARKER'):
+        a, b = a[..., :3] @ LUMINANCE, b[..., :3] @ LUMINANCE
+        op = 'GREATER_THAN' if op == 'BRIGHTER' else 'LESS_THAN'
+
+    elif data_type not in ('FLOAT', 'INT', 'RGBA'):
+        raise NodeError(f"Field evaluation: Compare data type '{data_type}' not supported")
+
+    if op in COMPARE_OPS:
+        res = COMPARE_OPS[op](a, b)
+    elif op in ('EQUAL', 'NOT_EQUAL'):
+        if data_type == 'INT':
+            res = np.equal(a, b)
+        else:
+            res = np.abs(np.subtract(a, b)) <= ev.input(_enabled(bnode.inputs, 'Epsilon'))
+        if op == 'NOT_EQUAL':
+            res = ~res
+    else:
+        raise NodeError(f"Field evaluation: Compare operation '{op}' not supported")
+
+    # Element wise comparison of vectors and colors
+    if (data_type == 'VECTOR' and bnode.mode == 'ELEMENT') or (data_type == 'RGBA' and op in ('EQUAL', 'NOT_EQUAL')):
+        res = np.any(res, axis=-1) if op == 'NOT_EQUAL' else np.all(res, axis=-1)
+
+    return {'Result': res}
+
+def _map_range(ev, bnode):
+    vector = bnode.data_type == 'FLOAT_VECTOR'
+    value = ev.input(_enabled(bnode.inputs, 'Vector' if vector else 'Value'))
+    fmin  = ev.input(_enabled(bnode.inputs, 'From Min'))
+    fmax  = ev.input(_enabled(bnode.inputs, 'From Max'))
+    tmin  = ev.input(_enabled(bnode.inputs, 'To Min'))
+    tmax  = ev.input(_enabled(bnode.inputs, 'To Max'))
+
+    factor = _safe_divide(np.subtract(value, fmin), np.subtract(fmax, fmin))
+
+    interpolation = bnode.interpolation_type
+    if interpolation == 'STEPPED':
+        steps = ev.input(_enabled(bnode.inputs, 'Steps'))
+        factor = np.where(np.asarray(steps) > 0, np.floor(factor*(np.add(steps, 1)))/np.where(np.asarray(steps) > 0, steps, 1), 0.)
+    elif interpolation == 'SMOOTHSTEP':
+        t = np.clip(factor, 0, 1)
+        factor = t*t*(3 - 2*t)
+    elif interpolation == 'SMOOTHERSTEP':
+        t = np.clip(factor, 0, 1)
+        factor = t*t*t*(t*(t*6 - 15) + 10)
+
+    res = tmin + factor*np.subtract(tmax, tmin)
+    if bnode.clamp and interpolation in ('LINEAR', 'STEPPED'):
+        res = np.clip(res, np.minimum(tmin, tmax), np.maximum(tmin, tmax))
+
+    return {'Vector' if vector else 'Result': res}
+
+def _mix(ev, bnode):
+    data_type = bnode.data_type
+    if data_type not in ('FLOAT', 'VECTOR', 'RGBA'):
+        raise NodeError(f"Field evaluation: Mix data type '{data_type}' not supported")
+
+    factor = ev.input(_enabled(bnode.inputs, 'Factor'))
+    if bnode.clamp_factor:
+        factor = np.clip(factor, 0, 1)
+    a = ev.input(_enabled(bnode.inputs, 'A'))
+    b = ev.input(_enabled(bnode.inputs, 'B'))
+
+    # Non uniform factor is a vector, otherwise the factor is applied to all the components
+    if data_type == 'VECTOR' and bnode.factor_mode == 'NON_UNIFORM':
+        factor = np.asarray(factor)
+    elif data_type != 'FLOAT':
+        factor = np.asarray(factor)[..., None]
+    else:
+        factor = np.asarray(factor)
+
+    if data_type != 'RGBA':
+        return {'Result': a + factor*np.subtract(b, a)}
+
+    blend = bnode.blend_type
+    if blend == 'MIX':
+        return {'Result': a + factor*np.subtract(b, a)}
+
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    rgb_a, rgb_b = a[..., :3], b[..., :3]
+    if blend == 'ADD':
+        rgb = rgb_a + factor*rgb_b
+    elif blend == 'SUBTRACT':
+        rgb = rgb_a - factor*rgb_b
+    elif blend == 'MULTIPLY':
+        rgb = rgb_a*(1 - factor + factor*rgb_b)
+    elif blend == 'DARKEN':
+        rgb = rgb_a + factor*(np.minimum(rgb_a, rgb_b) - rgb_a)
+    elif blend == 'LIGHTEN':
+        rgb = rgb_a + factor*(np.maximum(rgb_a, rgb_b) - rgb_a)
+    elif blend == 'DIFFERENCE':
+        rgb = rgb_a + factor*(np.abs(rgb_a - rgb_b) - rgb_a)
+    else:
+        raise NodeError(f"Field evaluation: Mix blend type '{blend}' not supported")
+
+    if bnode.clamp_result:
+        rgb = np.clip(rgb, 0, 1)
+    alpha = np.broadcast_to(a[..., 3:], rgb.shape[:-1] + (1,))
+    return {'Result': np.concatenate((rgb, alpha), axis=-1)}
+
+def _switch(ev, bnode):
+    switch = ev.input(_enabled(bnode.inputs, 'Switch'))
+    false  = ev.input(_enabled(bnode.inputs, 'False'))
+    true   = ev.input(_enabled(bnode.inputs, 'True'))
+    if bnode.input_type in ('VECTOR', 'RGBA'):
+        switch = np.asarray(switch)[..., None]
+    return {'Output': np.where(switch, true, false)}
+
+def _separate_xyz(ev, bnode):
+    v = ev.input(bnode.inputs[0])
+    return {'X': v[..., 0], 'Y': v[..., 1], 'Z': v[..., 2]}
+
+def _combine_xyz(ev, bnode):
+    x, y, z = np.broadcast_arrays(*[ev.input(bsocket) for bsocket in bnode.inputs[:3]])
+    return {'Vector': np.stack((x, y, z), axis=-1).astype(float)}
+
+def _clamp(ev, bnode):
+    value, vmin, vmax = [ev.input(bsocket) for bsocket in bnode.inputs[:3]]
+    if bnode.clamp_type == 'RANGE':
+        vmin, vmax = np.minimum(vmin, vmax), np.maximum(vmin, vmax)
+    return {'Result': np.minimum(np.maximum(value, vmin), vmax)}
+
+def _float_to_int(ev, bnode):
+    f = {'ROUND': lambda a: np.floor(a + .5), 'FLOOR': np.floor, 'CEILING': np.ceil, 'TRUNCATE': np.trunc}[bnode.rounding_mode]
+    return {'Integer': f(ev.input(bnode.inputs[0])).astype(np.int64)}
+
+def _reroute(ev, bnode):
+    return {bnode.outputs[0].name: ev.input(bnode.inputs[0])}
+
+def _position(ev, bnode):
+    return {'Position': ev.position}
+
+def _index(ev, bnode):
+    return {'Index': ev.index}
+
+def _id(ev, bnode):
+    return {'ID': ev.attributes.get('id', ev.index)}
+
+def _named_attribute(ev, bnode):
+    name = ev.input(_enabled(bnode.inputs, 'Name'))
+    if name not in ev.attributes:
+        return {'Attribute': np.zeros(3 if bnode.data_type == 'FLOAT_VECTOR' else ()), 'Exists': False}
+    return {'Attribute': ev.attributes[name], 'Exists': True}
+
+def _constant(attr, name):
+    def f(ev, bnode):
+        return {name: np.array(getattr(bnode, attr))}
+    return f
+
+def _value(ev, bnode):
+    return {'Value': np.array(bnode.outputs[0].default_value)}
+
+def _rotation(name):
+    def f(ev, bnode):
+        return {name: ev.input(bnode.inputs[0])}
+    return f
+
+NODES = {
+    'ShaderNodeMath'                 : _math,
+    'ShaderNodeVectorMath'           : _vector_math,
+    'FunctionNodeIntegerMath'        : _integer_math,
+    'FunctionNodeBooleanMath'        : _boolean_math,
+    'FunctionNodeCompare'            : _compare,
+    'ShaderNodeMapRange'             : _map_range,
+    'ShaderNodeMix'                  : _mix,
+    'GeometryNodeSwitch'             : _switch,
+    'ShaderNodeSeparateXYZ'          : _separate_xyz,
+    'ShaderNodeCombineXYZ'           : _combine_xyz,
+    'ShaderNodeClamp'                : _clamp,
+    'FunctionNodeFloatToInt'         : _float_to_int,
+    'NodeReroute'                    : _reroute,
+    'FunctionNodeEulerToRotation'    : _rotation('Rotation'),
+    'FunctionNodeRotationToEuler'    : _rotation('Euler'),
+
+    'GeometryNodeInputPosition'      : _position,
+    'GeometryNodeInputIndex'         : _index,
+    'GeometryNodeInputID'            : _id,
+    'GeometryNodeInputNamedAttribute': _named_attribute,
+    'ShaderNodeValue'                : _value,
+    'FunctionNodeInputInt'           : _constant('integer', 'Integer'),
+    'FunctionNodeInputBool'          : _constant('boolean', 'Boolean'),
+    'FunctionNodeInputVector'        : _constant('vector', 'Vector'),
+}
+
+# =============================================================================================================================
+# Evaluator
+
+class FieldEvaluator:
+    def __init__(self, btree, count=None, position=None, index=None, attributes=None, inputs=None, links=None):
+        """ > Evaluate fields of a tree on arrays
+
+        The values of the input nodes are given by the arguments:
+        - <&Node Position> : position, default is zeros
+        - <&Node Index> : index, default is arange(count)
+        - <&Node Named Attribute> : attributes dict
+        - <&Node Group Input> : inputs dict, default is the interface default value
+
+        The values computed for the node outputs are cached: a node shared by several
+        formulas is evaluated only once.
+
+        Arguments
+        ---------
+        - btree (NodeTree) : the tree
+        - count (int = None) : number of points, deduced from the arrays if None
+        - position (array of vectors = None) : positions
+        - index (array of ints = None) : indices
+        - attributes (dict = None) : named attributes, any mapping can be used
+        - inputs (dict = None) : group input values
+        - links (dict = None) : links index returned by <#links_index>, built if None
+        """
+        self.btree      = btree
+        self.attributes = {} if attributes is None else attributes
+        self.inputs     = {} if inputs is None else dict(inputs)
+
+        if count is None:
+            if position is not None:
+                count = len(position)
+            elif index is not None:
+                count = len(index)
+            else:
+                count = max([len(a) for a in self.attributes.values() if np.ndim(a)], default=1)
+        self.count = count
+
+        self.position = np.zeros((count, 3)) if position is None else np.asarray(position, dtype=float)
+        self.index    = np.arange(count) if index is None else np.asarray(index)
+
+        self._links = self.links_index(btree) if links is None else links
+        self._cache = {}
+
+    @staticmethod
+    def links_index(btree):
+        """ > Links index : input socket pointer -> output socket
+
+        Arguments
+        ---------
+        - btree (NodeTree) : the tree
+
+        Returns
+        -------
+        - dict
+        """
+        links = {}
+        for link in btree.links:
+            if link.is_valid and not link.is_muted:
+                links[link.to_socket.as_pointer()] = link.from_socket
+        return links
+
+    # ----------------------------------------------------------------------------------------------------
+    # Group input default values
+
+    def group_input(self, bsocket):
+        if bsocket.name in self.inputs:
+            return np.asarray(self.inputs[bsocket.name])
+        if bsocket.identifier in self.inputs:
+            return np.asarray(self.inputs[bsocket.identifier])
+
+        for item in self.btree.interface.items_tree:
+            if item.item_type == 'SOCKET' and item.in_out == 'INPUT' and item.identifier == bsocket.identifier:
+                if item.socket_type == 'NodeSocketVector' and getattr(item, 'default_input', 'VALUE') == 'POSITION':
+                    return self.position
+                if getattr(item, 'default_input', 'VALUE') == 'INDEX':
+                    return self.index
+                if hasattr(item, 'default_value'):
+                    return np.array(item.default_value)
+        raise NodeError(f"Field evaluation: no value for group input '{bsocket.name}'")
+
+    # ----------------------------------------------------------------------------------------------------
+    # Evaluation
+
+    def input(self, bsocket):
+        """ > Value of an input socket
+
+        Arguments
+        ---------
+        - bsocket (NodeSocket) : input socket
+
+        Returns
+        -------
+        - array
+        """
+        from_socket = self._links.get(bsocket.as_pointer())
+        if from_socket is None:
+            value = bsocket.default_value
+            if isinstance(value, str):
+                return value
+            return np.array(value)
+
+        return convert(self.output(from_socket), from_socket.type, bsocket.type)
+
+    def output(self, bsocket):
+        """ > Value of an output socket
+
+        Arguments
+        ---------
+        - bsocket (NodeSocket) : output socket
+
+        Returns
+        -------
+        - array
+        """
+        bnode = bsocket.node
+
+        # Group inputs are resolved per socket: the unused inputs can have no value (Matrix, Geometry...)
+        if bnode.bl_idname == 'NodeGroupInput':
+            key = bsocket.as_pointer()
+            if key not in self._cache:
+                self._cache[key] = self.group_input(bsocket)
+            return self._cache[key]
+
+        key = bnode.as_pointer()
+        values = self._cache.get(key)
+        if values is None:
+            f = NODES.get(bnode.bl_idname)
+            if f is None:
+                raise NodeError(f"Field evaluation: node '{bnode.name}' ({bnode.bl_idname}) is not supported")
+            if bnode.mute:
+                raise NodeError(f"Field evaluation: muted node '{bnode.name}' is not supported")
+            with np.errstate(all='ignore'):
+                values = f(self, bnode)
+            self._cache[key] = values
+
+        if bsocket.name not in values:
+            raise NodeError(f"Field evaluation: output socket '{bsocket.name}' of node '{bnode.name}' is not supported")
+        return values[bsocket.name]
+
+    def evaluate(self, socket):
+        """ > Evaluate a socket
+
+        The socket can be an output socket or an input socket, for instance the
+        input of the <&Node Group Output> node.
+
+        Arguments
+        ---------
+        - socket (Socket or NodeSocket) : the socket to evaluate
+
+        Returns
+        -------
+        - array of count values
+        """
+        bsocket = getattr(socket, '_bsocket', socket)
+        if bsocket.is_output:
+            value = self.output(bsocket)
+        else:
+            value = self.input(bsocket)
+
+        value = np.asarray(value)
+        if bsocket.type in ('VECTOR', 'RGBA', 'ROTATION') and value.ndim:
+            shape = (self.count, value.shape[-1])
+        else:
+            shape = (self.count,)
+        return np.array(np.broadcast_to(value, shape))
+
+def evaluate(socket, count=None, position=None, index=None, attributes=None, inputs=None):
+    """ > Evaluate a socket with NumPy
+
+    See <!FieldEvaluator>
+
+    Arguments
+    ---------
+    - socket (Socket or NodeSocket) : the socket to evaluate
+    - count (int = None) : number of points, deduced from the arrays if None
+    - position (array of vectors = None) : positions
+    - index (array of ints = None) : indices
+    - attributes (dict = None) : named attributes
+    - inputs (dict = None) : group input values
+
+    Returns
+    -------
+    - array of count values
+    """
+    tree = getattr(socket, '_tree', None)
+    if tree is not None:
+        tree.flush_links()
+    bsocket = getattr(socket, '_bsocket', socket)
+    ev = FieldEvaluator(bsocket.id_data, count=count, position=position, index=index, attributes=attributes, inputs=inputs)
+    return ev.evaluate(bsocket)
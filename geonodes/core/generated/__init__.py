@@ -1,34 +1,40 @@
-from .rotation import Rotation
-from .boolean import Boolean
-from . import gnmath
-from .color import Color
-from .matrix import Matrix
-from .float import Float
-from .integer import Integer
-from .vector import Vector
-from .string import String
-from .point import Point
-from .edge import Edge
-from .face import Face
-from .corner import Corner
-from .spline import Spline
-from .instance import Instance
-from .layer import Layer
-from .mesh import Mesh
-from .curve import Curve
-from .cloud import Cloud
-from .instances import Instances
-from .greasepencil import GreasePencil
-from .geometry import Geometry
-from .collection import Collection
-from .vertex import Vertex
-from .splinepoint import SplinePoint
-from .volume import Volume
-from .image import Image
-from .object import Object
-from .texture import Texture
-from .cloudpoint import CloudPoint
-from .static_nd import nd
-from .shader import Shader
-from .volumeshader import VolumeShader
-from .static_snd import snd
\ No newline at end of file
+from ..lazyload import lazy_attributes
+
+LAZY = {
+    'Rotation': ('.rotation', 'Rotation'),
+    'Boolean': ('.boolean', 'Boolean'),
+    'gnmath': ('.gnmath', None),
+    'Color': ('.color', 'Color'),
+    'Matrix': ('.matrix', 'Matrix'),
+    'Float': ('.float', 'Float'),
+    'Integer': ('.integer', 'Integer'),
+    'Vector': ('.vector', 'Vector'),
+    'String': ('.string', 'String'),
+    'Point': ('.point', 'Point'),
+    'Edge': ('.edge', 'Edge'),
+    'Face': ('.face', 'Face'),
+    'Corner': ('.corner', 'Corner'),
+    'Spline': ('.spline', 'Spline'),
+    'Instance': ('.instance', 'Instance'),
+    'Layer': ('.layer', 'Layer'),
+    'Mesh': ('.mesh', 'Mesh'),
+    'Curve': ('.curve', 'Curve'),
+    'Cloud': ('.cloud', 'Cloud'),
+    'Instances': ('.instances', 'Instances'),
+    'GreasePencil': ('.greasepencil', 'GreasePencil'),
+    'Geometry': ('.geometry', 'Geometry'),
+    'Collection': ('.collection', 'Collection'),
+    'Vertex': ('.vertex', 'Vertex'),
+    'SplinePoint': ('.splinepoint', 'SplinePoint'),
+    'Volume': ('.volume', 'Volume'),
+    'Image': ('.image', 'Image'),
+    'Object': ('.object', 'Object'),
+    'Texture': ('.texture', 'Texture'),
+    'CloudPoint': ('.cloudpoint', 'CloudPoint'),
+    'nd': ('.static_nd', 'nd'),
+    'Shader': ('.shader', 'Shader'),
+    'VolumeShader': ('.volumeshader', 'VolumeShader'),
+    'snd': ('.static_snd', 'snd'),
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY)
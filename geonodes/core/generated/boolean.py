@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Boolean(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'band': r'''
     def band(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -25,7 +29,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='AND')
         return node._out
-
+''',
+'bor': r'''
     def bor(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -44,7 +49,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='OR')
         return node._out
-
+''',
+'bnot': r'''
     def bnot(self):
         """ > Node <&Node Boolean Math>
 
@@ -59,7 +65,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self}, operation='NOT')
         return node._out
-
+''',
+'not_and': r'''
     def not_and(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -78,7 +85,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='NAND')
         return node._out
-
+''',
+'nor': r'''
     def nor(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -97,7 +105,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='NOR')
         return node._out
-
+''',
+'xnor': r'''
     def xnor(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -116,7 +125,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='XNOR')
         return node._out
-
+''',
+'xor': r'''
     def xor(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -135,7 +145,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='XOR')
         return node._out
-
+''',
+'imply': r'''
     def imply(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -154,7 +165,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='IMPLY')
         return node._out
-
+''',
+'nimply': r'''
     def nimply(self, boolean=None):
         """ > Node <&Node Boolean Math>
 
@@ -173,7 +185,8 @@ class Boolean(Socket):
         """
         node = Node('Boolean Math', sockets={'Boolean': self, 'Boolean_001': boolean}, operation='NIMPLY')
         return node._out
-
+''',
+'Random': r'''
     @classmethod
     def Random(cls, probability=None, id=None, seed=None):
         """ > Node <&Node Random Value>
@@ -194,7 +207,8 @@ class Boolean(Socket):
         """
         node = Node('Random Value', sockets={'Probability': probability, 'ID': id, 'Seed': seed}, data_type='BOOLEAN')
         return cls(node._out)
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -213,7 +227,8 @@ class Boolean(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='BOOLEAN')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -232,7 +247,8 @@ class Boolean(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='BOOLEAN')
         return cls(node._out)
-
+''',
+'is_viewport': r'''
     @classmethod
     @property
     def is_viewport(cls):
@@ -244,7 +260,8 @@ class Boolean(Socket):
         """
         node = Node('Is Viewport', sockets={})
         return node._out
-
+''',
+'sample_grid': r'''
     def sample_grid(self, position=None, interpolation_mode='TRILINEAR'):
         """ > Node <&Node Sample Grid>
 
@@ -265,7 +282,8 @@ class Boolean(Socket):
         utils.check_enum_arg('Sample Grid', 'interpolation_mode', interpolation_mode, 'sample_grid', ('NEAREST', 'TRILINEAR', 'TRIQUADRATIC'))
         node = Node('Sample Grid', sockets={'Grid': self, 'Position': position}, data_type='BOOLEAN', interpolation_mode=interpolation_mode)
         return node._out
-
+''',
+'sample_grid_index': r'''
     def sample_grid_index(self, x=None, y=None, z=None):
         """ > Node <&Node Sample Grid Index>
 
@@ -286,7 +304,8 @@ class Boolean(Socket):
         """
         node = Node('Sample Grid Index', sockets={'Grid': self, 'X': x, 'Y': y, 'Z': z}, data_type='BOOLEAN')
         return node._out
-
+''',
+'uv_unwrap': r'''
     def uv_unwrap(self, seam=None, margin=None, fill_holes=None, method='ANGLE_BASED'):
         """ > Node <&Node UV Unwrap>
 
@@ -308,7 +327,8 @@ class Boolean(Socket):
         utils.check_enum_arg('UV Unwrap', 'method', method, 'uv_unwrap', ('ANGLE_BASED', 'CONFORMAL'))
         node = Node('UV Unwrap', sockets={'Selection': self, 'Seam': seam, 'Margin': margin, 'Fill Holes': fill_holes}, method=method)
         return node._out
-
+''',
+'error': r'''
     def error(self, message=None):
         """ > Node <&Node Warning>
 
@@ -327,7 +347,8 @@ class Boolean(Socket):
         """
         node = Node('Warning', sockets={'Show': self, 'Message': message}, warning_type='ERROR')
         return node._out
-
+''',
+'warning': r'''
     def warning(self, message=None):
         """ > Node <&Node Warning>
 
@@ -346,7 +367,8 @@ class Boolean(Socket):
         """
         node = Node('Warning', sockets={'Show': self, 'Message': message}, warning_type='WARNING')
         return node._out
-
+''',
+'info': r'''
     def info(self, message=None):
         """ > Node <&Node Warning>
 
@@ -365,4 +387,7 @@ class Boolean(Socket):
         """
         node = Node('Warning', sockets={'Show': self, 'Message': message}, warning_type='INFO')
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Boolean)
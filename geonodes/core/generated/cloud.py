@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Cloud(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'domain_size': r'''
     def domain_size(self):
         """ > Node <&Node Domain Size>
 
@@ -21,7 +25,8 @@ class Cloud(Socket):
         """
         node = self._cache('Domain Size', sockets={'Geometry': self}, component='POINTCLOUD')
         return node
-
+''',
+'DistributeingridDensityRandom': r'''
     @classmethod
     def DistributeingridDensityRandom(cls, grid=None, density=None, seed=None):
         """ > Node <&Node Distribute Points in Grid>
@@ -42,7 +47,8 @@ class Cloud(Socket):
         """
         node = Node('Distribute Points in Grid', sockets={'Grid': grid, 'Density': density, 'Seed': seed}, mode='DENSITY_RANDOM')
         return cls(node._out)
-
+''',
+'DistributeingridDensityGrid': r'''
     @classmethod
     def DistributeingridDensityGrid(cls, grid=None, spacing=None, threshold=None):
         """ > Node <&Node Distribute Points in Grid>
@@ -63,7 +69,8 @@ class Cloud(Socket):
         """
         node = Node('Distribute Points in Grid', sockets={'Grid': grid, 'Spacing': spacing, 'Threshold': threshold}, mode='DENSITY_GRID')
         return cls(node._out)
-
+''',
+'DistributeInGrid': r'''
     @classmethod
     def DistributeInGrid(cls, grid=None, density=None, seed=None, mode='DENSITY_RANDOM'):
         """ > Node <&Node Distribute Points in Grid>
@@ -82,7 +89,8 @@ class Cloud(Socket):
         utils.check_enum_arg('Distribute Points in Grid', 'mode', mode, 'DistributeInGrid', ('DENSITY_RANDOM', 'DENSITY_GRID'))
         node = Node('Distribute Points in Grid', sockets={'Grid': grid, 'Density': density, 'Seed': seed}, mode=mode)
         return cls(node._out)
-
+''',
+'instance_on': r'''
     def instance_on(self, instance=None, pick_instance=None, instance_index=None, rotation=None, scale=None):
         """ > Node <&Node Instance on Points>
 
@@ -105,7 +113,8 @@ class Cloud(Socket):
         """
         node = Node('Instance on Points', sockets={'Points': self, 'Selection': self._sel, 'Instance': instance, 'Pick Instance': pick_instance, 'Instance Index': instance_index, 'Rotation': rotation, 'Scale': scale})
         return node._out
-
+''',
+'interpolate_curves': r'''
     def interpolate_curves(self, guide_curves=None, guide_up=None, guide_group_id=None, point_up=None, point_group_id=None, max_neighbors=None):
         """ > Node <&Node Interpolate Curves>
 
@@ -128,7 +137,8 @@ class Cloud(Socket):
         """
         node = Node('Interpolate Curves', sockets={'Guide Curves': guide_curves, 'Guide Up': guide_up, 'Guide Group ID': guide_group_id, 'Points': self, 'Point Up': point_up, 'Point Group ID': point_group_id, 'Max Neighbors': max_neighbors})
         return node._out
-
+''',
+'Points': r'''
     @classmethod
     def Points(cls, count=None, position=None, radius=None):
         """ > Node <&Node Points>
@@ -145,7 +155,8 @@ class Cloud(Socket):
         """
         node = Node('Points', sockets={'Count': count, 'Position': position, 'Radius': radius})
         return cls(node._out)
-
+''',
+'to_curves': r'''
     def to_curves(self, curve_group_id=None, weight=None):
         """ > Node <&Node Points to Curves>
 
@@ -164,7 +175,8 @@ class Cloud(Socket):
         """
         node = Node('Points to Curves', sockets={'Points': self, 'Curve Group ID': curve_group_id, 'Weight': weight})
         return node._out
-
+''',
+'to_sdf_grid': r'''
     def to_sdf_grid(self, radius=None, voxel_size=None):
         """ > Node <&Node Points to SDF Grid>
 
@@ -183,7 +195,8 @@ class Cloud(Socket):
         """
         node = Node('Points to SDF Grid', sockets={'Points': self, 'Radius': radius, 'Voxel Size': voxel_size})
         return node._out
-
+''',
+'to_vertices': r'''
     def to_vertices(self):
         """ > Node <&Node Points to Vertices>
 
@@ -198,7 +211,8 @@ class Cloud(Socket):
         """
         node = Node('Points to Vertices', sockets={'Points': self, 'Selection': self._sel})
         return node._out
-
+''',
+'to_volume': r'''
     def to_volume(self, density=None, voxel_amount=None, radius=None, resolution_mode='VOXEL_AMOUNT'):
         """ > Node <&Node Points to Volume>
 
@@ -220,7 +234,8 @@ class Cloud(Socket):
         utils.check_enum_arg('Points to Volume', 'resolution_mode', resolution_mode, 'to_volume', ('VOXEL_AMOUNT', 'VOXEL_SIZE'))
         node = Node('Points to Volume', sockets={'Points': self, 'Density': density, 'Voxel Amount': voxel_amount, 'Radius': radius}, resolution_mode=resolution_mode)
         return node._out
-
+''',
+'radius': r'''
     @property
     def radius(self):
         """ Property get node <Node Set Point Radius>
@@ -249,4 +264,7 @@ class Cloud(Socket):
         node = Node('Set Point Radius', sockets={'Points': self, 'Selection': self._sel, 'Radius': radius})
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(Cloud)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class CloudPoint(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'radius': r'''
     @property
     def radius(self):
         """ Property get node <Node Set Point Radius>
@@ -35,4 +39,7 @@ class CloudPoint(Socket):
         node = Node('Set Point Radius', sockets={'Points': self, 'Selection': self._sel, 'Radius': radius})
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(CloudPoint)
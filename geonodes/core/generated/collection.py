@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Collection(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'info': r'''
     def info(self, separate_children=None, reset_children=None, transform_space='ORIGINAL'):
         """ > Node <&Node Collection Info>
 
@@ -27,4 +31,7 @@ class Collection(Socket):
         utils.check_enum_arg('Collection Info', 'transform_space', transform_space, 'info', ('ORIGINAL', 'RELATIVE'))
         node = self._cache('Collection Info', sockets={'Collection': self, 'Separate Children': separate_children, 'Reset Children': reset_children}, transform_space=transform_space)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Collection)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Color(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'CombineRGB': r'''
     @classmethod
     def CombineRGB(cls, red=None, green=None, blue=None, alpha=None):
         """ > Node <&Node Combine Color>
@@ -28,7 +32,8 @@ class Color(Socket):
         """
         node = Node('Combine Color', sockets={'Red': red, 'Green': green, 'Blue': blue, 'Alpha': alpha}, mode='RGB')
         return cls(node._out)
-
+''',
+'CombineHSV': r'''
     @classmethod
     def CombineHSV(cls, hue=None, saturation=None, value=None, alpha=None):
         """ > Node <&Node Combine Color>
@@ -50,7 +55,8 @@ class Color(Socket):
         """
         node = Node('Combine Color', sockets={'Red': hue, 'Green': saturation, 'Blue': value, 'Alpha': alpha}, mode='HSV')
         return cls(node._out)
-
+''',
+'CombineHSL': r'''
     @classmethod
     def CombineHSL(cls, hue=None, saturation=None, lightness=None, alpha=None):
         """ > Node <&Node Combine Color>
@@ -72,7 +78,8 @@ class Color(Socket):
         """
         node = Node('Combine Color', sockets={'Red': hue, 'Green': saturation, 'Blue': lightness, 'Alpha': alpha}, mode='HSL')
         return cls(node._out)
-
+''',
+'Combine': r'''
     @classmethod
     def Combine(cls, red=None, green=None, blue=None, alpha=None, mode='RGB'):
         """ > Node <&Node Combine Color>
@@ -92,7 +99,8 @@ class Color(Socket):
         utils.check_enum_arg('Combine Color', 'mode', mode, 'Combine', ('RGB', 'HSV', 'HSL'))
         node = Node('Combine Color', sockets={'Red': red, 'Green': green, 'Blue': blue, 'Alpha': alpha}, mode=mode)
         return cls(node._out)
-
+''',
+'equal': r'''
     def equal(self, b=None, epsilon=None):
         """ > Node <&Node Compare>
 
@@ -114,7 +122,8 @@ class Color(Socket):
         """
         node = Node('Compare', sockets={'A_COL': self, 'B_COL': b, 'Epsilon': epsilon}, data_type='RGBA', mode='ELEMENT', operation='EQUAL')
         return node._out
-
+''',
+'not_equal': r'''
     def not_equal(self, b=None, epsilon=None):
         """ > Node <&Node Compare>
 
@@ -136,7 +145,8 @@ class Color(Socket):
         """
         node = Node('Compare', sockets={'A_COL': self, 'B_COL': b, 'Epsilon': epsilon}, data_type='RGBA', mode='ELEMENT', operation='NOT_EQUAL')
         return node._out
-
+''',
+'brighter': r'''
     def brighter(self, b=None):
         """ > Node <&Node Compare>
 
@@ -157,7 +167,8 @@ class Color(Socket):
         """
         node = Node('Compare', sockets={'A_COL': self, 'B_COL': b}, data_type='RGBA', mode='ELEMENT', operation='BRIGHTER')
         return node._out
-
+''',
+'darker': r'''
     def darker(self, b=None):
         """ > Node <&Node Compare>
 
@@ -178,7 +189,8 @@ class Color(Socket):
         """
         node = Node('Compare', sockets={'A_COL': self, 'B_COL': b}, data_type='RGBA', mode='ELEMENT', operation='DARKER')
         return node._out
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -197,7 +209,8 @@ class Color(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='RGBA')
         return node._out
-
+''',
+'separate_RGB': r'''
     def separate_RGB(self):
         """ > Node <&Node Separate Color>
 
@@ -212,7 +225,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return node._out
-
+''',
+'separate_HSV': r'''
     def separate_HSV(self):
         """ > Node <&Node Separate Color>
 
@@ -227,7 +241,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSV')
         return node._out
-
+''',
+'separate_HSL': r'''
     def separate_HSL(self):
         """ > Node <&Node Separate Color>
 
@@ -242,7 +257,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSL')
         return node._out
-
+''',
+'separate': r'''
     def separate(self, mode='RGB'):
         """ > Node <&Node Separate Color>
 
@@ -261,7 +277,8 @@ class Color(Socket):
         utils.check_enum_arg('Separate Color', 'mode', mode, 'separate', ('RGB', 'HSV', 'HSL'))
         node = self._cache('Separate Color', sockets={'Color': self}, mode=mode)
         return node._out
-
+''',
+'rgb': r'''
     @property
     def rgb(self):
         """ > Node <&Node Separate Color>
@@ -277,7 +294,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return (node.red, node.green, node.blue, node.alpha)
-
+''',
+'hsv': r'''
     @property
     def hsv(self):
         """ > Node <&Node Separate Color>
@@ -293,7 +311,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSL')
         return (node.hue, node.saturation, node.lightness, node.alpha)
-
+''',
+'separate_color': r'''
     def separate_color(self):
         """ > Node <&Node Separate Color>
 
@@ -308,7 +327,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return node
-
+''',
+'hue': r'''
     @property
     def hue(self):
         """ > Node <&Node Separate Color>
@@ -324,7 +344,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSV')
         return node.hue
-
+''',
+'saturation': r'''
     @property
     def saturation(self):
         """ > Node <&Node Separate Color>
@@ -340,7 +361,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSV')
         return node.saturation
-
+''',
+'lightness': r'''
     @property
     def lightness(self):
         """ > Node <&Node Separate Color>
@@ -356,7 +378,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSL')
         return node.lightness
-
+''',
+'alpha': r'''
     @property
     def alpha(self):
         """ > Node <&Node Separate Color>
@@ -372,7 +395,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return node.alpha
-
+''',
+'value': r'''
     @property
     def value(self):
         """ > Node <&Node Separate Color>
@@ -388,7 +412,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='HSV')
         return node.value
-
+''',
+'red': r'''
     @property
     def red(self):
         """ > Node <&Node Separate Color>
@@ -404,7 +429,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return node.red
-
+''',
+'green': r'''
     @property
     def green(self):
         """ > Node <&Node Separate Color>
@@ -420,7 +446,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return node.green
-
+''',
+'blue': r'''
     @property
     def blue(self):
         """ > Node <&Node Separate Color>
@@ -436,7 +463,8 @@ class Color(Socket):
         """
         node = self._cache('Separate Color', sockets={'Color': self}, mode='RGB')
         return node.blue
-
+''',
+'blur': r'''
     def blur(self, iterations=None, weight=None):
         """ > Node <&Node Blur Attribute>
 
@@ -456,7 +484,8 @@ class Color(Socket):
         """
         node = Node('Blur Attribute', sockets={'Value': self, 'Iterations': iterations, 'Weight': weight}, data_type='FLOAT_COLOR')
         return node._out
-
+''',
+'ImageTexture': r'''
     @classmethod
     def ImageTexture(cls, image=None, vector=None, frame=None, extension='REPEAT', interpolation='Linear'):
         """ > Node <&Node Image Texture>
@@ -477,7 +506,8 @@ class Color(Socket):
         utils.check_enum_arg('Image Texture', 'interpolation', interpolation, 'ImageTexture', ('Linear', 'Closest', 'Cubic'))
         node = Node('Image Texture', sockets={'Image': image, 'Vector': vector, 'Frame': frame}, extension=extension, interpolation=interpolation)
         return cls(node._out)
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -496,7 +526,8 @@ class Color(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT_COLOR')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -515,7 +546,8 @@ class Color(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT_COLOR')
         return cls(node._out)
-
+''',
+'Blackbody': r'''
     @classmethod
     def Blackbody(cls, temperature=None):
         """ > Node <&Node Blackbody>
@@ -530,7 +562,8 @@ class Color(Socket):
         """
         node = Node('Blackbody', sockets={'Temperature': temperature})
         return cls(node._out)
-
+''',
+'mix_mix': r'''
     def mix_mix(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -554,7 +587,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='MIX', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_darken': r'''
     def mix_darken(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -578,7 +612,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='DARKEN', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_multiply': r'''
     def mix_multiply(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -602,7 +637,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='MULTIPLY', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_burn': r'''
     def mix_burn(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -626,7 +662,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='BURN', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_lighten': r'''
     def mix_lighten(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -650,7 +687,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='LIGHTEN', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_screen': r'''
     def mix_screen(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -674,7 +712,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='SCREEN', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_dodge': r'''
     def mix_dodge(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -698,7 +737,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='DODGE', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_add': r'''
     def mix_add(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -722,7 +762,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='ADD', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_overlay': r'''
     def mix_overlay(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -746,7 +787,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='OVERLAY', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_soft_light': r'''
     def mix_soft_light(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -770,7 +812,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='SOFT_LIGHT', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_linear_light': r'''
     def mix_linear_light(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -794,7 +837,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='LINEAR_LIGHT', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_difference': r'''
     def mix_difference(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -818,7 +862,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='DIFFERENCE', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_exclusion': r'''
     def mix_exclusion(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -842,7 +887,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='EXCLUSION', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_subtract': r'''
     def mix_subtract(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -866,7 +912,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='SUBTRACT', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_divide': r'''
     def mix_divide(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -890,7 +937,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='DIVIDE', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_hue': r'''
     def mix_hue(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -914,7 +962,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='HUE', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_saturation': r'''
     def mix_saturation(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -938,7 +987,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='SATURATION', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_color': r'''
     def mix_color(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -962,7 +1012,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='COLOR', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_value': r'''
     def mix_value(self, b=None, factor=None, clamp_factor=True, clamp_result=False):
         """ > Node <&Node Mix>
 
@@ -986,7 +1037,8 @@ class Color(Socket):
         """
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='VALUE', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix': r'''
     def mix(self, b=None, factor=None, clamp_factor=True, clamp_result=False, factor_mode='UNIFORM'):
         """ > Node <&Node Mix>
 
@@ -1011,7 +1063,8 @@ class Color(Socket):
         utils.check_enum_arg('Mix', 'factor_mode', factor_mode, 'mix', ('UNIFORM', 'NON_UNIFORM'))
         node = Node('Mix', sockets={'A_Color': self, 'B_Color': b, 'Factor_Float': factor}, blend_type='MIX', clamp_factor=clamp_factor, clamp_result=clamp_result, data_type='RGBA', factor_mode=factor_mode)
         return node._out
-
+''',
+'Brick': r'''
     @classmethod
     def Brick(cls, vector=None, color1=None, color2=None, mortar=None, scale=None, mortar_size=None, mortar_smooth=None, bias=None, brick_width=None, row_height=None, offset=0.5, offset_frequency=2, squash=1.0, squash_frequency=2):
         """ > Node <&Node Brick Texture>
@@ -1039,7 +1092,8 @@ class Color(Socket):
         """
         node = Node('Brick Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Mortar': mortar, 'Scale': scale, 'Mortar Size': mortar_size, 'Mortar Smooth': mortar_smooth, 'Bias': bias, 'Brick Width': brick_width, 'Row Height': row_height}, offset=offset, offset_frequency=offset_frequency, squash=squash, squash_frequency=squash_frequency)
         return cls(node._out)
-
+''',
+'Checker': r'''
     @classmethod
     def Checker(cls, vector=None, color1=None, color2=None, scale=None):
         """ > Node <&Node Checker Texture>
@@ -1057,7 +1111,8 @@ class Color(Socket):
         """
         node = Node('Checker Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Scale': scale})
         return cls(node._out)
-
+''',
+'Gradient': r'''
     @classmethod
     def Gradient(cls, vector=None, gradient_type='LINEAR'):
         """ > Node <&Node Gradient Texture>
@@ -1074,7 +1129,8 @@ class Color(Socket):
         utils.check_enum_arg('Gradient Texture', 'gradient_type', gradient_type, 'Gradient', ('LINEAR', 'QUADRATIC', 'EASING', 'DIAGONAL', 'SPHERICAL', 'QUADRATIC_SPHERE', 'RADIAL'))
         node = Node('Gradient Texture', sockets={'Vector': vector}, gradient_type=gradient_type)
         return cls(node._out)
-
+''',
+'Magic': r'''
     @classmethod
     def Magic(cls, vector=None, scale=None, distortion=None, turbulence_depth=2):
         """ > Node <&Node Magic Texture>
@@ -1092,7 +1148,8 @@ class Color(Socket):
         """
         node = Node('Magic Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion}, turbulence_depth=turbulence_depth)
         return cls(node._out)
-
+''',
+'Wave': r'''
     @classmethod
     def Wave(cls, vector=None, scale=None, distortion=None, detail=None, detail_scale=None, detail_roughness=None, phase_offset=None, bands_direction='X', rings_direction='X', wave_profile='SIN', wave_type='BANDS'):
         """ > Node <&Node Wave Texture>
@@ -1121,7 +1178,8 @@ class Color(Socket):
         utils.check_enum_arg('Wave Texture', 'wave_type', wave_type, 'Wave', ('BANDS', 'RINGS'))
         node = Node('Wave Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion, 'Detail': detail, 'Detail Scale': detail_scale, 'Detail Roughness': detail_roughness, 'Phase Offset': phase_offset}, bands_direction=bands_direction, rings_direction=rings_direction, wave_profile=wave_profile, wave_type=wave_type)
         return cls(node._out)
-
+''',
+'ambient_occlusion': r'''
     def ambient_occlusion(self, distance=None, normal=None, inside=False, only_local=False, samples=16):
         """ > Node <&ShaderNode Ambient Occlusion>
 
@@ -1143,7 +1201,8 @@ class Color(Socket):
         """
         node = Node('Ambient Occlusion', sockets={'Color': self, 'Distance': distance, 'Normal': normal}, inside=inside, only_local=only_local, samples=samples)
         return node._out
-
+''',
+'background': r'''
     def background(self, strength=None):
         """ > Node <&ShaderNode Background>
 
@@ -1161,7 +1220,8 @@ class Color(Socket):
         """
         node = Node('Background', sockets={'Color': self, 'Strength': strength})
         return node._out
-
+''',
+'brightness_contrast': r'''
     def brightness_contrast(self, bright=None, contrast=None):
         """ > Node <&ShaderNode Brightness/Contrast>
 
@@ -1180,7 +1240,8 @@ class Color(Socket):
         """
         node = Node('Brightness/Contrast', sockets={'Color': self, 'Bright': bright, 'Contrast': contrast})
         return node._out
-
+''',
+'gamma': r'''
     def gamma(self, gamma=None):
         """ > Node <&ShaderNode Gamma>
 
@@ -1198,7 +1259,8 @@ class Color(Socket):
         """
         node = Node('Gamma', sockets={'Color': self, 'Gamma': gamma})
         return node._out
-
+''',
+'hue_saturation_value': r'''
     def hue_saturation_value(self, hue=None, saturation=None, value=None, fac=None):
         """ > Node <&ShaderNode Hue/Saturation/Value>
 
@@ -1219,7 +1281,8 @@ class Color(Socket):
         """
         node = Node('Hue/Saturation/Value', sockets={'Hue': hue, 'Saturation': saturation, 'Value': value, 'Color': self, 'Fac': fac})
         return node._out
-
+''',
+'invert_color': r'''
     def invert_color(self, fac=None):
         """ > Node <&ShaderNode Invert Color>
 
@@ -1237,7 +1300,8 @@ class Color(Socket):
         """
         node = Node('Invert Color', sockets={'Color': self, 'Fac': fac})
         return node._out
-
+''',
+'aov_output': r'''
     def aov_output(self, value=None, aov_name=''):
         """ > Node <&ShaderNode AOV Output>
 
@@ -1256,7 +1320,8 @@ class Color(Socket):
         """
         node = Node('AOV Output', sockets={'Color': self, 'Value': value}, aov_name=aov_name)
         return node._out
-
+''',
+'line_style_output': r'''
     def line_style_output(self, color_fac=None, alpha=None, alpha_fac=None, blend_type='MIX', is_active_output=True, target='ALL', use_alpha=False, use_clamp=False):
         """ > Node <&ShaderNode Line Style Output>
 
@@ -1283,7 +1348,8 @@ class Color(Socket):
         utils.check_enum_arg('Line Style Output', 'target', target, 'line_style_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('Line Style Output', sockets={'Color': self, 'Color Fac': color_fac, 'Alpha': alpha, 'Alpha Fac': alpha_fac}, blend_type=blend_type, is_active_output=is_active_output, target=target, use_alpha=use_alpha, use_clamp=use_clamp)
         return node._out
-
+''',
+'RGB': r'''
     @classmethod
     def RGB(cls):
         """ > Node <&ShaderNode RGB>
@@ -1294,7 +1360,8 @@ class Color(Socket):
         """
         node = Node('RGB', sockets={})
         return cls(node._out)
-
+''',
+'rgb_to_bw': r'''
     def rgb_to_bw(self):
         """ > Node <&ShaderNode RGB to BW>
 
@@ -1308,7 +1375,8 @@ class Color(Socket):
         """
         node = Node('RGB to BW', sockets={'Color': self})
         return node._out
-
+''',
+'separate_col_RGB': r'''
     def separate_col_RGB(self):
         """ > Node <&ShaderNode Separate Color>
 
@@ -1323,7 +1391,8 @@ class Color(Socket):
         """
         node = Node('Separate Color', sockets={'Color': self}, mode='RGB')
         return node._out
-
+''',
+'separate_col_HSV': r'''
     def separate_col_HSV(self):
         """ > Node <&ShaderNode Separate Color>
 
@@ -1338,7 +1407,8 @@ class Color(Socket):
         """
         node = Node('Separate Color', sockets={'Color': self}, mode='HSV')
         return node._out
-
+''',
+'separate_col_HSL': r'''
     def separate_col_HSL(self):
         """ > Node <&ShaderNode Separate Color>
 
@@ -1353,7 +1423,8 @@ class Color(Socket):
         """
         node = Node('Separate Color', sockets={'Color': self}, mode='HSL')
         return node._out
-
+''',
+'separate_col': r'''
     def separate_col(self, mode='RGB'):
         """ > Node <&ShaderNode Separate Color>
 
@@ -1372,7 +1443,8 @@ class Color(Socket):
         utils.check_enum_arg('Separate Color', 'mode', mode, 'separate_col', ('RGB', 'HSV', 'HSL'))
         node = Node('Separate Color', sockets={'Color': self}, mode=mode)
         return node._out
-
+''',
+'SkyTexture': r'''
     @classmethod
     def SkyTexture(cls, air_density=1.0, altitude=0.0, dust_density=1.0, ground_albedo=0.30000001192092896, ozone_density=1.0, sky_type='NISHITA', sun_disc=True, sun_elevation=0.2617993950843811, sun_intensity=1.0, sun_rotation=0.0, sun_size=0.009512044489383698, turbidity=2.200000047683716):
         """ > Node <&ShaderNode Sky Texture>
@@ -1399,7 +1471,8 @@ class Color(Socket):
         utils.check_enum_arg('Sky Texture', 'sky_type', sky_type, 'SkyTexture', ('PREETHAM', 'HOSEK_WILKIE', 'NISHITA'))
         node = Node('Sky Texture', sockets={}, air_density=air_density, altitude=altitude, dust_density=dust_density, ground_albedo=ground_albedo, ozone_density=ozone_density, sky_type=sky_type, sun_disc=sun_disc, sun_elevation=sun_elevation, sun_intensity=sun_intensity, sun_rotation=sun_rotation, sun_size=sun_size, turbidity=turbidity)
         return cls(node._out)
-
+''',
+'vector_displacement': r'''
     def vector_displacement(self, midlevel=None, scale=None, space='TANGENT'):
         """ > Node <&ShaderNode Vector Displacement>
 
@@ -1420,7 +1493,8 @@ class Color(Socket):
         utils.check_enum_arg('Vector Displacement', 'space', space, 'vector_displacement', ('TANGENT', 'OBJECT', 'WORLD'))
         node = Node('Vector Displacement', sockets={'Vector': self, 'Midlevel': midlevel, 'Scale': scale}, space=space)
         return node._out
-
+''',
+'ColorAttribute': r'''
     @classmethod
     def ColorAttribute(cls, layer_name=''):
         """ > Node <&ShaderNode Color Attribute>
@@ -1435,4 +1509,7 @@ class Color(Socket):
         """
         node = Node('Color Attribute', sockets={}, layer_name=layer_name)
         return cls(node._out)
+''',
+}
 
+MethodTable(METHODS, globals()).install(Color)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Corner(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'accumulate_field': r'''
     @classmethod
     def accumulate_field(cls, value=None, group_id=None):
         """ > Node <&Node Accumulate Field>
@@ -28,7 +32,8 @@ class Corner(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'MATRIX': 'TRANSFORM'}, 'Corner.accumulate_field', 'value')
         node = Node('Accumulate Field', sockets={'Value': value, 'Group Index': group_id}, data_type=data_type, domain='CORNER')
         return node._out
-
+''',
+'attribute_statistic': r'''
     def attribute_statistic(self, attribute=None):
         """ > Node <&Node Attribute Statistic>
 
@@ -48,9 +53,10 @@ class Corner(Socket):
         - node [mean (Float), median (Float), sum (Float), min (Float), max (Float), range (Float), standard_deviation (Float), variance (Float)]
         """
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Corner.attribute_statistic', 'attribute')
-        node = Node('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='CORNER')
+        node = self._cache('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='CORNER')
         return node
-
+''',
+'edges': r'''
     @classmethod
     def edges(cls, corner_index=None):
         """ > Node <&Node Edges of Corner>
@@ -65,7 +71,8 @@ class Corner(Socket):
         """
         node = Node('Edges of Corner', sockets={'Corner Index': corner_index})
         return node
-
+''',
+'next_edge_index': r'''
     @classmethod
     def next_edge_index(cls, corner_index=None):
         """ > Node <&Node Edges of Corner>
@@ -80,7 +87,8 @@ class Corner(Socket):
         """
         node = Node('Edges of Corner', sockets={'Corner Index': corner_index})
         return node.next_edge_index
-
+''',
+'previous_edge_index': r'''
     @classmethod
     def previous_edge_index(cls, corner_index=None):
         """ > Node <&Node Edges of Corner>
@@ -95,7 +103,8 @@ class Corner(Socket):
         """
         node = Node('Edges of Corner', sockets={'Corner Index': corner_index})
         return node.previous_edge_index
-
+''',
+'face': r'''
     @classmethod
     def face(cls, corner_index=None):
         """ > Node <&Node Face of Corner>
@@ -110,7 +119,8 @@ class Corner(Socket):
         """
         node = Node('Face of Corner', sockets={'Corner Index': corner_index})
         return node
-
+''',
+'face_index': r'''
     @classmethod
     def face_index(cls, corner_index=None):
         """ > Node <&Node Face of Corner>
@@ -125,7 +135,8 @@ class Corner(Socket):
         """
         node = Node('Face of Corner', sockets={'Corner Index': corner_index})
         return node.face_index
-
+''',
+'index_in_face': r'''
     @classmethod
     def index_in_face(cls, corner_index=None):
         """ > Node <&Node Face of Corner>
@@ -140,7 +151,8 @@ class Corner(Socket):
         """
         node = Node('Face of Corner', sockets={'Corner Index': corner_index})
         return node.index_in_face
-
+''',
+'evaluate_at_index': r'''
     @classmethod
     def evaluate_at_index(cls, index=None, value=None):
         """ > Node <&Node Evaluate at Index>
@@ -162,7 +174,8 @@ class Corner(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Corner.evaluate_at_index', 'value')
         node = Node('Evaluate at Index', sockets={'Index': index, 'Value': value}, data_type=data_type, domain='CORNER')
         return node._out
-
+''',
+'evaluate_on_domain': r'''
     @classmethod
     def evaluate_on_domain(cls, value=None):
         """ > Node <&Node Evaluate on Domain>
@@ -183,7 +196,8 @@ class Corner(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Corner.evaluate_on_domain', 'value')
         node = Node('Evaluate on Domain', sockets={'Value': value}, data_type=data_type, domain='CORNER')
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -204,7 +218,8 @@ class Corner(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='CORNERS')
         return node._out
-
+''',
+'offset_in_face': r'''
     @classmethod
     def offset_in_face(cls, corner_index=None, offset=None):
         """ > Node <&Node Offset Corner in Face>
@@ -220,7 +235,8 @@ class Corner(Socket):
         """
         node = Node('Offset Corner in Face', sockets={'Corner Index': corner_index, 'Offset': offset})
         return node._out
-
+''',
+'sample_index': r'''
     def sample_index(self, value=None, index=None, clamp=False):
         """ > Node <&Node Sample Index>
 
@@ -241,9 +257,10 @@ class Corner(Socket):
         - Float
         """
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Corner.sample_index', 'value')
-        node = Node('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='CORNER')
+        node = self._cache('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='CORNER')
         return node._out
-
+''',
+'sample_nearest': r'''
     def sample_nearest(self, sample_position=None):
         """ > Node <&Node Sample Nearest>
 
@@ -262,7 +279,8 @@ class Corner(Socket):
         """
         node = Node('Sample Nearest', sockets={'Geometry': self, 'Sample Position': sample_position}, domain='CORNER')
         return node._out
-
+''',
+'store_named_attribute': r'''
     def store_named_attribute(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -288,7 +306,8 @@ class Corner(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='CORNER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'store': r'''
     def store(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -314,7 +333,8 @@ class Corner(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='CORNER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'store_uv': r'''
     def store_uv(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -339,7 +359,8 @@ class Corner(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type='FLOAT2', domain='CORNER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'pack_uv_islands': r'''
     @classmethod
     def pack_uv_islands(cls, uv=None, margin=None, rotate=None):
         """ > Node <&Node Pack UV Islands>
@@ -360,7 +381,8 @@ class Corner(Socket):
         """
         node = Node('Pack UV Islands', sockets={'UV': uv, 'Selection': self._sel, 'Margin': margin, 'Rotate': rotate})
         return node._out
-
+''',
+'uv_unwrap': r'''
     @classmethod
     def uv_unwrap(cls, seam=None, margin=None, fill_holes=None, method='ANGLE_BASED'):
         """ > Node <&Node UV Unwrap>
@@ -383,7 +405,8 @@ class Corner(Socket):
         utils.check_enum_arg('UV Unwrap', 'method', method, 'uv_unwrap', ('ANGLE_BASED', 'CONFORMAL'))
         node = Node('UV Unwrap', sockets={'Selection': self._sel, 'Seam': seam, 'Margin': margin, 'Fill Holes': fill_holes}, method=method)
         return node._out
-
+''',
+'vertex_index': r'''
     @classmethod
     def vertex_index(cls, corner_index=None):
         """ > Node <&Node Vertex of Corner>
@@ -398,7 +421,8 @@ class Corner(Socket):
         """
         node = Node('Vertex of Corner', sockets={'Corner Index': corner_index})
         return node._out
-
+''',
+'viewer': r'''
     def viewer(self, value=None):
         """ > Node <&Node Viewer>
 
@@ -416,4 +440,7 @@ class Corner(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Corner.viewer', 'value')
         node = Node('Viewer', sockets={'Geometry': self, 'Value': value}, data_type=data_type, domain='CORNER')
         return
+''',
+}
 
+MethodTable(METHODS, globals()).install(Corner)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Curve(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'domain_size': r'''
     def domain_size(self):
         """ > Node <&Node Domain Size>
 
@@ -21,7 +25,8 @@ class Curve(Socket):
         """
         node = self._cache('Domain Size', sockets={'Geometry': self}, component='CURVE')
         return node
-
+''',
+'ArcPoints': r'''
     @classmethod
     def ArcPoints(cls, resolution=None, start=None, middle=None, end=None, offset_angle=None, connect_center=None, invert_arc=None):
         """ > Node <&Node Arc>
@@ -46,7 +51,8 @@ class Curve(Socket):
         """
         node = Node('Arc', sockets={'Resolution': resolution, 'Start': start, 'Middle': middle, 'End': end, 'Offset Angle': offset_angle, 'Connect Center': connect_center, 'Invert Arc': invert_arc}, mode='POINTS')
         return cls(node._out)
-
+''',
+'ArcRadius': r'''
     @classmethod
     def ArcRadius(cls, resolution=None, radius=None, start_angle=None, sweep_angle=None, connect_center=None, invert_arc=None):
         """ > Node <&Node Arc>
@@ -70,7 +76,8 @@ class Curve(Socket):
         """
         node = Node('Arc', sockets={'Resolution': resolution, 'Radius': radius, 'Start Angle': start_angle, 'Sweep Angle': sweep_angle, 'Connect Center': connect_center, 'Invert Arc': invert_arc}, mode='RADIUS')
         return cls(node._out)
-
+''',
+'Arc': r'''
     @classmethod
     def Arc(cls, resolution=None, radius=None, start_angle=None, sweep_angle=None, connect_center=None, invert_arc=None, mode='RADIUS'):
         """ > Node <&Node Arc>
@@ -92,7 +99,8 @@ class Curve(Socket):
         utils.check_enum_arg('Arc', 'mode', mode, 'Arc', ('POINTS', 'RADIUS'))
         node = Node('Arc', sockets={'Resolution': resolution, 'Radius': radius, 'Start Angle': start_angle, 'Sweep Angle': sweep_angle, 'Connect Center': connect_center, 'Invert Arc': invert_arc}, mode=mode)
         return cls(node._out)
-
+''',
+'endpoint_selection': r'''
     @classmethod
     def endpoint_selection(cls, start_size=None, end_size=None):
         """ > Node <&Node Endpoint Selection>
@@ -108,7 +116,8 @@ class Curve(Socket):
         """
         node = Node('Endpoint Selection', sockets={'Start Size': start_size, 'End Size': end_size})
         return node._out
-
+''',
+'handle_type_selection': r'''
     @classmethod
     def handle_type_selection(cls, handle_type='AUTO', mode={'LEFT', 'RIGHT'}):
         """ > Node <&Node Handle Type Selection>
@@ -125,7 +134,8 @@ class Curve(Socket):
         utils.check_enum_arg('Handle Type Selection', 'handle_type', handle_type, 'handle_type_selection', ('FREE', 'AUTO', 'VECTOR', 'ALIGN'))
         node = Node('Handle Type Selection', sockets={}, handle_type=handle_type, mode=mode)
         return node._out
-
+''',
+'length': r'''
     def length(self):
         """ > Node <&Node Curve Length>
 
@@ -139,7 +149,8 @@ class Curve(Socket):
         """
         node = Node('Curve Length', sockets={'Curve': self})
         return node._out
-
+''',
+'curve_of_point': r'''
     @classmethod
     def curve_of_point(cls, point_index=None):
         """ > Node <&Node Curve of Point>
@@ -154,7 +165,8 @@ class Curve(Socket):
         """
         node = Node('Curve of Point', sockets={'Point Index': point_index})
         return node._out
-
+''',
+'BeziersegmentPosition': r'''
     @classmethod
     def BeziersegmentPosition(cls, resolution=None, start=None, start_handle=None, end_handle=None, end=None):
         """ > Node <&Node Bézier Segment>
@@ -177,7 +189,8 @@ class Curve(Socket):
         """
         node = Node('Bézier Segment', sockets={'Resolution': resolution, 'Start': start, 'Start Handle': start_handle, 'End Handle': end_handle, 'End': end}, mode='POSITION')
         return cls(node._out)
-
+''',
+'BeziersegmentOffset': r'''
     @classmethod
     def BeziersegmentOffset(cls, resolution=None, start=None, start_handle=None, end_handle=None, end=None):
         """ > Node <&Node Bézier Segment>
@@ -200,7 +213,8 @@ class Curve(Socket):
         """
         node = Node('Bézier Segment', sockets={'Resolution': resolution, 'Start': start, 'Start Handle': start_handle, 'End Handle': end_handle, 'End': end}, mode='OFFSET')
         return cls(node._out)
-
+''',
+'BezierSegment': r'''
     @classmethod
     def BezierSegment(cls, resolution=None, start=None, start_handle=None, end_handle=None, end=None, mode='POSITION'):
         """ > Node <&Node Bézier Segment>
@@ -221,7 +235,8 @@ class Curve(Socket):
         utils.check_enum_arg('Bézier Segment', 'mode', mode, 'BezierSegment', ('POSITION', 'OFFSET'))
         node = Node('Bézier Segment', sockets={'Resolution': resolution, 'Start': start, 'Start Handle': start_handle, 'End Handle': end_handle, 'End': end}, mode=mode)
         return cls(node._out)
-
+''',
+'CirclePoints': r'''
     @classmethod
     def CirclePoints(cls, resolution=None, point_1=None, point_2=None, point_3=None):
         """ > Node <&Node Curve Circle>
@@ -243,7 +258,8 @@ class Curve(Socket):
         """
         node = Node('Curve Circle', sockets={'Resolution': resolution, 'Point 1': point_1, 'Point 2': point_2, 'Point 3': point_3}, mode='POINTS')
         return cls(node._out)
-
+''',
+'CircleRadius': r'''
     @classmethod
     def CircleRadius(cls, resolution=None, radius=None):
         """ > Node <&Node Curve Circle>
@@ -263,7 +279,8 @@ class Curve(Socket):
         """
         node = Node('Curve Circle', sockets={'Resolution': resolution, 'Radius': radius}, mode='RADIUS')
         return cls(node._out)
-
+''',
+'Circle': r'''
     @classmethod
     def Circle(cls, resolution=None, radius=None, mode='RADIUS'):
         """ > Node <&Node Curve Circle>
@@ -281,7 +298,8 @@ class Curve(Socket):
         utils.check_enum_arg('Curve Circle', 'mode', mode, 'Circle', ('POINTS', 'RADIUS'))
         node = Node('Curve Circle', sockets={'Resolution': resolution, 'Radius': radius}, mode=mode)
         return cls(node._out)
-
+''',
+'LinePoints': r'''
     @classmethod
     def LinePoints(cls, start=None, end=None):
         """ > Node <&Node Curve Line>
@@ -301,7 +319,8 @@ class Curve(Socket):
         """
         node = Node('Curve Line', sockets={'Start': start, 'End': end}, mode='POINTS')
         return cls(node._out)
-
+''',
+'LineDirection': r'''
     @classmethod
     def LineDirection(cls, start=None, direction=None, length=None):
         """ > Node <&Node Curve Line>
@@ -322,7 +341,8 @@ class Curve(Socket):
         """
         node = Node('Curve Line', sockets={'Start': start, 'Direction': direction, 'Length': length}, mode='DIRECTION')
         return cls(node._out)
-
+''',
+'Line': r'''
     @classmethod
     def Line(cls, start=None, end=None, mode='POINTS'):
         """ > Node <&Node Curve Line>
@@ -340,7 +360,8 @@ class Curve(Socket):
         utils.check_enum_arg('Curve Line', 'mode', mode, 'Line', ('POINTS', 'DIRECTION'))
         node = Node('Curve Line', sockets={'Start': start, 'End': end}, mode=mode)
         return cls(node._out)
-
+''',
+'QuadrilateralRectangle': r'''
     @classmethod
     def QuadrilateralRectangle(cls, width=None, height=None):
         """ > Node <&Node Quadrilateral>
@@ -360,7 +381,8 @@ class Curve(Socket):
         """
         node = Node('Quadrilateral', sockets={'Width': width, 'Height': height}, mode='RECTANGLE')
         return cls(node._out)
-
+''',
+'QuadrilateralParallelogram': r'''
     @classmethod
     def QuadrilateralParallelogram(cls, width=None, height=None, offset=None):
         """ > Node <&Node Quadrilateral>
@@ -381,7 +403,8 @@ class Curve(Socket):
         """
         node = Node('Quadrilateral', sockets={'Width': width, 'Height': height, 'Offset': offset}, mode='PARALLELOGRAM')
         return cls(node._out)
-
+''',
+'QuadrilateralTrapezoid': r'''
     @classmethod
     def QuadrilateralTrapezoid(cls, width=None, height=None, bottom_width=None, top_width=None, offset=None):
         """ > Node <&Node Quadrilateral>
@@ -404,7 +427,8 @@ class Curve(Socket):
         """
         node = Node('Quadrilateral', sockets={'Width': width, 'Height': height, 'Bottom Width': bottom_width, 'Top Width': top_width, 'Offset': offset}, mode='TRAPEZOID')
         return cls(node._out)
-
+''',
+'QuadrilateralKite': r'''
     @classmethod
     def QuadrilateralKite(cls, width=None, bottom_height=None, top_height=None):
         """ > Node <&Node Quadrilateral>
@@ -425,7 +449,8 @@ class Curve(Socket):
         """
         node = Node('Quadrilateral', sockets={'Width': width, 'Bottom Height': bottom_height, 'Top Height': top_height}, mode='KITE')
         return cls(node._out)
-
+''',
+'QuadrilateralPoints': r'''
     @classmethod
     def QuadrilateralPoints(cls, width=None, point_1=None, point_2=None, point_3=None, point_4=None):
         """ > Node <&Node Quadrilateral>
@@ -448,7 +473,8 @@ class Curve(Socket):
         """
         node = Node('Quadrilateral', sockets={'Width': width, 'Point 1': point_1, 'Point 2': point_2, 'Point 3': point_3, 'Point 4': point_4}, mode='POINTS')
         return cls(node._out)
-
+''',
+'Quadrilateral': r'''
     @classmethod
     def Quadrilateral(cls, width=None, height=None, mode='RECTANGLE'):
         """ > Node <&Node Quadrilateral>
@@ -466,7 +492,8 @@ class Curve(Socket):
         utils.check_enum_arg('Quadrilateral', 'mode', mode, 'Quadrilateral', ('RECTANGLE', 'PARALLELOGRAM', 'TRAPEZOID', 'KITE', 'POINTS'))
         node = Node('Quadrilateral', sockets={'Width': width, 'Height': height}, mode=mode)
         return cls(node._out)
-
+''',
+'QuadraticBezier': r'''
     @classmethod
     def QuadraticBezier(cls, resolution=None, start=None, middle=None, end=None):
         """ > Node <&Node Quadratic Bézier>
@@ -484,7 +511,8 @@ class Curve(Socket):
         """
         node = Node('Quadratic Bézier', sockets={'Resolution': resolution, 'Start': start, 'Middle': middle, 'End': end})
         return cls(node._out)
-
+''',
+'set_handle_type': r'''
     def set_handle_type(self, handle_type='AUTO', mode={'LEFT', 'RIGHT'}):
         """ > Node <&Node Set Handle Type>
 
@@ -508,7 +536,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_left_handle_type': r'''
     def set_left_handle_type(self, handle_type='AUTO'):
         """ > Node <&Node Set Handle Type>
 
@@ -532,7 +561,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode={'LEFT'})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_right_handle_type': r'''
     def set_right_handle_type(self, handle_type='AUTO'):
         """ > Node <&Node Set Handle Type>
 
@@ -556,7 +586,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode={'RIGHT'})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_both_handle_type': r'''
     def set_both_handle_type(self, handle_type='AUTO'):
         """ > Node <&Node Set Handle Type>
 
@@ -580,7 +611,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode={'LEFT', 'RIGHT'})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'Spiral': r'''
     @classmethod
     def Spiral(cls, resolution=None, rotations=None, start_radius=None, end_radius=None, height=None, reverse=None):
         """ > Node <&Node Spiral>
@@ -600,7 +632,8 @@ class Curve(Socket):
         """
         node = Node('Spiral', sockets={'Resolution': resolution, 'Rotations': rotations, 'Start Radius': start_radius, 'End Radius': end_radius, 'Height': height, 'Reverse': reverse})
         return cls(node._out)
-
+''',
+'set_spline_type': r'''
     def set_spline_type(self, spline_type='POLY'):
         """ > Node <&Node Set Spline Type>
 
@@ -623,7 +656,8 @@ class Curve(Socket):
         node = Node('Set Spline Type', sockets={'Curve': self, 'Selection': self._sel}, spline_type=spline_type)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'Star': r'''
     @classmethod
     def Star(cls, points=None, inner_radius=None, outer_radius=None, twist=None):
         """ > Node <&Node Star>
@@ -641,7 +675,8 @@ class Curve(Socket):
         """
         node = Node('Star', sockets={'Points': points, 'Inner Radius': inner_radius, 'Outer Radius': outer_radius, 'Twist': twist})
         return cls(node._out)
-
+''',
+'to_mesh': r'''
     def to_mesh(self, profile_curve=None, fill_caps=None):
         """ > Node <&Node Curve to Mesh>
 
@@ -660,7 +695,8 @@ class Curve(Socket):
         """
         node = Node('Curve to Mesh', sockets={'Curve': self, 'Profile Curve': profile_curve, 'Fill Caps': fill_caps})
         return node._out
-
+''',
+'to_points_evaluated': r'''
     def to_points_evaluated(self):
         """ > Node <&Node Curve to Points>
 
@@ -675,7 +711,8 @@ class Curve(Socket):
         """
         node = Node('Curve to Points', sockets={'Curve': self}, mode='EVALUATED')
         return node._out
-
+''',
+'to_points_count': r'''
     def to_points_count(self, count=None):
         """ > Node <&Node Curve to Points>
 
@@ -694,7 +731,8 @@ class Curve(Socket):
         """
         node = Node('Curve to Points', sockets={'Curve': self, 'Count': count}, mode='COUNT')
         return node._out
-
+''',
+'to_points_length': r'''
     def to_points_length(self, length=None):
         """ > Node <&Node Curve to Points>
 
@@ -713,7 +751,8 @@ class Curve(Socket):
         """
         node = Node('Curve to Points', sockets={'Curve': self, 'Length': length}, mode='LENGTH')
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, count=None, mode='COUNT'):
         """ > Node <&Node Curve to Points>
 
@@ -733,7 +772,8 @@ class Curve(Socket):
         utils.check_enum_arg('Curve to Points', 'mode', mode, 'to_points', ('EVALUATED', 'COUNT', 'LENGTH'))
         node = Node('Curve to Points', sockets={'Curve': self, 'Count': count}, mode=mode)
         return node._out
-
+''',
+'to_grease_pencil': r'''
     def to_grease_pencil(self, instances_as_layers=None):
         """ > Node <&Node Curves to Grease Pencil>
 
@@ -752,7 +792,8 @@ class Curve(Socket):
         """
         node = Node('Curves to Grease Pencil', sockets={'Curves': self, 'Selection': self._sel, 'Instances as Layers': instances_as_layers})
         return node._out
-
+''',
+'deform_on_surface': r'''
     def deform_on_surface(self):
         """ > Node <&Node Deform Curves on Surface>
 
@@ -769,7 +810,8 @@ class Curve(Socket):
         node = Node('Deform Curves on Surface', sockets={'Curves': self})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'fill_triangles': r'''
     def fill_triangles(self, group_id=None):
         """ > Node <&Node Fill Curve>
 
@@ -788,7 +830,8 @@ class Curve(Socket):
         """
         node = Node('Fill Curve', sockets={'Curve': self, 'Group ID': group_id}, mode='TRIANGLES')
         return node._out
-
+''',
+'fill_ngons': r'''
     def fill_ngons(self, group_id=None):
         """ > Node <&Node Fill Curve>
 
@@ -807,7 +850,8 @@ class Curve(Socket):
         """
         node = Node('Fill Curve', sockets={'Curve': self, 'Group ID': group_id}, mode='NGONS')
         return node._out
-
+''',
+'fill': r'''
     def fill(self, group_id=None, mode='TRIANGLES'):
         """ > Node <&Node Fill Curve>
 
@@ -827,7 +871,8 @@ class Curve(Socket):
         utils.check_enum_arg('Fill Curve', 'mode', mode, 'fill', ('TRIANGLES', 'NGONS'))
         node = Node('Fill Curve', sockets={'Curve': self, 'Group ID': group_id}, mode=mode)
         return node._out
-
+''',
+'fillet_bezier': r'''
     def fillet_bezier(self, radius=None, limit_radius=None):
         """ > Node <&Node Fillet Curve>
 
@@ -850,7 +895,8 @@ class Curve(Socket):
         node = Node('Fillet Curve', sockets={'Curve': self, 'Radius': radius, 'Limit Radius': limit_radius}, mode='BEZIER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'fillet_poly': r'''
     def fillet_poly(self, count=None, radius=None, limit_radius=None):
         """ > Node <&Node Fillet Curve>
 
@@ -874,7 +920,8 @@ class Curve(Socket):
         node = Node('Fillet Curve', sockets={'Curve': self, 'Count': count, 'Radius': radius, 'Limit Radius': limit_radius}, mode='POLY')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'fillet': r'''
     def fillet(self, radius=None, limit_radius=None, mode='BEZIER'):
         """ > Node <&Node Fillet Curve>
 
@@ -898,7 +945,8 @@ class Curve(Socket):
         node = Node('Fillet Curve', sockets={'Curve': self, 'Radius': radius, 'Limit Radius': limit_radius}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'handle_positions': r'''
     @classmethod
     def handle_positions(cls, relative=None):
         """ > Node <&Node Curve Handle Positions>
@@ -913,7 +961,8 @@ class Curve(Socket):
         """
         node = Node('Curve Handle Positions', sockets={'Relative': relative})
         return node._out
-
+''',
+'tangent': r'''
     @classmethod
     @property
     def tangent(cls):
@@ -925,7 +974,8 @@ class Curve(Socket):
         """
         node = Node('Curve Tangent', sockets={})
         return node._out
-
+''',
+'Interpolate': r'''
     @classmethod
     def Interpolate(cls, guide_curves=None, guide_up=None, guide_group_id=None, points=None, point_up=None, point_group_id=None, max_neighbors=None):
         """ > Node <&Node Interpolate Curves>
@@ -946,7 +996,8 @@ class Curve(Socket):
         """
         node = Node('Interpolate Curves', sockets={'Guide Curves': guide_curves, 'Guide Up': guide_up, 'Guide Group ID': guide_group_id, 'Points': points, 'Point Up': point_up, 'Point Group ID': point_group_id, 'Max Neighbors': max_neighbors})
         return cls(node._out)
-
+''',
+'interpolate': r'''
     def interpolate(self, guide_up=None, guide_group_id=None, points=None, point_up=None, point_group_id=None, max_neighbors=None):
         """ > Node <&Node Interpolate Curves>
 
@@ -972,7 +1023,8 @@ class Curve(Socket):
         node = Node('Interpolate Curves', sockets={'Guide Curves': self, 'Guide Up': guide_up, 'Guide Group ID': guide_group_id, 'Points': points, 'Point Up': point_up, 'Point Group ID': point_group_id, 'Max Neighbors': max_neighbors})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'material_selection': r'''
     @classmethod
     def material_selection(cls, material=None):
         """ > Node <&Node Material Selection>
@@ -987,7 +1039,8 @@ class Curve(Socket):
         """
         node = Node('Material Selection', sockets={'Material': material})
         return node._out
-
+''',
+'offset_point_in_curve': r'''
     @classmethod
     def offset_point_in_curve(cls, point_index=None, offset=None):
         """ > Node <&Node Offset Point in Curve>
@@ -1003,7 +1056,8 @@ class Curve(Socket):
         """
         node = Node('Offset Point in Curve', sockets={'Point Index': point_index, 'Offset': offset})
         return node._out
-
+''',
+'points_of_curve': r'''
     @classmethod
     def points_of_curve(cls, curve_index=None, weights=None, sort_index=None):
         """ > Node <&Node Points of Curve>
@@ -1020,7 +1074,8 @@ class Curve(Socket):
         """
         node = Node('Points of Curve', sockets={'Curve Index': curve_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'resample_evaluated': r'''
     def resample_evaluated(self):
         """ > Node <&Node Resample Curve>
 
@@ -1039,7 +1094,8 @@ class Curve(Socket):
         node = Node('Resample Curve', sockets={'Curve': self, 'Selection': self._sel}, mode='EVALUATED')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'resample_count': r'''
     def resample_count(self, count=None):
         """ > Node <&Node Resample Curve>
 
@@ -1062,7 +1118,8 @@ class Curve(Socket):
         node = Node('Resample Curve', sockets={'Curve': self, 'Selection': self._sel, 'Count': count}, mode='COUNT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'resample_length': r'''
     def resample_length(self, length=None):
         """ > Node <&Node Resample Curve>
 
@@ -1085,7 +1142,8 @@ class Curve(Socket):
         node = Node('Resample Curve', sockets={'Curve': self, 'Selection': self._sel, 'Length': length}, mode='LENGTH')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'resample': r'''
     def resample(self, count=None, mode='COUNT'):
         """ > Node <&Node Resample Curve>
 
@@ -1109,7 +1167,8 @@ class Curve(Socket):
         node = Node('Resample Curve', sockets={'Curve': self, 'Selection': self._sel, 'Count': count}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'reverse': r'''
     def reverse(self):
         """ > Node <&Node Reverse Curve>
 
@@ -1127,7 +1186,8 @@ class Curve(Socket):
         node = Node('Reverse Curve', sockets={'Curve': self, 'Selection': self._sel})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'sample_factor': r'''
     def sample_factor(self, value=None, curve_index=None, factor=None, use_all_curves=False):
         """ > Node <&Node Sample Curve>
 
@@ -1151,7 +1211,8 @@ class Curve(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Curve.sample_factor', 'value')
         node = Node('Sample Curve', sockets={'Curves': self, 'Value': value, 'Curve Index': curve_index, 'Factor': factor}, data_type=data_type, mode='FACTOR', use_all_curves=use_all_curves)
         return node._out
-
+''',
+'sample_length': r'''
     def sample_length(self, value=None, length=None, curve_index=None, use_all_curves=False):
         """ > Node <&Node Sample Curve>
 
@@ -1175,7 +1236,8 @@ class Curve(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Curve.sample_length', 'value')
         node = Node('Sample Curve', sockets={'Curves': self, 'Value': value, 'Length': length, 'Curve Index': curve_index}, data_type=data_type, mode='LENGTH', use_all_curves=use_all_curves)
         return node._out
-
+''',
+'sample': r'''
     def sample(self, value=None, curve_index=None, factor=None, mode='FACTOR', use_all_curves=False):
         """ > Node <&Node Sample Curve>
 
@@ -1200,7 +1262,8 @@ class Curve(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Curve.sample', 'value')
         node = Node('Sample Curve', sockets={'Curves': self, 'Value': value, 'Curve Index': curve_index, 'Factor': factor}, data_type=data_type, mode=mode, use_all_curves=use_all_curves)
         return node._out
-
+''',
+'set_handle_positions': r'''
     def set_handle_positions(self, position=None, offset=None, mode='LEFT'):
         """ > Node <&Node Set Handle Positions>
 
@@ -1225,7 +1288,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': position, 'Offset': offset}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_left_handle_positions': r'''
     def set_left_handle_positions(self, position=None, offset=None):
         """ > Node <&Node Set Handle Positions>
 
@@ -1249,7 +1313,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': position, 'Offset': offset}, mode='LEFT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_right_handle_positions': r'''
     def set_right_handle_positions(self, position=None, offset=None):
         """ > Node <&Node Set Handle Positions>
 
@@ -1273,7 +1338,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': position, 'Offset': offset}, mode='RIGHT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_normal_minimum_twist': r'''
     def set_normal_minimum_twist(self):
         """ > Node <&Node Set Curve Normal>
 
@@ -1292,7 +1358,8 @@ class Curve(Socket):
         node = Node('Set Curve Normal', sockets={'Curve': self, 'Selection': self._sel}, mode='MINIMUM_TWIST')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_normal_z_up': r'''
     def set_normal_z_up(self):
         """ > Node <&Node Set Curve Normal>
 
@@ -1311,7 +1378,8 @@ class Curve(Socket):
         node = Node('Set Curve Normal', sockets={'Curve': self, 'Selection': self._sel}, mode='Z_UP')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_normal_free': r'''
     def set_normal_free(self, normal=None):
         """ > Node <&Node Set Curve Normal>
 
@@ -1334,7 +1402,8 @@ class Curve(Socket):
         node = Node('Set Curve Normal', sockets={'Curve': self, 'Selection': self._sel, 'Normal': normal}, mode='FREE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_normal': r'''
     def set_normal(self, mode='MINIMUM_TWIST'):
         """ > Node <&Node Set Curve Normal>
 
@@ -1357,7 +1426,8 @@ class Curve(Socket):
         node = Node('Set Curve Normal', sockets={'Curve': self, 'Selection': self._sel}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_radius': r'''
     def set_radius(self, radius=None):
         """ > Node <&Node Set Curve Radius>
 
@@ -1379,7 +1449,8 @@ class Curve(Socket):
         node = Node('Set Curve Radius', sockets={'Curve': self, 'Selection': self._sel, 'Radius': radius})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_tilt': r'''
     def set_tilt(self, tilt=None):
         """ > Node <&Node Set Curve Tilt>
 
@@ -1401,7 +1472,8 @@ class Curve(Socket):
         node = Node('Set Curve Tilt', sockets={'Curve': self, 'Selection': self._sel, 'Tilt': tilt})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'spline_length': r'''
     @classmethod
     def spline_length(cls):
         """ > Node <&Node Spline Length>
@@ -1412,7 +1484,8 @@ class Curve(Socket):
         """
         node = Node('Spline Length', sockets={})
         return node._out
-
+''',
+'spline_parameter': r'''
     @classmethod
     def spline_parameter(cls):
         """ > Node <&Node Spline Parameter>
@@ -1423,7 +1496,8 @@ class Curve(Socket):
         """
         node = Node('Spline Parameter', sockets={})
         return node._out
-
+''',
+'subdivide': r'''
     def subdivide(self, cuts=None):
         """ > Node <&Node Subdivide Curve>
 
@@ -1444,7 +1518,8 @@ class Curve(Socket):
         node = Node('Subdivide Curve', sockets={'Curve': self, 'Cuts': cuts})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'trim_factor': r'''
     def trim_factor(self, start=None, end=None):
         """ > Node <&Node Trim Curve>
 
@@ -1468,7 +1543,8 @@ class Curve(Socket):
         node = Node('Trim Curve', sockets={'Curve': self, 'Selection': self._sel, 'Start': start, 'End': end}, mode='FACTOR')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'trim_length': r'''
     def trim_length(self, start=None, end=None):
         """ > Node <&Node Trim Curve>
 
@@ -1492,7 +1568,8 @@ class Curve(Socket):
         node = Node('Trim Curve', sockets={'Curve': self, 'Selection': self._sel, 'Start_001': start, 'End_001': end}, mode='LENGTH')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'trim': r'''
     def trim(self, start=None, end=None, mode='FACTOR'):
         """ > Node <&Node Trim Curve>
 
@@ -1517,7 +1594,8 @@ class Curve(Socket):
         node = Node('Trim Curve', sockets={'Curve': self, 'Selection': self._sel, 'Start': start, 'End': end}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'radius': r'''
     @property
     def radius(self):
         """ Property get node <Node Set Curve Radius>
@@ -1546,7 +1624,8 @@ class Curve(Socket):
         node = Node('Set Curve Radius', sockets={'Curve': self, 'Selection': self._sel, 'Radius': radius})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'left_handle_position': r'''
     @property
     def left_handle_position(self):
         """ Property get node <Node Set Handle Positions>
@@ -1577,7 +1656,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': position, 'Offset': None}, mode='LEFT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'right_handle_position': r'''
     @property
     def right_handle_position(self):
         """ Property get node <Node Set Handle Positions>
@@ -1608,7 +1688,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': position, 'Offset': None}, mode='RIGHT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'left_handle_offset': r'''
     @property
     def left_handle_offset(self):
         """ Property get node <Node Set Handle Positions>
@@ -1639,7 +1720,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': None, 'Offset': offset}, mode='LEFT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'right_handle_offset': r'''
     @property
     def right_handle_offset(self):
         """ Property get node <Node Set Handle Positions>
@@ -1670,7 +1752,8 @@ class Curve(Socket):
         node = Node('Set Handle Positions', sockets={'Curve': self, 'Selection': self._sel, 'Position': None, 'Offset': offset}, mode='RIGHT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'handle_type': r'''
     @property
     def handle_type(self):
         """ Write only property for node <Node Set Handle Type>
@@ -1701,7 +1784,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode={'LEFT', 'RIGHT'})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'left_handle_type': r'''
     @property
     def left_handle_type(self):
         """ Write only property for node <Node Set Handle Type>
@@ -1732,7 +1816,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode={'LEFT'})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'right_handle_type': r'''
     @property
     def right_handle_type(self):
         """ Write only property for node <Node Set Handle Type>
@@ -1763,7 +1848,8 @@ class Curve(Socket):
         node = Node('Set Handle Type', sockets={'Curve': self, 'Selection': self._sel}, handle_type=handle_type, mode={'RIGHT'})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'tilt': r'''
     @property
     def tilt(self):
         """ Property get node <Node Set Curve Tilt>
@@ -1792,7 +1878,8 @@ class Curve(Socket):
         node = Node('Set Curve Tilt', sockets={'Curve': self, 'Selection': self._sel, 'Tilt': tilt})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'normal': r'''
     @property
     def normal(self):
         """ Write only property for node <Node Set Curve Normal>
@@ -1822,7 +1909,8 @@ class Curve(Socket):
         node = Node('Set Curve Normal', sockets={'Curve': self, 'Selection': self._sel}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'is_cyclic': r'''
     @property
     def is_cyclic(self):
         """ Property get node <Node Set Spline Cyclic>
@@ -1851,7 +1939,8 @@ class Curve(Socket):
         node = Node('Set Spline Cyclic', sockets={'Geometry': self, 'Selection': self._sel, 'Cyclic': cyclic})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'resolution': r'''
     @property
     def resolution(self):
         """ Property get node <Node Set Spline Resolution>
@@ -1880,7 +1969,8 @@ class Curve(Socket):
         node = Node('Set Spline Resolution', sockets={'Geometry': self, 'Selection': self._sel, 'Resolution': resolution})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'type': r'''
     @property
     def type(self):
         """ Write only property for node <Node Set Spline Type>
@@ -1910,4 +2000,7 @@ class Curve(Socket):
         node = Node('Set Spline Type', sockets={'Curve': self, 'Selection': self._sel}, spline_type=spline_type)
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(Curve)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Edge(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'accumulate_field': r'''
     @classmethod
     def accumulate_field(cls, value=None, group_id=None):
         """ > Node <&Node Accumulate Field>
@@ -28,7 +32,8 @@ class Edge(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'MATRIX': 'TRANSFORM'}, 'Edge.accumulate_field', 'value')
         node = Node('Accumulate Field', sockets={'Value': value, 'Group Index': group_id}, data_type=data_type, domain='EDGE')
         return node._out
-
+''',
+'attribute_statistic': r'''
     def attribute_statistic(self, attribute=None):
         """ > Node <&Node Attribute Statistic>
 
@@ -48,9 +53,10 @@ class Edge(Socket):
         - node [mean (Float), median (Float), sum (Float), min (Float), max (Float), range (Float), standard_deviation (Float), variance (Float)]
         """
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Edge.attribute_statistic', 'attribute')
-        node = Node('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='EDGE')
+        node = self._cache('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='EDGE')
         return node
-
+''',
+'corners': r'''
     @classmethod
     def corners(cls, edge_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Edge>
@@ -67,7 +73,8 @@ class Edge(Socket):
         """
         node = Node('Corners of Edge', sockets={'Edge Index': edge_index, 'Weights': weights, 'Sort Index': sort_index})
         return node
-
+''',
+'corner_index': r'''
     @classmethod
     def corner_index(cls, edge_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Edge>
@@ -84,7 +91,8 @@ class Edge(Socket):
         """
         node = Node('Corners of Edge', sockets={'Edge Index': edge_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.corner_index
-
+''',
+'corners_total': r'''
     @classmethod
     def corners_total(cls, edge_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Edge>
@@ -101,7 +109,8 @@ class Edge(Socket):
         """
         node = Node('Corners of Edge', sockets={'Edge Index': edge_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.total
-
+''',
+'delete_geometry_all': r'''
     def delete_geometry_all(self):
         """ > Node <&Node Delete Geometry>
 
@@ -121,7 +130,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry_edge_face': r'''
     def delete_geometry_edge_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -141,7 +151,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode='EDGE_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry_only_face': r'''
     def delete_geometry_only_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -161,7 +172,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode='ONLY_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry': r'''
     def delete_geometry(self, mode='ALL'):
         """ > Node <&Node Delete Geometry>
 
@@ -185,7 +197,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_all': r'''
     def delete_all(self):
         """ > Node <&Node Delete Geometry>
 
@@ -205,7 +218,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_edge_face': r'''
     def delete_edge_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -225,7 +239,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode='EDGE_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_only_face': r'''
     def delete_only_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -245,7 +260,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode='ONLY_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete': r'''
     def delete(self, mode='ALL'):
         """ > Node <&Node Delete Geometry>
 
@@ -269,7 +285,8 @@ class Edge(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'duplicate': r'''
     def duplicate(self, amount=None):
         """ > Node <&Node Duplicate Elements>
 
@@ -292,7 +309,8 @@ class Edge(Socket):
         node = Node('Duplicate Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Amount': amount}, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'paths_to_curves': r'''
     def paths_to_curves(self, start_vertices=None, next_vertex_index=None):
         """ > Node <&Node Edge Paths to Curves>
 
@@ -311,7 +329,8 @@ class Edge(Socket):
         """
         node = Node('Edge Paths to Curves', sockets={'Mesh': self, 'Start Vertices': start_vertices, 'Next Vertex Index': next_vertex_index})
         return node._out
-
+''',
+'paths_to_selection': r'''
     @classmethod
     def paths_to_selection(cls, start_vertices=None, next_vertex_index=None):
         """ > Node <&Node Edge Paths to Selection>
@@ -327,7 +346,8 @@ class Edge(Socket):
         """
         node = Node('Edge Paths to Selection', sockets={'Start Vertices': start_vertices, 'Next Vertex Index': next_vertex_index})
         return node._out
-
+''',
+'to_face_groups': r'''
     @classmethod
     def to_face_groups(cls, boundary_edges=None):
         """ > Node <&Node Edges to Face Groups>
@@ -342,7 +362,8 @@ class Edge(Socket):
         """
         node = Node('Edges to Face Groups', sockets={'Boundary Edges': boundary_edges})
         return node._out
-
+''',
+'extrude': r'''
     def extrude(self, offset=None, offset_scale=None):
         """ > Node <&Node Extrude Mesh>
 
@@ -366,7 +387,8 @@ class Edge(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale}, mode='EDGES')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'evaluate_at_index': r'''
     @classmethod
     def evaluate_at_index(cls, index=None, value=None):
         """ > Node <&Node Evaluate at Index>
@@ -388,7 +410,8 @@ class Edge(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Edge.evaluate_at_index', 'value')
         node = Node('Evaluate at Index', sockets={'Index': index, 'Value': value}, data_type=data_type, domain='EDGE')
         return node._out
-
+''',
+'evaluate_on_domain': r'''
     @classmethod
     def evaluate_on_domain(cls, value=None):
         """ > Node <&Node Evaluate on Domain>
@@ -409,7 +432,8 @@ class Edge(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Edge.evaluate_on_domain', 'value')
         node = Node('Evaluate on Domain', sockets={'Value': value}, data_type=data_type, domain='EDGE')
         return node._out
-
+''',
+'edge_angle': r'''
     @classmethod
     def edge_angle(cls):
         """ > Node <&Node Edge Angle>
@@ -420,7 +444,8 @@ class Edge(Socket):
         """
         node = Node('Edge Angle', sockets={})
         return node
-
+''',
+'unsigned_angle': r'''
     @classmethod
     @property
     def unsigned_angle(cls):
@@ -432,7 +457,8 @@ class Edge(Socket):
         """
         node = Node('Edge Angle', sockets={})
         return node.unsigned_angle
-
+''',
+'signed_angle': r'''
     @classmethod
     @property
     def signed_angle(cls):
@@ -444,7 +470,8 @@ class Edge(Socket):
         """
         node = Node('Edge Angle', sockets={})
         return node.signed_angle
-
+''',
+'face_count': r'''
     @classmethod
     @property
     def face_count(cls):
@@ -456,7 +483,8 @@ class Edge(Socket):
         """
         node = Node('Edge Neighbors', sockets={})
         return node._out
-
+''',
+'edge_vertices': r'''
     @classmethod
     def edge_vertices(cls):
         """ > Node <&Node Edge Vertices>
@@ -467,7 +495,8 @@ class Edge(Socket):
         """
         node = Node('Edge Vertices', sockets={})
         return node
-
+''',
+'vertex_index_1': r'''
     @classmethod
     @property
     def vertex_index_1(cls):
@@ -479,7 +508,8 @@ class Edge(Socket):
         """
         node = Node('Edge Vertices', sockets={})
         return node.vertex_index_1
-
+''',
+'vertex_index_2': r'''
     @classmethod
     @property
     def vertex_index_2(cls):
@@ -491,7 +521,8 @@ class Edge(Socket):
         """
         node = Node('Edge Vertices', sockets={})
         return node.vertex_index_2
-
+''',
+'position_1': r'''
     @classmethod
     @property
     def position_1(cls):
@@ -503,7 +534,8 @@ class Edge(Socket):
         """
         node = Node('Edge Vertices', sockets={})
         return node.position_1
-
+''',
+'position_2': r'''
     @classmethod
     @property
     def position_2(cls):
@@ -515,7 +547,8 @@ class Edge(Socket):
         """
         node = Node('Edge Vertices', sockets={})
         return node.position_2
-
+''',
+'shortest_paths': r'''
     @classmethod
     def shortest_paths(cls, end_vertex=None, edge_cost=None):
         """ > Node <&Node Shortest Edge Paths>
@@ -531,7 +564,8 @@ class Edge(Socket):
         """
         node = Node('Shortest Edge Paths', sockets={'End Vertex': end_vertex, 'Edge Cost': edge_cost})
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -552,7 +586,8 @@ class Edge(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='EDGES')
         return node._out
-
+''',
+'sample_index': r'''
     def sample_index(self, value=None, index=None, clamp=False):
         """ > Node <&Node Sample Index>
 
@@ -573,9 +608,10 @@ class Edge(Socket):
         - Float
         """
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Edge.sample_index', 'value')
-        node = Node('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='EDGE')
+        node = self._cache('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='EDGE')
         return node._out
-
+''',
+'sample_nearest': r'''
     def sample_nearest(self, sample_position=None):
         """ > Node <&Node Sample Nearest>
 
@@ -594,7 +630,8 @@ class Edge(Socket):
         """
         node = Node('Sample Nearest', sockets={'Geometry': self, 'Sample Position': sample_position}, domain='EDGE')
         return node._out
-
+''',
+'scale': r'''
     def scale(self, scale=None, center=None, scale_mode='UNIFORM'):
         """ > Node <&Node Scale Elements>
 
@@ -620,7 +657,8 @@ class Edge(Socket):
         node = Node('Scale Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Scale': scale, 'Center': center}, domain='EDGE', scale_mode=scale_mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'scale_uniform': r'''
     def scale_uniform(self, scale=None, center=None):
         """ > Node <&Node Scale Elements>
 
@@ -645,7 +683,8 @@ class Edge(Socket):
         node = Node('Scale Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Scale': scale, 'Center': center}, domain='EDGE', scale_mode='UNIFORM')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'scale_single_axis': r'''
     def scale_single_axis(self, scale=None, center=None, axis=None):
         """ > Node <&Node Scale Elements>
 
@@ -671,7 +710,8 @@ class Edge(Socket):
         node = Node('Scale Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Scale': scale, 'Center': center, 'Axis': axis}, domain='EDGE', scale_mode='SINGLE_AXIS')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'separate': r'''
     def separate(self):
         """ > Node <&Node Separate Geometry>
 
@@ -690,7 +730,8 @@ class Edge(Socket):
         node = Node('Separate Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_shade_smooth': r'''
     def set_shade_smooth(self, shade_smooth=None):
         """ > Node <&Node Set Shade Smooth>
 
@@ -713,7 +754,8 @@ class Edge(Socket):
         node = Node('Set Shade Smooth', sockets={'Geometry': self, 'Selection': self._sel, 'Shade Smooth': shade_smooth}, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'sort': r'''
     def sort(self, group_id=None, sort_weight=None):
         """ > Node <&Node Sort Elements>
 
@@ -737,7 +779,8 @@ class Edge(Socket):
         node = Node('Sort Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Group ID': group_id, 'Sort Weight': sort_weight}, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'split': r'''
     def split(self):
         """ > Node <&Node Split Edges>
 
@@ -755,7 +798,8 @@ class Edge(Socket):
         node = Node('Split Edges', sockets={'Mesh': self, 'Selection': self._sel})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'split_to_instances': r'''
     def split_to_instances(self, group_id=None):
         """ > Node <&Node Split to Instances>
 
@@ -775,7 +819,8 @@ class Edge(Socket):
         """
         node = Node('Split to Instances', sockets={'Geometry': self, 'Selection': self._sel, 'Group ID': group_id}, domain='EDGE')
         return node._out
-
+''',
+'store_named_attribute': r'''
     def store_named_attribute(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -801,7 +846,8 @@ class Edge(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'store': r'''
     def store(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -827,7 +873,8 @@ class Edge(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'active_element': r'''
     @classmethod
     def active_element(cls):
         """ > Node <&Node Active Element>
@@ -842,7 +889,8 @@ class Edge(Socket):
         """
         node = Node('Active Element', sockets={}, domain='EDGE')
         return node._out
-
+''',
+'set_selection': r'''
     def set_selection(self):
         """ > Node <&Node Set Selection>
 
@@ -863,7 +911,8 @@ class Edge(Socket):
         node = Node('Set Selection', sockets={'Geometry': self, 'Selection': self._sel}, domain='EDGE', selection_type=selection_type)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'viewer': r'''
     def viewer(self, value=None):
         """ > Node <&Node Viewer>
 
@@ -881,7 +930,8 @@ class Edge(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Edge.viewer', 'value')
         node = Node('Viewer', sockets={'Geometry': self, 'Value': value}, data_type=data_type, domain='EDGE')
         return
-
+''',
+'material': r'''
     @property
     def material(self):
         """ Write only property for node <Node Set Material>
@@ -910,7 +960,8 @@ class Edge(Socket):
         node = Node('Set Material', sockets={'Geometry': self, 'Selection': self._sel, 'Material': material})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'shade_smooth': r'''
     @property
     def shade_smooth(self):
         """ Property get node <Node Set Shade Smooth>
@@ -940,7 +991,8 @@ class Edge(Socket):
         node = Node('Set Shade Smooth', sockets={'Geometry': self, 'Selection': self._sel, 'Shade Smooth': shade_smooth}, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'smooth': r'''
     @property
     def smooth(self):
         """ Property get node <Node Set Shade Smooth>
@@ -970,4 +1022,7 @@ class Edge(Socket):
         node = Node('Set Shade Smooth', sockets={'Geometry': self, 'Selection': self._sel, 'Shade Smooth': shade_smooth}, domain='EDGE')
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(Edge)
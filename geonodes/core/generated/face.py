@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Face(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'accumulate_field': r'''
     @classmethod
     def accumulate_field(cls, value=None, group_id=None):
         """ > Node <&Node Accumulate Field>
@@ -28,7 +32,8 @@ class Face(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'MATRIX': 'TRANSFORM'}, 'Face.accumulate_field', 'value')
         node = Node('Accumulate Field', sockets={'Value': value, 'Group Index': group_id}, data_type=data_type, domain='FACE')
         return node._out
-
+''',
+'attribute_statistic': r'''
     def attribute_statistic(self, attribute=None):
         """ > Node <&Node Attribute Statistic>
 
@@ -48,9 +53,10 @@ class Face(Socket):
         - node [mean (Float), median (Float), sum (Float), min (Float), max (Float), range (Float), standard_deviation (Float), variance (Float)]
         """
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Face.attribute_statistic', 'attribute')
-        node = Node('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='FACE')
+        node = self._cache('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='FACE')
         return node
-
+''',
+'corners': r'''
     @classmethod
     def corners(cls, face_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Face>
@@ -67,7 +73,8 @@ class Face(Socket):
         """
         node = Node('Corners of Face', sockets={'Face Index': face_index, 'Weights': weights, 'Sort Index': sort_index})
         return node
-
+''',
+'corner_index': r'''
     @classmethod
     def corner_index(cls, face_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Face>
@@ -84,7 +91,8 @@ class Face(Socket):
         """
         node = Node('Corners of Face', sockets={'Face Index': face_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.corner_index
-
+''',
+'corners_total': r'''
     @classmethod
     def corners_total(cls, face_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Face>
@@ -101,7 +109,8 @@ class Face(Socket):
         """
         node = Node('Corners of Face', sockets={'Face Index': face_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.total
-
+''',
+'delete_geometry_all': r'''
     def delete_geometry_all(self):
         """ > Node <&Node Delete Geometry>
 
@@ -121,7 +130,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry_edge_face': r'''
     def delete_geometry_edge_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -141,7 +151,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode='EDGE_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry_only_face': r'''
     def delete_geometry_only_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -161,7 +172,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode='ONLY_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry': r'''
     def delete_geometry(self, mode='ALL'):
         """ > Node <&Node Delete Geometry>
 
@@ -185,7 +197,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_all': r'''
     def delete_all(self):
         """ > Node <&Node Delete Geometry>
 
@@ -205,7 +218,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_edge_face': r'''
     def delete_edge_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -225,7 +239,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode='EDGE_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_only_face': r'''
     def delete_only_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -245,7 +260,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode='ONLY_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete': r'''
     def delete(self, mode='ALL'):
         """ > Node <&Node Delete Geometry>
 
@@ -269,7 +285,8 @@ class Face(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'distribute_points': r'''
     def distribute_points(self, density=None, seed=None, distribute_method='RANDOM', use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
 
@@ -292,7 +309,8 @@ class Face(Socket):
         utils.check_enum_arg('Distribute Points on Faces', 'distribute_method', distribute_method, 'distribute_points', ('RANDOM', 'POISSON'))
         node = Node('Distribute Points on Faces', sockets={'Mesh': self, 'Selection': self._sel, 'Density': density, 'Seed': seed}, distribute_method=distribute_method, use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'distribute_points_random': r'''
     def distribute_points_random(self, density=None, seed=None, use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
 
@@ -314,7 +332,8 @@ class Face(Socket):
         """
         node = Node('Distribute Points on Faces', sockets={'Mesh': self, 'Selection': self._sel, 'Density': density, 'Seed': seed}, distribute_method='RANDOM', use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'distribute_points_poisson': r'''
     def distribute_points_poisson(self, distance_min=None, density_max=None, density_factor=None, seed=None, use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
 
@@ -338,7 +357,8 @@ class Face(Socket):
         """
         node = Node('Distribute Points on Faces', sockets={'Mesh': self, 'Selection': self._sel, 'Distance Min': distance_min, 'Density Max': density_max, 'Density Factor': density_factor, 'Seed': seed}, distribute_method='POISSON', use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'duplicate': r'''
     def duplicate(self, amount=None):
         """ > Node <&Node Duplicate Elements>
 
@@ -361,7 +381,8 @@ class Face(Socket):
         node = Node('Duplicate Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Amount': amount}, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'extrude': r'''
     def extrude(self, offset=None, offset_scale=None, individual=None):
         """ > Node <&Node Extrude Mesh>
 
@@ -386,7 +407,8 @@ class Face(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale, 'Individual': individual}, mode='FACES')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'evaluate_at_index': r'''
     @classmethod
     def evaluate_at_index(cls, index=None, value=None):
         """ > Node <&Node Evaluate at Index>
@@ -408,7 +430,8 @@ class Face(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Face.evaluate_at_index', 'value')
         node = Node('Evaluate at Index', sockets={'Index': index, 'Value': value}, data_type=data_type, domain='FACE')
         return node._out
-
+''',
+'evaluate_on_domain': r'''
     @classmethod
     def evaluate_on_domain(cls, value=None):
         """ > Node <&Node Evaluate on Domain>
@@ -429,7 +452,8 @@ class Face(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Face.evaluate_on_domain', 'value')
         node = Node('Evaluate on Domain', sockets={'Value': value}, data_type=data_type, domain='FACE')
         return node._out
-
+''',
+'area': r'''
     @classmethod
     @property
     def area(cls):
@@ -441,7 +465,8 @@ class Face(Socket):
         """
         node = Node('Face Area', sockets={})
         return node._out
-
+''',
+'is_planar': r'''
     @classmethod
     def is_planar(cls, threshold=None):
         """ > Node <&Node Is Face Planar>
@@ -456,7 +481,8 @@ class Face(Socket):
         """
         node = Node('Is Face Planar', sockets={'Threshold': threshold})
         return node._out
-
+''',
+'neighbors': r'''
     @classmethod
     def neighbors(cls):
         """ > Node <&Node Face Neighbors>
@@ -467,7 +493,8 @@ class Face(Socket):
         """
         node = Node('Face Neighbors', sockets={})
         return node
-
+''',
+'neighbors_vertex_count': r'''
     @classmethod
     @property
     def neighbors_vertex_count(cls):
@@ -479,7 +506,8 @@ class Face(Socket):
         """
         node = Node('Face Neighbors', sockets={})
         return node.vertex_count
-
+''',
+'neighbors_face_count': r'''
     @classmethod
     @property
     def neighbors_face_count(cls):
@@ -491,7 +519,8 @@ class Face(Socket):
         """
         node = Node('Face Neighbors', sockets={})
         return node.face_count
-
+''',
+'normal': r'''
     @classmethod
     @property
     def normal(cls):
@@ -503,7 +532,8 @@ class Face(Socket):
         """
         node = Node('Normal', sockets={})
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -524,7 +554,8 @@ class Face(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='FACES')
         return node._out
-
+''',
+'sample_index': r'''
     def sample_index(self, value=None, index=None, clamp=False):
         """ > Node <&Node Sample Index>
 
@@ -545,9 +576,10 @@ class Face(Socket):
         - Float
         """
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Face.sample_index', 'value')
-        node = Node('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='FACE')
+        node = self._cache('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='FACE')
         return node._out
-
+''',
+'sample_nearest': r'''
     def sample_nearest(self, sample_position=None):
         """ > Node <&Node Sample Nearest>
 
@@ -566,7 +598,8 @@ class Face(Socket):
         """
         node = Node('Sample Nearest', sockets={'Geometry': self, 'Sample Position': sample_position}, domain='FACE')
         return node._out
-
+''',
+'scale': r'''
     def scale(self, scale=None, center=None, scale_mode='UNIFORM'):
         """ > Node <&Node Scale Elements>
 
@@ -592,7 +625,8 @@ class Face(Socket):
         node = Node('Scale Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Scale': scale, 'Center': center}, domain='FACE', scale_mode=scale_mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'scale_uniform': r'''
     def scale_uniform(self, scale=None, center=None):
         """ > Node <&Node Scale Elements>
 
@@ -617,7 +651,8 @@ class Face(Socket):
         node = Node('Scale Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Scale': scale, 'Center': center}, domain='FACE', scale_mode='UNIFORM')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'scale_single_axis': r'''
     def scale_single_axis(self, scale=None, center=None, axis=None):
         """ > Node <&Node Scale Elements>
 
@@ -643,7 +678,8 @@ class Face(Socket):
         node = Node('Scale Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Scale': scale, 'Center': center, 'Axis': axis}, domain='FACE', scale_mode='SINGLE_AXIS')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'separate': r'''
     def separate(self):
         """ > Node <&Node Separate Geometry>
 
@@ -662,7 +698,8 @@ class Face(Socket):
         node = Node('Separate Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_shade_smooth': r'''
     def set_shade_smooth(self, shade_smooth=None):
         """ > Node <&Node Set Shade Smooth>
 
@@ -685,7 +722,8 @@ class Face(Socket):
         node = Node('Set Shade Smooth', sockets={'Geometry': self, 'Selection': self._sel, 'Shade Smooth': shade_smooth}, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'sort': r'''
     def sort(self, group_id=None, sort_weight=None):
         """ > Node <&Node Sort Elements>
 
@@ -709,7 +747,8 @@ class Face(Socket):
         node = Node('Sort Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Group ID': group_id, 'Sort Weight': sort_weight}, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'split_to_instances': r'''
     def split_to_instances(self, group_id=None):
         """ > Node <&Node Split to Instances>
 
@@ -729,7 +768,8 @@ class Face(Socket):
         """
         node = Node('Split to Instances', sockets={'Geometry': self, 'Selection': self._sel, 'Group ID': group_id}, domain='FACE')
         return node._out
-
+''',
+'store_named_attribute': r'''
     def store_named_attribute(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -755,7 +795,8 @@ class Face(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'store': r'''
     def store(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -781,7 +822,8 @@ class Face(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'active_element': r'''
     @classmethod
     def active_element(cls):
         """ > Node <&Node Active Element>
@@ -796,7 +838,8 @@ class Face(Socket):
         """
         node = Node('Active Element', sockets={}, domain='FACE')
         return node._out
-
+''',
+'set_selection': r'''
     def set_selection(self):
         """ > Node <&Node Set Selection>
 
@@ -817,7 +860,8 @@ class Face(Socket):
         node = Node('Set Selection', sockets={'Geometry': self, 'Selection': self._sel}, domain='FACE', selection_type=selection_type)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'viewer': r'''
     def viewer(self, value=None):
         """ > Node <&Node Viewer>
 
@@ -835,7 +879,8 @@ class Face(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Face.viewer', 'value')
         node = Node('Viewer', sockets={'Geometry': self, 'Value': value}, data_type=data_type, domain='FACE')
         return
-
+''',
+'material': r'''
     @property
     def material(self):
         """ Write only property for node <Node Set Material>
@@ -864,7 +909,8 @@ class Face(Socket):
         node = Node('Set Material', sockets={'Geometry': self, 'Selection': self._sel, 'Material': material})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'material_index': r'''
     @property
     def material_index(self):
         """ Property get node <Node Set Material Index>
@@ -893,7 +939,8 @@ class Face(Socket):
         node = Node('Set Material Index', sockets={'Geometry': self, 'Selection': self._sel, 'Material Index': material_index})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'shade_smooth': r'''
     @property
     def shade_smooth(self):
         """ Property get node <Node Set Shade Smooth>
@@ -923,7 +970,8 @@ class Face(Socket):
         node = Node('Set Shade Smooth', sockets={'Geometry': self, 'Selection': self._sel, 'Shade Smooth': shade_smooth}, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'smooth': r'''
     @property
     def smooth(self):
         """ Property get node <Node Set Shade Smooth>
@@ -953,4 +1001,7 @@ class Face(Socket):
         node = Node('Set Shade Smooth', sockets={'Geometry': self, 'Selection': self._sel, 'Shade Smooth': shade_smooth}, domain='FACE')
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(Face)
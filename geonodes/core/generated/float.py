@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Float(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'less_than': r'''
     def less_than(self, b=None):
         """ > Node <&Node Compare>
 
@@ -27,7 +31,8 @@ class Float(Socket):
         """
         node = Node('Compare', sockets={'A': self, 'B': b}, data_type='FLOAT', mode='ELEMENT', operation='LESS_THAN')
         return node._out
-
+''',
+'less_equal': r'''
     def less_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -48,7 +53,8 @@ class Float(Socket):
         """
         node = Node('Compare', sockets={'A': self, 'B': b}, data_type='FLOAT', mode='ELEMENT', operation='LESS_EQUAL')
         return node._out
-
+''',
+'greater_than': r'''
     def greater_than(self, b=None):
         """ > Node <&Node Compare>
 
@@ -69,7 +75,8 @@ class Float(Socket):
         """
         node = Node('Compare', sockets={'A': self, 'B': b}, data_type='FLOAT', mode='ELEMENT', operation='GREATER_THAN')
         return node._out
-
+''',
+'greater_equal': r'''
     def greater_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -90,7 +97,8 @@ class Float(Socket):
         """
         node = Node('Compare', sockets={'A': self, 'B': b}, data_type='FLOAT', mode='ELEMENT', operation='GREATER_EQUAL')
         return node._out
-
+''',
+'equal': r'''
     def equal(self, b=None, epsilon=None):
         """ > Node <&Node Compare>
 
@@ -112,7 +120,8 @@ class Float(Socket):
         """
         node = Node('Compare', sockets={'A': self, 'B': b, 'Epsilon': epsilon}, data_type='FLOAT', mode='ELEMENT', operation='EQUAL')
         return node._out
-
+''',
+'not_equal': r'''
     def not_equal(self, b=None, epsilon=None):
         """ > Node <&Node Compare>
 
@@ -134,7 +143,8 @@ class Float(Socket):
         """
         node = Node('Compare', sockets={'A': self, 'B': b, 'Epsilon': epsilon}, data_type='FLOAT', mode='ELEMENT', operation='NOT_EQUAL')
         return node._out
-
+''',
+'to_integer': r'''
     def to_integer(self, rounding_mode='ROUND'):
         """ > Node <&Node Float to Integer>
 
@@ -153,7 +163,8 @@ class Float(Socket):
         utils.check_enum_arg('Float to Integer', 'rounding_mode', rounding_mode, 'to_integer', ('ROUND', 'FLOOR', 'CEILING', 'TRUNCATE'))
         node = Node('Float to Integer', sockets={'Float': self}, rounding_mode=rounding_mode)
         return node._out
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -172,7 +183,8 @@ class Float(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='FLOAT')
         return node._out
-
+''',
+'Random': r'''
     @classmethod
     def Random(cls, min=None, max=None, id=None, seed=None):
         """ > Node <&Node Random Value>
@@ -194,7 +206,8 @@ class Float(Socket):
         """
         node = Node('Random Value', sockets={'Min_001': min, 'Max_001': max, 'ID': id, 'Seed': seed}, data_type='FLOAT')
         return cls(node._out)
-
+''',
+'to_string': r'''
     def to_string(self, decimals=None):
         """ > Node <&Node Value to String>
 
@@ -213,7 +226,8 @@ class Float(Socket):
         """
         node = Node('Value to String', sockets={'Value': self, 'Decimals': decimals}, data_type='FLOAT')
         return node._out
-
+''',
+'blur': r'''
     def blur(self, iterations=None, weight=None):
         """ > Node <&Node Blur Attribute>
 
@@ -233,7 +247,8 @@ class Float(Socket):
         """
         node = Node('Blur Attribute', sockets={'Value': self, 'Iterations': iterations, 'Weight': weight}, data_type='FLOAT')
         return node._out
-
+''',
+'dial_gizmo': r'''
     def dial_gizmo(self, *value, position=None, up=None, screen_space=None, radius=None, color_id='PRIMARY'):
         """ > Node <&Node Dial Gizmo>
 
@@ -253,7 +268,8 @@ class Float(Socket):
         utils.check_enum_arg('Dial Gizmo', 'color_id', color_id, 'dial_gizmo', ('PRIMARY', 'SECONDARY', 'X', 'Y', 'Z'))
         node = Node('Dial Gizmo', sockets={'Value': [self] + list(value), 'Position': position, 'Up': up, 'Screen Space': screen_space, 'Radius': radius}, color_id=color_id)
         return node._out
-
+''',
+'linear_gizmo': r'''
     def linear_gizmo(self, *value, position=None, direction=None, color_id='PRIMARY', draw_style='ARROW'):
         """ > Node <&Node Linear Gizmo>
 
@@ -273,7 +289,8 @@ class Float(Socket):
         utils.check_enum_arg('Linear Gizmo', 'draw_style', draw_style, 'linear_gizmo', ('ARROW', 'CROSS', 'BOX'))
         node = Node('Linear Gizmo', sockets={'Value': [self] + list(value), 'Position': position, 'Direction': direction}, color_id=color_id, draw_style=draw_style)
         return node._out
-
+''',
+'to_mesh': r'''
     def to_mesh(self, threshold=None, adaptivity=None):
         """ > Node <&Node Grid to Mesh>
 
@@ -292,7 +309,8 @@ class Float(Socket):
         """
         node = Node('Grid to Mesh', sockets={'Grid': self, 'Threshold': threshold, 'Adaptivity': adaptivity})
         return node._out
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -311,7 +329,8 @@ class Float(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -330,7 +349,8 @@ class Float(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT')
         return cls(node._out)
-
+''',
+'scene_time': r'''
     @classmethod
     def scene_time(cls):
         """ > Node <&Node Scene Time>
@@ -341,7 +361,8 @@ class Float(Socket):
         """
         node = Node('Scene Time', sockets={})
         return node
-
+''',
+'seconds': r'''
     @classmethod
     @property
     def seconds(cls):
@@ -353,7 +374,8 @@ class Float(Socket):
         """
         node = Node('Scene Time', sockets={})
         return node.seconds
-
+''',
+'frame': r'''
     @classmethod
     @property
     def frame(cls):
@@ -365,7 +387,8 @@ class Float(Socket):
         """
         node = Node('Scene Time', sockets={})
         return node.frame
-
+''',
+'grid_boolean': r'''
     def grid_boolean(self, *grid_2, operation='DIFFERENCE'):
         """ > Node <&Node SDF Grid Boolean>
 
@@ -385,7 +408,8 @@ class Float(Socket):
         utils.check_enum_arg('SDF Grid Boolean', 'operation', operation, 'grid_boolean', ('INTERSECT', 'UNION', 'DIFFERENCE'))
         node = Node('SDF Grid Boolean', sockets={'Grid 1': self, 'Grid 2': list(grid_2)}, operation=operation)
         return node._out
-
+''',
+'sdf_intersect': r'''
     def sdf_intersect(self, *grid):
         """ > Node <&Node SDF Grid Boolean>
 
@@ -403,7 +427,8 @@ class Float(Socket):
         """
         node = Node('SDF Grid Boolean', sockets={'Grid 2': [self] + list(grid)}, operation='INTERSECT')
         return node._out
-
+''',
+'sdf_union': r'''
     def sdf_union(self, *grid):
         """ > Node <&Node SDF Grid Boolean>
 
@@ -421,7 +446,8 @@ class Float(Socket):
         """
         node = Node('SDF Grid Boolean', sockets={'Grid 2': [self] + list(grid)}, operation='UNION')
         return node._out
-
+''',
+'sdf_difference': r'''
     def sdf_difference(self, *grid_2):
         """ > Node <&Node SDF Grid Boolean>
 
@@ -440,7 +466,8 @@ class Float(Socket):
         """
         node = Node('SDF Grid Boolean', sockets={'Grid 1': self, 'Grid 2': list(grid_2)}, operation='DIFFERENCE')
         return node._out
-
+''',
+'sample_grid': r'''
     def sample_grid(self, position=None, interpolation_mode='TRILINEAR'):
         """ > Node <&Node Sample Grid>
 
@@ -461,7 +488,8 @@ class Float(Socket):
         utils.check_enum_arg('Sample Grid', 'interpolation_mode', interpolation_mode, 'sample_grid', ('NEAREST', 'TRILINEAR', 'TRIQUADRATIC'))
         node = Node('Sample Grid', sockets={'Grid': self, 'Position': position}, data_type='FLOAT', interpolation_mode=interpolation_mode)
         return node._out
-
+''',
+'sample_grid_index': r'''
     def sample_grid_index(self, x=None, y=None, z=None):
         """ > Node <&Node Sample Grid Index>
 
@@ -482,7 +510,8 @@ class Float(Socket):
         """
         node = Node('Sample Grid Index', sockets={'Grid': self, 'X': x, 'Y': y, 'Z': z}, data_type='FLOAT')
         return node._out
-
+''',
+'clamp': r'''
     def clamp(self, min=None, max=None, clamp_type='MINMAX'):
         """ > Node <&Node Clamp>
 
@@ -503,7 +532,8 @@ class Float(Socket):
         utils.check_enum_arg('Clamp', 'clamp_type', clamp_type, 'clamp', ('MINMAX', 'RANGE'))
         node = Node('Clamp', sockets={'Value': self, 'Min': min, 'Max': max}, clamp_type=clamp_type)
         return node._out
-
+''',
+'clamp_minmax': r'''
     def clamp_minmax(self, min=None, max=None):
         """ > Node <&Node Clamp>
 
@@ -523,7 +553,8 @@ class Float(Socket):
         """
         node = Node('Clamp', sockets={'Value': self, 'Min': min, 'Max': max}, clamp_type='MINMAX')
         return node._out
-
+''',
+'clamp_range': r'''
     def clamp_range(self, min=None, max=None):
         """ > Node <&Node Clamp>
 
@@ -543,7 +574,8 @@ class Float(Socket):
         """
         node = Node('Clamp', sockets={'Value': self, 'Min': min, 'Max': max}, clamp_type='RANGE')
         return node._out
-
+''',
+'map_range': r'''
     def map_range(self, from_min=None, from_max=None, to_min=None, to_max=None, clamp=True, interpolation_type='LINEAR'):
         """ > Node <&Node Map Range>
 
@@ -569,7 +601,8 @@ class Float(Socket):
         data_type = utils.get_argument_data_type(from_min, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Float.map_range', 'from_min')
         node = Node('Map Range', sockets={'Value': self, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max}, clamp=clamp, data_type=data_type, interpolation_type=interpolation_type)
         return node._out
-
+''',
+'map_range_linear': r'''
     def map_range_linear(self, from_min=None, from_max=None, to_min=None, to_max=None, clamp=True):
         """ > Node <&Node Map Range>
 
@@ -594,7 +627,8 @@ class Float(Socket):
         data_type = utils.get_argument_data_type(from_min, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Float.map_range_linear', 'from_min')
         node = Node('Map Range', sockets={'Value': self, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max}, clamp=clamp, data_type=data_type, interpolation_type='LINEAR')
         return node._out
-
+''',
+'map_range_stepped': r'''
     def map_range_stepped(self, from_min=None, from_max=None, to_min=None, to_max=None, steps=None, clamp=True):
         """ > Node <&Node Map Range>
 
@@ -620,7 +654,8 @@ class Float(Socket):
         data_type = utils.get_argument_data_type(from_min, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Float.map_range_stepped', 'from_min')
         node = Node('Map Range', sockets={'Value': self, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max, 'Steps': steps}, clamp=clamp, data_type=data_type, interpolation_type='STEPPED')
         return node._out
-
+''',
+'map_range_smooth_step': r'''
     def map_range_smooth_step(self, from_min=None, from_max=None, to_min=None, to_max=None, clamp=True):
         """ > Node <&Node Map Range>
 
@@ -645,7 +680,8 @@ class Float(Socket):
         data_type = utils.get_argument_data_type(from_min, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Float.map_range_smooth_step', 'from_min')
         node = Node('Map Range', sockets={'Value': self, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max}, clamp=clamp, data_type=data_type, interpolation_type='SMOOTHSTEP')
         return node._out
-
+''',
+'map_range_smoother_step': r'''
     def map_range_smoother_step(self, from_min=None, from_max=None, to_min=None, to_max=None, clamp=True):
         """ > Node <&Node Map Range>
 
@@ -670,7 +706,8 @@ class Float(Socket):
         data_type = utils.get_argument_data_type(from_min, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Float.map_range_smoother_step', 'from_min')
         node = Node('Map Range', sockets={'Value': self, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max}, clamp=clamp, data_type=data_type, interpolation_type='SMOOTHERSTEP')
         return node._out
-
+''',
+'add': r'''
     def add(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -690,7 +727,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='ADD', use_clamp=use_clamp)
         return node._out
-
+''',
+'subtract': r'''
     def subtract(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -710,7 +748,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='SUBTRACT', use_clamp=use_clamp)
         return node._out
-
+''',
+'multiply': r'''
     def multiply(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -730,7 +769,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='MULTIPLY', use_clamp=use_clamp)
         return node._out
-
+''',
+'divide': r'''
     def divide(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -750,7 +790,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='DIVIDE', use_clamp=use_clamp)
         return node._out
-
+''',
+'multiply_add': r'''
     def multiply_add(self, multiplier=None, addend=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -771,7 +812,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': multiplier, 'Value_002': addend}, operation='MULTIPLY_ADD', use_clamp=use_clamp)
         return node._out
-
+''',
+'power': r'''
     def power(self, exponent=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -791,7 +833,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': exponent}, operation='POWER', use_clamp=use_clamp)
         return node._out
-
+''',
+'log': r'''
     def log(self, base=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -811,7 +854,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': base}, operation='LOGARITHM', use_clamp=use_clamp)
         return node._out
-
+''',
+'sqrt': r'''
     def sqrt(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -830,7 +874,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='SQRT', use_clamp=use_clamp)
         return node._out
-
+''',
+'inverse_sqrt': r'''
     def inverse_sqrt(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -849,7 +894,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='INVERSE_SQRT', use_clamp=use_clamp)
         return node._out
-
+''',
+'abs': r'''
     def abs(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -868,7 +914,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='ABSOLUTE', use_clamp=use_clamp)
         return node._out
-
+''',
+'exp': r'''
     def exp(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -887,7 +934,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='EXPONENT', use_clamp=use_clamp)
         return node._out
-
+''',
+'min': r'''
     def min(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -907,7 +955,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='MINIMUM', use_clamp=use_clamp)
         return node._out
-
+''',
+'max': r'''
     def max(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -927,7 +976,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='MAXIMUM', use_clamp=use_clamp)
         return node._out
-
+''',
+'mless_than': r'''
     def mless_than(self, threshold=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -947,7 +997,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': threshold}, operation='LESS_THAN', use_clamp=use_clamp)
         return node._out
-
+''',
+'mgreater_than': r'''
     def mgreater_than(self, threshold=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -967,7 +1018,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': threshold}, operation='GREATER_THAN', use_clamp=use_clamp)
         return node._out
-
+''',
+'sign': r'''
     def sign(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -986,7 +1038,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='SIGN', use_clamp=use_clamp)
         return node._out
-
+''',
+'compare': r'''
     def compare(self, value=None, epsilon=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1007,7 +1060,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value, 'Value_002': epsilon}, operation='COMPARE', use_clamp=use_clamp)
         return node._out
-
+''',
+'smooth_min': r'''
     def smooth_min(self, value=None, distance=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1028,7 +1082,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value, 'Value_002': distance}, operation='SMOOTH_MIN', use_clamp=use_clamp)
         return node._out
-
+''',
+'smooth_max': r'''
     def smooth_max(self, value=None, distance=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1049,7 +1104,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value, 'Value_002': distance}, operation='SMOOTH_MAX', use_clamp=use_clamp)
         return node._out
-
+''',
+'round': r'''
     def round(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1068,7 +1124,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='ROUND', use_clamp=use_clamp)
         return node._out
-
+''',
+'floor': r'''
     def floor(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1087,7 +1144,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='FLOOR', use_clamp=use_clamp)
         return node._out
-
+''',
+'ceil': r'''
     def ceil(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1106,7 +1164,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='CEIL', use_clamp=use_clamp)
         return node._out
-
+''',
+'trunc': r'''
     def trunc(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1125,7 +1184,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='TRUNC', use_clamp=use_clamp)
         return node._out
-
+''',
+'fract': r'''
     def fract(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1144,7 +1204,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='FRACT', use_clamp=use_clamp)
         return node._out
-
+''',
+'modulo': r'''
     def modulo(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1164,7 +1225,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='MODULO', use_clamp=use_clamp)
         return node._out
-
+''',
+'floored_modulo': r'''
     def floored_modulo(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1184,7 +1246,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='FLOORED_MODULO', use_clamp=use_clamp)
         return node._out
-
+''',
+'wrap': r'''
     def wrap(self, max=None, min=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1205,7 +1268,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': max, 'Value_002': min}, operation='WRAP', use_clamp=use_clamp)
         return node._out
-
+''',
+'snap': r'''
     def snap(self, increment=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1225,7 +1289,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': increment}, operation='SNAP', use_clamp=use_clamp)
         return node._out
-
+''',
+'pingpong': r'''
     def pingpong(self, scale=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1245,7 +1310,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': scale}, operation='PINGPONG', use_clamp=use_clamp)
         return node._out
-
+''',
+'sin': r'''
     def sin(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1264,7 +1330,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='SINE', use_clamp=use_clamp)
         return node._out
-
+''',
+'cos': r'''
     def cos(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1283,7 +1350,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='COSINE', use_clamp=use_clamp)
         return node._out
-
+''',
+'tan': r'''
     def tan(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1302,7 +1370,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='TANGENT', use_clamp=use_clamp)
         return node._out
-
+''',
+'asin': r'''
     def asin(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1321,7 +1390,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='ARCSINE', use_clamp=use_clamp)
         return node._out
-
+''',
+'acos': r'''
     def acos(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1340,7 +1410,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='ARCCOSINE', use_clamp=use_clamp)
         return node._out
-
+''',
+'arctangent': r'''
     def arctangent(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1359,7 +1430,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='ARCTANGENT', use_clamp=use_clamp)
         return node._out
-
+''',
+'atan2': r'''
     def atan2(self, value=None, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1379,7 +1451,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self, 'Value_001': value}, operation='ARCTAN2', use_clamp=use_clamp)
         return node._out
-
+''',
+'sinh': r'''
     def sinh(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1398,7 +1471,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='SINH', use_clamp=use_clamp)
         return node._out
-
+''',
+'cosh': r'''
     def cosh(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1417,7 +1491,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='COSH', use_clamp=use_clamp)
         return node._out
-
+''',
+'tanh': r'''
     def tanh(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1436,7 +1511,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='TANH', use_clamp=use_clamp)
         return node._out
-
+''',
+'radians': r'''
     def radians(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1455,7 +1531,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='RADIANS', use_clamp=use_clamp)
         return node._out
-
+''',
+'degrees': r'''
     def degrees(self, use_clamp=False):
         """ > Node <&Node Math>
 
@@ -1474,7 +1551,8 @@ class Float(Socket):
         """
         node = Node('Math', sockets={'Value': self}, operation='DEGREES', use_clamp=use_clamp)
         return node._out
-
+''',
+'mix': r'''
     def mix(self, b=None, factor=None, clamp_factor=True):
         """ > Node <&Node Mix>
 
@@ -1498,7 +1576,8 @@ class Float(Socket):
         """
         node = Node('Mix', sockets={'A_Float': self, 'B_Float': b, 'Factor_Float': factor}, blend_type='MIX', clamp_factor=clamp_factor, clamp_result=False, data_type='FLOAT', factor_mode='UNIFORM')
         return node._out
-
+''',
+'Gabor': r'''
     @classmethod
     def Gabor(cls, vector=None, scale=None, frequency=None, anisotropy=None, orientation=None, gabor_type='2D'):
         """ > Node <&Node Gabor Texture>
@@ -1519,7 +1598,8 @@ class Float(Socket):
         utils.check_enum_arg('Gabor Texture', 'gabor_type', gabor_type, 'Gabor', ('2D', '3D'))
         node = Node('Gabor Texture', sockets={'Vector': vector, 'Scale': scale, 'Frequency': frequency, 'Anisotropy': anisotropy, 'Orientation 2D': orientation}, gabor_type=gabor_type)
         return cls(node._out)
-
+''',
+'Noise': r'''
     @classmethod
     def Noise(cls, vector=None, scale=None, detail=None, roughness=None, lacunarity=None, distortion=None, noise_dimensions='3D', noise_type='FBM', normalize=True):
         """ > Node <&Node Noise Texture>
@@ -1544,7 +1624,8 @@ class Float(Socket):
         utils.check_enum_arg('Noise Texture', 'noise_type', noise_type, 'Noise', ('MULTIFRACTAL', 'RIDGED_MULTIFRACTAL', 'HYBRID_MULTIFRACTAL', 'FBM', 'HETERO_TERRAIN'))
         node = Node('Noise Texture', sockets={'Vector': vector, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Distortion': distortion}, noise_dimensions=noise_dimensions, noise_type=noise_type, normalize=normalize)
         return cls(node._out)
-
+''',
+'Voronoi': r'''
     @classmethod
     def Voronoi(cls, vector=None, scale=None, detail=None, roughness=None, lacunarity=None, randomness=None, distance='EUCLIDEAN', feature='F1', normalize=False, voronoi_dimensions='3D'):
         """ > Node <&Node Voronoi Texture>
@@ -1571,7 +1652,8 @@ class Float(Socket):
         utils.check_enum_arg('Voronoi Texture', 'voronoi_dimensions', voronoi_dimensions, 'Voronoi', ('1D', '2D', '3D', '4D'))
         node = Node('Voronoi Texture', sockets={'Vector': vector, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Randomness': randomness}, distance=distance, feature=feature, normalize=normalize, voronoi_dimensions=voronoi_dimensions)
         return cls(node._out)
-
+''',
+'WhiteNoise': r'''
     @classmethod
     def WhiteNoise(cls, vector=None, noise_dimensions='3D'):
         """ > Node <&Node White Noise Texture>
@@ -1588,7 +1670,8 @@ class Float(Socket):
         utils.check_enum_arg('White Noise Texture', 'noise_dimensions', noise_dimensions, 'WhiteNoise', ('1D', '2D', '3D', '4D'))
         node = Node('White Noise Texture', sockets={'Vector': vector}, noise_dimensions=noise_dimensions)
         return cls(node._out)
-
+''',
+'bevel': r'''
     def bevel(self, normal=None, samples=4):
         """ > Node <&ShaderNode Bevel>
 
@@ -1607,7 +1690,8 @@ class Float(Socket):
         """
         node = Node('Bevel', sockets={'Radius': self, 'Normal': normal}, samples=samples)
         return node._out
-
+''',
+'bump': r'''
     def bump(self, distance=None, height=None, normal=None, invert=False):
         """ > Node <&ShaderNode Bump>
 
@@ -1628,7 +1712,8 @@ class Float(Socket):
         """
         node = Node('Bump', sockets={'Strength': self, 'Distance': distance, 'Height': height, 'Normal': normal}, invert=invert)
         return node._out
-
+''',
+'combine_color_RGB': r'''
     def combine_color_RGB(self, green=None, blue=None):
         """ > Node <&ShaderNode Combine Color>
 
@@ -1648,7 +1733,8 @@ class Float(Socket):
         """
         node = Node('Combine Color', sockets={'Red': self, 'Green': green, 'Blue': blue}, mode='RGB')
         return node._out
-
+''',
+'combine_color_HSV': r'''
     def combine_color_HSV(self, saturation=None, value=None):
         """ > Node <&ShaderNode Combine Color>
 
@@ -1668,7 +1754,8 @@ class Float(Socket):
         """
         node = Node('Combine Color', sockets={'Red': self, 'Green': saturation, 'Blue': value}, mode='HSV')
         return node._out
-
+''',
+'combine_color_HSL': r'''
     def combine_color_HSL(self, saturation=None, lightness=None):
         """ > Node <&ShaderNode Combine Color>
 
@@ -1688,7 +1775,8 @@ class Float(Socket):
         """
         node = Node('Combine Color', sockets={'Red': self, 'Green': saturation, 'Blue': lightness}, mode='HSL')
         return node._out
-
+''',
+'combine_color': r'''
     def combine_color(self, green=None, blue=None, mode='RGB'):
         """ > Node <&ShaderNode Combine Color>
 
@@ -1709,7 +1797,8 @@ class Float(Socket):
         utils.check_enum_arg('Combine Color', 'mode', mode, 'combine_color', ('RGB', 'HSV', 'HSL'))
         node = Node('Combine Color', sockets={'Red': self, 'Green': green, 'Blue': blue}, mode=mode)
         return node._out
-
+''',
+'displacement': r'''
     def displacement(self, midlevel=None, scale=None, normal=None, space='OBJECT'):
         """ > Node <&ShaderNode Displacement>
 
@@ -1731,7 +1820,8 @@ class Float(Socket):
         utils.check_enum_arg('Displacement', 'space', space, 'displacement', ('OBJECT', 'WORLD'))
         node = Node('Displacement', sockets={'Height': self, 'Midlevel': midlevel, 'Scale': scale, 'Normal': normal}, space=space)
         return node._out
-
+''',
+'fresnel': r'''
     def fresnel(self, normal=None):
         """ > Node <&ShaderNode Fresnel>
 
@@ -1749,7 +1839,8 @@ class Float(Socket):
         """
         node = Node('Fresnel', sockets={'IOR': self, 'Normal': normal})
         return node._out
-
+''',
+'hue_saturation_value': r'''
     def hue_saturation_value(self, saturation=None, value=None, color=None, fac=None):
         """ > Node <&ShaderNode Hue/Saturation/Value>
 
@@ -1770,7 +1861,8 @@ class Float(Socket):
         """
         node = Node('Hue/Saturation/Value', sockets={'Hue': self, 'Saturation': saturation, 'Value': value, 'Color': color, 'Fac': fac})
         return node._out
-
+''',
+'layer_weight': r'''
     def layer_weight(self, normal=None):
         """ > Node <&ShaderNode Layer Weight>
 
@@ -1788,7 +1880,8 @@ class Float(Socket):
         """
         node = Node('Layer Weight', sockets={'Blend': self, 'Normal': normal})
         return node._out
-
+''',
+'light_falloff': r'''
     def light_falloff(self, smooth=None):
         """ > Node <&ShaderNode Light Falloff>
 
@@ -1806,7 +1899,8 @@ class Float(Socket):
         """
         node = Node('Light Falloff', sockets={'Strength': self, 'Smooth': smooth})
         return node._out
-
+''',
+'normal_map': r'''
     def normal_map(self, color=None, space='TANGENT', uv_map=''):
         """ > Node <&ShaderNode Normal Map>
 
@@ -1827,7 +1921,8 @@ class Float(Socket):
         utils.check_enum_arg('Normal Map', 'space', space, 'normal_map', ('TANGENT', 'OBJECT', 'WORLD', 'BLENDER_OBJECT', 'BLENDER_WORLD'))
         node = Node('Normal Map', sockets={'Strength': self, 'Color': color}, space=space, uv_map=uv_map)
         return node._out
-
+''',
+'wavelength': r'''
     def wavelength(self):
         """ > Node <&ShaderNode Wavelength>
 
@@ -1841,7 +1936,8 @@ class Float(Socket):
         """
         node = Node('Wavelength', sockets={'Wavelength': self})
         return node._out
-
+''',
+'wireframe': r'''
     def wireframe(self, use_pixel_size=False):
         """ > Node <&ShaderNode Wireframe>
 
@@ -1859,4 +1955,7 @@ class Float(Socket):
         """
         node = Node('Wireframe', sockets={'Size': self}, use_pixel_size=use_pixel_size)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Float)
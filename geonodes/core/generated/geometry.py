@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Geometry(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'bounding_box': r'''
     def bounding_box(self):
         """ > Node <&Node Bounding Box>
 
@@ -18,9 +22,10 @@ class Geometry(Socket):
         -------
         - Mesh [min_ (Vector), max_ (Vector)]
         """
-        node = Node('Bounding Box', sockets={'Geometry': self})
+        node = self._cache('Bounding Box', sockets={'Geometry': self})
         return node._out
-
+''',
+'convex_hull': r'''
     def convex_hull(self):
         """ > Node <&Node Convex Hull>
 
@@ -34,7 +39,8 @@ class Geometry(Socket):
         """
         node = Node('Convex Hull', sockets={'Geometry': self})
         return node._out
-
+''',
+'to_instance': r'''
     def to_instance(self, *geometry):
         """ > Node <&Node Geometry to Instance>
 
@@ -48,7 +54,8 @@ class Geometry(Socket):
         """
         node = Node('Geometry to Instance', sockets={'Geometry': [self] + list(geometry)})
         return node._out
-
+''',
+'index_of_nearest': r'''
     @classmethod
     def index_of_nearest(cls, position=None, group_id=None):
         """ > Node <&Node Index of Nearest>
@@ -64,7 +71,8 @@ class Geometry(Socket):
         """
         node = Node('Index of Nearest', sockets={'Position': position, 'Group ID': group_id})
         return node._out
-
+''',
+'index': r'''
     @classmethod
     @property
     def index(cls):
@@ -76,7 +84,8 @@ class Geometry(Socket):
         """
         node = Node('Index', sockets={})
         return node._out
-
+''',
+'instance_on_points': r'''
     def instance_on_points(self, instance=None, pick_instance=None, instance_index=None, rotation=None, scale=None):
         """ > Node <&Node Instance on Points>
 
@@ -99,7 +108,8 @@ class Geometry(Socket):
         """
         node = Node('Instance on Points', sockets={'Points': self, 'Selection': self._sel, 'Instance': instance, 'Pick Instance': pick_instance, 'Instance Index': instance_index, 'Rotation': rotation, 'Scale': scale})
         return node._out
-
+''',
+'join': r'''
     def join(self, *geometry):
         """ > Node <&Node Join Geometry>
 
@@ -116,7 +126,8 @@ class Geometry(Socket):
         node = Node('Join Geometry', sockets={'Geometry': [self] + list(geometry)})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'Join': r'''
     @classmethod
     def Join(cls, *geometry):
         """ > Node <&Node Join Geometry>
@@ -131,7 +142,8 @@ class Geometry(Socket):
         """
         node = Node('Join Geometry', sockets={'Geometry': list(geometry)})
         return cls(node._out)
-
+''',
+'merge_by_distance': r'''
     def merge_by_distance(self, distance=None, mode='ALL'):
         """ > Node <&Node Merge by Distance>
 
@@ -155,7 +167,8 @@ class Geometry(Socket):
         node = Node('Merge by Distance', sockets={'Geometry': self, 'Selection': self._sel, 'Distance': distance}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'merge_all': r'''
     def merge_all(self, distance=None):
         """ > Node <&Node Merge by Distance>
 
@@ -178,7 +191,8 @@ class Geometry(Socket):
         node = Node('Merge by Distance', sockets={'Geometry': self, 'Selection': self._sel, 'Distance': distance}, mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'merge_connected': r'''
     def merge_connected(self, distance=None):
         """ > Node <&Node Merge by Distance>
 
@@ -201,7 +215,8 @@ class Geometry(Socket):
         node = Node('Merge by Distance', sockets={'Geometry': self, 'Selection': self._sel, 'Distance': distance}, mode='CONNECTED')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'merge': r'''
     def merge(self, distance=None, mode='ALL'):
         """ > Node <&Node Merge by Distance>
 
@@ -225,7 +240,8 @@ class Geometry(Socket):
         node = Node('Merge by Distance', sockets={'Geometry': self, 'Selection': self._sel, 'Distance': distance}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'proximity': r'''
     def proximity(self, group_id=None, sample_position=None, sample_group_id=None, target_element='FACES'):
         """ > Node <&Node Geometry Proximity>
 
@@ -247,7 +263,8 @@ class Geometry(Socket):
         utils.check_enum_arg('Geometry Proximity', 'target_element', target_element, 'proximity', ('POINTS', 'EDGES', 'FACES'))
         node = Node('Geometry Proximity', sockets={'Target': self, 'Group ID': group_id, 'Source Position': sample_position, 'Sample Group ID': sample_group_id}, target_element=target_element)
         return node._out
-
+''',
+'proximity_points': r'''
     def proximity_points(self, group_id=None, sample_position=None, sample_group_id=None):
         """ > Node <&Node Geometry Proximity>
 
@@ -268,7 +285,8 @@ class Geometry(Socket):
         """
         node = Node('Geometry Proximity', sockets={'Target': self, 'Group ID': group_id, 'Source Position': sample_position, 'Sample Group ID': sample_group_id}, target_element='POINTS')
         return node._out
-
+''',
+'proximity_edges': r'''
     def proximity_edges(self, group_id=None, sample_position=None, sample_group_id=None):
         """ > Node <&Node Geometry Proximity>
 
@@ -289,7 +307,8 @@ class Geometry(Socket):
         """
         node = Node('Geometry Proximity', sockets={'Target': self, 'Group ID': group_id, 'Source Position': sample_position, 'Sample Group ID': sample_group_id}, target_element='EDGES')
         return node._out
-
+''',
+'proximity_faces': r'''
     def proximity_faces(self, group_id=None, sample_position=None, sample_group_id=None):
         """ > Node <&Node Geometry Proximity>
 
@@ -310,7 +329,8 @@ class Geometry(Socket):
         """
         node = Node('Geometry Proximity', sockets={'Target': self, 'Group ID': group_id, 'Source Position': sample_position, 'Sample Group ID': sample_group_id}, target_element='FACES')
         return node._out
-
+''',
+'raycast': r'''
     def raycast(self, attribute=None, source_position=None, ray_direction=None, ray_length=None, mapping='INTERPOLATED'):
         """ > Node <&Node Raycast>
 
@@ -335,7 +355,8 @@ class Geometry(Socket):
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Geometry.raycast', 'attribute')
         node = Node('Raycast', sockets={'Target Geometry': self, 'Attribute': attribute, 'Source Position': source_position, 'Ray Direction': ray_direction, 'Ray Length': ray_length}, data_type=data_type, mapping=mapping)
         return node
-
+''',
+'raycast_interpolated': r'''
     def raycast_interpolated(self, attribute=None, source_position=None, ray_direction=None, ray_length=None):
         """ > Node <&Node Raycast>
 
@@ -359,7 +380,8 @@ class Geometry(Socket):
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Geometry.raycast_interpolated', 'attribute')
         node = Node('Raycast', sockets={'Target Geometry': self, 'Attribute': attribute, 'Source Position': source_position, 'Ray Direction': ray_direction, 'Ray Length': ray_length}, data_type=data_type, mapping='INTERPOLATED')
         return node
-
+''',
+'raycast_nearest': r'''
     def raycast_nearest(self, attribute=None, source_position=None, ray_direction=None, ray_length=None):
         """ > Node <&Node Raycast>
 
@@ -383,7 +405,8 @@ class Geometry(Socket):
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Geometry.raycast_nearest', 'attribute')
         node = Node('Raycast', sockets={'Target Geometry': self, 'Attribute': attribute, 'Source Position': source_position, 'Ray Direction': ray_direction, 'Ray Length': ray_length}, data_type=data_type, mapping='NEAREST')
         return node
-
+''',
+'realize': r'''
     def realize(self, realize_all=None, depth=None):
         """ > Node <&Node Realize Instances>
 
@@ -403,7 +426,8 @@ class Geometry(Socket):
         """
         node = Node('Realize Instances', sockets={'Geometry': self, 'Selection': self._sel, 'Realize All': realize_all, 'Depth': depth})
         return node._out
-
+''',
+'remove_named_attribute': r'''
     def remove_named_attribute(self, name=None, pattern_mode='EXACT'):
         """ > Node <&Node Remove Named Attribute>
 
@@ -426,7 +450,8 @@ class Geometry(Socket):
         node = Node('Remove Named Attribute', sockets={'Geometry': self, 'Name': name}, pattern_mode=pattern_mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'remove_names': r'''
     def remove_names(self, name=None):
         """ > Node <&Node Remove Named Attribute>
 
@@ -448,7 +473,8 @@ class Geometry(Socket):
         node = Node('Remove Named Attribute', sockets={'Geometry': self, 'Name': name}, pattern_mode='WILDCARD')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'replace_material': r'''
     def replace_material(self, old=None, new=None):
         """ > Node <&Node Replace Material>
 
@@ -470,7 +496,8 @@ class Geometry(Socket):
         node = Node('Replace Material', sockets={'Geometry': self, 'Old': old, 'New': new})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'separate_components': r'''
     def separate_components(self):
         """ > Node <&Node Separate Components>
 
@@ -484,7 +511,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node
-
+''',
+'mesh': r'''
     @property
     def mesh(self):
         """ > Node <&Node Separate Components>
@@ -499,7 +527,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node.mesh
-
+''',
+'curve': r'''
     @property
     def curve(self):
         """ > Node <&Node Separate Components>
@@ -514,7 +543,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node.curve
-
+''',
+'grease_pencil': r'''
     @property
     def grease_pencil(self):
         """ > Node <&Node Separate Components>
@@ -529,7 +559,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node.grease_pencil
-
+''',
+'point_cloud': r'''
     @property
     def point_cloud(self):
         """ > Node <&Node Separate Components>
@@ -544,7 +575,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node.point_cloud
-
+''',
+'volume': r'''
     @property
     def volume(self):
         """ > Node <&Node Separate Components>
@@ -559,7 +591,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node.volume
-
+''',
+'instances': r'''
     @property
     def instances(self):
         """ > Node <&Node Separate Components>
@@ -574,7 +607,8 @@ class Geometry(Socket):
         """
         node = self._cache('Separate Components', sockets={'Geometry': self})
         return node.instances
-
+''',
+'set_name': r'''
     def set_name(self, name=None):
         """ > Node <&Node Set Geometry Name>
 
@@ -595,7 +629,8 @@ class Geometry(Socket):
         node = Node('Set Geometry Name', sockets={'Geometry': self, 'Name': name})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_id': r'''
     def set_id(self, id=None):
         """ > Node <&Node Set ID>
 
@@ -617,7 +652,8 @@ class Geometry(Socket):
         node = Node('Set ID', sockets={'Geometry': self, 'Selection': self._sel, 'ID': id})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_material': r'''
     def set_material(self, material=None):
         """ > Node <&Node Set Material>
 
@@ -639,7 +675,8 @@ class Geometry(Socket):
         node = Node('Set Material', sockets={'Geometry': self, 'Selection': self._sel, 'Material': material})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_material_index': r'''
     def set_material_index(self, material_index=None):
         """ > Node <&Node Set Material Index>
 
@@ -661,7 +698,8 @@ class Geometry(Socket):
         node = Node('Set Material Index', sockets={'Geometry': self, 'Selection': self._sel, 'Material Index': material_index})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_position': r'''
     def set_position(self, position=None, offset=None):
         """ > Node <&Node Set Position>
 
@@ -684,7 +722,8 @@ class Geometry(Socket):
         node = Node('Set Position', sockets={'Geometry': self, 'Selection': self._sel, 'Position': position, 'Offset': offset})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_spline_cyclic': r'''
     def set_spline_cyclic(self, cyclic=None):
         """ > Node <&Node Set Spline Cyclic>
 
@@ -706,7 +745,8 @@ class Geometry(Socket):
         node = Node('Set Spline Cyclic', sockets={'Geometry': self, 'Selection': self._sel, 'Cyclic': cyclic})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_spline_resolution': r'''
     def set_spline_resolution(self, resolution=None):
         """ > Node <&Node Set Spline Resolution>
 
@@ -728,7 +768,8 @@ class Geometry(Socket):
         node = Node('Set Spline Resolution', sockets={'Geometry': self, 'Selection': self._sel, 'Resolution': resolution})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'transform_components': r'''
     def transform_components(self, translation=None, rotation=None, scale=None, transform=None):
         """ > Node <&Node Transform Geometry>
 
@@ -753,7 +794,8 @@ class Geometry(Socket):
         node = Node('Transform Geometry', sockets={'Geometry': self, 'Translation': translation, 'Rotation': rotation, 'Scale': scale, 'Transform': transform}, mode='COMPONENTS')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'transform_matrix': r'''
     def transform_matrix(self, translation=None, rotation=None, scale=None, transform=None):
         """ > Node <&Node Transform Geometry>
 
@@ -778,7 +820,8 @@ class Geometry(Socket):
         node = Node('Transform Geometry', sockets={'Geometry': self, 'Translation': translation, 'Rotation': rotation, 'Scale': scale, 'Transform': transform}, mode='MATRIX')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'transform': r'''
     def transform(self, translation=None, rotation=None, scale=None, transform=None, mode='COMPONENTS'):
         """ > Node <&Node Transform Geometry>
 
@@ -804,7 +847,8 @@ class Geometry(Socket):
         node = Node('Transform Geometry', sockets={'Geometry': self, 'Translation': translation, 'Rotation': rotation, 'Scale': scale, 'Transform': transform}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'viewer': r'''
     def viewer(self, value=None):
         """ > Node <&Node Viewer>
 
@@ -822,7 +866,8 @@ class Geometry(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Geometry.viewer', 'value')
         node = Node('Viewer', sockets={'Geometry': self, 'Value': value}, data_type=data_type, domain='AUTO')
         return
-
+''',
+'position': r'''
     @property
     def position(self):
         """ Property get node <Node Set Position>
@@ -852,7 +897,8 @@ class Geometry(Socket):
         node = Node('Set Position', sockets={'Geometry': self, 'Selection': self._sel, 'Position': position, 'Offset': None})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'offset': r'''
     @property
     def offset(self):
         """ Write only property for node <Node Set Position>
@@ -882,7 +928,8 @@ class Geometry(Socket):
         node = Node('Set Position', sockets={'Geometry': self, 'Selection': self._sel, 'Position': None, 'Offset': offset})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'id': r'''
     @property
     def id(self):
         """ Property get node <Node Set ID>
@@ -911,7 +958,8 @@ class Geometry(Socket):
         node = Node('Set ID', sockets={'Geometry': self, 'Selection': self._sel, 'ID': id})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'material': r'''
     @property
     def material(self):
         """ Write only property for node <Node Set Material>
@@ -940,7 +988,8 @@ class Geometry(Socket):
         node = Node('Set Material', sockets={'Geometry': self, 'Selection': self._sel, 'Material': material})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'name': r'''
     @property
     def name(self):
         """ Write only property for node <Node Set Geometry Name>
@@ -968,7 +1017,8 @@ class Geometry(Socket):
         node = Node('Set Geometry Name', sockets={'Geometry': self, 'Name': name})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'material_index': r'''
     @property
     def material_index(self):
         """ Property get node <Node Set Material Index>
@@ -997,4 +1047,7 @@ class Geometry(Socket):
         node = Node('Set Material Index', sockets={'Geometry': self, 'Selection': self._sel, 'Material Index': material_index})
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(Geometry)
@@ -2,7 +2,12 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
+from .. tabulate import tabulate
+
+FUNCTIONS = {
+'band': r'''
 def band(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -21,7 +26,8 @@ def band(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='AND')
     return node._out
-
+''',
+'bor': r'''
 def bor(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -40,7 +46,8 @@ def bor(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='OR')
     return node._out
-
+''',
+'bnot': r'''
 def bnot(boolean=None):
     """ > Node <&Node Boolean Math>
 
@@ -58,7 +65,8 @@ def bnot(boolean=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean}, operation='NOT')
     return node._out
-
+''',
+'not_and': r'''
 def not_and(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -77,7 +85,8 @@ def not_and(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='NAND')
     return node._out
-
+''',
+'nor': r'''
 def nor(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -96,7 +105,8 @@ def nor(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='NOR')
     return node._out
-
+''',
+'xnor': r'''
 def xnor(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -115,7 +125,8 @@ def xnor(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='XNOR')
     return node._out
-
+''',
+'xor': r'''
 def xor(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -134,7 +145,8 @@ def xor(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='XOR')
     return node._out
-
+''',
+'imply': r'''
 def imply(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -153,7 +165,8 @@ def imply(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='IMPLY')
     return node._out
-
+''',
+'nimply': r'''
 def nimply(boolean=None, boolean_1=None):
     """ > Node <&Node Boolean Math>
 
@@ -172,7 +185,8 @@ def nimply(boolean=None, boolean_1=None):
     """
     node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation='NIMPLY')
     return node._out
-
+''',
+'iadd': r'''
 def iadd(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -191,7 +205,8 @@ def iadd(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='ADD')
     return node._out
-
+''',
+'isubtract': r'''
 def isubtract(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -210,7 +225,8 @@ def isubtract(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='SUBTRACT')
     return node._out
-
+''',
+'imultiply': r'''
 def imultiply(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -229,7 +245,8 @@ def imultiply(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='MULTIPLY')
     return node._out
-
+''',
+'idivide': r'''
 def idivide(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -248,7 +265,8 @@ def idivide(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='DIVIDE')
     return node._out
-
+''',
+'imultiply_add': r'''
 def imultiply_add(value=None, multiplier=None, addend=None):
     """ > Node <&Node Integer Math>
 
@@ -268,7 +286,8 @@ def imultiply_add(value=None, multiplier=None, addend=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': multiplier, 'Value_002': addend}, operation='MULTIPLY_ADD')
     return node._out
-
+''',
+'iabs': r'''
 def iabs(value=None):
     """ > Node <&Node Integer Math>
 
@@ -286,7 +305,8 @@ def iabs(value=None):
     """
     node = Node('Integer Math', sockets={'Value': value}, operation='ABSOLUTE')
     return node._out
-
+''',
+'negate': r'''
 def negate(value=None):
     """ > Node <&Node Integer Math>
 
@@ -304,7 +324,8 @@ def negate(value=None):
     """
     node = Node('Integer Math', sockets={'Value': value}, operation='NEGATE')
     return node._out
-
+''',
+'ipower': r'''
 def ipower(base=None, exponent=None):
     """ > Node <&Node Integer Math>
 
@@ -323,7 +344,8 @@ def ipower(base=None, exponent=None):
     """
     node = Node('Integer Math', sockets={'Value': base, 'Value_001': exponent}, operation='POWER')
     return node._out
-
+''',
+'imin': r'''
 def imin(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -342,7 +364,8 @@ def imin(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='MINIMUM')
     return node._out
-
+''',
+'imax': r'''
 def imax(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -361,7 +384,8 @@ def imax(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='MAXIMUM')
     return node._out
-
+''',
+'isign': r'''
 def isign(value=None):
     """ > Node <&Node Integer Math>
 
@@ -379,7 +403,8 @@ def isign(value=None):
     """
     node = Node('Integer Math', sockets={'Value': value}, operation='SIGN')
     return node._out
-
+''',
+'divide_round': r'''
 def divide_round(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -398,7 +423,8 @@ def divide_round(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='DIVIDE_ROUND')
     return node._out
-
+''',
+'divide_floor': r'''
 def divide_floor(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -417,7 +443,8 @@ def divide_floor(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='DIVIDE_FLOOR')
     return node._out
-
+''',
+'divide_ceil': r'''
 def divide_ceil(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -436,7 +463,8 @@ def divide_ceil(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='DIVIDE_CEIL')
     return node._out
-
+''',
+'ifloored_modulo': r'''
 def ifloored_modulo(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -455,7 +483,8 @@ def ifloored_modulo(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='FLOORED_MODULO')
     return node._out
-
+''',
+'imodulo': r'''
 def imodulo(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -474,7 +503,8 @@ def imodulo(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='MODULO')
     return node._out
-
+''',
+'gcd': r'''
 def gcd(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -493,7 +523,8 @@ def gcd(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='GCD')
     return node._out
-
+''',
+'lcm': r'''
 def lcm(value=None, value_1=None):
     """ > Node <&Node Integer Math>
 
@@ -512,7 +543,8 @@ def lcm(value=None, value_1=None):
     """
     node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1}, operation='LCM')
     return node._out
-
+''',
+'add': r'''
 def add(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -532,7 +564,8 @@ def add(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='ADD', use_clamp=use_clamp)
     return node._out
-
+''',
+'subtract': r'''
 def subtract(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -552,7 +585,8 @@ def subtract(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='SUBTRACT', use_clamp=use_clamp)
     return node._out
-
+''',
+'multiply': r'''
 def multiply(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -572,7 +606,8 @@ def multiply(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='MULTIPLY', use_clamp=use_clamp)
     return node._out
-
+''',
+'divide': r'''
 def divide(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -592,7 +627,8 @@ def divide(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='DIVIDE', use_clamp=use_clamp)
     return node._out
-
+''',
+'multiply_add': r'''
 def multiply_add(value=None, multiplier=None, addend=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -613,7 +649,8 @@ def multiply_add(value=None, multiplier=None, addend=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': multiplier, 'Value_002': addend}, operation='MULTIPLY_ADD', use_clamp=use_clamp)
     return node._out
-
+''',
+'power': r'''
 def power(base=None, exponent=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -633,7 +670,8 @@ def power(base=None, exponent=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': base, 'Value_001': exponent}, operation='POWER', use_clamp=use_clamp)
     return node._out
-
+''',
+'log': r'''
 def log(value=None, base=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -653,7 +691,8 @@ def log(value=None, base=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': base}, operation='LOGARITHM', use_clamp=use_clamp)
     return node._out
-
+''',
+'sqrt': r'''
 def sqrt(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -672,7 +711,8 @@ def sqrt(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='SQRT', use_clamp=use_clamp)
     return node._out
-
+''',
+'inverse_sqrt': r'''
 def inverse_sqrt(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -691,7 +731,8 @@ def inverse_sqrt(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='INVERSE_SQRT', use_clamp=use_clamp)
     return node._out
-
+''',
+'abs': r'''
 def abs(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -710,7 +751,8 @@ def abs(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='ABSOLUTE', use_clamp=use_clamp)
     return node._out
-
+''',
+'exp': r'''
 def exp(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -729,7 +771,8 @@ def exp(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='EXPONENT', use_clamp=use_clamp)
     return node._out
-
+''',
+'min': r'''
 def min(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -749,7 +792,8 @@ def min(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='MINIMUM', use_clamp=use_clamp)
     return node._out
-
+''',
+'max': r'''
 def max(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -769,7 +813,8 @@ def max(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='MAXIMUM', use_clamp=use_clamp)
     return node._out
-
+''',
+'mless_than': r'''
 def mless_than(value=None, threshold=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -789,7 +834,8 @@ def mless_than(value=None, threshold=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': threshold}, operation='LESS_THAN', use_clamp=use_clamp)
     return node._out
-
+''',
+'mgreater_than': r'''
 def mgreater_than(value=None, threshold=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -809,7 +855,8 @@ def mgreater_than(value=None, threshold=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': threshold}, operation='GREATER_THAN', use_clamp=use_clamp)
     return node._out
-
+''',
+'sign': r'''
 def sign(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -828,7 +875,8 @@ def sign(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='SIGN', use_clamp=use_clamp)
     return node._out
-
+''',
+'compare': r'''
 def compare(value=None, value_1=None, epsilon=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -849,7 +897,8 @@ def compare(value=None, value_1=None, epsilon=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1, 'Value_002': epsilon}, operation='COMPARE', use_clamp=use_clamp)
     return node._out
-
+''',
+'smooth_min': r'''
 def smooth_min(value=None, value_1=None, distance=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -870,7 +919,8 @@ def smooth_min(value=None, value_1=None, distance=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1, 'Value_002': distance}, operation='SMOOTH_MIN', use_clamp=use_clamp)
     return node._out
-
+''',
+'smooth_max': r'''
 def smooth_max(value=None, value_1=None, distance=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -891,7 +941,8 @@ def smooth_max(value=None, value_1=None, distance=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1, 'Value_002': distance}, operation='SMOOTH_MAX', use_clamp=use_clamp)
     return node._out
-
+''',
+'round': r'''
 def round(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -910,7 +961,8 @@ def round(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='ROUND', use_clamp=use_clamp)
     return node._out
-
+''',
+'floor': r'''
 def floor(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -929,7 +981,8 @@ def floor(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='FLOOR', use_clamp=use_clamp)
     return node._out
-
+''',
+'ceil': r'''
 def ceil(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -948,7 +1001,8 @@ def ceil(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='CEIL', use_clamp=use_clamp)
     return node._out
-
+''',
+'trunc': r'''
 def trunc(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -967,7 +1021,8 @@ def trunc(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='TRUNC', use_clamp=use_clamp)
     return node._out
-
+''',
+'fract': r'''
 def fract(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -986,7 +1041,8 @@ def fract(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='FRACT', use_clamp=use_clamp)
     return node._out
-
+''',
+'modulo': r'''
 def modulo(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1006,7 +1062,8 @@ def modulo(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='MODULO', use_clamp=use_clamp)
     return node._out
-
+''',
+'floored_modulo': r'''
 def floored_modulo(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1026,7 +1083,8 @@ def floored_modulo(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='FLOORED_MODULO', use_clamp=use_clamp)
     return node._out
-
+''',
+'wrap': r'''
 def wrap(value=None, max=None, min=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1047,7 +1105,8 @@ def wrap(value=None, max=None, min=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': max, 'Value_002': min}, operation='WRAP', use_clamp=use_clamp)
     return node._out
-
+''',
+'snap': r'''
 def snap(value=None, increment=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1067,7 +1126,8 @@ def snap(value=None, increment=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': increment}, operation='SNAP', use_clamp=use_clamp)
     return node._out
-
+''',
+'pingpong': r'''
 def pingpong(value=None, scale=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1087,7 +1147,8 @@ def pingpong(value=None, scale=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': scale}, operation='PINGPONG', use_clamp=use_clamp)
     return node._out
-
+''',
+'sin': r'''
 def sin(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1106,7 +1167,8 @@ def sin(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='SINE', use_clamp=use_clamp)
     return node._out
-
+''',
+'cos': r'''
 def cos(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1125,7 +1187,8 @@ def cos(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='COSINE', use_clamp=use_clamp)
     return node._out
-
+''',
+'tan': r'''
 def tan(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1144,7 +1207,8 @@ def tan(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='TANGENT', use_clamp=use_clamp)
     return node._out
-
+''',
+'asin': r'''
 def asin(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1163,7 +1227,8 @@ def asin(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='ARCSINE', use_clamp=use_clamp)
     return node._out
-
+''',
+'acos': r'''
 def acos(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1182,7 +1247,8 @@ def acos(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='ARCCOSINE', use_clamp=use_clamp)
     return node._out
-
+''',
+'arctangent': r'''
 def arctangent(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1201,7 +1267,8 @@ def arctangent(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='ARCTANGENT', use_clamp=use_clamp)
     return node._out
-
+''',
+'atan2': r'''
 def atan2(value=None, value_1=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1221,7 +1288,8 @@ def atan2(value=None, value_1=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value, 'Value_001': value_1}, operation='ARCTAN2', use_clamp=use_clamp)
     return node._out
-
+''',
+'sinh': r'''
 def sinh(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1240,7 +1308,8 @@ def sinh(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='SINH', use_clamp=use_clamp)
     return node._out
-
+''',
+'cosh': r'''
 def cosh(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1259,7 +1328,8 @@ def cosh(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='COSH', use_clamp=use_clamp)
     return node._out
-
+''',
+'tanh': r'''
 def tanh(value=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1278,7 +1348,8 @@ def tanh(value=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': value}, operation='TANH', use_clamp=use_clamp)
     return node._out
-
+''',
+'radians': r'''
 def radians(degrees=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1297,7 +1368,8 @@ def radians(degrees=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': degrees}, operation='RADIANS', use_clamp=use_clamp)
     return node._out
-
+''',
+'degrees': r'''
 def degrees(radians=None, use_clamp=False):
     """ > Node <&Node Math>
 
@@ -1316,7 +1388,8 @@ def degrees(radians=None, use_clamp=False):
     """
     node = Node('Math', sockets={'Value': radians}, operation='DEGREES', use_clamp=use_clamp)
     return node._out
-
+''',
+'vadd': r'''
 def vadd(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1335,7 +1408,8 @@ def vadd(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='ADD')
     return node._out
-
+''',
+'vsubtract': r'''
 def vsubtract(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1354,7 +1428,8 @@ def vsubtract(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='SUBTRACT')
     return node._out
-
+''',
+'vmultiply': r'''
 def vmultiply(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1373,7 +1448,8 @@ def vmultiply(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='MULTIPLY')
     return node._out
-
+''',
+'vdivide': r'''
 def vdivide(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1392,7 +1468,8 @@ def vdivide(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='DIVIDE')
     return node._out
-
+''',
+'vmultiply_add': r'''
 def vmultiply_add(vector=None, multiplier=None, addend=None):
     """ > Node <&Node Vector Math>
 
@@ -1412,7 +1489,8 @@ def vmultiply_add(vector=None, multiplier=None, addend=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': multiplier, 'Vector_002': addend}, operation='MULTIPLY_ADD')
     return node._out
-
+''',
+'cross': r'''
 def cross(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1431,7 +1509,8 @@ def cross(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='CROSS_PRODUCT')
     return node._out
-
+''',
+'project': r'''
 def project(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1450,7 +1529,8 @@ def project(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='PROJECT')
     return node._out
-
+''',
+'reflect': r'''
 def reflect(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1469,7 +1549,8 @@ def reflect(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='REFLECT')
     return node._out
-
+''',
+'refract': r'''
 def refract(vector=None, vector_1=None, ior=None):
     """ > Node <&Node Vector Math>
 
@@ -1489,7 +1570,8 @@ def refract(vector=None, vector_1=None, ior=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1, 'Scale': ior}, operation='REFRACT')
     return node._out
-
+''',
+'faceforward': r'''
 def faceforward(vector=None, incident=None, reference=None):
     """ > Node <&Node Vector Math>
 
@@ -1509,7 +1591,8 @@ def faceforward(vector=None, incident=None, reference=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': incident, 'Vector_002': reference}, operation='FACEFORWARD')
     return node._out
-
+''',
+'dot': r'''
 def dot(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1528,7 +1611,8 @@ def dot(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='DOT_PRODUCT')
     return node._out
-
+''',
+'distance': r'''
 def distance(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1547,7 +1631,8 @@ def distance(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='DISTANCE')
     return node._out
-
+''',
+'length': r'''
 def length(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1565,7 +1650,8 @@ def length(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='LENGTH')
     return node._out
-
+''',
+'scale': r'''
 def scale(vector=None, scale=None):
     """ > Node <&Node Vector Math>
 
@@ -1584,7 +1670,8 @@ def scale(vector=None, scale=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Scale': scale}, operation='SCALE')
     return node._out
-
+''',
+'normalize': r'''
 def normalize(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1602,7 +1689,8 @@ def normalize(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='NORMALIZE')
     return node._out
-
+''',
+'vabs': r'''
 def vabs(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1620,7 +1708,8 @@ def vabs(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='ABSOLUTE')
     return node._out
-
+''',
+'vmin': r'''
 def vmin(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1639,7 +1728,8 @@ def vmin(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='MINIMUM')
     return node._out
-
+''',
+'vmax': r'''
 def vmax(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1658,7 +1748,8 @@ def vmax(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='MAXIMUM')
     return node._out
-
+''',
+'vfloor': r'''
 def vfloor(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1676,7 +1767,8 @@ def vfloor(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='FLOOR')
     return node._out
-
+''',
+'vceil': r'''
 def vceil(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1694,7 +1786,8 @@ def vceil(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='CEIL')
     return node._out
-
+''',
+'vfraction': r'''
 def vfraction(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1712,7 +1805,8 @@ def vfraction(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='FRACTION')
     return node._out
-
+''',
+'vmodulo': r'''
 def vmodulo(vector=None, vector_1=None):
     """ > Node <&Node Vector Math>
 
@@ -1731,7 +1825,8 @@ def vmodulo(vector=None, vector_1=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1}, operation='MODULO')
     return node._out
-
+''',
+'vwrap': r'''
 def vwrap(vector=None, max=None, min=None):
     """ > Node <&Node Vector Math>
 
@@ -1751,7 +1846,8 @@ def vwrap(vector=None, max=None, min=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': max, 'Vector_002': min}, operation='WRAP')
     return node._out
-
+''',
+'vsnap': r'''
 def vsnap(vector=None, increment=None):
     """ > Node <&Node Vector Math>
 
@@ -1770,7 +1866,8 @@ def vsnap(vector=None, increment=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': increment}, operation='SNAP')
     return node._out
-
+''',
+'vsin': r'''
 def vsin(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1788,7 +1885,8 @@ def vsin(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='SINE')
     return node._out
-
+''',
+'vcos': r'''
 def vcos(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1806,7 +1904,8 @@ def vcos(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='COSINE')
     return node._out
-
+''',
+'vtan': r'''
 def vtan(vector=None):
     """ > Node <&Node Vector Math>
 
@@ -1824,4 +1923,11 @@ def vtan(vector=None):
     """
     node = Node('Vector Math', sockets={'Vector': vector}, operation='TANGENT')
     return node._out
+''',
+}
+
+__all__ = list(FUNCTIONS.keys()) + ['tabulate']
 
+_table = MethodTable(FUNCTIONS, globals())
+__getattr__ = _table.module_getattr
+__dir__ = _table.module_dir
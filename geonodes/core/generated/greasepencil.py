@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class GreasePencil(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'domain_size': r'''
     def domain_size(self):
         """ > Node <&Node Domain Size>
 
@@ -21,7 +25,8 @@ class GreasePencil(Socket):
         """
         node = self._cache('Domain Size', sockets={'Geometry': self}, component='GREASEPENCIL')
         return node
-
+''',
+'to_curves': r'''
     def to_curves(self, layers_as_instances=None):
         """ > Node <&Node Grease Pencil to Curves>
 
@@ -40,7 +45,8 @@ class GreasePencil(Socket):
         """
         node = Node('Grease Pencil to Curves', sockets={'Grease Pencil': self, 'Selection': self._sel, 'Layers as Instances': layers_as_instances})
         return node._out
-
+''',
+'named_layer_selection': r'''
     @classmethod
     def named_layer_selection(cls, name=None):
         """ > Node <&Node Named Layer Selection>
@@ -55,7 +61,8 @@ class GreasePencil(Socket):
         """
         node = Node('Named Layer Selection', sockets={'Name': name})
         return node._out
-
+''',
+'merge_layers_by_name': r'''
     def merge_layers_by_name(self):
         """ > Node <&Node Merge Layers>
 
@@ -74,7 +81,8 @@ class GreasePencil(Socket):
         node = Node('Merge Layers', sockets={'Grease Pencil': self, 'Selection': self._sel}, mode='MERGE_BY_NAME')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'merge_layers_by_id': r'''
     def merge_layers_by_id(self, group_id=None):
         """ > Node <&Node Merge Layers>
 
@@ -97,7 +105,8 @@ class GreasePencil(Socket):
         node = Node('Merge Layers', sockets={'Grease Pencil': self, 'Selection': self._sel, 'Group ID': group_id}, mode='MERGE_BY_ID')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'merge_layers': r'''
     def merge_layers(self, mode='MERGE_BY_NAME'):
         """ > Node <&Node Merge Layers>
 
@@ -120,4 +129,7 @@ class GreasePencil(Socket):
         node = Node('Merge Layers', sockets={'Grease Pencil': self, 'Selection': self._sel}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(GreasePencil)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Image(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'info': r'''
     def info(self, frame=None):
         """ > Node <&Node Image Info>
 
@@ -24,7 +28,8 @@ class Image(Socket):
         """
         node = self._cache('Image Info', sockets={'Image': self, 'Frame': frame})
         return node
-
+''',
+'width': r'''
     def width(self, frame=None):
         """ > Node <&Node Image Info>
 
@@ -42,7 +47,8 @@ class Image(Socket):
         """
         node = self._cache('Image Info', sockets={'Image': self, 'Frame': frame})
         return node.width
-
+''',
+'height': r'''
     def height(self, frame=None):
         """ > Node <&Node Image Info>
 
@@ -60,7 +66,8 @@ class Image(Socket):
         """
         node = self._cache('Image Info', sockets={'Image': self, 'Frame': frame})
         return node.height
-
+''',
+'has_alpha': r'''
     def has_alpha(self, frame=None):
         """ > Node <&Node Image Info>
 
@@ -78,7 +85,8 @@ class Image(Socket):
         """
         node = self._cache('Image Info', sockets={'Image': self, 'Frame': frame})
         return node.has_alpha
-
+''',
+'frame_count': r'''
     def frame_count(self, frame=None):
         """ > Node <&Node Image Info>
 
@@ -96,7 +104,8 @@ class Image(Socket):
         """
         node = self._cache('Image Info', sockets={'Image': self, 'Frame': frame})
         return node.frame_count
-
+''',
+'fps': r'''
     def fps(self, frame=None):
         """ > Node <&Node Image Info>
 
@@ -114,4 +123,7 @@ class Image(Socket):
         """
         node = self._cache('Image Info', sockets={'Image': self, 'Frame': frame})
         return node.fps
+''',
+}
 
+MethodTable(METHODS, globals()).install(Image)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Instances(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'domain_size': r'''
     def domain_size(self):
         """ > Node <&Node Domain Size>
 
@@ -21,7 +25,8 @@ class Instances(Socket):
         """
         node = self._cache('Domain Size', sockets={'Geometry': self}, component='INSTANCES')
         return node
-
+''',
+'FromGeometry': r'''
     @classmethod
     def FromGeometry(cls, *geometry):
         """ > Node <&Node Geometry to Instance>
@@ -36,7 +41,8 @@ class Instances(Socket):
         """
         node = Node('Geometry to Instance', sockets={'Geometry': list(geometry)})
         return cls(node._out)
-
+''',
+'ImportOBJ': r'''
     @classmethod
     def ImportOBJ(cls, path=None):
         """ > Node <&Node Import OBJ>
@@ -51,7 +57,8 @@ class Instances(Socket):
         """
         node = Node('Import OBJ', sockets={'Path': path})
         return cls(node._out)
-
+''',
+'rotation': r'''
     @classmethod
     @property
     def rotation(cls):
@@ -63,7 +70,8 @@ class Instances(Socket):
         """
         node = Node('Instance Rotation', sockets={})
         return node._out
-
+''',
+'instance_scale': r'''
     @classmethod
     @property
     def instance_scale(cls):
@@ -75,7 +83,8 @@ class Instances(Socket):
         """
         node = Node('Instance Scale', sockets={})
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, position=None, radius=None):
         """ > Node <&Node Instances to Points>
 
@@ -95,7 +104,8 @@ class Instances(Socket):
         """
         node = Node('Instances to Points', sockets={'Instances': self, 'Selection': self._sel, 'Position': position, 'Radius': radius})
         return node._out
-
+''',
+'rotate': r'''
     def rotate(self, rotation=None, pivot_point=None, local_space=None):
         """ > Node <&Node Rotate Instances>
 
@@ -119,7 +129,8 @@ class Instances(Socket):
         node = Node('Rotate Instances', sockets={'Instances': self, 'Selection': self._sel, 'Rotation': rotation, 'Pivot Point': pivot_point, 'Local Space': local_space})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'scale': r'''
     def scale(self, scale=None, center=None, local_space=None):
         """ > Node <&Node Scale Instances>
 
@@ -143,7 +154,8 @@ class Instances(Socket):
         node = Node('Scale Instances', sockets={'Instances': self, 'Selection': self._sel, 'Scale': scale, 'Center': center, 'Local Space': local_space})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_transform': r'''
     def set_transform(self, transform=None):
         """ > Node <&Node Set Instance Transform>
 
@@ -165,7 +177,8 @@ class Instances(Socket):
         node = Node('Set Instance Transform', sockets={'Instances': self, 'Selection': self._sel, 'Transform': transform})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'translate': r'''
     def translate(self, translation=None, local_space=None):
         """ > Node <&Node Translate Instances>
 
@@ -188,7 +201,8 @@ class Instances(Socket):
         node = Node('Translate Instances', sockets={'Instances': self, 'Selection': self._sel, 'Translation': translation, 'Local Space': local_space})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'transform': r'''
     @property
     def transform(self):
         """ Property get node <Node Set Instance Transform>
@@ -217,4 +231,7 @@ class Instances(Socket):
         node = Node('Set Instance Transform', sockets={'Instances': self, 'Selection': self._sel, 'Transform': transform})
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(Instances)
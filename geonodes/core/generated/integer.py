@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Integer(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'less_than': r'''
     def less_than(self, b=None):
         """ > Node <&Node Compare>
 
@@ -27,7 +31,8 @@ class Integer(Socket):
         """
         node = Node('Compare', sockets={'A_INT': self, 'B_INT': b}, data_type='INT', mode='ELEMENT', operation='LESS_THAN')
         return node._out
-
+''',
+'less_equal': r'''
     def less_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -48,7 +53,8 @@ class Integer(Socket):
         """
         node = Node('Compare', sockets={'A_INT': self, 'B_INT': b}, data_type='INT', mode='ELEMENT', operation='LESS_EQUAL')
         return node._out
-
+''',
+'greater_than': r'''
     def greater_than(self, b=None):
         """ > Node <&Node Compare>
 
@@ -69,7 +75,8 @@ class Integer(Socket):
         """
         node = Node('Compare', sockets={'A_INT': self, 'B_INT': b}, data_type='INT', mode='ELEMENT', operation='GREATER_THAN')
         return node._out
-
+''',
+'greater_equal': r'''
     def greater_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -90,7 +97,8 @@ class Integer(Socket):
         """
         node = Node('Compare', sockets={'A_INT': self, 'B_INT': b}, data_type='INT', mode='ELEMENT', operation='GREATER_EQUAL')
         return node._out
-
+''',
+'equal': r'''
     def equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -111,7 +119,8 @@ class Integer(Socket):
         """
         node = Node('Compare', sockets={'A_INT': self, 'B_INT': b}, data_type='INT', mode='ELEMENT', operation='EQUAL')
         return node._out
-
+''',
+'not_equal': r'''
     def not_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -132,7 +141,8 @@ class Integer(Socket):
         """
         node = Node('Compare', sockets={'A_INT': self, 'B_INT': b}, data_type='INT', mode='ELEMENT', operation='NOT_EQUAL')
         return node._out
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -151,7 +161,8 @@ class Integer(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='INT')
         return node._out
-
+''',
+'add': r'''
     def add(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -170,7 +181,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='ADD')
         return node._out
-
+''',
+'subtract': r'''
     def subtract(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -189,7 +201,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='SUBTRACT')
         return node._out
-
+''',
+'multiply': r'''
     def multiply(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -208,7 +221,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='MULTIPLY')
         return node._out
-
+''',
+'divide': r'''
     def divide(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -227,7 +241,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='DIVIDE')
         return node._out
-
+''',
+'multiply_add': r'''
     def multiply_add(self, multiplier=None, addend=None):
         """ > Node <&Node Integer Math>
 
@@ -247,7 +262,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': multiplier, 'Value_002': addend}, operation='MULTIPLY_ADD')
         return node._out
-
+''',
+'abs': r'''
     def abs(self):
         """ > Node <&Node Integer Math>
 
@@ -262,7 +278,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self}, operation='ABSOLUTE')
         return node._out
-
+''',
+'negate': r'''
     def negate(self):
         """ > Node <&Node Integer Math>
 
@@ -277,7 +294,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self}, operation='NEGATE')
         return node._out
-
+''',
+'power': r'''
     def power(self, exponent=None):
         """ > Node <&Node Integer Math>
 
@@ -296,7 +314,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': exponent}, operation='POWER')
         return node._out
-
+''',
+'min': r'''
     def min(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -315,7 +334,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='MINIMUM')
         return node._out
-
+''',
+'max': r'''
     def max(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -334,7 +354,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='MAXIMUM')
         return node._out
-
+''',
+'sign': r'''
     def sign(self):
         """ > Node <&Node Integer Math>
 
@@ -349,7 +370,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self}, operation='SIGN')
         return node._out
-
+''',
+'divide_round': r'''
     def divide_round(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -368,7 +390,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='DIVIDE_ROUND')
         return node._out
-
+''',
+'divide_floor': r'''
     def divide_floor(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -387,7 +410,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='DIVIDE_FLOOR')
         return node._out
-
+''',
+'divide_ceil': r'''
     def divide_ceil(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -406,7 +430,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='DIVIDE_CEIL')
         return node._out
-
+''',
+'floored_modulo': r'''
     def floored_modulo(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -425,7 +450,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='FLOORED_MODULO')
         return node._out
-
+''',
+'modulo': r'''
     def modulo(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -444,7 +470,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='MODULO')
         return node._out
-
+''',
+'gcd': r'''
     def gcd(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -463,7 +490,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='GCD')
         return node._out
-
+''',
+'lcm': r'''
     def lcm(self, value=None):
         """ > Node <&Node Integer Math>
 
@@ -482,7 +510,8 @@ class Integer(Socket):
         """
         node = Node('Integer Math', sockets={'Value': self, 'Value_001': value}, operation='LCM')
         return node._out
-
+''',
+'Random': r'''
     @classmethod
     def Random(cls, min=None, max=None, id=None, seed=None):
         """ > Node <&Node Random Value>
@@ -504,7 +533,8 @@ class Integer(Socket):
         """
         node = Node('Random Value', sockets={'Min_002': min, 'Max_002': max, 'ID': id, 'Seed': seed}, data_type='INT')
         return cls(node._out)
-
+''',
+'to_string': r'''
     def to_string(self):
         """ > Node <&Node Value to String>
 
@@ -519,7 +549,8 @@ class Integer(Socket):
         """
         node = Node('Value to String', sockets={'Value': self}, data_type='INT')
         return node._out
-
+''',
+'blur': r'''
     def blur(self, iterations=None, weight=None):
         """ > Node <&Node Blur Attribute>
 
@@ -539,7 +570,8 @@ class Integer(Socket):
         """
         node = Node('Blur Attribute', sockets={'Value': self, 'Iterations': iterations, 'Weight': weight}, data_type='INT')
         return node._out
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -558,7 +590,8 @@ class Integer(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='INT')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -577,7 +610,8 @@ class Integer(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='INT')
         return cls(node._out)
-
+''',
+'sample_grid': r'''
     def sample_grid(self, position=None, interpolation_mode='TRILINEAR'):
         """ > Node <&Node Sample Grid>
 
@@ -598,7 +632,8 @@ class Integer(Socket):
         utils.check_enum_arg('Sample Grid', 'interpolation_mode', interpolation_mode, 'sample_grid', ('NEAREST', 'TRILINEAR', 'TRIQUADRATIC'))
         node = Node('Sample Grid', sockets={'Grid': self, 'Position': position}, data_type='INT', interpolation_mode=interpolation_mode)
         return node._out
-
+''',
+'sample_grid_index': r'''
     def sample_grid_index(self, x=None, y=None, z=None):
         """ > Node <&Node Sample Grid Index>
 
@@ -619,4 +654,7 @@ class Integer(Socket):
         """
         node = Node('Sample Grid Index', sockets={'Grid': self, 'X': x, 'Y': y, 'Z': z}, data_type='INT')
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Integer)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Layer(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'accumulate_field': r'''
     @classmethod
     def accumulate_field(cls, value=None, group_id=None):
         """ > Node <&Node Accumulate Field>
@@ -28,7 +32,8 @@ class Layer(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'MATRIX': 'TRANSFORM'}, 'Layer.accumulate_field', 'value')
         node = Node('Accumulate Field', sockets={'Value': value, 'Group Index': group_id}, data_type=data_type, domain='LAYER')
         return node._out
-
+''',
+'attribute_statistic': r'''
     def attribute_statistic(self, attribute=None):
         """ > Node <&Node Attribute Statistic>
 
@@ -48,9 +53,10 @@ class Layer(Socket):
         - node [mean (Float), median (Float), sum (Float), min (Float), max (Float), range (Float), standard_deviation (Float), variance (Float)]
         """
         data_type = utils.get_argument_data_type(attribute, {'VALUE': 'FLOAT', 'VECTOR': 'FLOAT_VECTOR'}, 'Layer.attribute_statistic', 'attribute')
-        node = Node('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='LAYER')
+        node = self._cache('Attribute Statistic', sockets={'Geometry': self, 'Selection': self._sel, 'Attribute': attribute}, data_type=data_type, domain='LAYER')
         return node
-
+''',
+'delete_geometry_all': r'''
     def delete_geometry_all(self):
         """ > Node <&Node Delete Geometry>
 
@@ -70,7 +76,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry_edge_face': r'''
     def delete_geometry_edge_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -90,7 +97,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode='EDGE_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry_only_face': r'''
     def delete_geometry_only_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -110,7 +118,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode='ONLY_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_geometry': r'''
     def delete_geometry(self, mode='ALL'):
         """ > Node <&Node Delete Geometry>
 
@@ -134,7 +143,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_all': r'''
     def delete_all(self):
         """ > Node <&Node Delete Geometry>
 
@@ -154,7 +164,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode='ALL')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_edge_face': r'''
     def delete_edge_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -174,7 +185,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode='EDGE_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete_only_face': r'''
     def delete_only_face(self):
         """ > Node <&Node Delete Geometry>
 
@@ -194,7 +206,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode='ONLY_FACE')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'delete': r'''
     def delete(self, mode='ALL'):
         """ > Node <&Node Delete Geometry>
 
@@ -218,7 +231,8 @@ class Layer(Socket):
         node = Node('Delete Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER', mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'duplicate': r'''
     def duplicate(self, amount=None):
         """ > Node <&Node Duplicate Elements>
 
@@ -241,7 +255,8 @@ class Layer(Socket):
         node = Node('Duplicate Elements', sockets={'Geometry': self, 'Selection': self._sel, 'Amount': amount}, domain='LAYER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'evaluate_at_index': r'''
     @classmethod
     def evaluate_at_index(cls, index=None, value=None):
         """ > Node <&Node Evaluate at Index>
@@ -263,7 +278,8 @@ class Layer(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Layer.evaluate_at_index', 'value')
         node = Node('Evaluate at Index', sockets={'Index': index, 'Value': value}, data_type=data_type, domain='LAYER')
         return node._out
-
+''',
+'evaluate_on_domain': r'''
     @classmethod
     def evaluate_on_domain(cls, value=None):
         """ > Node <&Node Evaluate on Domain>
@@ -284,7 +300,8 @@ class Layer(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Layer.evaluate_on_domain', 'value')
         node = Node('Evaluate on Domain', sockets={'Value': value}, data_type=data_type, domain='LAYER')
         return node._out
-
+''',
+'named_selection': r'''
     @classmethod
     def named_selection(cls, name=None):
         """ > Node <&Node Named Layer Selection>
@@ -299,7 +316,8 @@ class Layer(Socket):
         """
         node = Node('Named Layer Selection', sockets={'Name': name})
         return node._out
-
+''',
+'sample_index': r'''
     def sample_index(self, value=None, index=None, clamp=False):
         """ > Node <&Node Sample Index>
 
@@ -320,9 +338,10 @@ class Layer(Socket):
         - Float
         """
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Layer.sample_index', 'value')
-        node = Node('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='LAYER')
+        node = self._cache('Sample Index', sockets={'Geometry': self, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain='LAYER')
         return node._out
-
+''',
+'separate': r'''
     def separate(self):
         """ > Node <&Node Separate Geometry>
 
@@ -341,7 +360,8 @@ class Layer(Socket):
         node = Node('Separate Geometry', sockets={'Geometry': self, 'Selection': self._sel}, domain='LAYER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'split_to_instances': r'''
     def split_to_instances(self, group_id=None):
         """ > Node <&Node Split to Instances>
 
@@ -361,7 +381,8 @@ class Layer(Socket):
         """
         node = Node('Split to Instances', sockets={'Geometry': self, 'Selection': self._sel, 'Group ID': group_id}, domain='LAYER')
         return node._out
-
+''',
+'store_named_attribute': r'''
     def store_named_attribute(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -387,7 +408,8 @@ class Layer(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='LAYER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'store': r'''
     def store(self, name=None, value=None):
         """ > Node <&Node Store Named Attribute>
 
@@ -413,7 +435,8 @@ class Layer(Socket):
         node = Node('Store Named Attribute', sockets={'Geometry': self, 'Selection': self._sel, 'Name': name, 'Value': value}, data_type=data_type, domain='LAYER')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'viewer': r'''
     def viewer(self, value=None):
         """ > Node <&Node Viewer>
 
@@ -431,4 +454,7 @@ class Layer(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Layer.viewer', 'value')
         node = Node('Viewer', sockets={'Geometry': self, 'Value': value}, data_type=data_type, domain='LAYER')
         return
+''',
+}
 
+MethodTable(METHODS, globals()).install(Layer)
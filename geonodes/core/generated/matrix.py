@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Matrix(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'Combine': r'''
     @classmethod
     def Combine(cls, column_1_row_1=None, column_1_row_2=None, column_1_row_3=None, column_1_row_4=None, column_2_row_1=None, column_2_row_2=None, column_2_row_3=None, column_2_row_4=None, column_3_row_1=None, column_3_row_2=None, column_3_row_3=None, column_3_row_4=None, column_4_row_1=None, column_4_row_2=None, column_4_row_3=None, column_4_row_4=None):
         """ > Node <&Node Combine Matrix>
@@ -36,7 +40,8 @@ class Matrix(Socket):
         """
         node = Node('Combine Matrix', sockets={'Column 1 Row 1': column_1_row_1, 'Column 1 Row 2': column_1_row_2, 'Column 1 Row 3': column_1_row_3, 'Column 1 Row 4': column_1_row_4, 'Column 2 Row 1': column_2_row_1, 'Column 2 Row 2': column_2_row_2, 'Column 2 Row 3': column_2_row_3, 'Column 2 Row 4': column_2_row_4, 'Column 3 Row 1': column_3_row_1, 'Column 3 Row 2': column_3_row_2, 'Column 3 Row 3': column_3_row_3, 'Column 3 Row 4': column_3_row_4, 'Column 4 Row 1': column_4_row_1, 'Column 4 Row 2': column_4_row_2, 'Column 4 Row 3': column_4_row_3, 'Column 4 Row 4': column_4_row_4})
         return cls(node._out)
-
+''',
+'CombineTransform': r'''
     @classmethod
     def CombineTransform(cls, translation=None, rotation=None, scale=None):
         """ > Node <&Node Combine Transform>
@@ -53,7 +58,8 @@ class Matrix(Socket):
         """
         node = Node('Combine Transform', sockets={'Translation': translation, 'Rotation': rotation, 'Scale': scale})
         return cls(node._out)
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -72,7 +78,8 @@ class Matrix(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='MATRIX')
         return node._out
-
+''',
+'invert': r'''
     def invert(self):
         """ > Node <&Node Invert Matrix>
 
@@ -86,7 +93,8 @@ class Matrix(Socket):
         """
         node = Node('Invert Matrix', sockets={'Matrix': self})
         return node._out
-
+''',
+'determinant': r'''
     def determinant(self):
         """ > Node <&Node Matrix Determinant>
 
@@ -100,7 +108,8 @@ class Matrix(Socket):
         """
         node = Node('Matrix Determinant', sockets={'Matrix': self})
         return node._out
-
+''',
+'multiply': r'''
     def multiply(self, matrix=None):
         """ > Node <&Node Multiply Matrices>
 
@@ -118,7 +127,8 @@ class Matrix(Socket):
         """
         node = Node('Multiply Matrices', sockets={'Matrix': self, 'Matrix_001': matrix})
         return node._out
-
+''',
+'project_point': r'''
     def project_point(self, vector=None):
         """ > Node <&Node Project Point>
 
@@ -136,7 +146,8 @@ class Matrix(Socket):
         """
         node = Node('Project Point', sockets={'Vector': vector, 'Transform': self})
         return node._out
-
+''',
+'separate': r'''
     @property
     def separate(self):
         """ > Node <&Node Separate Matrix>
@@ -151,7 +162,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return (node.column_1_row_1, node.column_1_row_2, node.column_1_row_3, node.column_1_row_4, node.column_2_row_1, node.column_2_row_2, node.column_2_row_3, node.column_2_row_4, node.column_3_row_1, node.column_3_row_2, node.column_3_row_3, node.column_3_row_4, node.column_4_row_1, node.column_4_row_2, node.column_4_row_3, node.column_4_row_4)
-
+''',
+'separate_matrix': r'''
     def separate_matrix(self):
         """ > Node <&Node Separate Matrix>
 
@@ -165,7 +177,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node
-
+''',
+'column_1_row_1': r'''
     @property
     def column_1_row_1(self):
         """ > Node <&Node Separate Matrix>
@@ -180,7 +193,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_1_row_1
-
+''',
+'column_1_row_2': r'''
     @property
     def column_1_row_2(self):
         """ > Node <&Node Separate Matrix>
@@ -195,7 +209,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_1_row_2
-
+''',
+'column_1_row_3': r'''
     @property
     def column_1_row_3(self):
         """ > Node <&Node Separate Matrix>
@@ -210,7 +225,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_1_row_3
-
+''',
+'column_1_row_4': r'''
     @property
     def column_1_row_4(self):
         """ > Node <&Node Separate Matrix>
@@ -225,7 +241,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_1_row_4
-
+''',
+'column_2_row_1': r'''
     @property
     def column_2_row_1(self):
         """ > Node <&Node Separate Matrix>
@@ -240,7 +257,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_2_row_1
-
+''',
+'column_2_row_2': r'''
     @property
     def column_2_row_2(self):
         """ > Node <&Node Separate Matrix>
@@ -255,7 +273,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_2_row_2
-
+''',
+'column_2_row_3': r'''
     @property
     def column_2_row_3(self):
         """ > Node <&Node Separate Matrix>
@@ -270,7 +289,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_2_row_3
-
+''',
+'column_2_row_4': r'''
     @property
     def column_2_row_4(self):
         """ > Node <&Node Separate Matrix>
@@ -285,7 +305,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_2_row_4
-
+''',
+'column_3_row_1': r'''
     @property
     def column_3_row_1(self):
         """ > Node <&Node Separate Matrix>
@@ -300,7 +321,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_3_row_1
-
+''',
+'column_3_row_2': r'''
     @property
     def column_3_row_2(self):
         """ > Node <&Node Separate Matrix>
@@ -315,7 +337,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_3_row_2
-
+''',
+'column_3_row_3': r'''
     @property
     def column_3_row_3(self):
         """ > Node <&Node Separate Matrix>
@@ -330,7 +353,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_3_row_3
-
+''',
+'column_3_row_4': r'''
     @property
     def column_3_row_4(self):
         """ > Node <&Node Separate Matrix>
@@ -345,7 +369,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_3_row_4
-
+''',
+'column_4_row_1': r'''
     @property
     def column_4_row_1(self):
         """ > Node <&Node Separate Matrix>
@@ -360,7 +385,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_4_row_1
-
+''',
+'column_4_row_2': r'''
     @property
     def column_4_row_2(self):
         """ > Node <&Node Separate Matrix>
@@ -375,7 +401,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_4_row_2
-
+''',
+'column_4_row_3': r'''
     @property
     def column_4_row_3(self):
         """ > Node <&Node Separate Matrix>
@@ -390,7 +417,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_4_row_3
-
+''',
+'column_4_row_4': r'''
     @property
     def column_4_row_4(self):
         """ > Node <&Node Separate Matrix>
@@ -405,7 +433,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Matrix', sockets={'Matrix': self})
         return node.column_4_row_4
-
+''',
+'trs': r'''
     @property
     def trs(self):
         """ > Node <&Node Separate Transform>
@@ -420,7 +449,8 @@ class Matrix(Socket):
         """
         node = Node('Separate Transform', sockets={'Transform': self})
         return (node.translation, node.rotation, node.scale)
-
+''',
+'separate_transform': r'''
     def separate_transform(self):
         """ > Node <&Node Separate Transform>
 
@@ -434,7 +464,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Transform', sockets={'Transform': self})
         return node
-
+''',
+'translation': r'''
     @property
     def translation(self):
         """ > Node <&Node Separate Transform>
@@ -449,7 +480,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Transform', sockets={'Transform': self})
         return node.translation
-
+''',
+'rotation': r'''
     @property
     def rotation(self):
         """ > Node <&Node Separate Transform>
@@ -464,7 +496,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Transform', sockets={'Transform': self})
         return node.rotation
-
+''',
+'scale': r'''
     @property
     def scale(self):
         """ > Node <&Node Separate Transform>
@@ -479,7 +512,8 @@ class Matrix(Socket):
         """
         node = self._cache('Separate Transform', sockets={'Transform': self})
         return node.scale
-
+''',
+'transform_direction': r'''
     def transform_direction(self, direction=None):
         """ > Node <&Node Transform Direction>
 
@@ -497,7 +531,8 @@ class Matrix(Socket):
         """
         node = Node('Transform Direction', sockets={'Direction': direction, 'Transform': self})
         return node._out
-
+''',
+'transform_point': r'''
     def transform_point(self, vector=None):
         """ > Node <&Node Transform Point>
 
@@ -515,7 +550,8 @@ class Matrix(Socket):
         """
         node = Node('Transform Point', sockets={'Vector': vector, 'Transform': self})
         return node._out
-
+''',
+'transpose': r'''
     def transpose(self):
         """ > Node <&Node Transpose Matrix>
 
@@ -529,7 +565,8 @@ class Matrix(Socket):
         """
         node = Node('Transpose Matrix', sockets={'Matrix': self})
         return node._out
-
+''',
+'transform_gizmo': r'''
     def transform_gizmo(self, *value, position=None, rotation=None, use_rotation_x=True, use_rotation_y=True, use_rotation_z=True, use_scale_x=True, use_scale_y=True, use_scale_z=True, use_translation_x=True, use_translation_y=True, use_translation_z=True):
         """ > Node <&Node Transform Gizmo>
 
@@ -554,7 +591,8 @@ class Matrix(Socket):
         """
         node = Node('Transform Gizmo', sockets={'Value': [self] + list(value), 'Position': position, 'Rotation': rotation}, use_rotation_x=use_rotation_x, use_rotation_y=use_rotation_y, use_rotation_z=use_rotation_z, use_scale_x=use_scale_x, use_scale_y=use_scale_y, use_scale_z=use_scale_z, use_translation_x=use_translation_x, use_translation_y=use_translation_y, use_translation_z=use_translation_z)
         return node._out
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -573,7 +611,8 @@ class Matrix(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT4X4')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -592,4 +631,7 @@ class Matrix(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT4X4')
         return cls(node._out)
+''',
+}
 
+MethodTable(METHODS, globals()).install(Matrix)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Mesh(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'domain_size': r'''
     def domain_size(self):
         """ > Node <&Node Domain Size>
 
@@ -21,7 +25,8 @@ class Mesh(Socket):
         """
         node = self._cache('Domain Size', sockets={'Geometry': self}, component='MESH')
         return node
-
+''',
+'corners_of_edge': r'''
     @classmethod
     def corners_of_edge(cls, edge_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Edge>
@@ -38,7 +43,8 @@ class Mesh(Socket):
         """
         node = Node('Corners of Edge', sockets={'Edge Index': edge_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'corners_of_face': r'''
     @classmethod
     def corners_of_face(cls, face_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Face>
@@ -55,7 +61,8 @@ class Mesh(Socket):
         """
         node = Node('Corners of Face', sockets={'Face Index': face_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'corners_of_vertex': r'''
     @classmethod
     def corners_of_vertex(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Vertex>
@@ -72,7 +79,8 @@ class Mesh(Socket):
         """
         node = Node('Corners of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'distribute_points_on_faces': r'''
     def distribute_points_on_faces(self, density=None, seed=None, distribute_method='RANDOM', use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
 
@@ -95,7 +103,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Distribute Points on Faces', 'distribute_method', distribute_method, 'distribute_points_on_faces', ('RANDOM', 'POISSON'))
         node = Node('Distribute Points on Faces', sockets={'Mesh': self, 'Selection': self._sel, 'Density': density, 'Seed': seed}, distribute_method=distribute_method, use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'distribute_points_on_faces_random': r'''
     def distribute_points_on_faces_random(self, density=None, seed=None, use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
 
@@ -117,7 +126,8 @@ class Mesh(Socket):
         """
         node = Node('Distribute Points on Faces', sockets={'Mesh': self, 'Selection': self._sel, 'Density': density, 'Seed': seed}, distribute_method='RANDOM', use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'distribute_points_on_faces_poisson': r'''
     def distribute_points_on_faces_poisson(self, distance_min=None, density_max=None, density_factor=None, seed=None, use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
 
@@ -141,7 +151,8 @@ class Mesh(Socket):
         """
         node = Node('Distribute Points on Faces', sockets={'Mesh': self, 'Selection': self._sel, 'Distance Min': distance_min, 'Density Max': density_max, 'Density Factor': density_factor, 'Seed': seed}, distribute_method='POISSON', use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'dual': r'''
     def dual(self, keep_boundaries=None):
         """ > Node <&Node Dual Mesh>
 
@@ -162,7 +173,8 @@ class Mesh(Socket):
         node = Node('Dual Mesh', sockets={'Mesh': self, 'Keep Boundaries': keep_boundaries})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'edge_paths_to_curves': r'''
     def edge_paths_to_curves(self, start_vertices=None, next_vertex_index=None):
         """ > Node <&Node Edge Paths to Curves>
 
@@ -181,7 +193,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Paths to Curves', sockets={'Mesh': self, 'Start Vertices': start_vertices, 'Next Vertex Index': next_vertex_index})
         return node._out
-
+''',
+'edge_paths_to_selection': r'''
     @classmethod
     def edge_paths_to_selection(cls, start_vertices=None, next_vertex_index=None):
         """ > Node <&Node Edge Paths to Selection>
@@ -197,7 +210,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Paths to Selection', sockets={'Start Vertices': start_vertices, 'Next Vertex Index': next_vertex_index})
         return node._out
-
+''',
+'edges_of_corner': r'''
     @classmethod
     def edges_of_corner(cls, corner_index=None):
         """ > Node <&Node Edges of Corner>
@@ -212,7 +226,8 @@ class Mesh(Socket):
         """
         node = Node('Edges of Corner', sockets={'Corner Index': corner_index})
         return node._out
-
+''',
+'edges_of_vertex': r'''
     @classmethod
     def edges_of_vertex(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Edges of Vertex>
@@ -229,7 +244,8 @@ class Mesh(Socket):
         """
         node = Node('Edges of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'edges_to_face_groups': r'''
     @classmethod
     def edges_to_face_groups(cls, boundary_edges=None):
         """ > Node <&Node Edges to Face Groups>
@@ -244,7 +260,8 @@ class Mesh(Socket):
         """
         node = Node('Edges to Face Groups', sockets={'Boundary Edges': boundary_edges})
         return node._out
-
+''',
+'extrude_vertices': r'''
     def extrude_vertices(self, offset=None, offset_scale=None):
         """ > Node <&Node Extrude Mesh>
 
@@ -268,7 +285,8 @@ class Mesh(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale}, mode='VERTICES')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'extrude_edges': r'''
     def extrude_edges(self, offset=None, offset_scale=None):
         """ > Node <&Node Extrude Mesh>
 
@@ -292,7 +310,8 @@ class Mesh(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale}, mode='EDGES')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'extrude_faces': r'''
     def extrude_faces(self, offset=None, offset_scale=None, individual=None):
         """ > Node <&Node Extrude Mesh>
 
@@ -317,7 +336,8 @@ class Mesh(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale, 'Individual': individual}, mode='FACES')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'extrude': r'''
     def extrude(self, offset=None, offset_scale=None, individual=None, mode='FACES'):
         """ > Node <&Node Extrude Mesh>
 
@@ -343,7 +363,8 @@ class Mesh(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale, 'Individual': individual}, mode=mode)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'face_of_corner': r'''
     @classmethod
     def face_of_corner(cls, corner_index=None):
         """ > Node <&Node Face of Corner>
@@ -358,7 +379,8 @@ class Mesh(Socket):
         """
         node = Node('Face of Corner', sockets={'Corner Index': corner_index})
         return node._out
-
+''',
+'flip_faces': r'''
     def flip_faces(self):
         """ > Node <&Node Flip Faces>
 
@@ -376,7 +398,8 @@ class Mesh(Socket):
         node = Node('Flip Faces', sockets={'Mesh': self, 'Selection': self._sel})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'ImportPLY': r'''
     @classmethod
     def ImportPLY(cls, path=None):
         """ > Node <&Node Import PLY>
@@ -391,7 +414,8 @@ class Mesh(Socket):
         """
         node = Node('Import PLY', sockets={'Path': path})
         return cls(node._out)
-
+''',
+'ImportSTL': r'''
     @classmethod
     def ImportSTL(cls, path=None):
         """ > Node <&Node Import STL>
@@ -406,7 +430,8 @@ class Mesh(Socket):
         """
         node = Node('Import STL', sockets={'Path': path})
         return cls(node._out)
-
+''',
+'edge_angle': r'''
     @classmethod
     def edge_angle(cls):
         """ > Node <&Node Edge Angle>
@@ -417,7 +442,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Angle', sockets={})
         return node
-
+''',
+'unsigned_edge_angle': r'''
     @classmethod
     @property
     def unsigned_edge_angle(cls):
@@ -429,7 +455,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Angle', sockets={})
         return node.unsigned_angle
-
+''',
+'signed_edge_angle': r'''
     @classmethod
     @property
     def signed_edge_angle(cls):
@@ -441,7 +468,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Angle', sockets={})
         return node.signed_angle
-
+''',
+'edge_neighbors': r'''
     @classmethod
     @property
     def edge_neighbors(cls):
@@ -453,7 +481,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Neighbors', sockets={})
         return node._out
-
+''',
+'edge_vertices': r'''
     @classmethod
     def edge_vertices(cls):
         """ > Node <&Node Edge Vertices>
@@ -464,7 +493,8 @@ class Mesh(Socket):
         """
         node = Node('Edge Vertices', sockets={})
         return node
-
+''',
+'face_area': r'''
     @classmethod
     @property
     def face_area(cls):
@@ -476,7 +506,8 @@ class Mesh(Socket):
         """
         node = Node('Face Area', sockets={})
         return node._out
-
+''',
+'is_face_planar': r'''
     @classmethod
     def is_face_planar(cls, threshold=None):
         """ > Node <&Node Is Face Planar>
@@ -491,7 +522,8 @@ class Mesh(Socket):
         """
         node = Node('Is Face Planar', sockets={'Threshold': threshold})
         return node._out
-
+''',
+'face_neighbors': r'''
     @classmethod
     def face_neighbors(cls):
         """ > Node <&Node Face Neighbors>
@@ -502,7 +534,8 @@ class Mesh(Socket):
         """
         node = Node('Face Neighbors', sockets={})
         return node
-
+''',
+'mesh_island': r'''
     @classmethod
     def mesh_island(cls):
         """ > Node <&Node Mesh Island>
@@ -513,7 +546,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh Island', sockets={})
         return node
-
+''',
+'island_index': r'''
     @classmethod
     @property
     def island_index(cls):
@@ -525,7 +559,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh Island', sockets={})
         return node.island_index
-
+''',
+'island_count': r'''
     @classmethod
     @property
     def island_count(cls):
@@ -537,7 +572,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh Island', sockets={})
         return node.island_count
-
+''',
+'vertex_neighbors': r'''
     @classmethod
     def vertex_neighbors(cls):
         """ > Node <&Node Vertex Neighbors>
@@ -548,7 +584,8 @@ class Mesh(Socket):
         """
         node = Node('Vertex Neighbors', sockets={})
         return node
-
+''',
+'normal': r'''
     @classmethod
     @property
     def normal(cls):
@@ -560,7 +597,8 @@ class Mesh(Socket):
         """
         node = Node('Normal', sockets={})
         return node._out
-
+''',
+'shortest_edge_paths': r'''
     @classmethod
     def shortest_edge_paths(cls, end_vertex=None, edge_cost=None):
         """ > Node <&Node Shortest Edge Paths>
@@ -576,7 +614,8 @@ class Mesh(Socket):
         """
         node = Node('Shortest Edge Paths', sockets={'End Vertex': end_vertex, 'Edge Cost': edge_cost})
         return node._out
-
+''',
+'material_selection': r'''
     @classmethod
     def material_selection(cls, material=None):
         """ > Node <&Node Material Selection>
@@ -591,7 +630,8 @@ class Mesh(Socket):
         """
         node = Node('Material Selection', sockets={'Material': material})
         return node._out
-
+''',
+'boolean': r'''
     def boolean(self, *mesh_2, self_intersection=None, hole_tolerant=None, operation='DIFFERENCE', solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
 
@@ -618,7 +658,8 @@ class Mesh(Socket):
         node = Node('Mesh Boolean', sockets={'Mesh 1': self, 'Mesh 2': list(mesh_2), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation=operation, solver=solver)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'Boolean': r'''
     @classmethod
     def Boolean(cls, *mesh_2, mesh_1=None, self_intersection=None, hole_tolerant=None, operation='DIFFERENCE', solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
@@ -640,7 +681,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Boolean', 'solver', solver, 'Boolean', ('EXACT', 'FLOAT'))
         node = Node('Mesh Boolean', sockets={'Mesh 1': mesh_1, 'Mesh 2': list(mesh_2), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation=operation, solver=solver)
         return cls(node._out)
-
+''',
+'intersect': r'''
     def intersect(self, *mesh, self_intersection=None, hole_tolerant=None, solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
 
@@ -665,7 +707,8 @@ class Mesh(Socket):
         node = Node('Mesh Boolean', sockets={'Mesh 2': [self] + list(mesh), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation='INTERSECT', solver=solver)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'union': r'''
     def union(self, *mesh, self_intersection=None, hole_tolerant=None, solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
 
@@ -690,7 +733,8 @@ class Mesh(Socket):
         node = Node('Mesh Boolean', sockets={'Mesh 2': [self] + list(mesh), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation='UNION', solver=solver)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'difference': r'''
     def difference(self, *mesh_2, self_intersection=None, hole_tolerant=None, solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
 
@@ -716,7 +760,8 @@ class Mesh(Socket):
         node = Node('Mesh Boolean', sockets={'Mesh 1': self, 'Mesh 2': list(mesh_2), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation='DIFFERENCE', solver=solver)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'Intersect': r'''
     @classmethod
     def Intersect(cls, *mesh, self_intersection=None, hole_tolerant=None, solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
@@ -739,7 +784,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Boolean', 'solver', solver, 'Intersect', ('EXACT', 'FLOAT'))
         node = Node('Mesh Boolean', sockets={'Mesh 2': list(mesh), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation='INTERSECT', solver=solver)
         return cls(node._out)
-
+''',
+'Union': r'''
     @classmethod
     def Union(cls, *mesh, self_intersection=None, hole_tolerant=None, solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
@@ -762,7 +808,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Boolean', 'solver', solver, 'Union', ('EXACT', 'FLOAT'))
         node = Node('Mesh Boolean', sockets={'Mesh 2': list(mesh), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation='UNION', solver=solver)
         return cls(node._out)
-
+''',
+'Difference': r'''
     @classmethod
     def Difference(cls, *mesh_2, mesh_1=None, self_intersection=None, hole_tolerant=None, solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
@@ -786,7 +833,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Boolean', 'solver', solver, 'Difference', ('EXACT', 'FLOAT'))
         node = Node('Mesh Boolean', sockets={'Mesh 1': mesh_1, 'Mesh 2': list(mesh_2), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation='DIFFERENCE', solver=solver)
         return cls(node._out)
-
+''',
+'Circle': r'''
     @classmethod
     def Circle(cls, vertices=None, radius=None, fill_type='NONE'):
         """ > Node <&Node Mesh Circle>
@@ -804,7 +852,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Circle', 'fill_type', fill_type, 'Circle', ('NONE', 'NGON', 'TRIANGLE_FAN'))
         node = Node('Mesh Circle', sockets={'Vertices': vertices, 'Radius': radius}, fill_type=fill_type)
         return cls(node._out)
-
+''',
+'Cone': r'''
     @classmethod
     def Cone(cls, vertices=None, side_segments=None, fill_segments=None, radius_top=None, radius_bottom=None, depth=None, fill_type='NGON'):
         """ > Node <&Node Cone>
@@ -826,7 +875,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Cone', 'fill_type', fill_type, 'Cone', ('NONE', 'NGON', 'TRIANGLE_FAN'))
         node = Node('Cone', sockets={'Vertices': vertices, 'Side Segments': side_segments, 'Fill Segments': fill_segments, 'Radius Top': radius_top, 'Radius Bottom': radius_bottom, 'Depth': depth}, fill_type=fill_type)
         return cls(node._out)
-
+''',
+'Cube': r'''
     @classmethod
     def Cube(cls, size=None, vertices_x=None, vertices_y=None, vertices_z=None):
         """ > Node <&Node Cube>
@@ -844,7 +894,8 @@ class Mesh(Socket):
         """
         node = Node('Cube', sockets={'Size': size, 'Vertices X': vertices_x, 'Vertices Y': vertices_y, 'Vertices Z': vertices_z})
         return cls(node._out)
-
+''',
+'Cylinder': r'''
     @classmethod
     def Cylinder(cls, vertices=None, side_segments=None, fill_segments=None, radius=None, depth=None, fill_type='NGON'):
         """ > Node <&Node Cylinder>
@@ -865,7 +916,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Cylinder', 'fill_type', fill_type, 'Cylinder', ('NONE', 'NGON', 'TRIANGLE_FAN'))
         node = Node('Cylinder', sockets={'Vertices': vertices, 'Side Segments': side_segments, 'Fill Segments': fill_segments, 'Radius': radius, 'Depth': depth}, fill_type=fill_type)
         return cls(node._out)
-
+''',
+'face_group_boundaries': r'''
     @classmethod
     def face_group_boundaries(cls, face_group_id=None):
         """ > Node <&Node Face Group Boundaries>
@@ -880,7 +932,8 @@ class Mesh(Socket):
         """
         node = Node('Face Group Boundaries', sockets={'Face Set': face_group_id})
         return node._out
-
+''',
+'Grid': r'''
     @classmethod
     def Grid(cls, size_x=None, size_y=None, vertices_x=None, vertices_y=None):
         """ > Node <&Node Grid>
@@ -898,7 +951,8 @@ class Mesh(Socket):
         """
         node = Node('Grid', sockets={'Size X': size_x, 'Size Y': size_y, 'Vertices X': vertices_x, 'Vertices Y': vertices_y})
         return cls(node._out)
-
+''',
+'IcoSphere': r'''
     @classmethod
     def IcoSphere(cls, radius=None, subdivisions=None):
         """ > Node <&Node Ico Sphere>
@@ -914,7 +968,8 @@ class Mesh(Socket):
         """
         node = Node('Ico Sphere', sockets={'Radius': radius, 'Subdivisions': subdivisions})
         return cls(node._out)
-
+''',
+'LineOffset': r'''
     @classmethod
     def LineOffset(cls, count=None, start_location=None, offset=None, count_mode='TOTAL'):
         """ > Node <&Node Mesh Line>
@@ -937,7 +992,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Line', 'count_mode', count_mode, 'LineOffset', ('TOTAL', 'RESOLUTION'))
         node = Node('Mesh Line', sockets={'Count': count, 'Start Location': start_location, 'Offset': offset}, count_mode=count_mode, mode='OFFSET')
         return cls(node._out)
-
+''',
+'LineEndPoints': r'''
     @classmethod
     def LineEndPoints(cls, count=None, start_location=None, end_location=None, count_mode='TOTAL'):
         """ > Node <&Node Mesh Line>
@@ -960,7 +1016,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Line', 'count_mode', count_mode, 'LineEndPoints', ('TOTAL', 'RESOLUTION'))
         node = Node('Mesh Line', sockets={'Count': count, 'Start Location': start_location, 'Offset': end_location}, count_mode=count_mode, mode='END_POINTS')
         return cls(node._out)
-
+''',
+'Line': r'''
     @classmethod
     def Line(cls, count=None, start_location=None, offset=None, count_mode='TOTAL', mode='OFFSET'):
         """ > Node <&Node Mesh Line>
@@ -981,7 +1038,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh Line', 'mode', mode, 'Line', ('OFFSET', 'END_POINTS'))
         node = Node('Mesh Line', sockets={'Count': count, 'Start Location': start_location, 'Offset': offset}, count_mode=count_mode, mode=mode)
         return cls(node._out)
-
+''',
+'to_curve': r'''
     def to_curve(self):
         """ > Node <&Node Mesh to Curve>
 
@@ -996,7 +1054,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to Curve', sockets={'Mesh': self, 'Selection': self._sel})
         return node._out
-
+''',
+'to_density_grid': r'''
     def to_density_grid(self, density=None, voxel_size=None, gradient_width=None):
         """ > Node <&Node Mesh to Density Grid>
 
@@ -1016,7 +1075,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to Density Grid', sockets={'Mesh': self, 'Density': density, 'Voxel Size': voxel_size, 'Gradient Width': gradient_width})
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, position=None, radius=None, mode='VERTICES'):
         """ > Node <&Node Mesh to Points>
 
@@ -1038,7 +1098,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh to Points', 'mode', mode, 'to_points', ('VERTICES', 'EDGES', 'FACES', 'CORNERS'))
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode=mode)
         return node._out
-
+''',
+'vertices_to_points': r'''
     def vertices_to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -1059,7 +1120,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='VERTICES')
         return node._out
-
+''',
+'edges_to_points': r'''
     def edges_to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -1080,7 +1142,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='EDGES')
         return node._out
-
+''',
+'faces_to_points': r'''
     def faces_to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -1101,7 +1164,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='FACES')
         return node._out
-
+''',
+'corners_to_points': r'''
     def corners_to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -1122,7 +1186,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='CORNERS')
         return node._out
-
+''',
+'to_sdf_grid': r'''
     def to_sdf_grid(self, voxel_size=None, band_width=None):
         """ > Node <&Node Mesh to SDF Grid>
 
@@ -1141,7 +1206,8 @@ class Mesh(Socket):
         """
         node = Node('Mesh to SDF Grid', sockets={'Mesh': self, 'Voxel Size': voxel_size, 'Band Width': band_width})
         return node._out
-
+''',
+'to_volume': r'''
     def to_volume(self, density=None, voxel_amount=None, interior_band_width=None, resolution_mode='VOXEL_AMOUNT'):
         """ > Node <&Node Mesh to Volume>
 
@@ -1163,7 +1229,8 @@ class Mesh(Socket):
         utils.check_enum_arg('Mesh to Volume', 'resolution_mode', resolution_mode, 'to_volume', ('VOXEL_AMOUNT', 'VOXEL_SIZE'))
         node = Node('Mesh to Volume', sockets={'Mesh': self, 'Density': density, 'Voxel Amount': voxel_amount, 'Interior Band Width': interior_band_width}, resolution_mode=resolution_mode)
         return node._out
-
+''',
+'UVSphere': r'''
     @classmethod
     def UVSphere(cls, segments=None, rings=None, radius=None):
         """ > Node <&Node UV Sphere>
@@ -1180,7 +1247,8 @@ class Mesh(Socket):
         """
         node = Node('UV Sphere', sockets={'Segments': segments, 'Rings': rings, 'Radius': radius})
         return cls(node._out)
-
+''',
+'offset_corner_in_face': r'''
     @classmethod
     def offset_corner_in_face(cls, corner_index=None, offset=None):
         """ > Node <&Node Offset Corner in Face>
@@ -1196,7 +1264,8 @@ class Mesh(Socket):
         """
         node = Node('Offset Corner in Face', sockets={'Corner Index': corner_index, 'Offset': offset})
         return node._out
-
+''',
+'sample_nearest_surface': r'''
     def sample_nearest_surface(self, value=None, group_id=None, sample_position=None, sample_group_id=None):
         """ > Node <&Node Sample Nearest Surface>
 
@@ -1219,7 +1288,8 @@ class Mesh(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Mesh.sample_nearest_surface', 'value')
         node = Node('Sample Nearest Surface', sockets={'Mesh': self, 'Value': value, 'Group ID': group_id, 'Sample Position': sample_position, 'Sample Group ID': sample_group_id}, data_type=data_type)
         return node._out
-
+''',
+'sample_uv_surface': r'''
     def sample_uv_surface(self, value=None, uv_map=None, sample_uv=None):
         """ > Node <&Node Sample UV Surface>
 
@@ -1241,7 +1311,8 @@ class Mesh(Socket):
         data_type = utils.get_argument_data_type(value, {'VALUE': 'FLOAT', 'INT': 'INT', 'VECTOR': 'FLOAT_VECTOR', 'RGBA': 'FLOAT_COLOR', 'BOOLEAN': 'BOOLEAN', 'ROTATION': 'QUATERNION', 'MATRIX': 'FLOAT4X4'}, 'Mesh.sample_uv_surface', 'value')
         node = Node('Sample UV Surface', sockets={'Mesh': self, 'Value': value, 'Source UV Map': uv_map, 'Sample UV': sample_uv}, data_type=data_type)
         return node._out
-
+''',
+'split_edges': r'''
     def split_edges(self):
         """ > Node <&Node Split Edges>
 
@@ -1259,7 +1330,8 @@ class Mesh(Socket):
         node = Node('Split Edges', sockets={'Mesh': self, 'Selection': self._sel})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'subdivide': r'''
     def subdivide(self, level=None):
         """ > Node <&Node Subdivide Mesh>
 
@@ -1280,7 +1352,8 @@ class Mesh(Socket):
         node = Node('Subdivide Mesh', sockets={'Mesh': self, 'Level': level})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'subdivision_surface': r'''
     def subdivision_surface(self, level=None, edge_crease=None, vertex_crease=None, boundary_smooth='ALL', uv_smooth='PRESERVE_BOUNDARIES'):
         """ > Node <&Node Subdivision Surface>
 
@@ -1307,7 +1380,8 @@ class Mesh(Socket):
         node = Node('Subdivision Surface', sockets={'Mesh': self, 'Level': level, 'Edge Crease': edge_crease, 'Vertex Crease': vertex_crease}, boundary_smooth=boundary_smooth, uv_smooth=uv_smooth)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'set_face_set': r'''
     def set_face_set(self, face_set=None):
         """ > Node <&Node Set Face Set>
 
@@ -1329,7 +1403,8 @@ class Mesh(Socket):
         node = Node('Set Face Set', sockets={'Mesh': self, 'Selection': self._sel, 'Face Set': face_set})
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'triangulate': r'''
     def triangulate(self, minimum_vertices=None, ngon_method='BEAUTY', quad_method='SHORTEST_DIAGONAL'):
         """ > Node <&Node Triangulate>
 
@@ -1355,7 +1430,8 @@ class Mesh(Socket):
         node = Node('Triangulate', sockets={'Mesh': self, 'Selection': self._sel, 'Minimum Vertices': minimum_vertices}, ngon_method=ngon_method, quad_method=quad_method)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'vertex_of_corner': r'''
     @classmethod
     def vertex_of_corner(cls, corner_index=None):
         """ > Node <&Node Vertex of Corner>
@@ -1370,4 +1446,7 @@ class Mesh(Socket):
         """
         node = Node('Vertex of Corner', sockets={'Corner Index': corner_index})
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Mesh)
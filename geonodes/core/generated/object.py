@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Object(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'ActiveCamera': r'''
     @classmethod
     def ActiveCamera(cls):
         """ > Node <&Node Active Camera>
@@ -17,7 +21,8 @@ class Object(Socket):
         """
         node = Node('Active Camera', sockets={})
         return cls(node._out)
-
+''',
+'info': r'''
     def info(self, as_instance=None, transform_space='ORIGINAL'):
         """ > Node <&Node Object Info>
 
@@ -37,7 +42,8 @@ class Object(Socket):
         utils.check_enum_arg('Object Info', 'transform_space', transform_space, 'info', ('ORIGINAL', 'RELATIVE'))
         node = Node('Object Info', sockets={'Object': self, 'As Instance': as_instance}, transform_space=transform_space)
         return node
-
+''',
+'Self': r'''
     @classmethod
     def Self(cls):
         """ > Node <&Node Self Object>
@@ -48,4 +54,7 @@ class Object(Socket):
         """
         node = Node('Self Object', sockets={})
         return cls(node._out)
+''',
+}
 
+MethodTable(METHODS, globals()).install(Object)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Rotation(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'AlignToVector': r'''
     @classmethod
     def AlignToVector(cls, vector=None, factor=None, axis='Z', pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
@@ -30,7 +34,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'AlignToVector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': None, 'Vector': vector, 'Factor': factor}, axis=axis, pivot_axis=pivot_axis)
         return cls(node._out)
-
+''',
+'AlignXToVector': r'''
     @classmethod
     def AlignXToVector(cls, vector=None, factor=None, pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
@@ -53,7 +58,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'AlignXToVector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': None, 'Vector': vector, 'Factor': factor}, axis='X', pivot_axis=pivot_axis)
         return cls(node._out)
-
+''',
+'AlignYToVector': r'''
     @classmethod
     def AlignYToVector(cls, vector=None, factor=None, pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
@@ -76,7 +82,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'AlignYToVector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': None, 'Vector': vector, 'Factor': factor}, axis='Y', pivot_axis=pivot_axis)
         return cls(node._out)
-
+''',
+'AlignZToVector': r'''
     @classmethod
     def AlignZToVector(cls, vector=None, factor=None, pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
@@ -99,7 +106,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'AlignZToVector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': None, 'Vector': vector, 'Factor': factor}, axis='Z', pivot_axis=pivot_axis)
         return cls(node._out)
-
+''',
+'align_toVector': r'''
     def align_toVector(self, vector=None, factor=None, axis='Z', pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
 
@@ -122,7 +130,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'align_toVector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': self, 'Vector': vector, 'Factor': factor}, axis=axis, pivot_axis=pivot_axis)
         return node._out
-
+''',
+'align_x_to_vector': r'''
     def align_x_to_vector(self, vector=None, factor=None, pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
 
@@ -144,7 +153,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'align_x_to_vector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': self, 'Vector': vector, 'Factor': factor}, axis='X', pivot_axis=pivot_axis)
         return node._out
-
+''',
+'align_y_to_vector': r'''
     def align_y_to_vector(self, vector=None, factor=None, pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
 
@@ -166,7 +176,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'align_y_to_vector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': self, 'Vector': vector, 'Factor': factor}, axis='Y', pivot_axis=pivot_axis)
         return node._out
-
+''',
+'align_z_to_vector': r'''
     def align_z_to_vector(self, vector=None, factor=None, pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
 
@@ -188,7 +199,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'align_z_to_vector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': self, 'Vector': vector, 'Factor': factor}, axis='Z', pivot_axis=pivot_axis)
         return node._out
-
+''',
+'FromAxes': r'''
     @classmethod
     def FromAxes(cls, primary_axis_1=None, secondary_axis_1=None, primary_axis='Z', secondary_axis='X'):
         """ > Node <&Node Axes to Rotation>
@@ -208,7 +220,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Axes to Rotation', 'secondary_axis', secondary_axis, 'FromAxes', ('X', 'Y', 'Z'))
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis_1, 'Secondary Axis': secondary_axis_1}, primary_axis=primary_axis, secondary_axis=secondary_axis)
         return cls(node._out)
-
+''',
+'FromXYAxes': r'''
     @classmethod
     def FromXYAxes(cls, primary_axis=None, secondary_axis=None):
         """ > Node <&Node Axes to Rotation>
@@ -229,7 +242,8 @@ class Rotation(Socket):
         """
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis, 'Secondary Axis': secondary_axis}, primary_axis='X', secondary_axis='Y')
         return cls(node._out)
-
+''',
+'FromYXAxes': r'''
     @classmethod
     def FromYXAxes(cls, primary_axis=None, secondary_axis=None):
         """ > Node <&Node Axes to Rotation>
@@ -250,7 +264,8 @@ class Rotation(Socket):
         """
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis, 'Secondary Axis': secondary_axis}, primary_axis='Y', secondary_axis='X')
         return cls(node._out)
-
+''',
+'FromXZAxes': r'''
     @classmethod
     def FromXZAxes(cls, primary_axis=None, secondary_axis=None):
         """ > Node <&Node Axes to Rotation>
@@ -271,7 +286,8 @@ class Rotation(Socket):
         """
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis, 'Secondary Axis': secondary_axis}, primary_axis='X', secondary_axis='Z')
         return cls(node._out)
-
+''',
+'FromZXAxes': r'''
     @classmethod
     def FromZXAxes(cls, primary_axis=None, secondary_axis=None):
         """ > Node <&Node Axes to Rotation>
@@ -292,7 +308,8 @@ class Rotation(Socket):
         """
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis, 'Secondary Axis': secondary_axis}, primary_axis='Z', secondary_axis='X')
         return cls(node._out)
-
+''',
+'FromYZAxes': r'''
     @classmethod
     def FromYZAxes(cls, primary_axis=None, secondary_axis=None):
         """ > Node <&Node Axes to Rotation>
@@ -313,7 +330,8 @@ class Rotation(Socket):
         """
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis, 'Secondary Axis': secondary_axis}, primary_axis='Y', secondary_axis='Z')
         return cls(node._out)
-
+''',
+'FromZYAxes': r'''
     @classmethod
     def FromZYAxes(cls, primary_axis=None, secondary_axis=None):
         """ > Node <&Node Axes to Rotation>
@@ -334,7 +352,8 @@ class Rotation(Socket):
         """
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis, 'Secondary Axis': secondary_axis}, primary_axis='Z', secondary_axis='Y')
         return cls(node._out)
-
+''',
+'FromAxisAngle': r'''
     @classmethod
     def FromAxisAngle(cls, axis=None, angle=None):
         """ > Node <&Node Axis Angle to Rotation>
@@ -350,7 +369,8 @@ class Rotation(Socket):
         """
         node = Node('Axis Angle to Rotation', sockets={'Axis': axis, 'Angle': angle})
         return cls(node._out)
-
+''',
+'FromEuler': r'''
     @classmethod
     def FromEuler(cls, euler=None):
         """ > Node <&Node Euler to Rotation>
@@ -365,7 +385,8 @@ class Rotation(Socket):
         """
         node = Node('Euler to Rotation', sockets={'Euler': euler})
         return cls(node._out)
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -384,7 +405,8 @@ class Rotation(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='ROTATION')
         return node._out
-
+''',
+'invert': r'''
     def invert(self):
         """ > Node <&Node Invert Rotation>
 
@@ -398,7 +420,8 @@ class Rotation(Socket):
         """
         node = Node('Invert Rotation', sockets={'Rotation': self})
         return node._out
-
+''',
+'FromQuaternion': r'''
     @classmethod
     def FromQuaternion(cls, w=None, x=None, y=None, z=None):
         """ > Node <&Node Quaternion to Rotation>
@@ -416,7 +439,8 @@ class Rotation(Socket):
         """
         node = Node('Quaternion to Rotation', sockets={'W': w, 'X': x, 'Y': y, 'Z': z})
         return cls(node._out)
-
+''',
+'rotate': r'''
     def rotate(self, rotate_by=None, rotation_space='GLOBAL'):
         """ > Node <&Node Rotate Rotation>
 
@@ -436,7 +460,8 @@ class Rotation(Socket):
         utils.check_enum_arg('Rotate Rotation', 'rotation_space', rotation_space, 'rotate', ('GLOBAL', 'LOCAL'))
         node = Node('Rotate Rotation', sockets={'Rotation': self, 'Rotate By': rotate_by}, rotation_space=rotation_space)
         return node._out
-
+''',
+'rotate_global': r'''
     def rotate_global(self, rotate_by=None):
         """ > Node <&Node Rotate Rotation>
 
@@ -455,7 +480,8 @@ class Rotation(Socket):
         """
         node = Node('Rotate Rotation', sockets={'Rotation': self, 'Rotate By': rotate_by}, rotation_space='GLOBAL')
         return node._out
-
+''',
+'rotate_local': r'''
     def rotate_local(self, rotate_by=None):
         """ > Node <&Node Rotate Rotation>
 
@@ -474,7 +500,8 @@ class Rotation(Socket):
         """
         node = Node('Rotate Rotation', sockets={'Rotation': self, 'Rotate By': rotate_by}, rotation_space='LOCAL')
         return node._out
-
+''',
+'rotate_vector': r'''
     def rotate_vector(self, vector=None):
         """ > Node <&Node Rotate Vector>
 
@@ -492,7 +519,8 @@ class Rotation(Socket):
         """
         node = Node('Rotate Vector', sockets={'Vector': vector, 'Rotation': self})
         return node._out
-
+''',
+'to_axis_angle': r'''
     def to_axis_angle(self):
         """ > Node <&Node Rotation to Axis Angle>
 
@@ -506,7 +534,8 @@ class Rotation(Socket):
         """
         node = Node('Rotation to Axis Angle', sockets={'Rotation': self})
         return node._out
-
+''',
+'axis_angle': r'''
     @property
     def axis_angle(self):
         """ > Node <&Node Rotation to Axis Angle>
@@ -521,7 +550,8 @@ class Rotation(Socket):
         """
         node = Node('Rotation to Axis Angle', sockets={'Rotation': self})
         return (node.axis, node.angle)
-
+''',
+'to_euler': r'''
     def to_euler(self):
         """ > Node <&Node Rotation to Euler>
 
@@ -535,7 +565,8 @@ class Rotation(Socket):
         """
         node = Node('Rotation to Euler', sockets={'Rotation': self})
         return node._out
-
+''',
+'to_quaternion': r'''
     def to_quaternion(self):
         """ > Node <&Node Rotation to Quaternion>
 
@@ -549,7 +580,8 @@ class Rotation(Socket):
         """
         node = Node('Rotation to Quaternion', sockets={'Rotation': self})
         return node._out
-
+''',
+'wxyz': r'''
     @property
     def wxyz(self):
         """ > Node <&Node Rotation to Quaternion>
@@ -564,7 +596,8 @@ class Rotation(Socket):
         """
         node = Node('Rotation to Quaternion', sockets={'Rotation': self})
         return (node.w, node.x, node.y, node.z)
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -583,7 +616,8 @@ class Rotation(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='QUATERNION')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -602,7 +636,8 @@ class Rotation(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='QUATERNION')
         return cls(node._out)
-
+''',
+'mix': r'''
     def mix(self, b=None, factor=None, clamp_factor=True):
         """ > Node <&Node Mix>
 
@@ -626,4 +661,7 @@ class Rotation(Socket):
         """
         node = Node('Mix', sockets={'A_Rotation': self, 'B_Rotation': b, 'Factor_Float': factor}, blend_type='MIX', clamp_factor=clamp_factor, clamp_result=False, data_type='ROTATION', factor_mode='UNIFORM')
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Rotation)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Shader(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'add': r'''
     def add(self, shader=None):
         """ > Node <&ShaderNode Add Shader>
 
@@ -24,7 +28,8 @@ class Shader(Socket):
         """
         node = Node('Add Shader', sockets={'Shader': self, 'Shader_001': shader})
         return node._out
-
+''',
+'Glossy': r'''
     @classmethod
     def Glossy(cls, color=None, roughness=None, anisotropy=None, rotation=None, normal=None, tangent=None, distribution='MULTI_GGX'):
         """ > Node <&ShaderNode Glossy BSDF>
@@ -46,7 +51,8 @@ class Shader(Socket):
         utils.check_enum_arg('Glossy BSDF', 'distribution', distribution, 'Glossy', ('BECKMANN', 'GGX', 'ASHIKHMIN_SHIRLEY', 'MULTI_GGX'))
         node = Node('Glossy BSDF', sockets={'Color': color, 'Roughness': roughness, 'Anisotropy': anisotropy, 'Rotation': rotation, 'Normal': normal, 'Tangent': tangent}, distribution=distribution)
         return cls(node._out)
-
+''',
+'Diffuse': r'''
     @classmethod
     def Diffuse(cls, color=None, roughness=None, normal=None):
         """ > Node <&ShaderNode Diffuse BSDF>
@@ -63,7 +69,8 @@ class Shader(Socket):
         """
         node = Node('Diffuse BSDF', sockets={'Color': color, 'Roughness': roughness, 'Normal': normal})
         return cls(node._out)
-
+''',
+'Glass': r'''
     @classmethod
     def Glass(cls, color=None, roughness=None, ior=None, normal=None, distribution='MULTI_GGX'):
         """ > Node <&ShaderNode Glass BSDF>
@@ -83,7 +90,8 @@ class Shader(Socket):
         utils.check_enum_arg('Glass BSDF', 'distribution', distribution, 'Glass', ('BECKMANN', 'GGX', 'MULTI_GGX'))
         node = Node('Glass BSDF', sockets={'Color': color, 'Roughness': roughness, 'IOR': ior, 'Normal': normal}, distribution=distribution)
         return cls(node._out)
-
+''',
+'Hair': r'''
     @classmethod
     def Hair(cls, color=None, offset=None, roughnessu=None, roughnessv=None, tangent=None, component='Reflection'):
         """ > Node <&ShaderNode Hair BSDF>
@@ -104,7 +112,8 @@ class Shader(Socket):
         utils.check_enum_arg('Hair BSDF', 'component', component, 'Hair', ('Reflection', 'Transmission'))
         node = Node('Hair BSDF', sockets={'Color': color, 'Offset': offset, 'RoughnessU': roughnessu, 'RoughnessV': roughnessv, 'Tangent': tangent}, component=component)
         return cls(node._out)
-
+''',
+'PrincipledHair': r'''
     @classmethod
     def PrincipledHair(cls, color=None, roughness=None, radial_roughness=None, coat=None, ior=None, offset=None, random_roughness=None, random=None, model='CHIANG', parametrization='COLOR'):
         """ > Node <&ShaderNode Principled Hair BSDF>
@@ -130,7 +139,8 @@ class Shader(Socket):
         utils.check_enum_arg('Principled Hair BSDF', 'parametrization', parametrization, 'PrincipledHair', ('ABSORPTION', 'MELANIN', 'COLOR'))
         node = Node('Principled Hair BSDF', sockets={'Color': color, 'Roughness': roughness, 'Radial Roughness': radial_roughness, 'Coat': coat, 'IOR': ior, 'Offset': offset, 'Random Roughness': random_roughness, 'Random': random}, model=model, parametrization=parametrization)
         return cls(node._out)
-
+''',
+'Metallic': r'''
     @classmethod
     def Metallic(cls, base_color=None, edge_tint=None, roughness=None, anisotropy=None, rotation=None, normal=None, tangent=None, distribution='MULTI_GGX', fresnel_type='F82'):
         """ > Node <&ShaderNode Metallic BSDF>
@@ -155,7 +165,8 @@ class Shader(Socket):
         utils.check_enum_arg('Metallic BSDF', 'fresnel_type', fresnel_type, 'Metallic', ('PHYSICAL_CONDUCTOR', 'F82'))
         node = Node('Metallic BSDF', sockets={'Base Color': base_color, 'Edge Tint': edge_tint, 'Roughness': roughness, 'Anisotropy': anisotropy, 'Rotation': rotation, 'Normal': normal, 'Tangent': tangent}, distribution=distribution, fresnel_type=fresnel_type)
         return cls(node._out)
-
+''',
+'Principled': r'''
     @classmethod
     def Principled(cls, base_color=None, metallic=None, roughness=None, ior=None, alpha=None, normal=None, diffuse_roughness=None, subsurface_weight=None, subsurface_radius=None, subsurface_scale=None, subsurface_anisotropy=None, specular_ior_level=None, specular_tint=None, anisotropic=None, anisotropic_rotation=None, tangent=None, transmission_weight=None, coat_weight=None, coat_roughness=None, coat_ior=None, coat_tint=None, coat_normal=None, sheen_weight=None, sheen_roughness=None, sheen_tint=None, emission_color=None, emission_strength=None, thin_film_thickness=None, thin_film_ior=None, distribution='MULTI_GGX', subsurface_method='RANDOM_WALK'):
         """ > Node <&ShaderNode Principled BSDF>
@@ -202,7 +213,8 @@ class Shader(Socket):
         utils.check_enum_arg('Principled BSDF', 'subsurface_method', subsurface_method, 'Principled', ('BURLEY', 'RANDOM_WALK', 'RANDOM_WALK_SKIN'))
         node = Node('Principled BSDF', sockets={'Base Color': base_color, 'Metallic': metallic, 'Roughness': roughness, 'IOR': ior, 'Alpha': alpha, 'Normal': normal, 'Diffuse Roughness': diffuse_roughness, 'Subsurface Weight': subsurface_weight, 'Subsurface Radius': subsurface_radius, 'Subsurface Scale': subsurface_scale, 'Subsurface Anisotropy': subsurface_anisotropy, 'Specular IOR Level': specular_ior_level, 'Specular Tint': specular_tint, 'Anisotropic': anisotropic, 'Anisotropic Rotation': anisotropic_rotation, 'Tangent': tangent, 'Transmission Weight': transmission_weight, 'Coat Weight': coat_weight, 'Coat Roughness': coat_roughness, 'Coat IOR': coat_ior, 'Coat Tint': coat_tint, 'Coat Normal': coat_normal, 'Sheen Weight': sheen_weight, 'Sheen Roughness': sheen_roughness, 'Sheen Tint': sheen_tint, 'Emission Color': emission_color, 'Emission Strength': emission_strength, 'Thin Film Thickness': thin_film_thickness, 'Thin Film IOR': thin_film_ior}, distribution=distribution, subsurface_method=subsurface_method)
         return cls(node._out)
-
+''',
+'RayPortal': r'''
     @classmethod
     def RayPortal(cls, color=None, position=None, direction=None):
         """ > Node <&ShaderNode Ray Portal BSDF>
@@ -219,7 +231,8 @@ class Shader(Socket):
         """
         node = Node('Ray Portal BSDF', sockets={'Color': color, 'Position': position, 'Direction': direction})
         return cls(node._out)
-
+''',
+'Refraction': r'''
     @classmethod
     def Refraction(cls, color=None, roughness=None, ior=None, normal=None, distribution='BECKMANN'):
         """ > Node <&ShaderNode Refraction BSDF>
@@ -239,7 +252,8 @@ class Shader(Socket):
         utils.check_enum_arg('Refraction BSDF', 'distribution', distribution, 'Refraction', ('BECKMANN', 'GGX'))
         node = Node('Refraction BSDF', sockets={'Color': color, 'Roughness': roughness, 'IOR': ior, 'Normal': normal}, distribution=distribution)
         return cls(node._out)
-
+''',
+'Sheen': r'''
     @classmethod
     def Sheen(cls, color=None, roughness=None, normal=None, distribution='MICROFIBER'):
         """ > Node <&ShaderNode Sheen BSDF>
@@ -258,7 +272,8 @@ class Shader(Socket):
         utils.check_enum_arg('Sheen BSDF', 'distribution', distribution, 'Sheen', ('ASHIKHMIN', 'MICROFIBER'))
         node = Node('Sheen BSDF', sockets={'Color': color, 'Roughness': roughness, 'Normal': normal}, distribution=distribution)
         return cls(node._out)
-
+''',
+'Toon': r'''
     @classmethod
     def Toon(cls, color=None, size=None, smooth=None, normal=None, component='DIFFUSE'):
         """ > Node <&ShaderNode Toon BSDF>
@@ -278,7 +293,8 @@ class Shader(Socket):
         utils.check_enum_arg('Toon BSDF', 'component', component, 'Toon', ('DIFFUSE', 'GLOSSY'))
         node = Node('Toon BSDF', sockets={'Color': color, 'Size': size, 'Smooth': smooth, 'Normal': normal}, component=component)
         return cls(node._out)
-
+''',
+'Translucent': r'''
     @classmethod
     def Translucent(cls, color=None, normal=None):
         """ > Node <&ShaderNode Translucent BSDF>
@@ -294,7 +310,8 @@ class Shader(Socket):
         """
         node = Node('Translucent BSDF', sockets={'Color': color, 'Normal': normal})
         return cls(node._out)
-
+''',
+'Transparent': r'''
     @classmethod
     def Transparent(cls, color=None):
         """ > Node <&ShaderNode Transparent BSDF>
@@ -309,7 +326,8 @@ class Shader(Socket):
         """
         node = Node('Transparent BSDF', sockets={'Color': color})
         return cls(node._out)
-
+''',
+'Specular': r'''
     @classmethod
     def Specular(cls, base_color=None, specular=None, roughness=None, emissive_color=None, transparency=None, normal=None, clear_coat=None, clear_coat_roughness=None, clear_coat_normal=None):
         """ > Node <&ShaderNode Specular BSDF>
@@ -332,7 +350,8 @@ class Shader(Socket):
         """
         node = Node('Specular BSDF', sockets={'Base Color': base_color, 'Specular': specular, 'Roughness': roughness, 'Emissive Color': emissive_color, 'Transparency': transparency, 'Normal': normal, 'Clear Coat': clear_coat, 'Clear Coat Roughness': clear_coat_roughness, 'Clear Coat Normal': clear_coat_normal})
         return cls(node._out)
-
+''',
+'Emission': r'''
     @classmethod
     def Emission(cls, color=None, strength=None):
         """ > Node <&ShaderNode Emission>
@@ -348,7 +367,8 @@ class Shader(Socket):
         """
         node = Node('Emission', sockets={'Color': color, 'Strength': strength})
         return cls(node._out)
-
+''',
+'Holdout': r'''
     @classmethod
     def Holdout(cls):
         """ > Node <&ShaderNode Holdout>
@@ -359,7 +379,8 @@ class Shader(Socket):
         """
         node = Node('Holdout', sockets={})
         return cls(node._out)
-
+''',
+'mix': r'''
     def mix(self, shader=None, fac=None):
         """ > Node <&ShaderNode Mix Shader>
 
@@ -378,7 +399,8 @@ class Shader(Socket):
         """
         node = Node('Mix Shader', sockets={'Shader': self, 'Shader_001': shader, 'Fac': fac})
         return node._out
-
+''',
+'light_output': r'''
     def light_output(self, is_active_output=True, target='ALL'):
         """ > Node <&ShaderNode Light Output>
 
@@ -398,7 +420,8 @@ class Shader(Socket):
         utils.check_enum_arg('Light Output', 'target', target, 'light_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('Light Output', sockets={'Surface': self}, is_active_output=is_active_output, target=target)
         return node._out
-
+''',
+'material_output': r'''
     def material_output(self, volume=None, displacement=None, thickness=None, is_active_output=True, target='ALL'):
         """ > Node <&ShaderNode Material Output>
 
@@ -421,7 +444,8 @@ class Shader(Socket):
         utils.check_enum_arg('Material Output', 'target', target, 'material_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('Material Output', sockets={'Surface': self, 'Volume': volume, 'Displacement': displacement, 'Thickness': thickness}, is_active_output=is_active_output, target=target)
         return node._out
-
+''',
+'world_output': r'''
     def world_output(self, volume=None, is_active_output=True, target='ALL'):
         """ > Node <&ShaderNode World Output>
 
@@ -442,7 +466,8 @@ class Shader(Socket):
         utils.check_enum_arg('World Output', 'target', target, 'world_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('World Output', sockets={'Surface': self, 'Volume': volume}, is_active_output=is_active_output, target=target)
         return node._out
-
+''',
+'to_rgb': r'''
     def to_rgb(self):
         """ > Node <&ShaderNode Shader to RGB>
 
@@ -456,7 +481,8 @@ class Shader(Socket):
         """
         node = Node('Shader to RGB', sockets={'Shader': self})
         return node._out
-
+''',
+'SubsurfaceScattering': r'''
     @classmethod
     def SubsurfaceScattering(cls, color=None, scale=None, radius=None, ior=None, roughness=None, anisotropy=None, normal=None, falloff='RANDOM_WALK'):
         """ > Node <&ShaderNode Subsurface Scattering>
@@ -479,4 +505,7 @@ class Shader(Socket):
         utils.check_enum_arg('Subsurface Scattering', 'falloff', falloff, 'SubsurfaceScattering', ('BURLEY', 'RANDOM_WALK', 'RANDOM_WALK_SKIN'))
         node = Node('Subsurface Scattering', sockets={'Color': color, 'Scale': scale, 'Radius': radius, 'IOR': ior, 'Roughness': roughness, 'Anisotropy': anisotropy, 'Normal': normal}, falloff=falloff)
         return cls(node._out)
+''',
+}
 
+MethodTable(METHODS, globals()).install(Shader)
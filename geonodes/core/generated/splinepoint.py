@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class SplinePoint(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'curve_of_point': r'''
     @classmethod
     def curve_of_point(cls, point_index=None):
         """ > Node <&Node Curve of Point>
@@ -21,7 +25,8 @@ class SplinePoint(Socket):
         """
         node = Node('Curve of Point', sockets={'Point Index': point_index})
         return node
-
+''',
+'curve_index': r'''
     @classmethod
     def curve_index(cls, point_index=None):
         """ > Node <&Node Curve of Point>
@@ -36,7 +41,8 @@ class SplinePoint(Socket):
         """
         node = Node('Curve of Point', sockets={'Point Index': point_index})
         return node.curve_index
-
+''',
+'index_in_curve': r'''
     @classmethod
     def index_in_curve(cls, point_index=None):
         """ > Node <&Node Curve of Point>
@@ -51,7 +57,8 @@ class SplinePoint(Socket):
         """
         node = Node('Curve of Point', sockets={'Point Index': point_index})
         return node.index_in_curve
-
+''',
+'to_points_evaluated': r'''
     def to_points_evaluated(self):
         """ > Node <&Node Curve to Points>
 
@@ -66,7 +73,8 @@ class SplinePoint(Socket):
         """
         node = Node('Curve to Points', sockets={'Curve': self}, mode='EVALUATED')
         return node._out
-
+''',
+'to_points_count': r'''
     def to_points_count(self, count=None):
         """ > Node <&Node Curve to Points>
 
@@ -85,7 +93,8 @@ class SplinePoint(Socket):
         """
         node = Node('Curve to Points', sockets={'Curve': self, 'Count': count}, mode='COUNT')
         return node._out
-
+''',
+'to_points_length': r'''
     def to_points_length(self, length=None):
         """ > Node <&Node Curve to Points>
 
@@ -104,7 +113,8 @@ class SplinePoint(Socket):
         """
         node = Node('Curve to Points', sockets={'Curve': self, 'Length': length}, mode='LENGTH')
         return node._out
-
+''',
+'to_points': r'''
     def to_points(self, count=None, mode='COUNT'):
         """ > Node <&Node Curve to Points>
 
@@ -124,7 +134,8 @@ class SplinePoint(Socket):
         utils.check_enum_arg('Curve to Points', 'mode', mode, 'to_points', ('EVALUATED', 'COUNT', 'LENGTH'))
         node = Node('Curve to Points', sockets={'Curve': self, 'Count': count}, mode=mode)
         return node._out
-
+''',
+'offset_in_curve': r'''
     @classmethod
     def offset_in_curve(cls, point_index=None, offset=None):
         """ > Node <&Node Offset Point in Curve>
@@ -140,7 +151,8 @@ class SplinePoint(Socket):
         """
         node = Node('Offset Point in Curve', sockets={'Point Index': point_index, 'Offset': offset})
         return node._out
-
+''',
+'radius': r'''
     @property
     def radius(self):
         """ Property get node <Node Set Curve Radius>
@@ -169,4 +181,7 @@ class SplinePoint(Socket):
         node = Node('Set Curve Radius', sockets={'Curve': self, 'Selection': self._sel, 'Radius': radius})
         self._jump(node._out)
         return self._domain_to_geometry
+''',
+}
 
+MethodTable(METHODS, globals()).install(SplinePoint)
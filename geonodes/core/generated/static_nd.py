@@ -2,6 +2,7 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class nd:
     """" Static class
@@ -13,6 +14,8 @@ class nd:
     ```
     """
 
+METHODS = {
+'align_rotation_to_vector': r'''
     @classmethod
     def align_rotation_to_vector(cls, rotation=None, vector=None, factor=None, axis='Z', pivot_axis='AUTO'):
         """ > Node <&Node Align Rotation to Vector>
@@ -33,7 +36,8 @@ class nd:
         utils.check_enum_arg('Align Rotation to Vector', 'pivot_axis', pivot_axis, 'align_rotation_to_vector', ('AUTO', 'X', 'Y', 'Z'))
         node = Node('Align Rotation to Vector', sockets={'Rotation': rotation, 'Vector': vector, 'Factor': factor}, axis=axis, pivot_axis=pivot_axis)
         return node._out
-
+''',
+'axes_to_rotation': r'''
     @classmethod
     def axes_to_rotation(cls, primary_axis_1=None, secondary_axis_1=None, primary_axis='Z', secondary_axis='X'):
         """ > Node <&Node Axes to Rotation>
@@ -53,7 +57,8 @@ class nd:
         utils.check_enum_arg('Axes to Rotation', 'secondary_axis', secondary_axis, 'axes_to_rotation', ('X', 'Y', 'Z'))
         node = Node('Axes to Rotation', sockets={'Primary Axis': primary_axis_1, 'Secondary Axis': secondary_axis_1}, primary_axis=primary_axis, secondary_axis=secondary_axis)
         return node._out
-
+''',
+'axis_angle_to_rotation': r'''
     @classmethod
     def axis_angle_to_rotation(cls, axis=None, angle=None):
         """ > Node <&Node Axis Angle to Rotation>
@@ -69,7 +74,8 @@ class nd:
         """
         node = Node('Axis Angle to Rotation', sockets={'Axis': axis, 'Angle': angle})
         return node._out
-
+''',
+'boolean_math': r'''
     @classmethod
     def boolean_math(cls, boolean=None, boolean_1=None, operation='AND'):
         """ > Node <&Node Boolean Math>
@@ -87,7 +93,8 @@ class nd:
         utils.check_enum_arg('Boolean Math', 'operation', operation, 'boolean_math', ('AND', 'OR', 'NOT', 'NAND', 'NOR', 'XNOR', 'XOR', 'IMPLY', 'NIMPLY'))
         node = Node('Boolean Math', sockets={'Boolean': boolean, 'Boolean_001': boolean_1}, operation=operation)
         return node._out
-
+''',
+'combine_color': r'''
     @classmethod
     def combine_color(cls, red=None, green=None, blue=None, alpha=None, mode='RGB'):
         """ > Node <&Node Combine Color>
@@ -107,7 +114,8 @@ class nd:
         utils.check_enum_arg('Combine Color', 'mode', mode, 'combine_color', ('RGB', 'HSV', 'HSL'))
         node = Node('Combine Color', sockets={'Red': red, 'Green': green, 'Blue': blue, 'Alpha': alpha}, mode=mode)
         return node._out
-
+''',
+'combine_matrix': r'''
     @classmethod
     def combine_matrix(cls, column_1_row_1=None, column_1_row_2=None, column_1_row_3=None, column_1_row_4=None, column_2_row_1=None, column_2_row_2=None, column_2_row_3=None, column_2_row_4=None, column_3_row_1=None, column_3_row_2=None, column_3_row_3=None, column_3_row_4=None, column_4_row_1=None, column_4_row_2=None, column_4_row_3=None, column_4_row_4=None):
         """ > Node <&Node Combine Matrix>
@@ -137,7 +145,8 @@ class nd:
         """
         node = Node('Combine Matrix', sockets={'Column 1 Row 1': column_1_row_1, 'Column 1 Row 2': column_1_row_2, 'Column 1 Row 3': column_1_row_3, 'Column 1 Row 4': column_1_row_4, 'Column 2 Row 1': column_2_row_1, 'Column 2 Row 2': column_2_row_2, 'Column 2 Row 3': column_2_row_3, 'Column 2 Row 4': column_2_row_4, 'Column 3 Row 1': column_3_row_1, 'Column 3 Row 2': column_3_row_2, 'Column 3 Row 3': column_3_row_3, 'Column 3 Row 4': column_3_row_4, 'Column 4 Row 1': column_4_row_1, 'Column 4 Row 2': column_4_row_2, 'Column 4 Row 3': column_4_row_3, 'Column 4 Row 4': column_4_row_4})
         return node._out
-
+''',
+'combine_transform': r'''
     @classmethod
     def combine_transform(cls, translation=None, rotation=None, scale=None):
         """ > Node <&Node Combine Transform>
@@ -154,7 +163,8 @@ class nd:
         """
         node = Node('Combine Transform', sockets={'Translation': translation, 'Rotation': rotation, 'Scale': scale})
         return node._out
-
+''',
+'compare': r'''
     @classmethod
     def compare(cls, a=None, b=None, a_1=None, b_1=None, a_2=None, b_2=None, a_3=None, b_3=None, a_4=None, b_4=None, c=None, angle=None, epsilon=None, data_type='FLOAT', mode='ELEMENT', operation='GREATER_THAN'):
         """ > Node <&Node Compare>
@@ -187,7 +197,8 @@ class nd:
         utils.check_enum_arg('Compare', 'operation', operation, 'compare', ('LESS_THAN', 'LESS_EQUAL', 'GREATER_THAN', 'GREATER_EQUAL', 'EQUAL', 'NOT_EQUAL'))
         node = Node('Compare', sockets={'A': a, 'B': b, 'A_INT': a_1, 'B_INT': b_1, 'A_VEC3': a_2, 'B_VEC3': b_2, 'A_COL': a_3, 'B_COL': b_3, 'A_STR': a_4, 'B_STR': b_4, 'C': c, 'Angle': angle, 'Epsilon': epsilon}, data_type=data_type, mode=mode, operation=operation)
         return node._out
-
+''',
+'euler_to_rotation': r'''
     @classmethod
     def euler_to_rotation(cls, euler=None):
         """ > Node <&Node Euler to Rotation>
@@ -202,7 +213,8 @@ class nd:
         """
         node = Node('Euler to Rotation', sockets={'Euler': euler})
         return node._out
-
+''',
+'float_to_integer': r'''
     @classmethod
     def float_to_integer(cls, float=None, rounding_mode='ROUND'):
         """ > Node <&Node Float to Integer>
@@ -219,7 +231,8 @@ class nd:
         utils.check_enum_arg('Float to Integer', 'rounding_mode', rounding_mode, 'float_to_integer', ('ROUND', 'FLOOR', 'CEILING', 'TRUNCATE'))
         node = Node('Float to Integer', sockets={'Float': float}, rounding_mode=rounding_mode)
         return node._out
-
+''',
+'hash_value': r'''
     @classmethod
     def hash_value(cls, value=None, seed=None, data_type='INT'):
         """ > Node <&Node Hash Value>
@@ -237,7 +250,8 @@ class nd:
         utils.check_enum_arg('Hash Value', 'data_type', data_type, 'hash_value', ('FLOAT', 'INT', 'VECTOR', 'ROTATION', 'MATRIX', 'STRING', 'RGBA'))
         node = Node('Hash Value', sockets={'Value': value, 'Seed': seed}, data_type=data_type)
         return node._out
-
+''',
+'boolean': r'''
     @classmethod
     def boolean(cls, boolean=False):
         """ > Node <&Node Boolean>
@@ -252,7 +266,8 @@ class nd:
         """
         node = Node('Boolean', sockets={}, boolean=boolean)
         return node._out
-
+''',
+'color': r'''
     @classmethod
     @property
     def color(cls):
@@ -264,7 +279,8 @@ class nd:
         """
         node = Node('Color', sockets={})
         return node._out
-
+''',
+'integer': r'''
     @classmethod
     def integer(cls, integer=0):
         """ > Node <&Node Integer>
@@ -279,7 +295,8 @@ class nd:
         """
         node = Node('Integer', sockets={}, integer=integer)
         return node._out
-
+''',
+'rotation': r'''
     @classmethod
     @property
     def rotation(cls):
@@ -291,7 +308,8 @@ class nd:
         """
         node = Node('Rotation', sockets={})
         return node._out
-
+''',
+'special_characters': r'''
     @classmethod
     def special_characters(cls):
         """ > Node <&Node Special Characters>
@@ -302,7 +320,8 @@ class nd:
         """
         node = Node('Special Characters', sockets={})
         return node
-
+''',
+'string': r'''
     @classmethod
     def string(cls, string=''):
         """ > Node <&Node String>
@@ -317,7 +336,8 @@ class nd:
         """
         node = Node('String', sockets={}, string=string)
         return node._out
-
+''',
+'vector': r'''
     @classmethod
     @property
     def vector(cls):
@@ -329,7 +349,8 @@ class nd:
         """
         node = Node('Vector', sockets={})
         return node._out
-
+''',
+'integer_math': r'''
     @classmethod
     def integer_math(cls, value=None, value_1=None, value_2=None, operation='ADD'):
         """ > Node <&Node Integer Math>
@@ -348,7 +369,8 @@ class nd:
         utils.check_enum_arg('Integer Math', 'operation', operation, 'integer_math', ('ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'MULTIPLY_ADD', 'ABSOLUTE', 'NEGATE', 'POWER', 'MINIMUM', 'MAXIMUM', 'SIGN', 'DIVIDE_ROUND', 'DIVIDE_FLOOR', 'DIVIDE_CEIL', 'FLOORED_MODULO', 'MODULO', 'GCD', 'LCM'))
         node = Node('Integer Math', sockets={'Value': value, 'Value_001': value_1, 'Value_002': value_2}, operation=operation)
         return node._out
-
+''',
+'invert_matrix': r'''
     @classmethod
     def invert_matrix(cls, matrix=None):
         """ > Node <&Node Invert Matrix>
@@ -363,7 +385,8 @@ class nd:
         """
         node = Node('Invert Matrix', sockets={'Matrix': matrix})
         return node._out
-
+''',
+'invert_rotation': r'''
     @classmethod
     def invert_rotation(cls, rotation=None):
         """ > Node <&Node Invert Rotation>
@@ -378,7 +401,8 @@ class nd:
         """
         node = Node('Invert Rotation', sockets={'Rotation': rotation})
         return node._out
-
+''',
+'matrix_determinant': r'''
     @classmethod
     def matrix_determinant(cls, matrix=None):
         """ > Node <&Node Matrix Determinant>
@@ -393,7 +417,8 @@ class nd:
         """
         node = Node('Matrix Determinant', sockets={'Matrix': matrix})
         return node._out
-
+''',
+'multiply_matrices': r'''
     @classmethod
     def multiply_matrices(cls, matrix=None, matrix_1=None):
         """ > Node <&Node Multiply Matrices>
@@ -409,7 +434,8 @@ class nd:
         """
         node = Node('Multiply Matrices', sockets={'Matrix': matrix, 'Matrix_001': matrix_1})
         return node._out
-
+''',
+'project_point': r'''
     @classmethod
     def project_point(cls, vector=None, transform=None):
         """ > Node <&Node Project Point>
@@ -425,7 +451,8 @@ class nd:
         """
         node = Node('Project Point', sockets={'Vector': vector, 'Transform': transform})
         return node._out
-
+''',
+'quaternion_to_rotation': r'''
     @classmethod
     def quaternion_to_rotation(cls, w=None, x=None, y=None, z=None):
         """ > Node <&Node Quaternion to Rotation>
@@ -443,7 +470,8 @@ class nd:
         """
         node = Node('Quaternion to Rotation', sockets={'W': w, 'X': x, 'Y': y, 'Z': z})
         return node._out
-
+''',
+'random_value': r'''
     @classmethod
     def random_value(cls, min=None, max=None, min_1=None, max_1=None, min_2=None, max_2=None, probability=None, id=None, seed=None, data_type='FLOAT'):
         """ > Node <&Node Random Value>
@@ -468,7 +496,8 @@ class nd:
         utils.check_enum_arg('Random Value', 'data_type', data_type, 'random_value', ('FLOAT', 'INT', 'FLOAT_VECTOR', 'BOOLEAN'))
         node = Node('Random Value', sockets={'Min': min, 'Max': max, 'Min_001': min_1, 'Max_001': max_1, 'Min_002': min_2, 'Max_002': max_2, 'Probability': probability, 'ID': id, 'Seed': seed}, data_type=data_type)
         return node._out
-
+''',
+'replace_string': r'''
     @classmethod
     def replace_string(cls, string=None, find=None, replace=None):
         """ > Node <&Node Replace String>
@@ -485,7 +514,8 @@ class nd:
         """
         node = Node('Replace String', sockets={'String': string, 'Find': find, 'Replace': replace})
         return node._out
-
+''',
+'rotate_rotation': r'''
     @classmethod
     def rotate_rotation(cls, rotation=None, rotate_by=None, rotation_space='GLOBAL'):
         """ > Node <&Node Rotate Rotation>
@@ -503,7 +533,8 @@ class nd:
         utils.check_enum_arg('Rotate Rotation', 'rotation_space', rotation_space, 'rotate_rotation', ('GLOBAL', 'LOCAL'))
         node = Node('Rotate Rotation', sockets={'Rotation': rotation, 'Rotate By': rotate_by}, rotation_space=rotation_space)
         return node._out
-
+''',
+'rotate_vector': r'''
     @classmethod
     def rotate_vector(cls, vector=None, rotation=None):
         """ > Node <&Node Rotate Vector>
@@ -519,7 +550,8 @@ class nd:
         """
         node = Node('Rotate Vector', sockets={'Vector': vector, 'Rotation': rotation})
         return node._out
-
+''',
+'rotation_to_axis_angle': r'''
     @classmethod
     def rotation_to_axis_angle(cls, rotation=None):
         """ > Node <&Node Rotation to Axis Angle>
@@ -534,7 +566,8 @@ class nd:
         """
         node = Node('Rotation to Axis Angle', sockets={'Rotation': rotation})
         return node._out
-
+''',
+'rotation_to_euler': r'''
     @classmethod
     def rotation_to_euler(cls, rotation=None):
         """ > Node <&Node Rotation to Euler>
@@ -549,7 +582,8 @@ class nd:
         """
         node = Node('Rotation to Euler', sockets={'Rotation': rotation})
         return node._out
-
+''',
+'rotation_to_quaternion': r'''
     @classmethod
     def rotation_to_quaternion(cls, rotation=None):
         """ > Node <&Node Rotation to Quaternion>
@@ -564,7 +598,8 @@ class nd:
         """
         node = Node('Rotation to Quaternion', sockets={'Rotation': rotation})
         return node._out
-
+''',
+'separate_color': r'''
     @classmethod
     def separate_color(cls, color=None, mode='RGB'):
         """ > Node <&Node Separate Color>
@@ -581,7 +616,8 @@ class nd:
         utils.check_enum_arg('Separate Color', 'mode', mode, 'separate_color', ('RGB', 'HSV', 'HSL'))
         node = Node('Separate Color', sockets={'Color': color}, mode=mode)
         return node._out
-
+''',
+'separate_matrix': r'''
     @classmethod
     def separate_matrix(cls, matrix=None):
         """ > Node <&Node Separate Matrix>
@@ -596,7 +632,8 @@ class nd:
         """
         node = Node('Separate Matrix', sockets={'Matrix': matrix})
         return node._out
-
+''',
+'separate_transform': r'''
     @classmethod
     def separate_transform(cls, transform=None):
         """ > Node <&Node Separate Transform>
@@ -611,7 +648,8 @@ class nd:
         """
         node = Node('Separate Transform', sockets={'Transform': transform})
         return node._out
-
+''',
+'slice_string': r'''
     @classmethod
     def slice_string(cls, string=None, position=None, length=None):
         """ > Node <&Node Slice String>
@@ -628,7 +666,8 @@ class nd:
         """
         node = Node('Slice String', sockets={'String': string, 'Position': position, 'Length': length})
         return node._out
-
+''',
+'string_length': r'''
     @classmethod
     def string_length(cls, string=None):
         """ > Node <&Node String Length>
@@ -643,7 +682,8 @@ class nd:
         """
         node = Node('String Length', sockets={'String': string})
         return node._out
-
+''',
+'transform_direction': r'''
     @classmethod
     def transform_direction(cls, direction=None, transform=None):
         """ > Node <&Node Transform Direction>
@@ -659,7 +699,8 @@ class nd:
         """
         node = Node('Transform Direction', sockets={'Direction': direction, 'Transform': transform})
         return node._out
-
+''',
+'transform_point': r'''
     @classmethod
     def transform_point(cls, vector=None, transform=None):
         """ > Node <&Node Transform Point>
@@ -675,7 +716,8 @@ class nd:
         """
         node = Node('Transform Point', sockets={'Vector': vector, 'Transform': transform})
         return node._out
-
+''',
+'transpose_matrix': r'''
     @classmethod
     def transpose_matrix(cls, matrix=None):
         """ > Node <&Node Transpose Matrix>
@@ -690,7 +732,8 @@ class nd:
         """
         node = Node('Transpose Matrix', sockets={'Matrix': matrix})
         return node._out
-
+''',
+'value_to_string': r'''
     @classmethod
     def value_to_string(cls, value=None, decimals=None, data_type='FLOAT'):
         """ > Node <&Node Value to String>
@@ -708,7 +751,8 @@ class nd:
         utils.check_enum_arg('Value to String', 'data_type', data_type, 'value_to_string', ('FLOAT', 'INT'))
         node = Node('Value to String', sockets={'Value': value, 'Decimals': decimals}, data_type=data_type)
         return node._out
-
+''',
+'accumulate_field': r'''
     @classmethod
     def accumulate_field(cls, value=None, group_id=None, data_type='FLOAT', domain='POINT'):
         """ > Node <&Node Accumulate Field>
@@ -728,7 +772,8 @@ class nd:
         utils.check_enum_arg('Accumulate Field', 'domain', domain, 'accumulate_field', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Accumulate Field', sockets={'Value': value, 'Group Index': group_id}, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'domain_size': r'''
     @classmethod
     def domain_size(cls, geometry=None, component='MESH'):
         """ > Node <&Node Domain Size>
@@ -745,7 +790,8 @@ class nd:
         utils.check_enum_arg('Domain Size', 'component', component, 'domain_size', ('MESH', 'POINTCLOUD', 'CURVE', 'INSTANCES', 'GREASEPENCIL'))
         node = Node('Domain Size', sockets={'Geometry': geometry}, component=component)
         return node._out
-
+''',
+'attribute_statistic': r'''
     @classmethod
     def attribute_statistic(cls, geometry=None, selection=None, attribute=None, data_type='FLOAT', domain='POINT'):
         """ > Node <&Node Attribute Statistic>
@@ -766,7 +812,8 @@ class nd:
         utils.check_enum_arg('Attribute Statistic', 'domain', domain, 'attribute_statistic', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Attribute Statistic', sockets={'Geometry': geometry, 'Selection': selection, 'Attribute': attribute}, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'bake': r'''
     @classmethod
     def bake(cls, geometry=None):
         """ > Node <&Node Bake>
@@ -781,7 +828,8 @@ class nd:
         """
         node = Node('Bake', sockets={'Item_0': geometry})
         return node._out
-
+''',
+'blur_attribute': r'''
     @classmethod
     def blur_attribute(cls, value=None, iterations=None, weight=None, data_type='FLOAT'):
         """ > Node <&Node Blur Attribute>
@@ -800,7 +848,8 @@ class nd:
         utils.check_enum_arg('Blur Attribute', 'data_type', data_type, 'blur_attribute', ('FLOAT', 'INT', 'FLOAT_VECTOR', 'FLOAT_COLOR'))
         node = Node('Blur Attribute', sockets={'Value': value, 'Iterations': iterations, 'Weight': weight}, data_type=data_type)
         return node._out
-
+''',
+'bounding_box': r'''
     @classmethod
     def bounding_box(cls, geometry=None):
         """ > Node <&Node Bounding Box>
@@ -815,7 +864,8 @@ class nd:
         """
         node = Node('Bounding Box', sockets={'Geometry': geometry})
         return node._out
-
+''',
+'capture_attribute': r'''
     @classmethod
     def capture_attribute(cls, geometry=None, domain='POINT'):
         """ > Node <&Node Capture Attribute>
@@ -832,7 +882,8 @@ class nd:
         utils.check_enum_arg('Capture Attribute', 'domain', domain, 'capture_attribute', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Capture Attribute', sockets={'Geometry': geometry}, domain=domain)
         return node._out
-
+''',
+'collection_info': r'''
     @classmethod
     def collection_info(cls, collection=None, separate_children=None, reset_children=None, transform_space='ORIGINAL'):
         """ > Node <&Node Collection Info>
@@ -851,7 +902,8 @@ class nd:
         utils.check_enum_arg('Collection Info', 'transform_space', transform_space, 'collection_info', ('ORIGINAL', 'RELATIVE'))
         node = Node('Collection Info', sockets={'Collection': collection, 'Separate Children': separate_children, 'Reset Children': reset_children}, transform_space=transform_space)
         return node._out
-
+''',
+'convex_hull': r'''
     @classmethod
     def convex_hull(cls, geometry=None):
         """ > Node <&Node Convex Hull>
@@ -866,7 +918,8 @@ class nd:
         """
         node = Node('Convex Hull', sockets={'Geometry': geometry})
         return node._out
-
+''',
+'corners_of_edge': r'''
     @classmethod
     def corners_of_edge(cls, edge_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Edge>
@@ -883,7 +936,8 @@ class nd:
         """
         node = Node('Corners of Edge', sockets={'Edge Index': edge_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'corners_of_face': r'''
     @classmethod
     def corners_of_face(cls, face_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Face>
@@ -900,7 +954,8 @@ class nd:
         """
         node = Node('Corners of Face', sockets={'Face Index': face_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'corners_of_vertex': r'''
     @classmethod
     def corners_of_vertex(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Vertex>
@@ -917,7 +972,8 @@ class nd:
         """
         node = Node('Corners of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'arc': r'''
     @classmethod
     def arc(cls, resolution=None, start=None, middle=None, end=None, radius=None, start_angle=None, sweep_angle=None, offset_angle=None, connect_center=None, invert_arc=None, mode='RADIUS'):
         """ > Node <&Node Arc>
@@ -943,7 +999,8 @@ class nd:
         utils.check_enum_arg('Arc', 'mode', mode, 'arc', ('POINTS', 'RADIUS'))
         node = Node('Arc', sockets={'Resolution': resolution, 'Start': start, 'Middle': middle, 'End': end, 'Radius': radius, 'Start Angle': start_angle, 'Sweep Angle': sweep_angle, 'Offset Angle': offset_angle, 'Connect Center': connect_center, 'Invert Arc': invert_arc}, mode=mode)
         return node._out
-
+''',
+'endpoint_selection': r'''
     @classmethod
     def endpoint_selection(cls, start_size=None, end_size=None):
         """ > Node <&Node Endpoint Selection>
@@ -959,7 +1016,8 @@ class nd:
         """
         node = Node('Endpoint Selection', sockets={'Start Size': start_size, 'End Size': end_size})
         return node._out
-
+''',
+'handle_type_selection': r'''
     @classmethod
     def handle_type_selection(cls, handle_type='AUTO', mode={'LEFT', 'RIGHT'}):
         """ > Node <&Node Handle Type Selection>
@@ -976,7 +1034,8 @@ class nd:
         utils.check_enum_arg('Handle Type Selection', 'handle_type', handle_type, 'handle_type_selection', ('FREE', 'AUTO', 'VECTOR', 'ALIGN'))
         node = Node('Handle Type Selection', sockets={}, handle_type=handle_type, mode=mode)
         return node._out
-
+''',
+'curve_length': r'''
     @classmethod
     def curve_length(cls, curve=None):
         """ > Node <&Node Curve Length>
@@ -991,7 +1050,8 @@ class nd:
         """
         node = Node('Curve Length', sockets={'Curve': curve})
         return node._out
-
+''',
+'curve_of_point': r'''
     @classmethod
     def curve_of_point(cls, point_index=None):
         """ > Node <&Node Curve of Point>
@@ -1006,7 +1066,8 @@ class nd:
         """
         node = Node('Curve of Point', sockets={'Point Index': point_index})
         return node._out
-
+''',
+'bezier_segment': r'''
     @classmethod
     def bezier_segment(cls, resolution=None, start=None, start_handle=None, end_handle=None, end=None, mode='POSITION'):
         """ > Node <&Node Bézier Segment>
@@ -1027,7 +1088,8 @@ class nd:
         utils.check_enum_arg('Bézier Segment', 'mode', mode, 'bezier_segment', ('POSITION', 'OFFSET'))
         node = Node('Bézier Segment', sockets={'Resolution': resolution, 'Start': start, 'Start Handle': start_handle, 'End Handle': end_handle, 'End': end}, mode=mode)
         return node._out
-
+''',
+'curve_circle': r'''
     @classmethod
     def curve_circle(cls, resolution=None, point_1=None, point_2=None, point_3=None, radius=None, mode='RADIUS'):
         """ > Node <&Node Curve Circle>
@@ -1048,7 +1110,8 @@ class nd:
         utils.check_enum_arg('Curve Circle', 'mode', mode, 'curve_circle', ('POINTS', 'RADIUS'))
         node = Node('Curve Circle', sockets={'Resolution': resolution, 'Point 1': point_1, 'Point 2': point_2, 'Point 3': point_3, 'Radius': radius}, mode=mode)
         return node._out
-
+''',
+'curve_line': r'''
     @classmethod
     def curve_line(cls, start=None, end=None, direction=None, length=None, mode='POINTS'):
         """ > Node <&Node Curve Line>
@@ -1068,7 +1131,8 @@ class nd:
         utils.check_enum_arg('Curve Line', 'mode', mode, 'curve_line', ('POINTS', 'DIRECTION'))
         node = Node('Curve Line', sockets={'Start': start, 'End': end, 'Direction': direction, 'Length': length}, mode=mode)
         return node._out
-
+''',
+'quadrilateral': r'''
     @classmethod
     def quadrilateral(cls, width=None, height=None, bottom_width=None, top_width=None, offset=None, bottom_height=None, top_height=None, point_1=None, point_2=None, point_3=None, point_4=None, mode='RECTANGLE'):
         """ > Node <&Node Quadrilateral>
@@ -1095,7 +1159,8 @@ class nd:
         utils.check_enum_arg('Quadrilateral', 'mode', mode, 'quadrilateral', ('RECTANGLE', 'PARALLELOGRAM', 'TRAPEZOID', 'KITE', 'POINTS'))
         node = Node('Quadrilateral', sockets={'Width': width, 'Height': height, 'Bottom Width': bottom_width, 'Top Width': top_width, 'Offset': offset, 'Bottom Height': bottom_height, 'Top Height': top_height, 'Point 1': point_1, 'Point 2': point_2, 'Point 3': point_3, 'Point 4': point_4}, mode=mode)
         return node._out
-
+''',
+'quadratic_bezier': r'''
     @classmethod
     def quadratic_bezier(cls, resolution=None, start=None, middle=None, end=None):
         """ > Node <&Node Quadratic Bézier>
@@ -1113,7 +1178,8 @@ class nd:
         """
         node = Node('Quadratic Bézier', sockets={'Resolution': resolution, 'Start': start, 'Middle': middle, 'End': end})
         return node._out
-
+''',
+'set_handle_type': r'''
     @classmethod
     def set_handle_type(cls, curve=None, selection=None, handle_type='AUTO', mode={'LEFT', 'RIGHT'}):
         """ > Node <&Node Set Handle Type>
@@ -1132,7 +1198,8 @@ class nd:
         utils.check_enum_arg('Set Handle Type', 'handle_type', handle_type, 'set_handle_type', ('FREE', 'AUTO', 'VECTOR', 'ALIGN'))
         node = Node('Set Handle Type', sockets={'Curve': curve, 'Selection': selection}, handle_type=handle_type, mode=mode)
         return node._out
-
+''',
+'spiral': r'''
     @classmethod
     def spiral(cls, resolution=None, rotations=None, start_radius=None, end_radius=None, height=None, reverse=None):
         """ > Node <&Node Spiral>
@@ -1152,7 +1219,8 @@ class nd:
         """
         node = Node('Spiral', sockets={'Resolution': resolution, 'Rotations': rotations, 'Start Radius': start_radius, 'End Radius': end_radius, 'Height': height, 'Reverse': reverse})
         return node._out
-
+''',
+'set_spline_type': r'''
     @classmethod
     def set_spline_type(cls, curve=None, selection=None, spline_type='POLY'):
         """ > Node <&Node Set Spline Type>
@@ -1170,7 +1238,8 @@ class nd:
         utils.check_enum_arg('Set Spline Type', 'spline_type', spline_type, 'set_spline_type', ('CATMULL_ROM', 'POLY', 'BEZIER', 'NURBS'))
         node = Node('Set Spline Type', sockets={'Curve': curve, 'Selection': selection}, spline_type=spline_type)
         return node._out
-
+''',
+'star': r'''
     @classmethod
     def star(cls, points=None, inner_radius=None, outer_radius=None, twist=None):
         """ > Node <&Node Star>
@@ -1188,7 +1257,8 @@ class nd:
         """
         node = Node('Star', sockets={'Points': points, 'Inner Radius': inner_radius, 'Outer Radius': outer_radius, 'Twist': twist})
         return node._out
-
+''',
+'curve_to_mesh': r'''
     @classmethod
     def curve_to_mesh(cls, curve=None, profile_curve=None, fill_caps=None):
         """ > Node <&Node Curve to Mesh>
@@ -1205,7 +1275,8 @@ class nd:
         """
         node = Node('Curve to Mesh', sockets={'Curve': curve, 'Profile Curve': profile_curve, 'Fill Caps': fill_caps})
         return node._out
-
+''',
+'curve_to_points': r'''
     @classmethod
     def curve_to_points(cls, curve=None, count=None, length=None, mode='COUNT'):
         """ > Node <&Node Curve to Points>
@@ -1224,7 +1295,8 @@ class nd:
         utils.check_enum_arg('Curve to Points', 'mode', mode, 'curve_to_points', ('EVALUATED', 'COUNT', 'LENGTH'))
         node = Node('Curve to Points', sockets={'Curve': curve, 'Count': count, 'Length': length}, mode=mode)
         return node._out
-
+''',
+'curves_to_grease_pencil': r'''
     @classmethod
     def curves_to_grease_pencil(cls, curves=None, selection=None, instances_as_layers=None):
         """ > Node <&Node Curves to Grease Pencil>
@@ -1241,7 +1313,8 @@ class nd:
         """
         node = Node('Curves to Grease Pencil', sockets={'Curves': curves, 'Selection': selection, 'Instances as Layers': instances_as_layers})
         return node._out
-
+''',
+'deform_curves_on_surface': r'''
     @classmethod
     def deform_curves_on_surface(cls, curves=None):
         """ > Node <&Node Deform Curves on Surface>
@@ -1256,7 +1329,8 @@ class nd:
         """
         node = Node('Deform Curves on Surface', sockets={'Curves': curves})
         return node._out
-
+''',
+'delete_geometry': r'''
     @classmethod
     def delete_geometry(cls, geometry=None, selection=None, domain='POINT', mode='ALL'):
         """ > Node <&Node Delete Geometry>
@@ -1276,7 +1350,8 @@ class nd:
         utils.check_enum_arg('Delete Geometry', 'mode', mode, 'delete_geometry', ('ALL', 'EDGE_FACE', 'ONLY_FACE'))
         node = Node('Delete Geometry', sockets={'Geometry': geometry, 'Selection': selection}, domain=domain, mode=mode)
         return node._out
-
+''',
+'distribute_points_in_grid': r'''
     @classmethod
     def distribute_points_in_grid(cls, grid=None, density=None, seed=None, spacing=None, threshold=None, mode='DENSITY_RANDOM'):
         """ > Node <&Node Distribute Points in Grid>
@@ -1297,7 +1372,8 @@ class nd:
         utils.check_enum_arg('Distribute Points in Grid', 'mode', mode, 'distribute_points_in_grid', ('DENSITY_RANDOM', 'DENSITY_GRID'))
         node = Node('Distribute Points in Grid', sockets={'Grid': grid, 'Density': density, 'Seed': seed, 'Spacing': spacing, 'Threshold': threshold}, mode=mode)
         return node._out
-
+''',
+'distribute_points_in_volume': r'''
     @classmethod
     def distribute_points_in_volume(cls, volume=None, density=None, seed=None, spacing=None, threshold=None, mode='DENSITY_RANDOM'):
         """ > Node <&Node Distribute Points in Volume>
@@ -1318,7 +1394,8 @@ class nd:
         utils.check_enum_arg('Distribute Points in Volume', 'mode', mode, 'distribute_points_in_volume', ('DENSITY_RANDOM', 'DENSITY_GRID'))
         node = Node('Distribute Points in Volume', sockets={'Volume': volume, 'Density': density, 'Seed': seed, 'Spacing': spacing, 'Threshold': threshold}, mode=mode)
         return node._out
-
+''',
+'distribute_points_on_faces': r'''
     @classmethod
     def distribute_points_on_faces(cls, mesh=None, selection=None, distance_min=None, density_max=None, density=None, density_factor=None, seed=None, distribute_method='RANDOM', use_legacy_normal=False):
         """ > Node <&Node Distribute Points on Faces>
@@ -1342,7 +1419,8 @@ class nd:
         utils.check_enum_arg('Distribute Points on Faces', 'distribute_method', distribute_method, 'distribute_points_on_faces', ('RANDOM', 'POISSON'))
         node = Node('Distribute Points on Faces', sockets={'Mesh': mesh, 'Selection': selection, 'Distance Min': distance_min, 'Density Max': density_max, 'Density': density, 'Density Factor': density_factor, 'Seed': seed}, distribute_method=distribute_method, use_legacy_normal=use_legacy_normal)
         return node._out
-
+''',
+'dual_mesh': r'''
     @classmethod
     def dual_mesh(cls, mesh=None, keep_boundaries=None):
         """ > Node <&Node Dual Mesh>
@@ -1358,7 +1436,8 @@ class nd:
         """
         node = Node('Dual Mesh', sockets={'Mesh': mesh, 'Keep Boundaries': keep_boundaries})
         return node._out
-
+''',
+'duplicate_elements': r'''
     @classmethod
     def duplicate_elements(cls, geometry=None, selection=None, amount=None, domain='POINT'):
         """ > Node <&Node Duplicate Elements>
@@ -1377,7 +1456,8 @@ class nd:
         utils.check_enum_arg('Duplicate Elements', 'domain', domain, 'duplicate_elements', ('POINT', 'EDGE', 'FACE', 'SPLINE', 'LAYER', 'INSTANCE'))
         node = Node('Duplicate Elements', sockets={'Geometry': geometry, 'Selection': selection, 'Amount': amount}, domain=domain)
         return node._out
-
+''',
+'edge_paths_to_curves': r'''
     @classmethod
     def edge_paths_to_curves(cls, mesh=None, start_vertices=None, next_vertex_index=None):
         """ > Node <&Node Edge Paths to Curves>
@@ -1394,7 +1474,8 @@ class nd:
         """
         node = Node('Edge Paths to Curves', sockets={'Mesh': mesh, 'Start Vertices': start_vertices, 'Next Vertex Index': next_vertex_index})
         return node._out
-
+''',
+'edge_paths_to_selection': r'''
     @classmethod
     def edge_paths_to_selection(cls, start_vertices=None, next_vertex_index=None):
         """ > Node <&Node Edge Paths to Selection>
@@ -1410,7 +1491,8 @@ class nd:
         """
         node = Node('Edge Paths to Selection', sockets={'Start Vertices': start_vertices, 'Next Vertex Index': next_vertex_index})
         return node._out
-
+''',
+'edges_of_corner': r'''
     @classmethod
     def edges_of_corner(cls, corner_index=None):
         """ > Node <&Node Edges of Corner>
@@ -1425,7 +1507,8 @@ class nd:
         """
         node = Node('Edges of Corner', sockets={'Corner Index': corner_index})
         return node._out
-
+''',
+'edges_of_vertex': r'''
     @classmethod
     def edges_of_vertex(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Edges of Vertex>
@@ -1442,7 +1525,8 @@ class nd:
         """
         node = Node('Edges of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'edges_to_face_groups': r'''
     @classmethod
     def edges_to_face_groups(cls, boundary_edges=None):
         """ > Node <&Node Edges to Face Groups>
@@ -1457,7 +1541,8 @@ class nd:
         """
         node = Node('Edges to Face Groups', sockets={'Boundary Edges': boundary_edges})
         return node._out
-
+''',
+'extrude_mesh': r'''
     @classmethod
     def extrude_mesh(cls, mesh=None, selection=None, offset=None, offset_scale=None, individual=None, mode='FACES'):
         """ > Node <&Node Extrude Mesh>
@@ -1478,7 +1563,8 @@ class nd:
         utils.check_enum_arg('Extrude Mesh', 'mode', mode, 'extrude_mesh', ('VERTICES', 'EDGES', 'FACES'))
         node = Node('Extrude Mesh', sockets={'Mesh': mesh, 'Selection': selection, 'Offset': offset, 'Offset Scale': offset_scale, 'Individual': individual}, mode=mode)
         return node._out
-
+''',
+'face_of_corner': r'''
     @classmethod
     def face_of_corner(cls, corner_index=None):
         """ > Node <&Node Face of Corner>
@@ -1493,7 +1579,8 @@ class nd:
         """
         node = Node('Face of Corner', sockets={'Corner Index': corner_index})
         return node._out
-
+''',
+'evaluate_at_index': r'''
     @classmethod
     def evaluate_at_index(cls, index=None, value=None, data_type='FLOAT', domain='POINT'):
         """ > Node <&Node Evaluate at Index>
@@ -1513,7 +1600,8 @@ class nd:
         utils.check_enum_arg('Evaluate at Index', 'domain', domain, 'evaluate_at_index', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Evaluate at Index', sockets={'Index': index, 'Value': value}, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'evaluate_on_domain': r'''
     @classmethod
     def evaluate_on_domain(cls, value=None, data_type='FLOAT', domain='POINT'):
         """ > Node <&Node Evaluate on Domain>
@@ -1532,7 +1620,8 @@ class nd:
         utils.check_enum_arg('Evaluate on Domain', 'domain', domain, 'evaluate_on_domain', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Evaluate on Domain', sockets={'Value': value}, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'fill_curve': r'''
     @classmethod
     def fill_curve(cls, curve=None, group_id=None, mode='TRIANGLES'):
         """ > Node <&Node Fill Curve>
@@ -1550,7 +1639,8 @@ class nd:
         utils.check_enum_arg('Fill Curve', 'mode', mode, 'fill_curve', ('TRIANGLES', 'NGONS'))
         node = Node('Fill Curve', sockets={'Curve': curve, 'Group ID': group_id}, mode=mode)
         return node._out
-
+''',
+'fillet_curve': r'''
     @classmethod
     def fillet_curve(cls, curve=None, count=None, radius=None, limit_radius=None, mode='BEZIER'):
         """ > Node <&Node Fillet Curve>
@@ -1570,7 +1660,8 @@ class nd:
         utils.check_enum_arg('Fillet Curve', 'mode', mode, 'fillet_curve', ('BEZIER', 'POLY'))
         node = Node('Fillet Curve', sockets={'Curve': curve, 'Count': count, 'Radius': radius, 'Limit Radius': limit_radius}, mode=mode)
         return node._out
-
+''',
+'flip_faces': r'''
     @classmethod
     def flip_faces(cls, mesh=None, selection=None):
         """ > Node <&Node Flip Faces>
@@ -1586,7 +1677,8 @@ class nd:
         """
         node = Node('Flip Faces', sockets={'Mesh': mesh, 'Selection': selection})
         return node._out
-
+''',
+'for_each_geometry_element_input': r'''
     @classmethod
     def for_each_geometry_element_input(cls, geometry=None, selection=None):
         """ > Node <&Node For Each Geometry Element Input>
@@ -1602,7 +1694,8 @@ class nd:
         """
         node = Node('For Each Geometry Element Input', sockets={'Geometry': geometry, 'Selection': selection})
         return node._out
-
+''',
+'for_each_geometry_element_output': r'''
     @classmethod
     def for_each_geometry_element_output(cls, geometry=None, active_generation_index=0, active_input_index=0, active_main_index=0, domain='POINT', inspection_index=0):
         """ > Node <&Node For Each Geometry Element Output>
@@ -1623,7 +1716,8 @@ class nd:
         utils.check_enum_arg('For Each Geometry Element Output', 'domain', domain, 'for_each_geometry_element_output', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('For Each Geometry Element Output', sockets={'Generation_0': geometry}, active_generation_index=active_generation_index, active_input_index=active_input_index, active_main_index=active_main_index, domain=domain, inspection_index=inspection_index)
         return node._out
-
+''',
+'geometry_to_instance': r'''
     @classmethod
     def geometry_to_instance(cls, *geometry):
         """ > Node <&Node Geometry to Instance>
@@ -1638,7 +1732,8 @@ class nd:
         """
         node = Node('Geometry to Instance', sockets={'Geometry': list(geometry)})
         return node._out
-
+''',
+'get_named_grid': r'''
     @classmethod
     def get_named_grid(cls, volume=None, name=None, remove=None, data_type='FLOAT'):
         """ > Node <&Node Get Named Grid>
@@ -1657,7 +1752,8 @@ class nd:
         utils.check_enum_arg('Get Named Grid', 'data_type', data_type, 'get_named_grid', ('FLOAT', 'VECTOR'))
         node = Node('Get Named Grid', sockets={'Volume': volume, 'Name': name, 'Remove': remove}, data_type=data_type)
         return node._out
-
+''',
+'dial_gizmo': r'''
     @classmethod
     def dial_gizmo(cls, *value, position=None, up=None, screen_space=None, radius=None, color_id='PRIMARY'):
         """ > Node <&Node Dial Gizmo>
@@ -1678,7 +1774,8 @@ class nd:
         utils.check_enum_arg('Dial Gizmo', 'color_id', color_id, 'dial_gizmo', ('PRIMARY', 'SECONDARY', 'X', 'Y', 'Z'))
         node = Node('Dial Gizmo', sockets={'Value': list(value), 'Position': position, 'Up': up, 'Screen Space': screen_space, 'Radius': radius}, color_id=color_id)
         return node._out
-
+''',
+'linear_gizmo': r'''
     @classmethod
     def linear_gizmo(cls, *value, position=None, direction=None, color_id='PRIMARY', draw_style='ARROW'):
         """ > Node <&Node Linear Gizmo>
@@ -1699,7 +1796,8 @@ class nd:
         utils.check_enum_arg('Linear Gizmo', 'draw_style', draw_style, 'linear_gizmo', ('ARROW', 'CROSS', 'BOX'))
         node = Node('Linear Gizmo', sockets={'Value': list(value), 'Position': position, 'Direction': direction}, color_id=color_id, draw_style=draw_style)
         return node._out
-
+''',
+'transform_gizmo': r'''
     @classmethod
     def transform_gizmo(cls, *value, position=None, rotation=None, use_rotation_x=True, use_rotation_y=True, use_rotation_z=True, use_scale_x=True, use_scale_y=True, use_scale_z=True, use_translation_x=True, use_translation_y=True, use_translation_z=True):
         """ > Node <&Node Transform Gizmo>
@@ -1725,7 +1823,8 @@ class nd:
         """
         node = Node('Transform Gizmo', sockets={'Value': list(value), 'Position': position, 'Rotation': rotation}, use_rotation_x=use_rotation_x, use_rotation_y=use_rotation_y, use_rotation_z=use_rotation_z, use_scale_x=use_scale_x, use_scale_y=use_scale_y, use_scale_z=use_scale_z, use_translation_x=use_translation_x, use_translation_y=use_translation_y, use_translation_z=use_translation_z)
         return node._out
-
+''',
+'grease_pencil_to_curves': r'''
     @classmethod
     def grease_pencil_to_curves(cls, grease_pencil=None, selection=None, layers_as_instances=None):
         """ > Node <&Node Grease Pencil to Curves>
@@ -1742,7 +1841,8 @@ class nd:
         """
         node = Node('Grease Pencil to Curves', sockets={'Grease Pencil': grease_pencil, 'Selection': selection, 'Layers as Instances': layers_as_instances})
         return node._out
-
+''',
+'grid_to_mesh': r'''
     @classmethod
     def grid_to_mesh(cls, grid=None, threshold=None, adaptivity=None):
         """ > Node <&Node Grid to Mesh>
@@ -1759,7 +1859,8 @@ class nd:
         """
         node = Node('Grid to Mesh', sockets={'Grid': grid, 'Threshold': threshold, 'Adaptivity': adaptivity})
         return node._out
-
+''',
+'group': r'''
     @classmethod
     def group(cls, node_tree=None):
         """ > Node <&Node Group>
@@ -1774,7 +1875,8 @@ class nd:
         """
         node = Node('Group', sockets={}, node_tree=node_tree)
         return node._out
-
+''',
+'image_info': r'''
     @classmethod
     def image_info(cls, image=None, frame=None):
         """ > Node <&Node Image Info>
@@ -1790,7 +1892,8 @@ class nd:
         """
         node = Node('Image Info', sockets={'Image': image, 'Frame': frame})
         return node._out
-
+''',
+'image_texture': r'''
     @classmethod
     def image_texture(cls, image=None, vector=None, frame=None, extension='REPEAT', interpolation='Linear'):
         """ > Node <&Node Image Texture>
@@ -1811,7 +1914,8 @@ class nd:
         utils.check_enum_arg('Image Texture', 'interpolation', interpolation, 'image_texture', ('Linear', 'Closest', 'Cubic'))
         node = Node('Image Texture', sockets={'Image': image, 'Vector': vector, 'Frame': frame}, extension=extension, interpolation=interpolation)
         return node._out
-
+''',
+'import_obj': r'''
     @classmethod
     def import_obj(cls, path=None):
         """ > Node <&Node Import OBJ>
@@ -1826,7 +1930,8 @@ class nd:
         """
         node = Node('Import OBJ', sockets={'Path': path})
         return node._out
-
+''',
+'import_ply': r'''
     @classmethod
     def import_ply(cls, path=None):
         """ > Node <&Node Import PLY>
@@ -1841,7 +1946,8 @@ class nd:
         """
         node = Node('Import PLY', sockets={'Path': path})
         return node._out
-
+''',
+'import_stl': r'''
     @classmethod
     def import_stl(cls, path=None):
         """ > Node <&Node Import STL>
@@ -1856,7 +1962,8 @@ class nd:
         """
         node = Node('Import STL', sockets={'Path': path})
         return node._out
-
+''',
+'index_of_nearest': r'''
     @classmethod
     def index_of_nearest(cls, position=None, group_id=None):
         """ > Node <&Node Index of Nearest>
@@ -1872,7 +1979,8 @@ class nd:
         """
         node = Node('Index of Nearest', sockets={'Position': position, 'Group ID': group_id})
         return node._out
-
+''',
+'index_switch': r'''
     @classmethod
     def index_switch(cls, index=None, _0=None, _1=None, data_type='GEOMETRY'):
         """ > Node <&Node Index Switch>
@@ -1891,7 +1999,8 @@ class nd:
         utils.check_enum_arg('Index Switch', 'data_type', data_type, 'index_switch', ('FLOAT', 'INT', 'BOOLEAN', 'VECTOR', 'ROTATION', 'MATRIX', 'STRING', 'MENU', 'RGBA', 'OBJECT', 'IMAGE', 'GEOMETRY', 'COLLECTION', 'MATERIAL'))
         node = Node('Index Switch', sockets={'Index': index, 'Item_0': _0, 'Item_1': _1}, data_type=data_type)
         return node._out
-
+''',
+'active_camera': r'''
     @classmethod
     @property
     def active_camera(cls):
@@ -1903,7 +2012,8 @@ class nd:
         """
         node = Node('Active Camera', sockets={})
         return node._out
-
+''',
+'curve_handle_positions': r'''
     @classmethod
     def curve_handle_positions(cls, relative=None):
         """ > Node <&Node Curve Handle Positions>
@@ -1918,7 +2028,8 @@ class nd:
         """
         node = Node('Curve Handle Positions', sockets={'Relative': relative})
         return node._out
-
+''',
+'curve_tilt': r'''
     @classmethod
     @property
     def curve_tilt(cls):
@@ -1930,7 +2041,8 @@ class nd:
         """
         node = Node('Curve Tilt', sockets={})
         return node._out
-
+''',
+'is_edge_smooth': r'''
     @classmethod
     @property
     def is_edge_smooth(cls):
@@ -1942,7 +2054,8 @@ class nd:
         """
         node = Node('Is Edge Smooth', sockets={})
         return node._out
-
+''',
+'id': r'''
     @classmethod
     @property
     def id(cls):
@@ -1954,7 +2067,8 @@ class nd:
         """
         node = Node('ID', sockets={})
         return node._out
-
+''',
+'image': r'''
     @classmethod
     def image(cls, image=None):
         """ > Node <&Node Image>
@@ -1969,7 +2083,8 @@ class nd:
         """
         node = Node('Image', sockets={}, image=image)
         return node._out
-
+''',
+'index': r'''
     @classmethod
     @property
     def index(cls):
@@ -1981,7 +2096,8 @@ class nd:
         """
         node = Node('Index', sockets={})
         return node._out
-
+''',
+'instance_rotation': r'''
     @classmethod
     @property
     def instance_rotation(cls):
@@ -1993,7 +2109,8 @@ class nd:
         """
         node = Node('Instance Rotation', sockets={})
         return node._out
-
+''',
+'instance_scale': r'''
     @classmethod
     @property
     def instance_scale(cls):
@@ -2005,7 +2122,8 @@ class nd:
         """
         node = Node('Instance Scale', sockets={})
         return node._out
-
+''',
+'material': r'''
     @classmethod
     def material(cls, material=None):
         """ > Node <&Node Material>
@@ -2020,7 +2138,8 @@ class nd:
         """
         node = Node('Material', sockets={}, material=material)
         return node._out
-
+''',
+'material_index': r'''
     @classmethod
     @property
     def material_index(cls):
@@ -2032,7 +2151,8 @@ class nd:
         """
         node = Node('Material Index', sockets={})
         return node._out
-
+''',
+'edge_angle': r'''
     @classmethod
     def edge_angle(cls):
         """ > Node <&Node Edge Angle>
@@ -2043,7 +2163,8 @@ class nd:
         """
         node = Node('Edge Angle', sockets={})
         return node
-
+''',
+'edge_neighbors': r'''
     @classmethod
     @property
     def edge_neighbors(cls):
@@ -2055,7 +2176,8 @@ class nd:
         """
         node = Node('Edge Neighbors', sockets={})
         return node._out
-
+''',
+'edge_vertices': r'''
     @classmethod
     def edge_vertices(cls):
         """ > Node <&Node Edge Vertices>
@@ -2066,7 +2188,8 @@ class nd:
         """
         node = Node('Edge Vertices', sockets={})
         return node
-
+''',
+'face_area': r'''
     @classmethod
     @property
     def face_area(cls):
@@ -2078,7 +2201,8 @@ class nd:
         """
         node = Node('Face Area', sockets={})
         return node._out
-
+''',
+'is_face_planar': r'''
     @classmethod
     def is_face_planar(cls, threshold=None):
         """ > Node <&Node Is Face Planar>
@@ -2093,7 +2217,8 @@ class nd:
         """
         node = Node('Is Face Planar', sockets={'Threshold': threshold})
         return node._out
-
+''',
+'face_neighbors': r'''
     @classmethod
     def face_neighbors(cls):
         """ > Node <&Node Face Neighbors>
@@ -2104,7 +2229,8 @@ class nd:
         """
         node = Node('Face Neighbors', sockets={})
         return node
-
+''',
+'mesh_island': r'''
     @classmethod
     def mesh_island(cls):
         """ > Node <&Node Mesh Island>
@@ -2115,7 +2241,8 @@ class nd:
         """
         node = Node('Mesh Island', sockets={})
         return node
-
+''',
+'vertex_neighbors': r'''
     @classmethod
     def vertex_neighbors(cls):
         """ > Node <&Node Vertex Neighbors>
@@ -2126,7 +2253,8 @@ class nd:
         """
         node = Node('Vertex Neighbors', sockets={})
         return node
-
+''',
+'named_attribute': r'''
     @classmethod
     def named_attribute(cls, name=None, data_type='FLOAT'):
         """ > Node <&Node Named Attribute>
@@ -2143,7 +2271,8 @@ class nd:
         utils.check_enum_arg('Named Attribute', 'data_type', data_type, 'named_attribute', ('FLOAT', 'INT', 'FLOAT_VECTOR', 'FLOAT_COLOR', 'BOOLEAN', 'QUATERNION', 'FLOAT4X4'))
         node = Node('Named Attribute', sockets={'Name': name}, data_type=data_type)
         return node._out
-
+''',
+'named_layer_selection': r'''
     @classmethod
     def named_layer_selection(cls, name=None):
         """ > Node <&Node Named Layer Selection>
@@ -2158,7 +2287,8 @@ class nd:
         """
         node = Node('Named Layer Selection', sockets={'Name': name})
         return node._out
-
+''',
+'normal': r'''
     @classmethod
     @property
     def normal(cls):
@@ -2170,7 +2300,8 @@ class nd:
         """
         node = Node('Normal', sockets={})
         return node._out
-
+''',
+'position': r'''
     @classmethod
     @property
     def position(cls):
@@ -2182,7 +2313,8 @@ class nd:
         """
         node = Node('Position', sockets={})
         return node._out
-
+''',
+'radius': r'''
     @classmethod
     @property
     def radius(cls):
@@ -2194,7 +2326,8 @@ class nd:
         """
         node = Node('Radius', sockets={})
         return node._out
-
+''',
+'scene_time': r'''
     @classmethod
     def scene_time(cls):
         """ > Node <&Node Scene Time>
@@ -2205,7 +2338,8 @@ class nd:
         """
         node = Node('Scene Time', sockets={})
         return node
-
+''',
+'is_face_smooth': r'''
     @classmethod
     @property
     def is_face_smooth(cls):
@@ -2217,7 +2351,8 @@ class nd:
         """
         node = Node('Is Face Smooth', sockets={})
         return node._out
-
+''',
+'shortest_edge_paths': r'''
     @classmethod
     def shortest_edge_paths(cls, end_vertex=None, edge_cost=None):
         """ > Node <&Node Shortest Edge Paths>
@@ -2233,7 +2368,8 @@ class nd:
         """
         node = Node('Shortest Edge Paths', sockets={'End Vertex': end_vertex, 'Edge Cost': edge_cost})
         return node._out
-
+''',
+'is_spline_cyclic': r'''
     @classmethod
     @property
     def is_spline_cyclic(cls):
@@ -2245,7 +2381,8 @@ class nd:
         """
         node = Node('Is Spline Cyclic', sockets={})
         return node._out
-
+''',
+'spline_resolution': r'''
     @classmethod
     @property
     def spline_resolution(cls):
@@ -2257,7 +2394,8 @@ class nd:
         """
         node = Node('Spline Resolution', sockets={})
         return node._out
-
+''',
+'curve_tangent': r'''
     @classmethod
     @property
     def curve_tangent(cls):
@@ -2269,7 +2407,8 @@ class nd:
         """
         node = Node('Curve Tangent', sockets={})
         return node._out
-
+''',
+'instance_on_points': r'''
     @classmethod
     def instance_on_points(cls, points=None, selection=None, instance=None, pick_instance=None, instance_index=None, rotation=None, scale=None):
         """ > Node <&Node Instance on Points>
@@ -2290,7 +2429,8 @@ class nd:
         """
         node = Node('Instance on Points', sockets={'Points': points, 'Selection': selection, 'Instance': instance, 'Pick Instance': pick_instance, 'Instance Index': instance_index, 'Rotation': rotation, 'Scale': scale})
         return node._out
-
+''',
+'instance_transform': r'''
     @classmethod
     @property
     def instance_transform(cls):
@@ -2302,7 +2442,8 @@ class nd:
         """
         node = Node('Instance Transform', sockets={})
         return node._out
-
+''',
+'instances_to_points': r'''
     @classmethod
     def instances_to_points(cls, instances=None, selection=None, position=None, radius=None):
         """ > Node <&Node Instances to Points>
@@ -2320,7 +2461,8 @@ class nd:
         """
         node = Node('Instances to Points', sockets={'Instances': instances, 'Selection': selection, 'Position': position, 'Radius': radius})
         return node._out
-
+''',
+'interpolate_curves': r'''
     @classmethod
     def interpolate_curves(cls, guide_curves=None, guide_up=None, guide_group_id=None, points=None, point_up=None, point_group_id=None, max_neighbors=None):
         """ > Node <&Node Interpolate Curves>
@@ -2341,7 +2483,8 @@ class nd:
         """
         node = Node('Interpolate Curves', sockets={'Guide Curves': guide_curves, 'Guide Up': guide_up, 'Guide Group ID': guide_group_id, 'Points': points, 'Point Up': point_up, 'Point Group ID': point_group_id, 'Max Neighbors': max_neighbors})
         return node._out
-
+''',
+'is_viewport': r'''
     @classmethod
     @property
     def is_viewport(cls):
@@ -2353,7 +2496,8 @@ class nd:
         """
         node = Node('Is Viewport', sockets={})
         return node._out
-
+''',
+'join_geometry': r'''
     @classmethod
     def join_geometry(cls, *geometry):
         """ > Node <&Node Join Geometry>
@@ -2368,7 +2512,8 @@ class nd:
         """
         node = Node('Join Geometry', sockets={'Geometry': list(geometry)})
         return node._out
-
+''',
+'material_selection': r'''
     @classmethod
     def material_selection(cls, material=None):
         """ > Node <&Node Material Selection>
@@ -2383,7 +2528,8 @@ class nd:
         """
         node = Node('Material Selection', sockets={'Material': material})
         return node._out
-
+''',
+'menu_switch': r'''
     @classmethod
     def menu_switch(cls, menu=None, a=None, b=None, data_type='GEOMETRY'):
         """ > Node <&Node Menu Switch>
@@ -2402,7 +2548,8 @@ class nd:
         utils.check_enum_arg('Menu Switch', 'data_type', data_type, 'menu_switch', ('FLOAT', 'INT', 'BOOLEAN', 'VECTOR', 'ROTATION', 'MATRIX', 'STRING', 'RGBA', 'OBJECT', 'IMAGE', 'GEOMETRY', 'COLLECTION', 'MATERIAL'))
         node = Node('Menu Switch', sockets={'Menu': menu, 'Item_0': a, 'Item_1': b}, data_type=data_type)
         return node._out
-
+''',
+'merge_by_distance': r'''
     @classmethod
     def merge_by_distance(cls, geometry=None, selection=None, distance=None, mode='ALL'):
         """ > Node <&Node Merge by Distance>
@@ -2421,7 +2568,8 @@ class nd:
         utils.check_enum_arg('Merge by Distance', 'mode', mode, 'merge_by_distance', ('ALL', 'CONNECTED'))
         node = Node('Merge by Distance', sockets={'Geometry': geometry, 'Selection': selection, 'Distance': distance}, mode=mode)
         return node._out
-
+''',
+'merge_layers': r'''
     @classmethod
     def merge_layers(cls, grease_pencil=None, selection=None, group_id=None, mode='MERGE_BY_NAME'):
         """ > Node <&Node Merge Layers>
@@ -2440,7 +2588,8 @@ class nd:
         utils.check_enum_arg('Merge Layers', 'mode', mode, 'merge_layers', ('MERGE_BY_NAME', 'MERGE_BY_ID'))
         node = Node('Merge Layers', sockets={'Grease Pencil': grease_pencil, 'Selection': selection, 'Group ID': group_id}, mode=mode)
         return node._out
-
+''',
+'mesh_boolean': r'''
     @classmethod
     def mesh_boolean(cls, *mesh_2, mesh_1=None, self_intersection=None, hole_tolerant=None, operation='DIFFERENCE', solver='FLOAT'):
         """ > Node <&Node Mesh Boolean>
@@ -2462,7 +2611,8 @@ class nd:
         utils.check_enum_arg('Mesh Boolean', 'solver', solver, 'mesh_boolean', ('EXACT', 'FLOAT'))
         node = Node('Mesh Boolean', sockets={'Mesh 1': mesh_1, 'Mesh 2': list(mesh_2), 'Self Intersection': self_intersection, 'Hole Tolerant': hole_tolerant}, operation=operation, solver=solver)
         return node._out
-
+''',
+'mesh_circle': r'''
     @classmethod
     def mesh_circle(cls, vertices=None, radius=None, fill_type='NONE'):
         """ > Node <&Node Mesh Circle>
@@ -2480,7 +2630,8 @@ class nd:
         utils.check_enum_arg('Mesh Circle', 'fill_type', fill_type, 'mesh_circle', ('NONE', 'NGON', 'TRIANGLE_FAN'))
         node = Node('Mesh Circle', sockets={'Vertices': vertices, 'Radius': radius}, fill_type=fill_type)
         return node._out
-
+''',
+'cone': r'''
     @classmethod
     def cone(cls, vertices=None, side_segments=None, fill_segments=None, radius_top=None, radius_bottom=None, depth=None, fill_type='NGON'):
         """ > Node <&Node Cone>
@@ -2502,7 +2653,8 @@ class nd:
         utils.check_enum_arg('Cone', 'fill_type', fill_type, 'cone', ('NONE', 'NGON', 'TRIANGLE_FAN'))
         node = Node('Cone', sockets={'Vertices': vertices, 'Side Segments': side_segments, 'Fill Segments': fill_segments, 'Radius Top': radius_top, 'Radius Bottom': radius_bottom, 'Depth': depth}, fill_type=fill_type)
         return node._out
-
+''',
+'cube': r'''
     @classmethod
     def cube(cls, size=None, vertices_x=None, vertices_y=None, vertices_z=None):
         """ > Node <&Node Cube>
@@ -2520,7 +2672,8 @@ class nd:
         """
         node = Node('Cube', sockets={'Size': size, 'Vertices X': vertices_x, 'Vertices Y': vertices_y, 'Vertices Z': vertices_z})
         return node._out
-
+''',
+'cylinder': r'''
     @classmethod
     def cylinder(cls, vertices=None, side_segments=None, fill_segments=None, radius=None, depth=None, fill_type='NGON'):
         """ > Node <&Node Cylinder>
@@ -2541,7 +2694,8 @@ class nd:
         utils.check_enum_arg('Cylinder', 'fill_type', fill_type, 'cylinder', ('NONE', 'NGON', 'TRIANGLE_FAN'))
         node = Node('Cylinder', sockets={'Vertices': vertices, 'Side Segments': side_segments, 'Fill Segments': fill_segments, 'Radius': radius, 'Depth': depth}, fill_type=fill_type)
         return node._out
-
+''',
+'face_group_boundaries': r'''
     @classmethod
     def face_group_boundaries(cls, face_group_id=None):
         """ > Node <&Node Face Group Boundaries>
@@ -2556,7 +2710,8 @@ class nd:
         """
         node = Node('Face Group Boundaries', sockets={'Face Set': face_group_id})
         return node._out
-
+''',
+'grid': r'''
     @classmethod
     def grid(cls, size_x=None, size_y=None, vertices_x=None, vertices_y=None):
         """ > Node <&Node Grid>
@@ -2574,7 +2729,8 @@ class nd:
         """
         node = Node('Grid', sockets={'Size X': size_x, 'Size Y': size_y, 'Vertices X': vertices_x, 'Vertices Y': vertices_y})
         return node._out
-
+''',
+'ico_sphere': r'''
     @classmethod
     def ico_sphere(cls, radius=None, subdivisions=None):
         """ > Node <&Node Ico Sphere>
@@ -2590,7 +2746,8 @@ class nd:
         """
         node = Node('Ico Sphere', sockets={'Radius': radius, 'Subdivisions': subdivisions})
         return node._out
-
+''',
+'mesh_line': r'''
     @classmethod
     def mesh_line(cls, count=None, resolution=None, start_location=None, offset=None, count_mode='TOTAL', mode='OFFSET'):
         """ > Node <&Node Mesh Line>
@@ -2612,7 +2769,8 @@ class nd:
         utils.check_enum_arg('Mesh Line', 'mode', mode, 'mesh_line', ('OFFSET', 'END_POINTS'))
         node = Node('Mesh Line', sockets={'Count': count, 'Resolution': resolution, 'Start Location': start_location, 'Offset': offset}, count_mode=count_mode, mode=mode)
         return node._out
-
+''',
+'mesh_to_curve': r'''
     @classmethod
     def mesh_to_curve(cls, mesh=None, selection=None):
         """ > Node <&Node Mesh to Curve>
@@ -2628,7 +2786,8 @@ class nd:
         """
         node = Node('Mesh to Curve', sockets={'Mesh': mesh, 'Selection': selection})
         return node._out
-
+''',
+'mesh_to_density_grid': r'''
     @classmethod
     def mesh_to_density_grid(cls, mesh=None, density=None, voxel_size=None, gradient_width=None):
         """ > Node <&Node Mesh to Density Grid>
@@ -2646,7 +2805,8 @@ class nd:
         """
         node = Node('Mesh to Density Grid', sockets={'Mesh': mesh, 'Density': density, 'Voxel Size': voxel_size, 'Gradient Width': gradient_width})
         return node._out
-
+''',
+'mesh_to_points': r'''
     @classmethod
     def mesh_to_points(cls, mesh=None, selection=None, position=None, radius=None, mode='VERTICES'):
         """ > Node <&Node Mesh to Points>
@@ -2666,7 +2826,8 @@ class nd:
         utils.check_enum_arg('Mesh to Points', 'mode', mode, 'mesh_to_points', ('VERTICES', 'EDGES', 'FACES', 'CORNERS'))
         node = Node('Mesh to Points', sockets={'Mesh': mesh, 'Selection': selection, 'Position': position, 'Radius': radius}, mode=mode)
         return node._out
-
+''',
+'mesh_to_sdf_grid': r'''
     @classmethod
     def mesh_to_sdf_grid(cls, mesh=None, voxel_size=None, band_width=None):
         """ > Node <&Node Mesh to SDF Grid>
@@ -2683,7 +2844,8 @@ class nd:
         """
         node = Node('Mesh to SDF Grid', sockets={'Mesh': mesh, 'Voxel Size': voxel_size, 'Band Width': band_width})
         return node._out
-
+''',
+'mesh_to_volume': r'''
     @classmethod
     def mesh_to_volume(cls, mesh=None, density=None, voxel_size=None, voxel_amount=None, interior_band_width=None, resolution_mode='VOXEL_AMOUNT'):
         """ > Node <&Node Mesh to Volume>
@@ -2704,7 +2866,8 @@ class nd:
         utils.check_enum_arg('Mesh to Volume', 'resolution_mode', resolution_mode, 'mesh_to_volume', ('VOXEL_AMOUNT', 'VOXEL_SIZE'))
         node = Node('Mesh to Volume', sockets={'Mesh': mesh, 'Density': density, 'Voxel Size': voxel_size, 'Voxel Amount': voxel_amount, 'Interior Band Width': interior_band_width}, resolution_mode=resolution_mode)
         return node._out
-
+''',
+'uv_sphere': r'''
     @classmethod
     def uv_sphere(cls, segments=None, rings=None, radius=None):
         """ > Node <&Node UV Sphere>
@@ -2721,7 +2884,8 @@ class nd:
         """
         node = Node('UV Sphere', sockets={'Segments': segments, 'Rings': rings, 'Radius': radius})
         return node._out
-
+''',
+'object_info': r'''
     @classmethod
     def object_info(cls, object=None, as_instance=None, transform_space='ORIGINAL'):
         """ > Node <&Node Object Info>
@@ -2739,7 +2903,8 @@ class nd:
         utils.check_enum_arg('Object Info', 'transform_space', transform_space, 'object_info', ('ORIGINAL', 'RELATIVE'))
         node = Node('Object Info', sockets={'Object': object, 'As Instance': as_instance}, transform_space=transform_space)
         return node._out
-
+''',
+'offset_corner_in_face': r'''
     @classmethod
     def offset_corner_in_face(cls, corner_index=None, offset=None):
         """ > Node <&Node Offset Corner in Face>
@@ -2755,7 +2920,8 @@ class nd:
         """
         node = Node('Offset Corner in Face', sockets={'Corner Index': corner_index, 'Offset': offset})
         return node._out
-
+''',
+'offset_point_in_curve': r'''
     @classmethod
     def offset_point_in_curve(cls, point_index=None, offset=None):
         """ > Node <&Node Offset Point in Curve>
@@ -2771,7 +2937,8 @@ class nd:
         """
         node = Node('Offset Point in Curve', sockets={'Point Index': point_index, 'Offset': offset})
         return node._out
-
+''',
+'points': r'''
     @classmethod
     def points(cls, count=None, position=None, radius=None):
         """ > Node <&Node Points>
@@ -2788,7 +2955,8 @@ class nd:
         """
         node = Node('Points', sockets={'Count': count, 'Position': position, 'Radius': radius})
         return node._out
-
+''',
+'points_of_curve': r'''
     @classmethod
     def points_of_curve(cls, curve_index=None, weights=None, sort_index=None):
         """ > Node <&Node Points of Curve>
@@ -2805,7 +2973,8 @@ class nd:
         """
         node = Node('Points of Curve', sockets={'Curve Index': curve_index, 'Weights': weights, 'Sort Index': sort_index})
         return node._out
-
+''',
+'points_to_curves': r'''
     @classmethod
     def points_to_curves(cls, points=None, curve_group_id=None, weight=None):
         """ > Node <&Node Points to Curves>
@@ -2822,7 +2991,8 @@ class nd:
         """
         node = Node('Points to Curves', sockets={'Points': points, 'Curve Group ID': curve_group_id, 'Weight': weight})
         return node._out
-
+''',
+'points_to_sdf_grid': r'''
     @classmethod
     def points_to_sdf_grid(cls, points=None, radius=None, voxel_size=None):
         """ > Node <&Node Points to SDF Grid>
@@ -2839,7 +3009,8 @@ class nd:
         """
         node = Node('Points to SDF Grid', sockets={'Points': points, 'Radius': radius, 'Voxel Size': voxel_size})
         return node._out
-
+''',
+'points_to_vertices': r'''
     @classmethod
     def points_to_vertices(cls, points=None, selection=None):
         """ > Node <&Node Points to Vertices>
@@ -2855,7 +3026,8 @@ class nd:
         """
         node = Node('Points to Vertices', sockets={'Points': points, 'Selection': selection})
         return node._out
-
+''',
+'points_to_volume': r'''
     @classmethod
     def points_to_volume(cls, points=None, density=None, voxel_size=None, voxel_amount=None, radius=None, resolution_mode='VOXEL_AMOUNT'):
         """ > Node <&Node Points to Volume>
@@ -2876,7 +3048,8 @@ class nd:
         utils.check_enum_arg('Points to Volume', 'resolution_mode', resolution_mode, 'points_to_volume', ('VOXEL_AMOUNT', 'VOXEL_SIZE'))
         node = Node('Points to Volume', sockets={'Points': points, 'Density': density, 'Voxel Size': voxel_size, 'Voxel Amount': voxel_amount, 'Radius': radius}, resolution_mode=resolution_mode)
         return node._out
-
+''',
+'geometry_proximity': r'''
     @classmethod
     def geometry_proximity(cls, geometry=None, group_id=None, sample_position=None, sample_group_id=None, target_element='FACES'):
         """ > Node <&Node Geometry Proximity>
@@ -2896,7 +3069,8 @@ class nd:
         utils.check_enum_arg('Geometry Proximity', 'target_element', target_element, 'geometry_proximity', ('POINTS', 'EDGES', 'FACES'))
         node = Node('Geometry Proximity', sockets={'Target': geometry, 'Group ID': group_id, 'Source Position': sample_position, 'Sample Group ID': sample_group_id}, target_element=target_element)
         return node._out
-
+''',
+'raycast': r'''
     @classmethod
     def raycast(cls, target_geometry=None, attribute=None, source_position=None, ray_direction=None, ray_length=None, data_type='FLOAT', mapping='INTERPOLATED'):
         """ > Node <&Node Raycast>
@@ -2919,7 +3093,8 @@ class nd:
         utils.check_enum_arg('Raycast', 'mapping', mapping, 'raycast', ('INTERPOLATED', 'NEAREST'))
         node = Node('Raycast', sockets={'Target Geometry': target_geometry, 'Attribute': attribute, 'Source Position': source_position, 'Ray Direction': ray_direction, 'Ray Length': ray_length}, data_type=data_type, mapping=mapping)
         return node._out
-
+''',
+'realize_instances': r'''
     @classmethod
     def realize_instances(cls, geometry=None, selection=None, realize_all=None, depth=None):
         """ > Node <&Node Realize Instances>
@@ -2937,7 +3112,8 @@ class nd:
         """
         node = Node('Realize Instances', sockets={'Geometry': geometry, 'Selection': selection, 'Realize All': realize_all, 'Depth': depth})
         return node._out
-
+''',
+'remove_named_attribute': r'''
     @classmethod
     def remove_named_attribute(cls, geometry=None, name=None, pattern_mode='EXACT'):
         """ > Node <&Node Remove Named Attribute>
@@ -2955,7 +3131,8 @@ class nd:
         utils.check_enum_arg('Remove Named Attribute', 'pattern_mode', pattern_mode, 'remove_named_attribute', ('EXACT', 'WILDCARD'))
         node = Node('Remove Named Attribute', sockets={'Geometry': geometry, 'Name': name}, pattern_mode=pattern_mode)
         return node._out
-
+''',
+'repeat_input': r'''
     @classmethod
     def repeat_input(cls, iterations=None):
         """ > Node <&Node Repeat Input>
@@ -2970,7 +3147,8 @@ class nd:
         """
         node = Node('Repeat Input', sockets={'Iterations': iterations})
         return node._out
-
+''',
+'repeat_output': r'''
     @classmethod
     def repeat_output(cls, geometry=None, inspection_index=0):
         """ > Node <&Node Repeat Output>
@@ -2986,7 +3164,8 @@ class nd:
         """
         node = Node('Repeat Output', sockets={'Item_0': geometry}, inspection_index=inspection_index)
         return node._out
-
+''',
+'replace_material': r'''
     @classmethod
     def replace_material(cls, geometry=None, old=None, new=None):
         """ > Node <&Node Replace Material>
@@ -3003,7 +3182,8 @@ class nd:
         """
         node = Node('Replace Material', sockets={'Geometry': geometry, 'Old': old, 'New': new})
         return node._out
-
+''',
+'resample_curve': r'''
     @classmethod
     def resample_curve(cls, curve=None, selection=None, count=None, length=None, mode='COUNT'):
         """ > Node <&Node Resample Curve>
@@ -3023,7 +3203,8 @@ class nd:
         utils.check_enum_arg('Resample Curve', 'mode', mode, 'resample_curve', ('EVALUATED', 'COUNT', 'LENGTH'))
         node = Node('Resample Curve', sockets={'Curve': curve, 'Selection': selection, 'Count': count, 'Length': length}, mode=mode)
         return node._out
-
+''',
+'reverse_curve': r'''
     @classmethod
     def reverse_curve(cls, curve=None, selection=None):
         """ > Node <&Node Reverse Curve>
@@ -3039,7 +3220,8 @@ class nd:
         """
         node = Node('Reverse Curve', sockets={'Curve': curve, 'Selection': selection})
         return node._out
-
+''',
+'rotate_instances': r'''
     @classmethod
     def rotate_instances(cls, instances=None, selection=None, rotation=None, pivot_point=None, local_space=None):
         """ > Node <&Node Rotate Instances>
@@ -3058,7 +3240,8 @@ class nd:
         """
         node = Node('Rotate Instances', sockets={'Instances': instances, 'Selection': selection, 'Rotation': rotation, 'Pivot Point': pivot_point, 'Local Space': local_space})
         return node._out
-
+''',
+'sdf_grid_boolean': r'''
     @classmethod
     def sdf_grid_boolean(cls, *grid_2, grid_1=None, operation='DIFFERENCE'):
         """ > Node <&Node SDF Grid Boolean>
@@ -3076,7 +3259,8 @@ class nd:
         utils.check_enum_arg('SDF Grid Boolean', 'operation', operation, 'sdf_grid_boolean', ('INTERSECT', 'UNION', 'DIFFERENCE'))
         node = Node('SDF Grid Boolean', sockets={'Grid 1': grid_1, 'Grid 2': list(grid_2)}, operation=operation)
         return node._out
-
+''',
+'sample_curve': r'''
     @classmethod
     def sample_curve(cls, curves=None, value=None, length=None, curve_index=None, factor=None, data_type='FLOAT', mode='FACTOR', use_all_curves=False):
         """ > Node <&Node Sample Curve>
@@ -3100,7 +3284,8 @@ class nd:
         utils.check_enum_arg('Sample Curve', 'mode', mode, 'sample_curve', ('FACTOR', 'LENGTH'))
         node = Node('Sample Curve', sockets={'Curves': curves, 'Value': value, 'Length': length, 'Curve Index': curve_index, 'Factor': factor}, data_type=data_type, mode=mode, use_all_curves=use_all_curves)
         return node._out
-
+''',
+'sample_grid': r'''
     @classmethod
     def sample_grid(cls, grid=None, position=None, data_type='FLOAT', interpolation_mode='TRILINEAR'):
         """ > Node <&Node Sample Grid>
@@ -3120,7 +3305,8 @@ class nd:
         utils.check_enum_arg('Sample Grid', 'interpolation_mode', interpolation_mode, 'sample_grid', ('NEAREST', 'TRILINEAR', 'TRIQUADRATIC'))
         node = Node('Sample Grid', sockets={'Grid': grid, 'Position': position}, data_type=data_type, interpolation_mode=interpolation_mode)
         return node._out
-
+''',
+'sample_grid_index': r'''
     @classmethod
     def sample_grid_index(cls, grid=None, x=None, y=None, z=None, data_type='FLOAT'):
         """ > Node <&Node Sample Grid Index>
@@ -3140,7 +3326,8 @@ class nd:
         utils.check_enum_arg('Sample Grid Index', 'data_type', data_type, 'sample_grid_index', ('FLOAT', 'INT', 'BOOLEAN', 'VECTOR'))
         node = Node('Sample Grid Index', sockets={'Grid': grid, 'X': x, 'Y': y, 'Z': z}, data_type=data_type)
         return node._out
-
+''',
+'sample_index': r'''
     @classmethod
     def sample_index(cls, geometry=None, value=None, index=None, clamp=False, data_type='FLOAT', domain='POINT'):
         """ > Node <&Node Sample Index>
@@ -3162,7 +3349,8 @@ class nd:
         utils.check_enum_arg('Sample Index', 'domain', domain, 'sample_index', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Sample Index', sockets={'Geometry': geometry, 'Value': value, 'Index': index}, clamp=clamp, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'sample_nearest': r'''
     @classmethod
     def sample_nearest(cls, geometry=None, sample_position=None, domain='POINT'):
         """ > Node <&Node Sample Nearest>
@@ -3180,7 +3368,8 @@ class nd:
         utils.check_enum_arg('Sample Nearest', 'domain', domain, 'sample_nearest', ('POINT', 'EDGE', 'FACE', 'CORNER'))
         node = Node('Sample Nearest', sockets={'Geometry': geometry, 'Sample Position': sample_position}, domain=domain)
         return node._out
-
+''',
+'sample_nearest_surface': r'''
     @classmethod
     def sample_nearest_surface(cls, mesh=None, value=None, group_id=None, sample_position=None, sample_group_id=None, data_type='FLOAT'):
         """ > Node <&Node Sample Nearest Surface>
@@ -3201,7 +3390,8 @@ class nd:
         utils.check_enum_arg('Sample Nearest Surface', 'data_type', data_type, 'sample_nearest_surface', ('FLOAT', 'INT', 'FLOAT_VECTOR', 'FLOAT_COLOR', 'BOOLEAN', 'QUATERNION', 'FLOAT4X4'))
         node = Node('Sample Nearest Surface', sockets={'Mesh': mesh, 'Value': value, 'Group ID': group_id, 'Sample Position': sample_position, 'Sample Group ID': sample_group_id}, data_type=data_type)
         return node._out
-
+''',
+'sample_uv_surface': r'''
     @classmethod
     def sample_uv_surface(cls, mesh=None, value=None, uv_map=None, sample_uv=None, data_type='FLOAT'):
         """ > Node <&Node Sample UV Surface>
@@ -3221,7 +3411,8 @@ class nd:
         utils.check_enum_arg('Sample UV Surface', 'data_type', data_type, 'sample_uv_surface', ('FLOAT', 'INT', 'FLOAT_VECTOR', 'FLOAT_COLOR', 'BOOLEAN', 'QUATERNION', 'FLOAT4X4'))
         node = Node('Sample UV Surface', sockets={'Mesh': mesh, 'Value': value, 'Source UV Map': uv_map, 'Sample UV': sample_uv}, data_type=data_type)
         return node._out
-
+''',
+'scale_elements': r'''
     @classmethod
     def scale_elements(cls, geometry=None, selection=None, scale=None, center=None, axis=None, domain='FACE', scale_mode='UNIFORM'):
         """ > Node <&Node Scale Elements>
@@ -3244,7 +3435,8 @@ class nd:
         utils.check_enum_arg('Scale Elements', 'scale_mode', scale_mode, 'scale_elements', ('UNIFORM', 'SINGLE_AXIS'))
         node = Node('Scale Elements', sockets={'Geometry': geometry, 'Selection': selection, 'Scale': scale, 'Center': center, 'Axis': axis}, domain=domain, scale_mode=scale_mode)
         return node._out
-
+''',
+'scale_instances': r'''
     @classmethod
     def scale_instances(cls, instances=None, selection=None, scale=None, center=None, local_space=None):
         """ > Node <&Node Scale Instances>
@@ -3263,7 +3455,8 @@ class nd:
         """
         node = Node('Scale Instances', sockets={'Instances': instances, 'Selection': selection, 'Scale': scale, 'Center': center, 'Local Space': local_space})
         return node._out
-
+''',
+'self_object': r'''
     @classmethod
     @property
     def self_object(cls):
@@ -3275,7 +3468,8 @@ class nd:
         """
         node = Node('Self Object', sockets={})
         return node._out
-
+''',
+'separate_components': r'''
     @classmethod
     def separate_components(cls, geometry=None):
         """ > Node <&Node Separate Components>
@@ -3290,7 +3484,8 @@ class nd:
         """
         node = Node('Separate Components', sockets={'Geometry': geometry})
         return node._out
-
+''',
+'separate_geometry': r'''
     @classmethod
     def separate_geometry(cls, geometry=None, selection=None, domain='POINT'):
         """ > Node <&Node Separate Geometry>
@@ -3308,7 +3503,8 @@ class nd:
         utils.check_enum_arg('Separate Geometry', 'domain', domain, 'separate_geometry', ('POINT', 'EDGE', 'FACE', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Separate Geometry', sockets={'Geometry': geometry, 'Selection': selection}, domain=domain)
         return node._out
-
+''',
+'set_handle_positions': r'''
     @classmethod
     def set_handle_positions(cls, curve=None, selection=None, position=None, offset=None, mode='LEFT'):
         """ > Node <&Node Set Handle Positions>
@@ -3328,7 +3524,8 @@ class nd:
         utils.check_enum_arg('Set Handle Positions', 'mode', mode, 'set_handle_positions', ('LEFT', 'RIGHT'))
         node = Node('Set Handle Positions', sockets={'Curve': curve, 'Selection': selection, 'Position': position, 'Offset': offset}, mode=mode)
         return node._out
-
+''',
+'set_curve_normal': r'''
     @classmethod
     def set_curve_normal(cls, curve=None, selection=None, normal=None, mode='MINIMUM_TWIST'):
         """ > Node <&Node Set Curve Normal>
@@ -3347,7 +3544,8 @@ class nd:
         utils.check_enum_arg('Set Curve Normal', 'mode', mode, 'set_curve_normal', ('MINIMUM_TWIST', 'Z_UP', 'FREE'))
         node = Node('Set Curve Normal', sockets={'Curve': curve, 'Selection': selection, 'Normal': normal}, mode=mode)
         return node._out
-
+''',
+'set_curve_radius': r'''
     @classmethod
     def set_curve_radius(cls, curve=None, selection=None, radius=None):
         """ > Node <&Node Set Curve Radius>
@@ -3364,7 +3562,8 @@ class nd:
         """
         node = Node('Set Curve Radius', sockets={'Curve': curve, 'Selection': selection, 'Radius': radius})
         return node._out
-
+''',
+'set_curve_tilt': r'''
     @classmethod
     def set_curve_tilt(cls, curve=None, selection=None, tilt=None):
         """ > Node <&Node Set Curve Tilt>
@@ -3381,7 +3580,8 @@ class nd:
         """
         node = Node('Set Curve Tilt', sockets={'Curve': curve, 'Selection': selection, 'Tilt': tilt})
         return node._out
-
+''',
+'set_geometry_name': r'''
     @classmethod
     def set_geometry_name(cls, geometry=None, name=None):
         """ > Node <&Node Set Geometry Name>
@@ -3397,7 +3597,8 @@ class nd:
         """
         node = Node('Set Geometry Name', sockets={'Geometry': geometry, 'Name': name})
         return node._out
-
+''',
+'set_id': r'''
     @classmethod
     def set_id(cls, geometry=None, selection=None, id=None):
         """ > Node <&Node Set ID>
@@ -3414,7 +3615,8 @@ class nd:
         """
         node = Node('Set ID', sockets={'Geometry': geometry, 'Selection': selection, 'ID': id})
         return node._out
-
+''',
+'set_instance_transform': r'''
     @classmethod
     def set_instance_transform(cls, instances=None, selection=None, transform=None):
         """ > Node <&Node Set Instance Transform>
@@ -3431,7 +3633,8 @@ class nd:
         """
         node = Node('Set Instance Transform', sockets={'Instances': instances, 'Selection': selection, 'Transform': transform})
         return node._out
-
+''',
+'set_material': r'''
     @classmethod
     def set_material(cls, geometry=None, selection=None, material=None):
         """ > Node <&Node Set Material>
@@ -3448,7 +3651,8 @@ class nd:
         """
         node = Node('Set Material', sockets={'Geometry': geometry, 'Selection': selection, 'Material': material})
         return node._out
-
+''',
+'set_material_index': r'''
     @classmethod
     def set_material_index(cls, geometry=None, selection=None, material_index=None):
         """ > Node <&Node Set Material Index>
@@ -3465,7 +3669,8 @@ class nd:
         """
         node = Node('Set Material Index', sockets={'Geometry': geometry, 'Selection': selection, 'Material Index': material_index})
         return node._out
-
+''',
+'set_point_radius': r'''
     @classmethod
     def set_point_radius(cls, points=None, selection=None, radius=None):
         """ > Node <&Node Set Point Radius>
@@ -3482,7 +3687,8 @@ class nd:
         """
         node = Node('Set Point Radius', sockets={'Points': points, 'Selection': selection, 'Radius': radius})
         return node._out
-
+''',
+'set_position': r'''
     @classmethod
     def set_position(cls, geometry=None, selection=None, position=None, offset=None):
         """ > Node <&Node Set Position>
@@ -3500,7 +3706,8 @@ class nd:
         """
         node = Node('Set Position', sockets={'Geometry': geometry, 'Selection': selection, 'Position': position, 'Offset': offset})
         return node._out
-
+''',
+'set_shade_smooth': r'''
     @classmethod
     def set_shade_smooth(cls, geometry=None, selection=None, shade_smooth=None, domain='FACE'):
         """ > Node <&Node Set Shade Smooth>
@@ -3519,7 +3726,8 @@ class nd:
         utils.check_enum_arg('Set Shade Smooth', 'domain', domain, 'set_shade_smooth', ('EDGE', 'FACE'))
         node = Node('Set Shade Smooth', sockets={'Geometry': geometry, 'Selection': selection, 'Shade Smooth': shade_smooth}, domain=domain)
         return node._out
-
+''',
+'set_spline_cyclic': r'''
     @classmethod
     def set_spline_cyclic(cls, geometry=None, selection=None, cyclic=None):
         """ > Node <&Node Set Spline Cyclic>
@@ -3536,7 +3744,8 @@ class nd:
         """
         node = Node('Set Spline Cyclic', sockets={'Geometry': geometry, 'Selection': selection, 'Cyclic': cyclic})
         return node._out
-
+''',
+'set_spline_resolution': r'''
     @classmethod
     def set_spline_resolution(cls, geometry=None, selection=None, resolution=None):
         """ > Node <&Node Set Spline Resolution>
@@ -3553,7 +3762,8 @@ class nd:
         """
         node = Node('Set Spline Resolution', sockets={'Geometry': geometry, 'Selection': selection, 'Resolution': resolution})
         return node._out
-
+''',
+'simulation_input': r'''
     @classmethod
     @property
     def simulation_input(cls):
@@ -3565,7 +3775,8 @@ class nd:
         """
         node = Node('Simulation Input', sockets={})
         return node._out
-
+''',
+'simulation_output': r'''
     @classmethod
     def simulation_output(cls, skip=None, geometry=None):
         """ > Node <&Node Simulation Output>
@@ -3581,7 +3792,8 @@ class nd:
         """
         node = Node('Simulation Output', sockets={'Skip': skip, 'Item_0': geometry})
         return node._out
-
+''',
+'sort_elements': r'''
     @classmethod
     def sort_elements(cls, geometry=None, selection=None, group_id=None, sort_weight=None, domain='POINT'):
         """ > Node <&Node Sort Elements>
@@ -3601,7 +3813,8 @@ class nd:
         utils.check_enum_arg('Sort Elements', 'domain', domain, 'sort_elements', ('POINT', 'EDGE', 'FACE', 'CURVE', 'INSTANCE'))
         node = Node('Sort Elements', sockets={'Geometry': geometry, 'Selection': selection, 'Group ID': group_id, 'Sort Weight': sort_weight}, domain=domain)
         return node._out
-
+''',
+'spline_length': r'''
     @classmethod
     def spline_length(cls):
         """ > Node <&Node Spline Length>
@@ -3612,7 +3825,8 @@ class nd:
         """
         node = Node('Spline Length', sockets={})
         return node
-
+''',
+'spline_parameter': r'''
     @classmethod
     def spline_parameter(cls):
         """ > Node <&Node Spline Parameter>
@@ -3623,7 +3837,8 @@ class nd:
         """
         node = Node('Spline Parameter', sockets={})
         return node
-
+''',
+'split_edges': r'''
     @classmethod
     def split_edges(cls, mesh=None, selection=None):
         """ > Node <&Node Split Edges>
@@ -3639,7 +3854,8 @@ class nd:
         """
         node = Node('Split Edges', sockets={'Mesh': mesh, 'Selection': selection})
         return node._out
-
+''',
+'split_to_instances': r'''
     @classmethod
     def split_to_instances(cls, geometry=None, selection=None, group_id=None, domain='POINT'):
         """ > Node <&Node Split to Instances>
@@ -3658,7 +3874,8 @@ class nd:
         utils.check_enum_arg('Split to Instances', 'domain', domain, 'split_to_instances', ('POINT', 'EDGE', 'FACE', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Split to Instances', sockets={'Geometry': geometry, 'Selection': selection, 'Group ID': group_id}, domain=domain)
         return node._out
-
+''',
+'store_named_attribute': r'''
     @classmethod
     def store_named_attribute(cls, geometry=None, selection=None, name=None, value=None, data_type='FLOAT', domain='POINT'):
         """ > Node <&Node Store Named Attribute>
@@ -3680,7 +3897,8 @@ class nd:
         utils.check_enum_arg('Store Named Attribute', 'domain', domain, 'store_named_attribute', ('POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Store Named Attribute', sockets={'Geometry': geometry, 'Selection': selection, 'Name': name, 'Value': value}, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'store_named_grid': r'''
     @classmethod
     def store_named_grid(cls, volume=None, name=None, grid=None, data_type='FLOAT'):
         """ > Node <&Node Store Named Grid>
@@ -3699,7 +3917,8 @@ class nd:
         utils.check_enum_arg('Store Named Grid', 'data_type', data_type, 'store_named_grid', ('FLOAT', 'FLOAT_VECTOR', 'FLOAT2'))
         node = Node('Store Named Grid', sockets={'Volume': volume, 'Name': name, 'Grid': grid}, data_type=data_type)
         return node._out
-
+''',
+'join_strings': r'''
     @classmethod
     def join_strings(cls, *strings, delimiter=None):
         """ > Node <&Node Join Strings>
@@ -3715,7 +3934,8 @@ class nd:
         """
         node = Node('Join Strings', sockets={'Delimiter': delimiter, 'Strings': list(strings)})
         return node._out
-
+''',
+'string_to_curves': r'''
     @classmethod
     def string_to_curves(cls, string=None, size=None, character_spacing=None, word_spacing=None, line_spacing=None, text_box_width=None, text_box_height=None, align_x='LEFT', align_y='TOP_BASELINE', overflow='OVERFLOW', pivot_mode='BOTTOM_LEFT'):
         """ > Node <&Node String to Curves>
@@ -3744,7 +3964,8 @@ class nd:
         utils.check_enum_arg('String to Curves', 'pivot_mode', pivot_mode, 'string_to_curves', ('MIDPOINT', 'TOP_LEFT', 'TOP_CENTER', 'TOP_RIGHT', 'BOTTOM_LEFT', 'BOTTOM_CENTER', 'BOTTOM_RIGHT'))
         node = Node('String to Curves', sockets={'String': string, 'Size': size, 'Character Spacing': character_spacing, 'Word Spacing': word_spacing, 'Line Spacing': line_spacing, 'Text Box Width': text_box_width, 'Text Box Height': text_box_height}, align_x=align_x, align_y=align_y, overflow=overflow, pivot_mode=pivot_mode)
         return node._out
-
+''',
+'subdivide_curve': r'''
     @classmethod
     def subdivide_curve(cls, curve=None, cuts=None):
         """ > Node <&Node Subdivide Curve>
@@ -3760,7 +3981,8 @@ class nd:
         """
         node = Node('Subdivide Curve', sockets={'Curve': curve, 'Cuts': cuts})
         return node._out
-
+''',
+'subdivide_mesh': r'''
     @classmethod
     def subdivide_mesh(cls, mesh=None, level=None):
         """ > Node <&Node Subdivide Mesh>
@@ -3776,7 +3998,8 @@ class nd:
         """
         node = Node('Subdivide Mesh', sockets={'Mesh': mesh, 'Level': level})
         return node._out
-
+''',
+'subdivision_surface': r'''
     @classmethod
     def subdivision_surface(cls, mesh=None, level=None, edge_crease=None, vertex_crease=None, boundary_smooth='ALL', uv_smooth='PRESERVE_BOUNDARIES'):
         """ > Node <&Node Subdivision Surface>
@@ -3798,7 +4021,8 @@ class nd:
         utils.check_enum_arg('Subdivision Surface', 'uv_smooth', uv_smooth, 'subdivision_surface', ('NONE', 'PRESERVE_CORNERS', 'PRESERVE_CORNERS_AND_JUNCTIONS', 'PRESERVE_CORNERS_JUNCTIONS_AND_CONCAVE', 'PRESERVE_BOUNDARIES', 'SMOOTH_ALL'))
         node = Node('Subdivision Surface', sockets={'Mesh': mesh, 'Level': level, 'Edge Crease': edge_crease, 'Vertex Crease': vertex_crease}, boundary_smooth=boundary_smooth, uv_smooth=uv_smooth)
         return node._out
-
+''',
+'switch': r'''
     @classmethod
     def switch(cls, switch=None, false=None, true=None, input_type='GEOMETRY'):
         """ > Node <&Node Switch>
@@ -3817,7 +4041,8 @@ class nd:
         utils.check_enum_arg('Switch', 'input_type', input_type, 'switch', ('FLOAT', 'INT', 'BOOLEAN', 'VECTOR', 'ROTATION', 'MATRIX', 'STRING', 'MENU', 'RGBA', 'OBJECT', 'IMAGE', 'GEOMETRY', 'COLLECTION', 'MATERIAL'))
         node = Node('Switch', sockets={'Switch': switch, 'False': false, 'True': true}, input_type=input_type)
         return node._out
-
+''',
+'_3d_cursor': r'''
     @classmethod
     def _3d_cursor(cls):
         """ > Node <&Node 3D Cursor>
@@ -3828,7 +4053,8 @@ class nd:
         """
         node = Node('3D Cursor', sockets={})
         return node
-
+''',
+'active_element': r'''
     @classmethod
     def active_element(cls, domain='POINT'):
         """ > Node <&Node Active Element>
@@ -3844,7 +4070,8 @@ class nd:
         utils.check_enum_arg('Active Element', 'domain', domain, 'active_element', ('POINT', 'EDGE', 'FACE'))
         node = Node('Active Element', sockets={}, domain=domain)
         return node
-
+''',
+'face_set': r'''
     @classmethod
     def face_set(cls):
         """ > Node <&Node Face Set>
@@ -3855,7 +4082,8 @@ class nd:
         """
         node = Node('Face Set', sockets={})
         return node
-
+''',
+'mouse_position': r'''
     @classmethod
     def mouse_position(cls):
         """ > Node <&Node Mouse Position>
@@ -3866,7 +4094,8 @@ class nd:
         """
         node = Node('Mouse Position', sockets={})
         return node
-
+''',
+'selection': r'''
     @classmethod
     def selection(cls):
         """ > Node <&Node Selection>
@@ -3877,7 +4106,8 @@ class nd:
         """
         node = Node('Selection', sockets={})
         return node
-
+''',
+'set_face_set': r'''
     @classmethod
     def set_face_set(cls, mesh=None, selection=None, face_set=None):
         """ > Node <&Node Set Face Set>
@@ -3894,7 +4124,8 @@ class nd:
         """
         node = Node('Set Face Set', sockets={'Mesh': mesh, 'Selection': selection, 'Face Set': face_set})
         return node._out
-
+''',
+'set_selection': r'''
     @classmethod
     def set_selection(cls, geometry=None, selection=None, domain='POINT', selection_type='BOOLEAN'):
         """ > Node <&Node Set Selection>
@@ -3914,7 +4145,8 @@ class nd:
         utils.check_enum_arg('Set Selection', 'selection_type', selection_type, 'set_selection', ('BOOLEAN', 'FLOAT'))
         node = Node('Set Selection', sockets={'Geometry': geometry, 'Selection': selection}, domain=domain, selection_type=selection_type)
         return node._out
-
+''',
+'transform_geometry': r'''
     @classmethod
     def transform_geometry(cls, geometry=None, translation=None, rotation=None, scale=None, transform=None, mode='COMPONENTS'):
         """ > Node <&Node Transform Geometry>
@@ -3935,7 +4167,8 @@ class nd:
         utils.check_enum_arg('Transform Geometry', 'mode', mode, 'transform_geometry', ('COMPONENTS', 'MATRIX'))
         node = Node('Transform Geometry', sockets={'Geometry': geometry, 'Translation': translation, 'Rotation': rotation, 'Scale': scale, 'Transform': transform}, mode=mode)
         return node._out
-
+''',
+'translate_instances': r'''
     @classmethod
     def translate_instances(cls, instances=None, selection=None, translation=None, local_space=None):
         """ > Node <&Node Translate Instances>
@@ -3953,7 +4186,8 @@ class nd:
         """
         node = Node('Translate Instances', sockets={'Instances': instances, 'Selection': selection, 'Translation': translation, 'Local Space': local_space})
         return node._out
-
+''',
+'triangulate': r'''
     @classmethod
     def triangulate(cls, mesh=None, selection=None, minimum_vertices=None, ngon_method='BEAUTY', quad_method='SHORTEST_DIAGONAL'):
         """ > Node <&Node Triangulate>
@@ -3974,7 +4208,8 @@ class nd:
         utils.check_enum_arg('Triangulate', 'quad_method', quad_method, 'triangulate', ('BEAUTY', 'FIXED', 'FIXED_ALTERNATE', 'SHORTEST_DIAGONAL', 'LONGEST_DIAGONAL'))
         node = Node('Triangulate', sockets={'Mesh': mesh, 'Selection': selection, 'Minimum Vertices': minimum_vertices}, ngon_method=ngon_method, quad_method=quad_method)
         return node._out
-
+''',
+'trim_curve': r'''
     @classmethod
     def trim_curve(cls, curve=None, selection=None, start=None, end=None, start_1=None, end_1=None, mode='FACTOR'):
         """ > Node <&Node Trim Curve>
@@ -3996,7 +4231,8 @@ class nd:
         utils.check_enum_arg('Trim Curve', 'mode', mode, 'trim_curve', ('FACTOR', 'LENGTH'))
         node = Node('Trim Curve', sockets={'Curve': curve, 'Selection': selection, 'Start': start, 'End': end, 'Start_001': start_1, 'End_001': end_1}, mode=mode)
         return node._out
-
+''',
+'pack_uv_islands': r'''
     @classmethod
     def pack_uv_islands(cls, uv=None, selection=None, margin=None, rotate=None):
         """ > Node <&Node Pack UV Islands>
@@ -4014,7 +4250,8 @@ class nd:
         """
         node = Node('Pack UV Islands', sockets={'UV': uv, 'Selection': selection, 'Margin': margin, 'Rotate': rotate})
         return node._out
-
+''',
+'uv_unwrap': r'''
     @classmethod
     def uv_unwrap(cls, selection=None, seam=None, margin=None, fill_holes=None, method='ANGLE_BASED'):
         """ > Node <&Node UV Unwrap>
@@ -4034,7 +4271,8 @@ class nd:
         utils.check_enum_arg('UV Unwrap', 'method', method, 'uv_unwrap', ('ANGLE_BASED', 'CONFORMAL'))
         node = Node('UV Unwrap', sockets={'Selection': selection, 'Seam': seam, 'Margin': margin, 'Fill Holes': fill_holes}, method=method)
         return node._out
-
+''',
+'vertex_of_corner': r'''
     @classmethod
     def vertex_of_corner(cls, corner_index=None):
         """ > Node <&Node Vertex of Corner>
@@ -4049,7 +4287,8 @@ class nd:
         """
         node = Node('Vertex of Corner', sockets={'Corner Index': corner_index})
         return node._out
-
+''',
+'viewer': r'''
     @classmethod
     def viewer(cls, geometry=None, value=None, data_type='FLOAT', domain='AUTO'):
         """ > Node <&Node Viewer>
@@ -4069,7 +4308,8 @@ class nd:
         utils.check_enum_arg('Viewer', 'domain', domain, 'viewer', ('AUTO', 'POINT', 'EDGE', 'FACE', 'CORNER', 'CURVE', 'INSTANCE', 'LAYER'))
         node = Node('Viewer', sockets={'Geometry': geometry, 'Value': value}, data_type=data_type, domain=domain)
         return node._out
-
+''',
+'viewport_transform': r'''
     @classmethod
     def viewport_transform(cls):
         """ > Node <&Node Viewport Transform>
@@ -4080,7 +4320,8 @@ class nd:
         """
         node = Node('Viewport Transform', sockets={})
         return node
-
+''',
+'volume_cube': r'''
     @classmethod
     def volume_cube(cls, density=None, background=None, min=None, max=None, resolution_x=None, resolution_y=None, resolution_z=None):
         """ > Node <&Node Volume Cube>
@@ -4101,7 +4342,8 @@ class nd:
         """
         node = Node('Volume Cube', sockets={'Density': density, 'Background': background, 'Min': min, 'Max': max, 'Resolution X': resolution_x, 'Resolution Y': resolution_y, 'Resolution Z': resolution_z})
         return node._out
-
+''',
+'volume_to_mesh': r'''
     @classmethod
     def volume_to_mesh(cls, volume=None, voxel_size=None, voxel_amount=None, threshold=None, adaptivity=None, resolution_mode='GRID'):
         """ > Node <&Node Volume to Mesh>
@@ -4122,7 +4364,8 @@ class nd:
         utils.check_enum_arg('Volume to Mesh', 'resolution_mode', resolution_mode, 'volume_to_mesh', ('GRID', 'VOXEL_AMOUNT', 'VOXEL_SIZE'))
         node = Node('Volume to Mesh', sockets={'Volume': volume, 'Voxel Size': voxel_size, 'Voxel Amount': voxel_amount, 'Threshold': threshold, 'Adaptivity': adaptivity}, resolution_mode=resolution_mode)
         return node._out
-
+''',
+'warning': r'''
     @classmethod
     def warning(cls, show=None, message=None, warning_type='ERROR'):
         """ > Node <&Node Warning>
@@ -4139,7 +4382,8 @@ class nd:
         """
         node = Node('Warning', sockets={'Show': show, 'Message': message}, warning_type=warning_type)
         return node._out
-
+''',
+'frame': r'''
     @classmethod
     def frame(cls, label_size=20, shrink=True, text=None):
         """ > Node <&Node Frame>
@@ -4156,7 +4400,8 @@ class nd:
         """
         node = Node('Frame', sockets={}, label_size=label_size, shrink=shrink, text=text)
         return node._out
-
+''',
+'group_input': r'''
     @classmethod
     @property
     def group_input(cls):
@@ -4168,7 +4413,8 @@ class nd:
         """
         node = Node('Group Input', sockets={})
         return node._out
-
+''',
+'group_output': r'''
     @classmethod
     def group_output(cls, is_active_output=True):
         """ > Node <&Node Group Output>
@@ -4183,7 +4429,8 @@ class nd:
         """
         node = Node('Group Output', sockets={}, is_active_output=is_active_output)
         return node._out
-
+''',
+'reroute': r'''
     @classmethod
     def reroute(cls, input=None, socket_idname='NodeSocketColor'):
         """ > Node <&Node Reroute>
@@ -4199,7 +4446,8 @@ class nd:
         """
         node = Node('Reroute', sockets={'Input': input}, socket_idname=socket_idname)
         return node._out
-
+''',
+'blackbody': r'''
     @classmethod
     def blackbody(cls, temperature=None):
         """ > Node <&Node Blackbody>
@@ -4214,7 +4462,8 @@ class nd:
         """
         node = Node('Blackbody', sockets={'Temperature': temperature})
         return node._out
-
+''',
+'clamp': r'''
     @classmethod
     def clamp(cls, value=None, min=None, max=None, clamp_type='MINMAX'):
         """ > Node <&Node Clamp>
@@ -4233,7 +4482,8 @@ class nd:
         utils.check_enum_arg('Clamp', 'clamp_type', clamp_type, 'clamp', ('MINMAX', 'RANGE'))
         node = Node('Clamp', sockets={'Value': value, 'Min': min, 'Max': max}, clamp_type=clamp_type)
         return node._out
-
+''',
+'combine_xyz': r'''
     @classmethod
     def combine_xyz(cls, x=None, y=None, z=None):
         """ > Node <&Node Combine XYZ>
@@ -4250,7 +4500,8 @@ class nd:
         """
         node = Node('Combine XYZ', sockets={'X': x, 'Y': y, 'Z': z})
         return node._out
-
+''',
+'float_curve': r'''
     @classmethod
     def float_curve(cls, value=None, factor=None):
         """ > Node <&Node Float Curve>
@@ -4266,7 +4517,8 @@ class nd:
         """
         node = NodeCurves('Float Curve', sockets={'Value': value, 'Factor': factor})
         return node._out
-
+''',
+'map_range': r'''
     @classmethod
     def map_range(cls, value=None, from_min=None, from_max=None, to_min=None, to_max=None, steps=None, vector=None, from_min_1=None, from_max_1=None, to_min_1=None, to_max_1=None, steps_1=None, clamp=True, data_type='FLOAT', interpolation_type='LINEAR'):
         """ > Node <&Node Map Range>
@@ -4297,7 +4549,8 @@ class nd:
         utils.check_enum_arg('Map Range', 'interpolation_type', interpolation_type, 'map_range', ('LINEAR', 'STEPPED', 'SMOOTHSTEP', 'SMOOTHERSTEP'))
         node = Node('Map Range', sockets={'Value': value, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max, 'Steps': steps, 'Vector': vector, 'From_Min_FLOAT3': from_min_1, 'From_Max_FLOAT3': from_max_1, 'To_Min_FLOAT3': to_min_1, 'To_Max_FLOAT3': to_max_1, 'Steps_FLOAT3': steps_1}, clamp=clamp, data_type=data_type, interpolation_type=interpolation_type)
         return node._out
-
+''',
+'math': r'''
     @classmethod
     def math(cls, value=None, value_1=None, value_2=None, operation='ADD', use_clamp=False):
         """ > Node <&Node Math>
@@ -4317,7 +4570,8 @@ class nd:
         utils.check_enum_arg('Math', 'operation', operation, 'math', ('ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'MULTIPLY_ADD', 'POWER', 'LOGARITHM', 'SQRT', 'INVERSE_SQRT', 'ABSOLUTE', 'EXPONENT', 'MINIMUM', 'MAXIMUM', 'LESS_THAN', 'GREATER_THAN', 'SIGN', 'COMPARE', 'SMOOTH_MIN', 'SMOOTH_MAX', 'ROUND', 'FLOOR', 'CEIL', 'TRUNC', 'FRACT', 'MODULO', 'FLOORED_MODULO', 'WRAP', 'SNAP', 'PINGPONG', 'SINE', 'COSINE', 'TANGENT', 'ARCSINE', 'ARCCOSINE', 'ARCTANGENT', 'ARCTAN2', 'SINH', 'COSH', 'TANH', 'RADIANS', 'DEGREES'))
         node = Node('Math', sockets={'Value': value, 'Value_001': value_1, 'Value_002': value_2}, operation=operation, use_clamp=use_clamp)
         return node._out
-
+''',
+'mix': r'''
     @classmethod
     def mix(cls, a=None, b=None, a_1=None, b_1=None, a_2=None, b_2=None, a_3=None, b_3=None, factor=None, blend_type='MIX', clamp_factor=True, clamp_result=False, data_type='FLOAT', factor_mode='UNIFORM'):
         """ > Node <&Node Mix>
@@ -4348,7 +4602,8 @@ class nd:
         utils.check_enum_arg('Mix', 'factor_mode', factor_mode, 'mix', ('UNIFORM', 'NON_UNIFORM'))
         node = Node('Mix', sockets={'A_Float': a, 'B_Float': b, 'A_Vector': a_1, 'B_Vector': b_1, 'A_Color': a_2, 'B_Color': b_2, 'A_Rotation': a_3, 'B_Rotation': b_3, 'Factor_Vector': factor}, blend_type=blend_type, clamp_factor=clamp_factor, clamp_result=clamp_result, data_type=data_type, factor_mode=factor_mode)
         return node._out
-
+''',
+'rgb_curves': r'''
     @classmethod
     def rgb_curves(cls, color=None, fac=None):
         """ > Node <&Node RGB Curves>
@@ -4364,7 +4619,8 @@ class nd:
         """
         node = NodeCurves('RGB Curves', sockets={'Color': color, 'Fac': fac})
         return node._out
-
+''',
+'separate_xyz': r'''
     @classmethod
     def separate_xyz(cls, vector=None):
         """ > Node <&Node Separate XYZ>
@@ -4379,7 +4635,8 @@ class nd:
         """
         node = Node('Separate XYZ', sockets={'Vector': vector})
         return node._out
-
+''',
+'brick_texture': r'''
     @classmethod
     def brick_texture(cls, vector=None, color1=None, color2=None, mortar=None, scale=None, mortar_size=None, mortar_smooth=None, bias=None, brick_width=None, row_height=None, offset=0.5, offset_frequency=2, squash=1.0, squash_frequency=2):
         """ > Node <&Node Brick Texture>
@@ -4407,7 +4664,8 @@ class nd:
         """
         node = Node('Brick Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Mortar': mortar, 'Scale': scale, 'Mortar Size': mortar_size, 'Mortar Smooth': mortar_smooth, 'Bias': bias, 'Brick Width': brick_width, 'Row Height': row_height}, offset=offset, offset_frequency=offset_frequency, squash=squash, squash_frequency=squash_frequency)
         return node._out
-
+''',
+'checker_texture': r'''
     @classmethod
     def checker_texture(cls, vector=None, color1=None, color2=None, scale=None):
         """ > Node <&Node Checker Texture>
@@ -4425,7 +4683,8 @@ class nd:
         """
         node = Node('Checker Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Scale': scale})
         return node._out
-
+''',
+'gabor_texture': r'''
     @classmethod
     def gabor_texture(cls, vector=None, scale=None, frequency=None, anisotropy=None, orientation=None, orientation_1=None, gabor_type='2D'):
         """ > Node <&Node Gabor Texture>
@@ -4447,7 +4706,8 @@ class nd:
         utils.check_enum_arg('Gabor Texture', 'gabor_type', gabor_type, 'gabor_texture', ('2D', '3D'))
         node = Node('Gabor Texture', sockets={'Vector': vector, 'Scale': scale, 'Frequency': frequency, 'Anisotropy': anisotropy, 'Orientation 2D': orientation, 'Orientation 3D': orientation_1}, gabor_type=gabor_type)
         return node._out
-
+''',
+'gradient_texture': r'''
     @classmethod
     def gradient_texture(cls, vector=None, gradient_type='LINEAR'):
         """ > Node <&Node Gradient Texture>
@@ -4464,7 +4724,8 @@ class nd:
         utils.check_enum_arg('Gradient Texture', 'gradient_type', gradient_type, 'gradient_texture', ('LINEAR', 'QUADRATIC', 'EASING', 'DIAGONAL', 'SPHERICAL', 'QUADRATIC_SPHERE', 'RADIAL'))
         node = Node('Gradient Texture', sockets={'Vector': vector}, gradient_type=gradient_type)
         return node._out
-
+''',
+'magic_texture': r'''
     @classmethod
     def magic_texture(cls, vector=None, scale=None, distortion=None, turbulence_depth=2):
         """ > Node <&Node Magic Texture>
@@ -4482,7 +4743,8 @@ class nd:
         """
         node = Node('Magic Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion}, turbulence_depth=turbulence_depth)
         return node._out
-
+''',
+'noise_texture': r'''
     @classmethod
     def noise_texture(cls, vector=None, w=None, scale=None, detail=None, roughness=None, lacunarity=None, offset=None, gain=None, distortion=None, noise_dimensions='3D', noise_type='FBM', normalize=True):
         """ > Node <&Node Noise Texture>
@@ -4510,7 +4772,8 @@ class nd:
         utils.check_enum_arg('Noise Texture', 'noise_type', noise_type, 'noise_texture', ('MULTIFRACTAL', 'RIDGED_MULTIFRACTAL', 'HYBRID_MULTIFRACTAL', 'FBM', 'HETERO_TERRAIN'))
         node = Node('Noise Texture', sockets={'Vector': vector, 'W': w, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Offset': offset, 'Gain': gain, 'Distortion': distortion}, noise_dimensions=noise_dimensions, noise_type=noise_type, normalize=normalize)
         return node._out
-
+''',
+'voronoi_texture': r'''
     @classmethod
     def voronoi_texture(cls, vector=None, w=None, scale=None, detail=None, roughness=None, lacunarity=None, smoothness=None, exponent=None, randomness=None, distance='EUCLIDEAN', feature='F1', normalize=False, voronoi_dimensions='3D'):
         """ > Node <&Node Voronoi Texture>
@@ -4540,7 +4803,8 @@ class nd:
         utils.check_enum_arg('Voronoi Texture', 'voronoi_dimensions', voronoi_dimensions, 'voronoi_texture', ('1D', '2D', '3D', '4D'))
         node = Node('Voronoi Texture', sockets={'Vector': vector, 'W': w, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Smoothness': smoothness, 'Exponent': exponent, 'Randomness': randomness}, distance=distance, feature=feature, normalize=normalize, voronoi_dimensions=voronoi_dimensions)
         return node._out
-
+''',
+'wave_texture': r'''
     @classmethod
     def wave_texture(cls, vector=None, scale=None, distortion=None, detail=None, detail_scale=None, detail_roughness=None, phase_offset=None, bands_direction='X', rings_direction='X', wave_profile='SIN', wave_type='BANDS'):
         """ > Node <&Node Wave Texture>
@@ -4569,7 +4833,8 @@ class nd:
         utils.check_enum_arg('Wave Texture', 'wave_type', wave_type, 'wave_texture', ('BANDS', 'RINGS'))
         node = Node('Wave Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion, 'Detail': detail, 'Detail Scale': detail_scale, 'Detail Roughness': detail_roughness, 'Phase Offset': phase_offset}, bands_direction=bands_direction, rings_direction=rings_direction, wave_profile=wave_profile, wave_type=wave_type)
         return node._out
-
+''',
+'white_noise_texture': r'''
     @classmethod
     def white_noise_texture(cls, vector=None, w=None, noise_dimensions='3D'):
         """ > Node <&Node White Noise Texture>
@@ -4587,7 +4852,8 @@ class nd:
         utils.check_enum_arg('White Noise Texture', 'noise_dimensions', noise_dimensions, 'white_noise_texture', ('1D', '2D', '3D', '4D'))
         node = Node('White Noise Texture', sockets={'Vector': vector, 'W': w}, noise_dimensions=noise_dimensions)
         return node._out
-
+''',
+'color_ramp': r'''
     @classmethod
     def color_ramp(cls, fac=None, stops=None, interpolation='LINEAR'):
         """ Node <&Node Color Ramp>
@@ -4607,7 +4873,8 @@ class nd:
         """
         node = ColorRamp(fac=fac, stops=stops, interpolation=interpolation)
         return node._out
-
+''',
+'value': r'''
     @classmethod
     @property
     def value(cls):
@@ -4619,7 +4886,8 @@ class nd:
         """
         node = Node('Value', sockets={})
         return node._out
-
+''',
+'vector_curves': r'''
     @classmethod
     def vector_curves(cls, vector=None, fac=None):
         """ > Node <&Node Vector Curves>
@@ -4635,7 +4903,8 @@ class nd:
         """
         node = NodeCurves('Vector Curves', sockets={'Vector': vector, 'Fac': fac})
         return node._out
-
+''',
+'vector_math': r'''
     @classmethod
     def vector_math(cls, vector=None, vector_1=None, vector_2=None, scale=None, operation='ADD'):
         """ > Node <&Node Vector Math>
@@ -4655,7 +4924,8 @@ class nd:
         utils.check_enum_arg('Vector Math', 'operation', operation, 'vector_math', ('ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'MULTIPLY_ADD', 'CROSS_PRODUCT', 'PROJECT', 'REFLECT', 'REFRACT', 'FACEFORWARD', 'DOT_PRODUCT', 'DISTANCE', 'LENGTH', 'SCALE', 'NORMALIZE', 'ABSOLUTE', 'MINIMUM', 'MAXIMUM', 'FLOOR', 'CEIL', 'FRACTION', 'MODULO', 'WRAP', 'SNAP', 'SINE', 'COSINE', 'TANGENT'))
         node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1, 'Vector_002': vector_2, 'Scale': scale}, operation=operation)
         return node._out
-
+''',
+'vector_rotate': r'''
     @classmethod
     def vector_rotate(cls, vector=None, center=None, axis=None, angle=None, rotation=None, invert=False, rotation_type='AXIS_ANGLE'):
         """ > Node <&Node Vector Rotate>
@@ -4677,4 +4947,7 @@ class nd:
         utils.check_enum_arg('Vector Rotate', 'rotation_type', rotation_type, 'vector_rotate', ('AXIS_ANGLE', 'X_AXIS', 'Y_AXIS', 'Z_AXIS', 'EULER_XYZ'))
         node = Node('Vector Rotate', sockets={'Vector': vector, 'Center': center, 'Axis': axis, 'Angle': angle, 'Rotation': rotation}, invert=invert, rotation_type=rotation_type)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(nd)
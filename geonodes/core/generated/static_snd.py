@@ -2,6 +2,7 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class snd:
     """" Static class
@@ -13,6 +14,8 @@ class snd:
     ```
     """
 
+METHODS = {
+'frame': r'''
     @classmethod
     def frame(cls, label_size=20, shrink=True, text=None):
         """ > Node <&ShaderNode Frame>
@@ -29,7 +32,8 @@ class snd:
         """
         node = Node('Frame', sockets={}, label_size=label_size, shrink=shrink, text=text)
         return node._out
-
+''',
+'group_input': r'''
     @classmethod
     @property
     def group_input(cls):
@@ -41,7 +45,8 @@ class snd:
         """
         node = Node('Group Input', sockets={})
         return node._out
-
+''',
+'group_output': r'''
     @classmethod
     def group_output(cls, is_active_output=True):
         """ > Node <&ShaderNode Group Output>
@@ -56,7 +61,8 @@ class snd:
         """
         node = Node('Group Output', sockets={}, is_active_output=is_active_output)
         return node._out
-
+''',
+'reroute': r'''
     @classmethod
     def reroute(cls, input=None, socket_idname='NodeSocketColor'):
         """ > Node <&ShaderNode Reroute>
@@ -72,7 +78,8 @@ class snd:
         """
         node = Node('Reroute', sockets={'Input': input}, socket_idname=socket_idname)
         return node._out
-
+''',
+'add_shader': r'''
     @classmethod
     def add_shader(cls, shader=None, shader_1=None):
         """ > Node <&ShaderNode Add Shader>
@@ -88,7 +95,8 @@ class snd:
         """
         node = Node('Add Shader', sockets={'Shader': shader, 'Shader_001': shader_1})
         return node._out
-
+''',
+'ambient_occlusion': r'''
     @classmethod
     def ambient_occlusion(cls, color=None, distance=None, normal=None, inside=False, only_local=False, samples=16):
         """ > Node <&ShaderNode Ambient Occlusion>
@@ -108,7 +116,8 @@ class snd:
         """
         node = Node('Ambient Occlusion', sockets={'Color': color, 'Distance': distance, 'Normal': normal}, inside=inside, only_local=only_local, samples=samples)
         return node._out
-
+''',
+'attribute': r'''
     @classmethod
     def attribute(cls, attribute_name='', attribute_type='GEOMETRY'):
         """ > Node <&ShaderNode Attribute>
@@ -125,7 +134,8 @@ class snd:
         utils.check_enum_arg('Attribute', 'attribute_type', attribute_type, 'attribute', ('GEOMETRY', 'OBJECT', 'INSTANCER', 'VIEW_LAYER'))
         node = Node('Attribute', sockets={}, attribute_name=attribute_name, attribute_type=attribute_type)
         return node
-
+''',
+'background': r'''
     @classmethod
     def background(cls, color=None, strength=None, weight=None):
         """ > Node <&ShaderNode Background>
@@ -142,7 +152,8 @@ class snd:
         """
         node = Node('Background', sockets={'Color': color, 'Strength': strength, 'Weight': weight})
         return node._out
-
+''',
+'bevel': r'''
     @classmethod
     def bevel(cls, radius=None, normal=None, samples=4):
         """ > Node <&ShaderNode Bevel>
@@ -159,7 +170,8 @@ class snd:
         """
         node = Node('Bevel', sockets={'Radius': radius, 'Normal': normal}, samples=samples)
         return node._out
-
+''',
+'blackbody': r'''
     @classmethod
     def blackbody(cls, temperature=None):
         """ > Node <&ShaderNode Blackbody>
@@ -174,7 +186,8 @@ class snd:
         """
         node = Node('Blackbody', sockets={'Temperature': temperature})
         return node._out
-
+''',
+'brightness_contrast': r'''
     @classmethod
     def brightness_contrast(cls, color=None, bright=None, contrast=None):
         """ > Node <&ShaderNode Brightness/Contrast>
@@ -191,7 +204,8 @@ class snd:
         """
         node = Node('Brightness/Contrast', sockets={'Color': color, 'Bright': bright, 'Contrast': contrast})
         return node._out
-
+''',
+'glossy_bsdf': r'''
     @classmethod
     def glossy_bsdf(cls, color=None, roughness=None, anisotropy=None, rotation=None, normal=None, tangent=None, weight=None, distribution='MULTI_GGX'):
         """ > Node <&ShaderNode Glossy BSDF>
@@ -214,7 +228,8 @@ class snd:
         utils.check_enum_arg('Glossy BSDF', 'distribution', distribution, 'glossy_bsdf', ('BECKMANN', 'GGX', 'ASHIKHMIN_SHIRLEY', 'MULTI_GGX'))
         node = Node('Glossy BSDF', sockets={'Color': color, 'Roughness': roughness, 'Anisotropy': anisotropy, 'Rotation': rotation, 'Normal': normal, 'Tangent': tangent, 'Weight': weight}, distribution=distribution)
         return node._out
-
+''',
+'diffuse_bsdf': r'''
     @classmethod
     def diffuse_bsdf(cls, color=None, roughness=None, normal=None, weight=None):
         """ > Node <&ShaderNode Diffuse BSDF>
@@ -232,7 +247,8 @@ class snd:
         """
         node = Node('Diffuse BSDF', sockets={'Color': color, 'Roughness': roughness, 'Normal': normal, 'Weight': weight})
         return node._out
-
+''',
+'glass_bsdf': r'''
     @classmethod
     def glass_bsdf(cls, color=None, roughness=None, ior=None, normal=None, weight=None, distribution='MULTI_GGX'):
         """ > Node <&ShaderNode Glass BSDF>
@@ -253,7 +269,8 @@ class snd:
         utils.check_enum_arg('Glass BSDF', 'distribution', distribution, 'glass_bsdf', ('BECKMANN', 'GGX', 'MULTI_GGX'))
         node = Node('Glass BSDF', sockets={'Color': color, 'Roughness': roughness, 'IOR': ior, 'Normal': normal, 'Weight': weight}, distribution=distribution)
         return node._out
-
+''',
+'hair_bsdf': r'''
     @classmethod
     def hair_bsdf(cls, color=None, offset=None, roughnessu=None, roughnessv=None, tangent=None, weight=None, component='Reflection'):
         """ > Node <&ShaderNode Hair BSDF>
@@ -275,7 +292,8 @@ class snd:
         utils.check_enum_arg('Hair BSDF', 'component', component, 'hair_bsdf', ('Reflection', 'Transmission'))
         node = Node('Hair BSDF', sockets={'Color': color, 'Offset': offset, 'RoughnessU': roughnessu, 'RoughnessV': roughnessv, 'Tangent': tangent, 'Weight': weight}, component=component)
         return node._out
-
+''',
+'principled_hair_bsdf': r'''
     @classmethod
     def principled_hair_bsdf(cls, color=None, melanin=None, melanin_redness=None, tint=None, absorption_coefficient=None, aspect_ratio=None, roughness=None, radial_roughness=None, coat=None, ior=None, offset=None, random_color=None, random_roughness=None, random=None, weight=None, reflection=None, transmission=None, secondary_reflection=None, model='CHIANG', parametrization='COLOR'):
         """ > Node <&ShaderNode Principled Hair BSDF>
@@ -311,7 +329,8 @@ class snd:
         utils.check_enum_arg('Principled Hair BSDF', 'parametrization', parametrization, 'principled_hair_bsdf', ('ABSORPTION', 'MELANIN', 'COLOR'))
         node = Node('Principled Hair BSDF', sockets={'Color': color, 'Melanin': melanin, 'Melanin Redness': melanin_redness, 'Tint': tint, 'Absorption Coefficient': absorption_coefficient, 'Aspect Ratio': aspect_ratio, 'Roughness': roughness, 'Radial Roughness': radial_roughness, 'Coat': coat, 'IOR': ior, 'Offset': offset, 'Random Color': random_color, 'Random Roughness': random_roughness, 'Random': random, 'Weight': weight, 'R lobe': reflection, 'TT lobe': transmission, 'TRT lobe': secondary_reflection}, model=model, parametrization=parametrization)
         return node._out
-
+''',
+'metallic_bsdf': r'''
     @classmethod
     def metallic_bsdf(cls, base_color=None, edge_tint=None, ior=None, extinction=None, roughness=None, anisotropy=None, rotation=None, normal=None, tangent=None, weight=None, distribution='MULTI_GGX', fresnel_type='F82'):
         """ > Node <&ShaderNode Metallic BSDF>
@@ -339,7 +358,8 @@ class snd:
         utils.check_enum_arg('Metallic BSDF', 'fresnel_type', fresnel_type, 'metallic_bsdf', ('PHYSICAL_CONDUCTOR', 'F82'))
         node = Node('Metallic BSDF', sockets={'Base Color': base_color, 'Edge Tint': edge_tint, 'IOR': ior, 'Extinction': extinction, 'Roughness': roughness, 'Anisotropy': anisotropy, 'Rotation': rotation, 'Normal': normal, 'Tangent': tangent, 'Weight': weight}, distribution=distribution, fresnel_type=fresnel_type)
         return node._out
-
+''',
+'principled_bsdf': r'''
     @classmethod
     def principled_bsdf(cls, base_color=None, metallic=None, roughness=None, ior=None, alpha=None, normal=None, weight=None, diffuse_roughness=None, subsurface_weight=None, subsurface_radius=None, subsurface_scale=None, subsurface_ior=None, subsurface_anisotropy=None, specular_ior_level=None, specular_tint=None, anisotropic=None, anisotropic_rotation=None, tangent=None, transmission_weight=None, coat_weight=None, coat_roughness=None, coat_ior=None, coat_tint=None, coat_normal=None, sheen_weight=None, sheen_roughness=None, sheen_tint=None, emission_color=None, emission_strength=None, thin_film_thickness=None, thin_film_ior=None, distribution='MULTI_GGX', subsurface_method='RANDOM_WALK'):
         """ > Node <&ShaderNode Principled BSDF>
@@ -388,7 +408,8 @@ class snd:
         utils.check_enum_arg('Principled BSDF', 'subsurface_method', subsurface_method, 'principled_bsdf', ('BURLEY', 'RANDOM_WALK', 'RANDOM_WALK_SKIN'))
         node = Node('Principled BSDF', sockets={'Base Color': base_color, 'Metallic': metallic, 'Roughness': roughness, 'IOR': ior, 'Alpha': alpha, 'Normal': normal, 'Weight': weight, 'Diffuse Roughness': diffuse_roughness, 'Subsurface Weight': subsurface_weight, 'Subsurface Radius': subsurface_radius, 'Subsurface Scale': subsurface_scale, 'Subsurface IOR': subsurface_ior, 'Subsurface Anisotropy': subsurface_anisotropy, 'Specular IOR Level': specular_ior_level, 'Specular Tint': specular_tint, 'Anisotropic': anisotropic, 'Anisotropic Rotation': anisotropic_rotation, 'Tangent': tangent, 'Transmission Weight': transmission_weight, 'Coat Weight': coat_weight, 'Coat Roughness': coat_roughness, 'Coat IOR': coat_ior, 'Coat Tint': coat_tint, 'Coat Normal': coat_normal, 'Sheen Weight': sheen_weight, 'Sheen Roughness': sheen_roughness, 'Sheen Tint': sheen_tint, 'Emission Color': emission_color, 'Emission Strength': emission_strength, 'Thin Film Thickness': thin_film_thickness, 'Thin Film IOR': thin_film_ior}, distribution=distribution, subsurface_method=subsurface_method)
         return node._out
-
+''',
+'ray_portal_bsdf': r'''
     @classmethod
     def ray_portal_bsdf(cls, color=None, position=None, direction=None, weight=None):
         """ > Node <&ShaderNode Ray Portal BSDF>
@@ -406,7 +427,8 @@ class snd:
         """
         node = Node('Ray Portal BSDF', sockets={'Color': color, 'Position': position, 'Direction': direction, 'Weight': weight})
         return node._out
-
+''',
+'refraction_bsdf': r'''
     @classmethod
     def refraction_bsdf(cls, color=None, roughness=None, ior=None, normal=None, weight=None, distribution='BECKMANN'):
         """ > Node <&ShaderNode Refraction BSDF>
@@ -427,7 +449,8 @@ class snd:
         utils.check_enum_arg('Refraction BSDF', 'distribution', distribution, 'refraction_bsdf', ('BECKMANN', 'GGX'))
         node = Node('Refraction BSDF', sockets={'Color': color, 'Roughness': roughness, 'IOR': ior, 'Normal': normal, 'Weight': weight}, distribution=distribution)
         return node._out
-
+''',
+'sheen_bsdf': r'''
     @classmethod
     def sheen_bsdf(cls, color=None, roughness=None, normal=None, weight=None, distribution='MICROFIBER'):
         """ > Node <&ShaderNode Sheen BSDF>
@@ -447,7 +470,8 @@ class snd:
         utils.check_enum_arg('Sheen BSDF', 'distribution', distribution, 'sheen_bsdf', ('ASHIKHMIN', 'MICROFIBER'))
         node = Node('Sheen BSDF', sockets={'Color': color, 'Roughness': roughness, 'Normal': normal, 'Weight': weight}, distribution=distribution)
         return node._out
-
+''',
+'toon_bsdf': r'''
     @classmethod
     def toon_bsdf(cls, color=None, size=None, smooth=None, normal=None, weight=None, component='DIFFUSE'):
         """ > Node <&ShaderNode Toon BSDF>
@@ -468,7 +492,8 @@ class snd:
         utils.check_enum_arg('Toon BSDF', 'component', component, 'toon_bsdf', ('DIFFUSE', 'GLOSSY'))
         node = Node('Toon BSDF', sockets={'Color': color, 'Size': size, 'Smooth': smooth, 'Normal': normal, 'Weight': weight}, component=component)
         return node._out
-
+''',
+'translucent_bsdf': r'''
     @classmethod
     def translucent_bsdf(cls, color=None, normal=None, weight=None):
         """ > Node <&ShaderNode Translucent BSDF>
@@ -485,7 +510,8 @@ class snd:
         """
         node = Node('Translucent BSDF', sockets={'Color': color, 'Normal': normal, 'Weight': weight})
         return node._out
-
+''',
+'transparent_bsdf': r'''
     @classmethod
     def transparent_bsdf(cls, color=None, weight=None):
         """ > Node <&ShaderNode Transparent BSDF>
@@ -501,7 +527,8 @@ class snd:
         """
         node = Node('Transparent BSDF', sockets={'Color': color, 'Weight': weight})
         return node._out
-
+''',
+'bump': r'''
     @classmethod
     def bump(cls, strength=None, distance=None, height=None, normal=None, invert=False):
         """ > Node <&ShaderNode Bump>
@@ -520,7 +547,8 @@ class snd:
         """
         node = Node('Bump', sockets={'Strength': strength, 'Distance': distance, 'Height': height, 'Normal': normal}, invert=invert)
         return node._out
-
+''',
+'camera_data': r'''
     @classmethod
     def camera_data(cls):
         """ > Node <&ShaderNode Camera Data>
@@ -531,7 +559,8 @@ class snd:
         """
         node = Node('Camera Data', sockets={})
         return node
-
+''',
+'clamp': r'''
     @classmethod
     def clamp(cls, value=None, min=None, max=None, clamp_type='MINMAX'):
         """ > Node <&ShaderNode Clamp>
@@ -550,7 +579,8 @@ class snd:
         utils.check_enum_arg('Clamp', 'clamp_type', clamp_type, 'clamp', ('MINMAX', 'RANGE'))
         node = Node('Clamp', sockets={'Value': value, 'Min': min, 'Max': max}, clamp_type=clamp_type)
         return node._out
-
+''',
+'combine_color': r'''
     @classmethod
     def combine_color(cls, red=None, green=None, blue=None, mode='RGB'):
         """ > Node <&ShaderNode Combine Color>
@@ -569,7 +599,8 @@ class snd:
         utils.check_enum_arg('Combine Color', 'mode', mode, 'combine_color', ('RGB', 'HSV', 'HSL'))
         node = Node('Combine Color', sockets={'Red': red, 'Green': green, 'Blue': blue}, mode=mode)
         return node._out
-
+''',
+'combine_xyz': r'''
     @classmethod
     def combine_xyz(cls, x=None, y=None, z=None):
         """ > Node <&ShaderNode Combine XYZ>
@@ -586,7 +617,8 @@ class snd:
         """
         node = Node('Combine XYZ', sockets={'X': x, 'Y': y, 'Z': z})
         return node._out
-
+''',
+'displacement': r'''
     @classmethod
     def displacement(cls, height=None, midlevel=None, scale=None, normal=None, space='OBJECT'):
         """ > Node <&ShaderNode Displacement>
@@ -606,7 +638,8 @@ class snd:
         utils.check_enum_arg('Displacement', 'space', space, 'displacement', ('OBJECT', 'WORLD'))
         node = Node('Displacement', sockets={'Height': height, 'Midlevel': midlevel, 'Scale': scale, 'Normal': normal}, space=space)
         return node._out
-
+''',
+'specular_bsdf': r'''
     @classmethod
     def specular_bsdf(cls, base_color=None, specular=None, roughness=None, emissive_color=None, transparency=None, normal=None, clear_coat=None, clear_coat_roughness=None, clear_coat_normal=None, weight=None):
         """ > Node <&ShaderNode Specular BSDF>
@@ -630,7 +663,8 @@ class snd:
         """
         node = Node('Specular BSDF', sockets={'Base Color': base_color, 'Specular': specular, 'Roughness': roughness, 'Emissive Color': emissive_color, 'Transparency': transparency, 'Normal': normal, 'Clear Coat': clear_coat, 'Clear Coat Roughness': clear_coat_roughness, 'Clear Coat Normal': clear_coat_normal, 'Weight': weight})
         return node._out
-
+''',
+'emission': r'''
     @classmethod
     def emission(cls, color=None, strength=None, weight=None):
         """ > Node <&ShaderNode Emission>
@@ -647,7 +681,8 @@ class snd:
         """
         node = Node('Emission', sockets={'Color': color, 'Strength': strength, 'Weight': weight})
         return node._out
-
+''',
+'float_curve': r'''
     @classmethod
     def float_curve(cls, value=None, factor=None):
         """ > Node <&ShaderNode Float Curve>
@@ -663,7 +698,8 @@ class snd:
         """
         node = NodeCurves('Float Curve', sockets={'Value': value, 'Factor': factor})
         return node._out
-
+''',
+'fresnel': r'''
     @classmethod
     def fresnel(cls, ior=None, normal=None):
         """ > Node <&ShaderNode Fresnel>
@@ -679,7 +715,8 @@ class snd:
         """
         node = Node('Fresnel', sockets={'IOR': ior, 'Normal': normal})
         return node._out
-
+''',
+'gamma': r'''
     @classmethod
     def gamma(cls, color=None, gamma=None):
         """ > Node <&ShaderNode Gamma>
@@ -695,7 +732,8 @@ class snd:
         """
         node = Node('Gamma', sockets={'Color': color, 'Gamma': gamma})
         return node._out
-
+''',
+'group': r'''
     @classmethod
     def group(cls, node_tree=None):
         """ > Node <&ShaderNode Group>
@@ -710,7 +748,8 @@ class snd:
         """
         node = Node('Group', sockets={}, node_tree=node_tree)
         return node._out
-
+''',
+'curves_info': r'''
     @classmethod
     def curves_info(cls):
         """ > Node <&ShaderNode Curves Info>
@@ -721,7 +760,8 @@ class snd:
         """
         node = Node('Curves Info', sockets={})
         return node
-
+''',
+'holdout': r'''
     @classmethod
     def holdout(cls, weight=None):
         """ > Node <&ShaderNode Holdout>
@@ -736,7 +776,8 @@ class snd:
         """
         node = Node('Holdout', sockets={'Weight': weight})
         return node._out
-
+''',
+'hue_saturation_value': r'''
     @classmethod
     def hue_saturation_value(cls, hue=None, saturation=None, value=None, color=None, fac=None):
         """ > Node <&ShaderNode Hue/Saturation/Value>
@@ -755,7 +796,8 @@ class snd:
         """
         node = Node('Hue/Saturation/Value', sockets={'Hue': hue, 'Saturation': saturation, 'Value': value, 'Color': color, 'Fac': fac})
         return node._out
-
+''',
+'invert_color': r'''
     @classmethod
     def invert_color(cls, color=None, fac=None):
         """ > Node <&ShaderNode Invert Color>
@@ -771,7 +813,8 @@ class snd:
         """
         node = Node('Invert Color', sockets={'Color': color, 'Fac': fac})
         return node._out
-
+''',
+'layer_weight': r'''
     @classmethod
     def layer_weight(cls, blend=None, normal=None):
         """ > Node <&ShaderNode Layer Weight>
@@ -787,7 +830,8 @@ class snd:
         """
         node = Node('Layer Weight', sockets={'Blend': blend, 'Normal': normal})
         return node._out
-
+''',
+'light_falloff': r'''
     @classmethod
     def light_falloff(cls, strength=None, smooth=None):
         """ > Node <&ShaderNode Light Falloff>
@@ -803,7 +847,8 @@ class snd:
         """
         node = Node('Light Falloff', sockets={'Strength': strength, 'Smooth': smooth})
         return node._out
-
+''',
+'light_path': r'''
     @classmethod
     def light_path(cls):
         """ > Node <&ShaderNode Light Path>
@@ -814,7 +859,8 @@ class snd:
         """
         node = Node('Light Path', sockets={})
         return node
-
+''',
+'map_range': r'''
     @classmethod
     def map_range(cls, value=None, from_min=None, from_max=None, to_min=None, to_max=None, steps=None, vector=None, from_min_1=None, from_max_1=None, to_min_1=None, to_max_1=None, steps_1=None, clamp=True, data_type='FLOAT', interpolation_type='LINEAR'):
         """ > Node <&ShaderNode Map Range>
@@ -845,7 +891,8 @@ class snd:
         utils.check_enum_arg('Map Range', 'interpolation_type', interpolation_type, 'map_range', ('LINEAR', 'STEPPED', 'SMOOTHSTEP', 'SMOOTHERSTEP'))
         node = Node('Map Range', sockets={'Value': value, 'From Min': from_min, 'From Max': from_max, 'To Min': to_min, 'To Max': to_max, 'Steps': steps, 'Vector': vector, 'From_Min_FLOAT3': from_min_1, 'From_Max_FLOAT3': from_max_1, 'To_Min_FLOAT3': to_min_1, 'To_Max_FLOAT3': to_max_1, 'Steps_FLOAT3': steps_1}, clamp=clamp, data_type=data_type, interpolation_type=interpolation_type)
         return node._out
-
+''',
+'mapping': r'''
     @classmethod
     def mapping(cls, vector=None, location=None, rotation=None, scale=None, vector_type='POINT'):
         """ > Node <&ShaderNode Mapping>
@@ -865,7 +912,8 @@ class snd:
         utils.check_enum_arg('Mapping', 'vector_type', vector_type, 'mapping', ('POINT', 'TEXTURE', 'VECTOR', 'NORMAL'))
         node = Node('Mapping', sockets={'Vector': vector, 'Location': location, 'Rotation': rotation, 'Scale': scale}, vector_type=vector_type)
         return node._out
-
+''',
+'math': r'''
     @classmethod
     def math(cls, value=None, value_1=None, value_2=None, operation='ADD', use_clamp=False):
         """ > Node <&ShaderNode Math>
@@ -885,7 +933,8 @@ class snd:
         utils.check_enum_arg('Math', 'operation', operation, 'math', ('ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'MULTIPLY_ADD', 'POWER', 'LOGARITHM', 'SQRT', 'INVERSE_SQRT', 'ABSOLUTE', 'EXPONENT', 'MINIMUM', 'MAXIMUM', 'LESS_THAN', 'GREATER_THAN', 'SIGN', 'COMPARE', 'SMOOTH_MIN', 'SMOOTH_MAX', 'ROUND', 'FLOOR', 'CEIL', 'TRUNC', 'FRACT', 'MODULO', 'FLOORED_MODULO', 'WRAP', 'SNAP', 'PINGPONG', 'SINE', 'COSINE', 'TANGENT', 'ARCSINE', 'ARCCOSINE', 'ARCTANGENT', 'ARCTAN2', 'SINH', 'COSH', 'TANH', 'RADIANS', 'DEGREES'))
         node = Node('Math', sockets={'Value': value, 'Value_001': value_1, 'Value_002': value_2}, operation=operation, use_clamp=use_clamp)
         return node._out
-
+''',
+'mix': r'''
     @classmethod
     def mix(cls, a=None, b=None, a_1=None, b_1=None, a_2=None, b_2=None, a_3=None, b_3=None, factor=None, blend_type='MIX', clamp_factor=True, clamp_result=False, data_type='FLOAT', factor_mode='UNIFORM'):
         """ > Node <&ShaderNode Mix>
@@ -916,7 +965,8 @@ class snd:
         utils.check_enum_arg('Mix', 'factor_mode', factor_mode, 'mix', ('UNIFORM', 'NON_UNIFORM'))
         node = Node('Mix', sockets={'A_Float': a, 'B_Float': b, 'A_Vector': a_1, 'B_Vector': b_1, 'A_Color': a_2, 'B_Color': b_2, 'A_Rotation': a_3, 'B_Rotation': b_3, 'Factor_Vector': factor}, blend_type=blend_type, clamp_factor=clamp_factor, clamp_result=clamp_result, data_type=data_type, factor_mode=factor_mode)
         return node._out
-
+''',
+'mix_shader': r'''
     @classmethod
     def mix_shader(cls, shader=None, shader_1=None, fac=None):
         """ > Node <&ShaderNode Mix Shader>
@@ -933,7 +983,8 @@ class snd:
         """
         node = Node('Mix Shader', sockets={'Shader': shader, 'Shader_001': shader_1, 'Fac': fac})
         return node._out
-
+''',
+'geometry': r'''
     @classmethod
     def geometry(cls):
         """ > Node <&ShaderNode Geometry>
@@ -944,7 +995,8 @@ class snd:
         """
         node = Node('Geometry', sockets={})
         return node
-
+''',
+'normal': r'''
     @classmethod
     def normal(cls, normal=None):
         """ > Node <&ShaderNode Normal>
@@ -959,7 +1011,8 @@ class snd:
         """
         node = Node('Normal', sockets={'Normal': normal})
         return node._out
-
+''',
+'normal_map': r'''
     @classmethod
     def normal_map(cls, strength=None, color=None, space='TANGENT', uv_map=''):
         """ > Node <&ShaderNode Normal Map>
@@ -978,7 +1031,8 @@ class snd:
         utils.check_enum_arg('Normal Map', 'space', space, 'normal_map', ('TANGENT', 'OBJECT', 'WORLD', 'BLENDER_OBJECT', 'BLENDER_WORLD'))
         node = Node('Normal Map', sockets={'Strength': strength, 'Color': color}, space=space, uv_map=uv_map)
         return node._out
-
+''',
+'object_info': r'''
     @classmethod
     def object_info(cls):
         """ > Node <&ShaderNode Object Info>
@@ -989,7 +1043,8 @@ class snd:
         """
         node = Node('Object Info', sockets={})
         return node
-
+''',
+'aov_output': r'''
     @classmethod
     def aov_output(cls, color=None, value=None, aov_name=''):
         """ > Node <&ShaderNode AOV Output>
@@ -1006,7 +1061,8 @@ class snd:
         """
         node = Node('AOV Output', sockets={'Color': color, 'Value': value}, aov_name=aov_name)
         return node._out
-
+''',
+'light_output': r'''
     @classmethod
     def light_output(cls, surface=None, is_active_output=True, target='ALL'):
         """ > Node <&ShaderNode Light Output>
@@ -1024,7 +1080,8 @@ class snd:
         utils.check_enum_arg('Light Output', 'target', target, 'light_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('Light Output', sockets={'Surface': surface}, is_active_output=is_active_output, target=target)
         return node._out
-
+''',
+'line_style_output': r'''
     @classmethod
     def line_style_output(cls, color=None, color_fac=None, alpha=None, alpha_fac=None, blend_type='MIX', is_active_output=True, target='ALL', use_alpha=False, use_clamp=False):
         """ > Node <&ShaderNode Line Style Output>
@@ -1049,7 +1106,8 @@ class snd:
         utils.check_enum_arg('Line Style Output', 'target', target, 'line_style_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('Line Style Output', sockets={'Color': color, 'Color Fac': color_fac, 'Alpha': alpha, 'Alpha Fac': alpha_fac}, blend_type=blend_type, is_active_output=is_active_output, target=target, use_alpha=use_alpha, use_clamp=use_clamp)
         return node._out
-
+''',
+'material_output': r'''
     @classmethod
     def material_output(cls, surface=None, volume=None, displacement=None, thickness=None, is_active_output=True, target='ALL'):
         """ > Node <&ShaderNode Material Output>
@@ -1070,7 +1128,8 @@ class snd:
         utils.check_enum_arg('Material Output', 'target', target, 'material_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('Material Output', sockets={'Surface': surface, 'Volume': volume, 'Displacement': displacement, 'Thickness': thickness}, is_active_output=is_active_output, target=target)
         return node._out
-
+''',
+'world_output': r'''
     @classmethod
     def world_output(cls, surface=None, volume=None, is_active_output=True, target='ALL'):
         """ > Node <&ShaderNode World Output>
@@ -1089,7 +1148,8 @@ class snd:
         utils.check_enum_arg('World Output', 'target', target, 'world_output', ('ALL', 'EEVEE', 'CYCLES'))
         node = Node('World Output', sockets={'Surface': surface, 'Volume': volume}, is_active_output=is_active_output, target=target)
         return node._out
-
+''',
+'particle_info': r'''
     @classmethod
     def particle_info(cls):
         """ > Node <&ShaderNode Particle Info>
@@ -1100,7 +1160,8 @@ class snd:
         """
         node = Node('Particle Info', sockets={})
         return node
-
+''',
+'point_info': r'''
     @classmethod
     def point_info(cls):
         """ > Node <&ShaderNode Point Info>
@@ -1111,7 +1172,8 @@ class snd:
         """
         node = Node('Point Info', sockets={})
         return node
-
+''',
+'rgb': r'''
     @classmethod
     @property
     def rgb(cls):
@@ -1123,7 +1185,8 @@ class snd:
         """
         node = Node('RGB', sockets={})
         return node._out
-
+''',
+'rgb_curves': r'''
     @classmethod
     def rgb_curves(cls, color=None, fac=None):
         """ > Node <&ShaderNode RGB Curves>
@@ -1139,7 +1202,8 @@ class snd:
         """
         node = NodeCurves('RGB Curves', sockets={'Color': color, 'Fac': fac})
         return node._out
-
+''',
+'rgb_to_bw': r'''
     @classmethod
     def rgb_to_bw(cls, color=None):
         """ > Node <&ShaderNode RGB to BW>
@@ -1154,7 +1218,8 @@ class snd:
         """
         node = Node('RGB to BW', sockets={'Color': color})
         return node._out
-
+''',
+'script': r'''
     @classmethod
     def script(cls, bytecode='', bytecode_hash='', filepath='', mode='INTERNAL', script=None, use_auto_update=False):
         """ > Node <&ShaderNode Script>
@@ -1175,7 +1240,8 @@ class snd:
         utils.check_enum_arg('Script', 'mode', mode, 'script', ('INTERNAL', 'EXTERNAL'))
         node = Node('Script', sockets={}, bytecode=bytecode, bytecode_hash=bytecode_hash, filepath=filepath, mode=mode, script=script, use_auto_update=use_auto_update)
         return node._out
-
+''',
+'separate_color': r'''
     @classmethod
     def separate_color(cls, color=None, mode='RGB'):
         """ > Node <&ShaderNode Separate Color>
@@ -1192,7 +1258,8 @@ class snd:
         utils.check_enum_arg('Separate Color', 'mode', mode, 'separate_color', ('RGB', 'HSV', 'HSL'))
         node = Node('Separate Color', sockets={'Color': color}, mode=mode)
         return node._out
-
+''',
+'separate_xyz': r'''
     @classmethod
     def separate_xyz(cls, vector=None):
         """ > Node <&ShaderNode Separate XYZ>
@@ -1207,7 +1274,8 @@ class snd:
         """
         node = Node('Separate XYZ', sockets={'Vector': vector})
         return node._out
-
+''',
+'shader_to_rgb': r'''
     @classmethod
     def shader_to_rgb(cls, shader=None):
         """ > Node <&ShaderNode Shader to RGB>
@@ -1222,7 +1290,8 @@ class snd:
         """
         node = Node('Shader to RGB', sockets={'Shader': shader})
         return node._out
-
+''',
+'subsurface_scattering': r'''
     @classmethod
     def subsurface_scattering(cls, color=None, scale=None, radius=None, ior=None, roughness=None, anisotropy=None, normal=None, weight=None, falloff='RANDOM_WALK'):
         """ > Node <&ShaderNode Subsurface Scattering>
@@ -1246,7 +1315,8 @@ class snd:
         utils.check_enum_arg('Subsurface Scattering', 'falloff', falloff, 'subsurface_scattering', ('BURLEY', 'RANDOM_WALK', 'RANDOM_WALK_SKIN'))
         node = Node('Subsurface Scattering', sockets={'Color': color, 'Scale': scale, 'Radius': radius, 'IOR': ior, 'Roughness': roughness, 'Anisotropy': anisotropy, 'Normal': normal, 'Weight': weight}, falloff=falloff)
         return node._out
-
+''',
+'tangent': r'''
     @classmethod
     def tangent(cls, axis='Z', direction_type='RADIAL', uv_map=''):
         """ > Node <&ShaderNode Tangent>
@@ -1265,7 +1335,8 @@ class snd:
         utils.check_enum_arg('Tangent', 'direction_type', direction_type, 'tangent', ('RADIAL', 'UV_MAP'))
         node = Node('Tangent', sockets={}, axis=axis, direction_type=direction_type, uv_map=uv_map)
         return node._out
-
+''',
+'brick_texture': r'''
     @classmethod
     def brick_texture(cls, vector=None, color1=None, color2=None, mortar=None, scale=None, mortar_size=None, mortar_smooth=None, bias=None, brick_width=None, row_height=None, offset=0.5, offset_frequency=2, squash=1.0, squash_frequency=2):
         """ > Node <&ShaderNode Brick Texture>
@@ -1293,7 +1364,8 @@ class snd:
         """
         node = Node('Brick Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Mortar': mortar, 'Scale': scale, 'Mortar Size': mortar_size, 'Mortar Smooth': mortar_smooth, 'Bias': bias, 'Brick Width': brick_width, 'Row Height': row_height}, offset=offset, offset_frequency=offset_frequency, squash=squash, squash_frequency=squash_frequency)
         return node._out
-
+''',
+'checker_texture': r'''
     @classmethod
     def checker_texture(cls, vector=None, color1=None, color2=None, scale=None):
         """ > Node <&ShaderNode Checker Texture>
@@ -1311,7 +1383,8 @@ class snd:
         """
         node = Node('Checker Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Scale': scale})
         return node._out
-
+''',
+'texture_coordinate': r'''
     @classmethod
     def texture_coordinate(cls, from_instancer=False, object=None):
         """ > Node <&ShaderNode Texture Coordinate>
@@ -1327,7 +1400,8 @@ class snd:
         """
         node = Node('Texture Coordinate', sockets={}, from_instancer=from_instancer, object=object)
         return node
-
+''',
+'environment_texture': r'''
     @classmethod
     def environment_texture(cls, vector=None, image=None, interpolation='Linear', projection='EQUIRECTANGULAR'):
         """ > Node <&ShaderNode Environment Texture>
@@ -1347,7 +1421,8 @@ class snd:
         utils.check_enum_arg('Environment Texture', 'projection', projection, 'environment_texture', ('EQUIRECTANGULAR', 'MIRROR_BALL'))
         node = Node('Environment Texture', sockets={'Vector': vector}, image=image, interpolation=interpolation, projection=projection)
         return node._out
-
+''',
+'gabor_texture': r'''
     @classmethod
     def gabor_texture(cls, vector=None, scale=None, frequency=None, anisotropy=None, orientation=None, orientation_1=None, gabor_type='2D'):
         """ > Node <&ShaderNode Gabor Texture>
@@ -1369,7 +1444,8 @@ class snd:
         utils.check_enum_arg('Gabor Texture', 'gabor_type', gabor_type, 'gabor_texture', ('2D', '3D'))
         node = Node('Gabor Texture', sockets={'Vector': vector, 'Scale': scale, 'Frequency': frequency, 'Anisotropy': anisotropy, 'Orientation 2D': orientation, 'Orientation 3D': orientation_1}, gabor_type=gabor_type)
         return node._out
-
+''',
+'gradient_texture': r'''
     @classmethod
     def gradient_texture(cls, vector=None, gradient_type='LINEAR'):
         """ > Node <&ShaderNode Gradient Texture>
@@ -1386,7 +1462,8 @@ class snd:
         utils.check_enum_arg('Gradient Texture', 'gradient_type', gradient_type, 'gradient_texture', ('LINEAR', 'QUADRATIC', 'EASING', 'DIAGONAL', 'SPHERICAL', 'QUADRATIC_SPHERE', 'RADIAL'))
         node = Node('Gradient Texture', sockets={'Vector': vector}, gradient_type=gradient_type)
         return node._out
-
+''',
+'ies_texture': r'''
     @classmethod
     def ies_texture(cls, vector=None, strength=None, filepath='', ies=None, mode='INTERNAL'):
         """ > Node <&ShaderNode IES Texture>
@@ -1406,7 +1483,8 @@ class snd:
         utils.check_enum_arg('IES Texture', 'mode', mode, 'ies_texture', ('INTERNAL', 'EXTERNAL'))
         node = Node('IES Texture', sockets={'Vector': vector, 'Strength': strength}, filepath=filepath, ies=ies, mode=mode)
         return node._out
-
+''',
+'image_texture': r'''
     @classmethod
     def image_texture(cls, vector=None, extension='REPEAT', image=None, interpolation='Linear', projection='FLAT', projection_blend=0.0):
         """ > Node <&ShaderNode Image Texture>
@@ -1429,7 +1507,8 @@ class snd:
         utils.check_enum_arg('Image Texture', 'projection', projection, 'image_texture', ('FLAT', 'BOX', 'SPHERE', 'TUBE'))
         node = Node('Image Texture', sockets={'Vector': vector}, extension=extension, image=image, interpolation=interpolation, projection=projection, projection_blend=projection_blend)
         return node._out
-
+''',
+'magic_texture': r'''
     @classmethod
     def magic_texture(cls, vector=None, scale=None, distortion=None, turbulence_depth=2):
         """ > Node <&ShaderNode Magic Texture>
@@ -1447,7 +1526,8 @@ class snd:
         """
         node = Node('Magic Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion}, turbulence_depth=turbulence_depth)
         return node._out
-
+''',
+'noise_texture': r'''
     @classmethod
     def noise_texture(cls, vector=None, w=None, scale=None, detail=None, roughness=None, lacunarity=None, offset=None, gain=None, distortion=None, noise_dimensions='3D', noise_type='FBM', normalize=True):
         """ > Node <&ShaderNode Noise Texture>
@@ -1475,7 +1555,8 @@ class snd:
         utils.check_enum_arg('Noise Texture', 'noise_type', noise_type, 'noise_texture', ('MULTIFRACTAL', 'RIDGED_MULTIFRACTAL', 'HYBRID_MULTIFRACTAL', 'FBM', 'HETERO_TERRAIN'))
         node = Node('Noise Texture', sockets={'Vector': vector, 'W': w, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Offset': offset, 'Gain': gain, 'Distortion': distortion}, noise_dimensions=noise_dimensions, noise_type=noise_type, normalize=normalize)
         return node._out
-
+''',
+'point_density': r'''
     @classmethod
     def point_density(cls, vector=None, interpolation='Linear', object=None, particle_color_source='PARTICLE_AGE', particle_system=None, point_source='PARTICLE_SYSTEM', radius=0.30000001192092896, resolution=100, space='OBJECT', vertex_attribute_name='', vertex_color_source='VERTEX_COLOR'):
         """ > Node <&ShaderNode Point Density>
@@ -1505,7 +1586,8 @@ class snd:
         utils.check_enum_arg('Point Density', 'vertex_color_source', vertex_color_source, 'point_density', ('VERTEX_COLOR', 'VERTEX_WEIGHT', 'VERTEX_NORMAL'))
         node = Node('Point Density', sockets={'Vector': vector}, interpolation=interpolation, object=object, particle_color_source=particle_color_source, particle_system=particle_system, point_source=point_source, radius=radius, resolution=resolution, space=space, vertex_attribute_name=vertex_attribute_name, vertex_color_source=vertex_color_source)
         return node._out
-
+''',
+'sky_texture': r'''
     @classmethod
     def sky_texture(cls, vector=None, air_density=1.0, altitude=0.0, dust_density=1.0, ground_albedo=0.30000001192092896, ozone_density=1.0, sky_type='NISHITA', sun_disc=True, sun_elevation=0.2617993950843811, sun_intensity=1.0, sun_rotation=0.0, sun_size=0.009512044489383698, turbidity=2.200000047683716):
         """ > Node <&ShaderNode Sky Texture>
@@ -1533,7 +1615,8 @@ class snd:
         utils.check_enum_arg('Sky Texture', 'sky_type', sky_type, 'sky_texture', ('PREETHAM', 'HOSEK_WILKIE', 'NISHITA'))
         node = Node('Sky Texture', sockets={'Vector': vector}, air_density=air_density, altitude=altitude, dust_density=dust_density, ground_albedo=ground_albedo, ozone_density=ozone_density, sky_type=sky_type, sun_disc=sun_disc, sun_elevation=sun_elevation, sun_intensity=sun_intensity, sun_rotation=sun_rotation, sun_size=sun_size, turbidity=turbidity)
         return node._out
-
+''',
+'voronoi_texture': r'''
     @classmethod
     def voronoi_texture(cls, vector=None, w=None, scale=None, detail=None, roughness=None, lacunarity=None, smoothness=None, exponent=None, randomness=None, distance='EUCLIDEAN', feature='F1', normalize=False, voronoi_dimensions='3D'):
         """ > Node <&ShaderNode Voronoi Texture>
@@ -1563,7 +1646,8 @@ class snd:
         utils.check_enum_arg('Voronoi Texture', 'voronoi_dimensions', voronoi_dimensions, 'voronoi_texture', ('1D', '2D', '3D', '4D'))
         node = Node('Voronoi Texture', sockets={'Vector': vector, 'W': w, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Smoothness': smoothness, 'Exponent': exponent, 'Randomness': randomness}, distance=distance, feature=feature, normalize=normalize, voronoi_dimensions=voronoi_dimensions)
         return node._out
-
+''',
+'wave_texture': r'''
     @classmethod
     def wave_texture(cls, vector=None, scale=None, distortion=None, detail=None, detail_scale=None, detail_roughness=None, phase_offset=None, bands_direction='X', rings_direction='X', wave_profile='SIN', wave_type='BANDS'):
         """ > Node <&ShaderNode Wave Texture>
@@ -1592,7 +1676,8 @@ class snd:
         utils.check_enum_arg('Wave Texture', 'wave_type', wave_type, 'wave_texture', ('BANDS', 'RINGS'))
         node = Node('Wave Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion, 'Detail': detail, 'Detail Scale': detail_scale, 'Detail Roughness': detail_roughness, 'Phase Offset': phase_offset}, bands_direction=bands_direction, rings_direction=rings_direction, wave_profile=wave_profile, wave_type=wave_type)
         return node._out
-
+''',
+'white_noise_texture': r'''
     @classmethod
     def white_noise_texture(cls, vector=None, w=None, noise_dimensions='3D'):
         """ > Node <&ShaderNode White Noise Texture>
@@ -1610,7 +1695,8 @@ class snd:
         utils.check_enum_arg('White Noise Texture', 'noise_dimensions', noise_dimensions, 'white_noise_texture', ('1D', '2D', '3D', '4D'))
         node = Node('White Noise Texture', sockets={'Vector': vector, 'W': w}, noise_dimensions=noise_dimensions)
         return node._out
-
+''',
+'uv_along_stroke': r'''
     @classmethod
     def uv_along_stroke(cls, use_tips=False):
         """ > Node <&ShaderNode UV Along Stroke>
@@ -1625,7 +1711,8 @@ class snd:
         """
         node = Node('UV Along Stroke', sockets={}, use_tips=use_tips)
         return node._out
-
+''',
+'uv_map': r'''
     @classmethod
     def uv_map(cls, from_instancer=False, uv_map=''):
         """ > Node <&ShaderNode UV Map>
@@ -1641,7 +1728,8 @@ class snd:
         """
         node = Node('UV Map', sockets={}, from_instancer=from_instancer, uv_map=uv_map)
         return node._out
-
+''',
+'color_ramp': r'''
     @classmethod
     def color_ramp(cls, fac=None, stops=None, interpolation='LINEAR'):
         """ Node <&Node Color Ramp>
@@ -1661,7 +1749,8 @@ class snd:
         """
         node = ColorRamp(fac=fac, stops=stops, interpolation=interpolation)
         return node._out
-
+''',
+'value': r'''
     @classmethod
     @property
     def value(cls):
@@ -1673,7 +1762,8 @@ class snd:
         """
         node = Node('Value', sockets={})
         return node._out
-
+''',
+'vector_curves': r'''
     @classmethod
     def vector_curves(cls, vector=None, fac=None):
         """ > Node <&ShaderNode Vector Curves>
@@ -1689,7 +1779,8 @@ class snd:
         """
         node = NodeCurves('Vector Curves', sockets={'Vector': vector, 'Fac': fac})
         return node._out
-
+''',
+'vector_displacement': r'''
     @classmethod
     def vector_displacement(cls, vector=None, midlevel=None, scale=None, space='TANGENT'):
         """ > Node <&ShaderNode Vector Displacement>
@@ -1708,7 +1799,8 @@ class snd:
         utils.check_enum_arg('Vector Displacement', 'space', space, 'vector_displacement', ('TANGENT', 'OBJECT', 'WORLD'))
         node = Node('Vector Displacement', sockets={'Vector': vector, 'Midlevel': midlevel, 'Scale': scale}, space=space)
         return node._out
-
+''',
+'vector_math': r'''
     @classmethod
     def vector_math(cls, vector=None, vector_1=None, vector_2=None, scale=None, operation='ADD'):
         """ > Node <&ShaderNode Vector Math>
@@ -1728,7 +1820,8 @@ class snd:
         utils.check_enum_arg('Vector Math', 'operation', operation, 'vector_math', ('ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'MULTIPLY_ADD', 'CROSS_PRODUCT', 'PROJECT', 'REFLECT', 'REFRACT', 'FACEFORWARD', 'DOT_PRODUCT', 'DISTANCE', 'LENGTH', 'SCALE', 'NORMALIZE', 'ABSOLUTE', 'MINIMUM', 'MAXIMUM', 'FLOOR', 'CEIL', 'FRACTION', 'MODULO', 'WRAP', 'SNAP', 'SINE', 'COSINE', 'TANGENT'))
         node = Node('Vector Math', sockets={'Vector': vector, 'Vector_001': vector_1, 'Vector_002': vector_2, 'Scale': scale}, operation=operation)
         return node._out
-
+''',
+'vector_rotate': r'''
     @classmethod
     def vector_rotate(cls, vector=None, center=None, axis=None, angle=None, rotation=None, invert=False, rotation_type='AXIS_ANGLE'):
         """ > Node <&ShaderNode Vector Rotate>
@@ -1750,7 +1843,8 @@ class snd:
         utils.check_enum_arg('Vector Rotate', 'rotation_type', rotation_type, 'vector_rotate', ('AXIS_ANGLE', 'X_AXIS', 'Y_AXIS', 'Z_AXIS', 'EULER_XYZ'))
         node = Node('Vector Rotate', sockets={'Vector': vector, 'Center': center, 'Axis': axis, 'Angle': angle, 'Rotation': rotation}, invert=invert, rotation_type=rotation_type)
         return node._out
-
+''',
+'vector_transform': r'''
     @classmethod
     def vector_transform(cls, vector=None, convert_from='WORLD', convert_to='OBJECT', vector_type='VECTOR'):
         """ > Node <&ShaderNode Vector Transform>
@@ -1771,7 +1865,8 @@ class snd:
         utils.check_enum_arg('Vector Transform', 'vector_type', vector_type, 'vector_transform', ('POINT', 'VECTOR', 'NORMAL'))
         node = Node('Vector Transform', sockets={'Vector': vector}, convert_from=convert_from, convert_to=convert_to, vector_type=vector_type)
         return node._out
-
+''',
+'color_attribute': r'''
     @classmethod
     def color_attribute(cls, layer_name=''):
         """ > Node <&ShaderNode Color Attribute>
@@ -1786,7 +1881,8 @@ class snd:
         """
         node = Node('Color Attribute', sockets={}, layer_name=layer_name)
         return node
-
+''',
+'volume_absorption': r'''
     @classmethod
     def volume_absorption(cls, color=None, density=None, weight=None):
         """ > Node <&ShaderNode Volume Absorption>
@@ -1803,7 +1899,8 @@ class snd:
         """
         node = Node('Volume Absorption', sockets={'Color': color, 'Density': density, 'Weight': weight})
         return node._out
-
+''',
+'volume_info': r'''
     @classmethod
     def volume_info(cls):
         """ > Node <&ShaderNode Volume Info>
@@ -1814,7 +1911,8 @@ class snd:
         """
         node = Node('Volume Info', sockets={})
         return node
-
+''',
+'principled_volume': r'''
     @classmethod
     def principled_volume(cls, color=None, color_attribute=None, density=None, density_attribute=None, anisotropy=None, absorption_color=None, emission_strength=None, emission_color=None, blackbody_intensity=None, blackbody_tint=None, temperature=None, temperature_attribute=None, weight=None):
         """ > Node <&ShaderNode Principled Volume>
@@ -1841,7 +1939,8 @@ class snd:
         """
         node = Node('Principled Volume', sockets={'Color': color, 'Color Attribute': color_attribute, 'Density': density, 'Density Attribute': density_attribute, 'Anisotropy': anisotropy, 'Absorption Color': absorption_color, 'Emission Strength': emission_strength, 'Emission Color': emission_color, 'Blackbody Intensity': blackbody_intensity, 'Blackbody Tint': blackbody_tint, 'Temperature': temperature, 'Temperature Attribute': temperature_attribute, 'Weight': weight})
         return node._out
-
+''',
+'volume_scatter': r'''
     @classmethod
     def volume_scatter(cls, color=None, density=None, anisotropy=None, ior=None, backscatter=None, alpha=None, diameter=None, weight=None, phase='HENYEY_GREENSTEIN'):
         """ > Node <&ShaderNode Volume Scatter>
@@ -1865,7 +1964,8 @@ class snd:
         utils.check_enum_arg('Volume Scatter', 'phase', phase, 'volume_scatter', ('HENYEY_GREENSTEIN', 'FOURNIER_FORAND', 'DRAINE', 'RAYLEIGH', 'MIE'))
         node = Node('Volume Scatter', sockets={'Color': color, 'Density': density, 'Anisotropy': anisotropy, 'IOR': ior, 'Backscatter': backscatter, 'Alpha': alpha, 'Diameter': diameter, 'Weight': weight}, phase=phase)
         return node._out
-
+''',
+'wavelength': r'''
     @classmethod
     def wavelength(cls, wavelength=None):
         """ > Node <&ShaderNode Wavelength>
@@ -1880,7 +1980,8 @@ class snd:
         """
         node = Node('Wavelength', sockets={'Wavelength': wavelength})
         return node._out
-
+''',
+'wireframe': r'''
     @classmethod
     def wireframe(cls, size=None, use_pixel_size=False):
         """ > Node <&ShaderNode Wireframe>
@@ -1896,4 +1997,7 @@ class snd:
         """
         node = Node('Wireframe', sockets={'Size': size}, use_pixel_size=use_pixel_size)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(snd)
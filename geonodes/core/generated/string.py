@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class String(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'equal': r'''
     def equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -27,7 +31,8 @@ class String(Socket):
         """
         node = Node('Compare', sockets={'A_STR': self, 'B_STR': b}, data_type='STRING', mode='ELEMENT', operation='EQUAL')
         return node._out
-
+''',
+'not_equal': r'''
     def not_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -48,7 +53,8 @@ class String(Socket):
         """
         node = Node('Compare', sockets={'A_STR': self, 'B_STR': b}, data_type='STRING', mode='ELEMENT', operation='NOT_EQUAL')
         return node._out
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -67,7 +73,8 @@ class String(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='STRING')
         return node._out
-
+''',
+'special_characters': r'''
     @classmethod
     def special_characters(cls):
         """ > Node <&Node Special Characters>
@@ -78,7 +85,8 @@ class String(Socket):
         """
         node = Node('Special Characters', sockets={})
         return node
-
+''',
+'line_break': r'''
     @classmethod
     @property
     def line_break(cls):
@@ -90,7 +98,8 @@ class String(Socket):
         """
         node = Node('Special Characters', sockets={})
         return node._out
-
+''',
+'tab': r'''
     @classmethod
     @property
     def tab(cls):
@@ -102,7 +111,8 @@ class String(Socket):
         """
         node = Node('Special Characters', sockets={})
         return node.tab
-
+''',
+'replace': r'''
     def replace(self, find=None, replace=None):
         """ > Node <&Node Replace String>
 
@@ -121,7 +131,8 @@ class String(Socket):
         """
         node = Node('Replace String', sockets={'String': self, 'Find': find, 'Replace': replace})
         return node._out
-
+''',
+'slice': r'''
     def slice(self, position=None, length=None):
         """ > Node <&Node Slice String>
 
@@ -140,7 +151,8 @@ class String(Socket):
         """
         node = Node('Slice String', sockets={'String': self, 'Position': position, 'Length': length})
         return node._out
-
+''',
+'length': r'''
     def length(self):
         """ > Node <&Node String Length>
 
@@ -154,7 +166,8 @@ class String(Socket):
         """
         node = Node('String Length', sockets={'String': self})
         return node._out
-
+''',
+'join': r'''
     def join(self, *strings):
         """ > Node <&Node Join Strings>
 
@@ -172,7 +185,8 @@ class String(Socket):
         """
         node = Node('Join Strings', sockets={'Delimiter': self, 'Strings': list(strings)})
         return node._out
-
+''',
+'Join': r'''
     @classmethod
     def Join(cls, *strings, delimiter=None):
         """ > Node <&Node Join Strings>
@@ -188,7 +202,8 @@ class String(Socket):
         """
         node = Node('Join Strings', sockets={'Delimiter': delimiter, 'Strings': list(strings)})
         return cls(node._out)
-
+''',
+'to_curves': r'''
     def to_curves(self, size=None, character_spacing=None, word_spacing=None, line_spacing=None, text_box_width=None, align_x='LEFT', align_y='TOP_BASELINE', overflow='OVERFLOW', pivot_mode='BOTTOM_LEFT'):
         """ > Node <&Node String to Curves>
 
@@ -218,4 +233,7 @@ class String(Socket):
         utils.check_enum_arg('String to Curves', 'pivot_mode', pivot_mode, 'to_curves', ('MIDPOINT', 'TOP_LEFT', 'TOP_CENTER', 'TOP_RIGHT', 'BOTTOM_LEFT', 'BOTTOM_CENTER', 'BOTTOM_RIGHT'))
         node = Node('String to Curves', sockets={'String': self, 'Size': size, 'Character Spacing': character_spacing, 'Word Spacing': word_spacing, 'Line Spacing': line_spacing, 'Text Box Width': text_box_width}, align_x=align_x, align_y=align_y, overflow=overflow, pivot_mode=pivot_mode)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(String)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Texture(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'Brick': r'''
     @classmethod
     def Brick(cls, vector=None, color1=None, color2=None, mortar=None, scale=None, mortar_size=None, mortar_smooth=None, bias=None, brick_width=None, row_height=None, offset=0.5, offset_frequency=2, squash=1.0, squash_frequency=2):
         """ > Node <&Node Brick Texture>
@@ -34,7 +38,8 @@ class Texture(Socket):
         """
         node = Node('Brick Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Mortar': mortar, 'Scale': scale, 'Mortar Size': mortar_size, 'Mortar Smooth': mortar_smooth, 'Bias': bias, 'Brick Width': brick_width, 'Row Height': row_height}, offset=offset, offset_frequency=offset_frequency, squash=squash, squash_frequency=squash_frequency)
         return node._out
-
+''',
+'Checked': r'''
     @classmethod
     def Checked(cls, vector=None, color1=None, color2=None, scale=None):
         """ > Node <&Node Checker Texture>
@@ -52,7 +57,8 @@ class Texture(Socket):
         """
         node = Node('Checker Texture', sockets={'Vector': vector, 'Color1': color1, 'Color2': color2, 'Scale': scale})
         return node._out
-
+''',
+'Gabor': r'''
     @classmethod
     def Gabor(cls, vector=None, scale=None, frequency=None, anisotropy=None, orientation=None, gabor_type='2D'):
         """ > Node <&Node Gabor Texture>
@@ -73,7 +79,8 @@ class Texture(Socket):
         utils.check_enum_arg('Gabor Texture', 'gabor_type', gabor_type, 'Gabor', ('2D', '3D'))
         node = Node('Gabor Texture', sockets={'Vector': vector, 'Scale': scale, 'Frequency': frequency, 'Anisotropy': anisotropy, 'Orientation 2D': orientation}, gabor_type=gabor_type)
         return node._out
-
+''',
+'Gradient': r'''
     @classmethod
     def Gradient(cls, vector=None, gradient_type='LINEAR'):
         """ > Node <&Node Gradient Texture>
@@ -90,7 +97,8 @@ class Texture(Socket):
         utils.check_enum_arg('Gradient Texture', 'gradient_type', gradient_type, 'Gradient', ('LINEAR', 'QUADRATIC', 'EASING', 'DIAGONAL', 'SPHERICAL', 'QUADRATIC_SPHERE', 'RADIAL'))
         node = Node('Gradient Texture', sockets={'Vector': vector}, gradient_type=gradient_type)
         return node._out
-
+''',
+'Magic': r'''
     @classmethod
     def Magic(cls, vector=None, scale=None, distortion=None, turbulence_depth=2):
         """ > Node <&Node Magic Texture>
@@ -108,7 +116,8 @@ class Texture(Socket):
         """
         node = Node('Magic Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion}, turbulence_depth=turbulence_depth)
         return node._out
-
+''',
+'Noise': r'''
     @classmethod
     def Noise(cls, vector=None, scale=None, detail=None, roughness=None, lacunarity=None, distortion=None, noise_dimensions='3D', noise_type='FBM', normalize=True):
         """ > Node <&Node Noise Texture>
@@ -133,7 +142,8 @@ class Texture(Socket):
         utils.check_enum_arg('Noise Texture', 'noise_type', noise_type, 'Noise', ('MULTIFRACTAL', 'RIDGED_MULTIFRACTAL', 'HYBRID_MULTIFRACTAL', 'FBM', 'HETERO_TERRAIN'))
         node = Node('Noise Texture', sockets={'Vector': vector, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Distortion': distortion}, noise_dimensions=noise_dimensions, noise_type=noise_type, normalize=normalize)
         return node._out
-
+''',
+'Voronoi': r'''
     @classmethod
     def Voronoi(cls, vector=None, scale=None, detail=None, roughness=None, lacunarity=None, randomness=None, distance='EUCLIDEAN', feature='F1', normalize=False, voronoi_dimensions='3D'):
         """ > Node <&Node Voronoi Texture>
@@ -160,7 +170,8 @@ class Texture(Socket):
         utils.check_enum_arg('Voronoi Texture', 'voronoi_dimensions', voronoi_dimensions, 'Voronoi', ('1D', '2D', '3D', '4D'))
         node = Node('Voronoi Texture', sockets={'Vector': vector, 'Scale': scale, 'Detail': detail, 'Roughness': roughness, 'Lacunarity': lacunarity, 'Randomness': randomness}, distance=distance, feature=feature, normalize=normalize, voronoi_dimensions=voronoi_dimensions)
         return node._out
-
+''',
+'Wave': r'''
     @classmethod
     def Wave(cls, vector=None, scale=None, distortion=None, detail=None, detail_scale=None, detail_roughness=None, phase_offset=None, bands_direction='X', rings_direction='X', wave_profile='SIN', wave_type='BANDS'):
         """ > Node <&Node Wave Texture>
@@ -189,7 +200,8 @@ class Texture(Socket):
         utils.check_enum_arg('Wave Texture', 'wave_type', wave_type, 'Wave', ('BANDS', 'RINGS'))
         node = Node('Wave Texture', sockets={'Vector': vector, 'Scale': scale, 'Distortion': distortion, 'Detail': detail, 'Detail Scale': detail_scale, 'Detail Roughness': detail_roughness, 'Phase Offset': phase_offset}, bands_direction=bands_direction, rings_direction=rings_direction, wave_profile=wave_profile, wave_type=wave_type)
         return node._out
-
+''',
+'WhiteNoise': r'''
     @classmethod
     def WhiteNoise(cls, vector=None, noise_dimensions='3D'):
         """ > Node <&Node White Noise Texture>
@@ -206,4 +218,7 @@ class Texture(Socket):
         utils.check_enum_arg('White Noise Texture', 'noise_dimensions', noise_dimensions, 'WhiteNoise', ('1D', '2D', '3D', '4D'))
         node = Node('White Noise Texture', sockets={'Vector': vector}, noise_dimensions=noise_dimensions)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Texture)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Vector(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'less_than': r'''
     def less_than(self, b=None):
         """ > Node <&Node Compare>
 
@@ -27,7 +31,8 @@ class Vector(Socket):
         """
         node = Node('Compare', sockets={'A_VEC3': self, 'B_VEC3': b}, data_type='VECTOR', mode='ELEMENT', operation='LESS_THAN')
         return node._out
-
+''',
+'less_equal': r'''
     def less_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -48,7 +53,8 @@ class Vector(Socket):
         """
         node = Node('Compare', sockets={'A_VEC3': self, 'B_VEC3': b}, data_type='VECTOR', mode='ELEMENT', operation='LESS_EQUAL')
         return node._out
-
+''',
+'greater_than': r'''
     def greater_than(self, b=None):
         """ > Node <&Node Compare>
 
@@ -69,7 +75,8 @@ class Vector(Socket):
         """
         node = Node('Compare', sockets={'A_VEC3': self, 'B_VEC3': b}, data_type='VECTOR', mode='ELEMENT', operation='GREATER_THAN')
         return node._out
-
+''',
+'greater_equal': r'''
     def greater_equal(self, b=None):
         """ > Node <&Node Compare>
 
@@ -90,7 +97,8 @@ class Vector(Socket):
         """
         node = Node('Compare', sockets={'A_VEC3': self, 'B_VEC3': b}, data_type='VECTOR', mode='ELEMENT', operation='GREATER_EQUAL')
         return node._out
-
+''',
+'equal': r'''
     def equal(self, b=None, epsilon=None):
         """ > Node <&Node Compare>
 
@@ -112,7 +120,8 @@ class Vector(Socket):
         """
         node = Node('Compare', sockets={'A_VEC3': self, 'B_VEC3': b, 'Epsilon': epsilon}, data_type='VECTOR', mode='ELEMENT', operation='EQUAL')
         return node._out
-
+''',
+'not_equal': r'''
     def not_equal(self, b=None, epsilon=None):
         """ > Node <&Node Compare>
 
@@ -134,7 +143,8 @@ class Vector(Socket):
         """
         node = Node('Compare', sockets={'A_VEC3': self, 'B_VEC3': b, 'Epsilon': epsilon}, data_type='VECTOR', mode='ELEMENT', operation='NOT_EQUAL')
         return node._out
-
+''',
+'to_rotation': r'''
     def to_rotation(self):
         """ > Node <&Node Euler to Rotation>
 
@@ -148,7 +158,8 @@ class Vector(Socket):
         """
         node = Node('Euler to Rotation', sockets={'Euler': self})
         return node._out
-
+''',
+'hash_value': r'''
     def hash_value(self, seed=None):
         """ > Node <&Node Hash Value>
 
@@ -167,7 +178,8 @@ class Vector(Socket):
         """
         node = Node('Hash Value', sockets={'Value': self, 'Seed': seed}, data_type='VECTOR')
         return node._out
-
+''',
+'Random': r'''
     @classmethod
     def Random(cls, min=None, max=None, id=None, seed=None):
         """ > Node <&Node Random Value>
@@ -189,7 +201,8 @@ class Vector(Socket):
         """
         node = Node('Random Value', sockets={'Min': min, 'Max': max, 'ID': id, 'Seed': seed}, data_type='FLOAT_VECTOR')
         return cls(node._out)
-
+''',
+'blur': r'''
     def blur(self, iterations=None, weight=None):
         """ > Node <&Node Blur Attribute>
 
@@ -209,7 +222,8 @@ class Vector(Socket):
         """
         node = Node('Blur Attribute', sockets={'Value': self, 'Iterations': iterations, 'Weight': weight}, data_type='FLOAT_VECTOR')
         return node._out
-
+''',
+'Named': r'''
     @classmethod
     def Named(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -228,7 +242,8 @@ class Vector(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT_VECTOR')
         return cls(node._out)
-
+''',
+'NamedAttribute': r'''
     @classmethod
     def NamedAttribute(cls, name=None):
         """ > Node <&Node Named Attribute>
@@ -247,7 +262,8 @@ class Vector(Socket):
         """
         node = Node('Named Attribute', sockets={'Name': name}, data_type='FLOAT_VECTOR')
         return cls(node._out)
-
+''',
+'sample_grid': r'''
     def sample_grid(self, position=None, interpolation_mode='TRILINEAR'):
         """ > Node <&Node Sample Grid>
 
@@ -268,7 +284,8 @@ class Vector(Socket):
         utils.check_enum_arg('Sample Grid', 'interpolation_mode', interpolation_mode, 'sample_grid', ('NEAREST', 'TRILINEAR', 'TRIQUADRATIC'))
         node = Node('Sample Grid', sockets={'Grid': self, 'Position': position}, data_type='VECTOR', interpolation_mode=interpolation_mode)
         return node._out
-
+''',
+'sample_grid_index': r'''
     def sample_grid_index(self, x=None, y=None, z=None):
         """ > Node <&Node Sample Grid Index>
 
@@ -289,7 +306,8 @@ class Vector(Socket):
         """
         node = Node('Sample Grid Index', sockets={'Grid': self, 'X': x, 'Y': y, 'Z': z}, data_type='VECTOR')
         return node._out
-
+''',
+'pack_uv_islands': r'''
     def pack_uv_islands(self, margin=None, rotate=None):
         """ > Node <&Node Pack UV Islands>
 
@@ -309,7 +327,8 @@ class Vector(Socket):
         """
         node = Node('Pack UV Islands', sockets={'UV': self, 'Selection': self._sel, 'Margin': margin, 'Rotate': rotate})
         return node._out
-
+''',
+'CombineXYZ': r'''
     @classmethod
     def CombineXYZ(cls, x=None, y=None, z=None):
         """ > Node <&Node Combine XYZ>
@@ -326,7 +345,8 @@ class Vector(Socket):
         """
         node = Node('Combine XYZ', sockets={'X': x, 'Y': y, 'Z': z})
         return cls(node._out)
-
+''',
+'mix_uniform': r'''
     def mix_uniform(self, b=None, factor=None, clamp_factor=True):
         """ > Node <&Node Mix>
 
@@ -350,7 +370,8 @@ class Vector(Socket):
         """
         node = Node('Mix', sockets={'A_Vector': self, 'B_Vector': b, 'Factor_Float': factor}, blend_type='MIX', clamp_factor=clamp_factor, clamp_result=False, data_type='VECTOR', factor_mode='UNIFORM')
         return node._out
-
+''',
+'mix_non_uniform': r'''
     def mix_non_uniform(self, b=None, factor=None, clamp_factor=True):
         """ > Node <&Node Mix>
 
@@ -374,7 +395,8 @@ class Vector(Socket):
         """
         node = Node('Mix', sockets={'A_Vector': self, 'B_Vector': b, 'Factor_Vector': factor}, blend_type='MIX', clamp_factor=clamp_factor, clamp_result=False, data_type='VECTOR', factor_mode='NON_UNIFORM')
         return node._out
-
+''',
+'xyz': r'''
     @property
     def xyz(self):
         """ > Node <&Node Separate XYZ>
@@ -389,7 +411,8 @@ class Vector(Socket):
         """
         node = self._cache('Separate XYZ', sockets={'Vector': self})
         return (node.x, node.y, node.z)
-
+''',
+'separate_xyz': r'''
     def separate_xyz(self):
         """ > Node <&Node Separate XYZ>
 
@@ -403,7 +426,8 @@ class Vector(Socket):
         """
         node = self._cache('Separate XYZ', sockets={'Vector': self})
         return node
-
+''',
+'x': r'''
     @property
     def x(self):
         """ > Node <&Node Separate XYZ>
@@ -418,7 +442,8 @@ class Vector(Socket):
         """
         node = self._cache('Separate XYZ', sockets={'Vector': self})
         return node.x
-
+''',
+'y': r'''
     @property
     def y(self):
         """ > Node <&Node Separate XYZ>
@@ -433,7 +458,8 @@ class Vector(Socket):
         """
         node = self._cache('Separate XYZ', sockets={'Vector': self})
         return node.y
-
+''',
+'z': r'''
     @property
     def z(self):
         """ > Node <&Node Separate XYZ>
@@ -448,7 +474,8 @@ class Vector(Socket):
         """
         node = self._cache('Separate XYZ', sockets={'Vector': self})
         return node.z
-
+''',
+'add': r'''
     def add(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -467,7 +494,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='ADD')
         return node._out
-
+''',
+'subtract': r'''
     def subtract(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -486,7 +514,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='SUBTRACT')
         return node._out
-
+''',
+'multiply': r'''
     def multiply(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -505,7 +534,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='MULTIPLY')
         return node._out
-
+''',
+'divide': r'''
     def divide(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -524,7 +554,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='DIVIDE')
         return node._out
-
+''',
+'multiply_add': r'''
     def multiply_add(self, multiplier=None, addend=None):
         """ > Node <&Node Vector Math>
 
@@ -544,7 +575,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': multiplier, 'Vector_002': addend}, operation='MULTIPLY_ADD')
         return node._out
-
+''',
+'cross': r'''
     def cross(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -563,7 +595,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='CROSS_PRODUCT')
         return node._out
-
+''',
+'project': r'''
     def project(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -582,7 +615,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='PROJECT')
         return node._out
-
+''',
+'reflect': r'''
     def reflect(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -601,7 +635,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='REFLECT')
         return node._out
-
+''',
+'refract': r'''
     def refract(self, vector=None, ior=None):
         """ > Node <&Node Vector Math>
 
@@ -621,7 +656,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector, 'Scale': ior}, operation='REFRACT')
         return node._out
-
+''',
+'faceforward': r'''
     def faceforward(self, incident=None, reference=None):
         """ > Node <&Node Vector Math>
 
@@ -641,7 +677,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': incident, 'Vector_002': reference}, operation='FACEFORWARD')
         return node._out
-
+''',
+'dot': r'''
     def dot(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -660,7 +697,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='DOT_PRODUCT')
         return node._out
-
+''',
+'distance': r'''
     def distance(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -679,7 +717,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='DISTANCE')
         return node._out
-
+''',
+'length': r'''
     def length(self):
         """ > Node <&Node Vector Math>
 
@@ -694,7 +733,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='LENGTH')
         return node._out
-
+''',
+'scale': r'''
     def scale(self, scale=None):
         """ > Node <&Node Vector Math>
 
@@ -713,7 +753,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Scale': scale}, operation='SCALE')
         return node._out
-
+''',
+'normalize': r'''
     def normalize(self):
         """ > Node <&Node Vector Math>
 
@@ -728,7 +769,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='NORMALIZE')
         return node._out
-
+''',
+'abs': r'''
     def abs(self):
         """ > Node <&Node Vector Math>
 
@@ -743,7 +785,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='ABSOLUTE')
         return node._out
-
+''',
+'min': r'''
     def min(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -762,7 +805,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='MINIMUM')
         return node._out
-
+''',
+'max': r'''
     def max(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -781,7 +825,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='MAXIMUM')
         return node._out
-
+''',
+'floor': r'''
     def floor(self):
         """ > Node <&Node Vector Math>
 
@@ -796,7 +841,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='FLOOR')
         return node._out
-
+''',
+'ceil': r'''
     def ceil(self):
         """ > Node <&Node Vector Math>
 
@@ -811,7 +857,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='CEIL')
         return node._out
-
+''',
+'fraction': r'''
     def fraction(self):
         """ > Node <&Node Vector Math>
 
@@ -826,7 +873,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='FRACTION')
         return node._out
-
+''',
+'modulo': r'''
     def modulo(self, vector=None):
         """ > Node <&Node Vector Math>
 
@@ -845,7 +893,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': vector}, operation='MODULO')
         return node._out
-
+''',
+'wrap': r'''
     def wrap(self, max=None, min=None):
         """ > Node <&Node Vector Math>
 
@@ -865,7 +914,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': max, 'Vector_002': min}, operation='WRAP')
         return node._out
-
+''',
+'snap': r'''
     def snap(self, increment=None):
         """ > Node <&Node Vector Math>
 
@@ -884,7 +934,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self, 'Vector_001': increment}, operation='SNAP')
         return node._out
-
+''',
+'sin': r'''
     def sin(self):
         """ > Node <&Node Vector Math>
 
@@ -899,7 +950,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='SINE')
         return node._out
-
+''',
+'cos': r'''
     def cos(self):
         """ > Node <&Node Vector Math>
 
@@ -914,7 +966,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='COSINE')
         return node._out
-
+''',
+'tan': r'''
     def tan(self):
         """ > Node <&Node Vector Math>
 
@@ -929,7 +982,8 @@ class Vector(Socket):
         """
         node = Node('Vector Math', sockets={'Vector': self}, operation='TANGENT')
         return node._out
-
+''',
+'rotate': r'''
     def rotate(self, center=None, axis=None, angle=None, invert=False, rotation_type='AXIS_ANGLE'):
         """ > Node <&Node Vector Rotate>
 
@@ -952,7 +1006,8 @@ class Vector(Socket):
         utils.check_enum_arg('Vector Rotate', 'rotation_type', rotation_type, 'rotate', ('AXIS_ANGLE', 'X_AXIS', 'Y_AXIS', 'Z_AXIS', 'EULER_XYZ'))
         node = Node('Vector Rotate', sockets={'Vector': self, 'Center': center, 'Axis': axis, 'Angle': angle}, invert=invert, rotation_type=rotation_type)
         return node._out
-
+''',
+'rotate_axis_angle': r'''
     def rotate_axis_angle(self, center=None, axis=None, angle=None, invert=False):
         """ > Node <&Node Vector Rotate>
 
@@ -974,7 +1029,8 @@ class Vector(Socket):
         """
         node = Node('Vector Rotate', sockets={'Vector': self, 'Center': center, 'Axis': axis, 'Angle': angle}, invert=invert, rotation_type='AXIS_ANGLE')
         return node._out
-
+''',
+'rotate_x_axis': r'''
     def rotate_x_axis(self, center=None, angle=None, invert=False):
         """ > Node <&Node Vector Rotate>
 
@@ -995,7 +1051,8 @@ class Vector(Socket):
         """
         node = Node('Vector Rotate', sockets={'Vector': self, 'Center': center, 'Angle': angle}, invert=invert, rotation_type='X_AXIS')
         return node._out
-
+''',
+'rotate_y_axis': r'''
     def rotate_y_axis(self, center=None, angle=None, invert=False):
         """ > Node <&Node Vector Rotate>
 
@@ -1016,7 +1073,8 @@ class Vector(Socket):
         """
         node = Node('Vector Rotate', sockets={'Vector': self, 'Center': center, 'Angle': angle}, invert=invert, rotation_type='Y_AXIS')
         return node._out
-
+''',
+'rotate_z_axis': r'''
     def rotate_z_axis(self, center=None, angle=None, invert=False):
         """ > Node <&Node Vector Rotate>
 
@@ -1037,7 +1095,8 @@ class Vector(Socket):
         """
         node = Node('Vector Rotate', sockets={'Vector': self, 'Center': center, 'Angle': angle}, invert=invert, rotation_type='Z_AXIS')
         return node._out
-
+''',
+'rotate_euler_xyz': r'''
     def rotate_euler_xyz(self, center=None, rotation=None, invert=False):
         """ > Node <&Node Vector Rotate>
 
@@ -1058,7 +1117,8 @@ class Vector(Socket):
         """
         node = Node('Vector Rotate', sockets={'Vector': self, 'Center': center, 'Rotation': rotation}, invert=invert, rotation_type='EULER_XYZ')
         return node._out
-
+''',
+'mapping': r'''
     def mapping(self, location=None, rotation=None, scale=None, vector_type='POINT'):
         """ > Node <&ShaderNode Mapping>
 
@@ -1080,7 +1140,8 @@ class Vector(Socket):
         utils.check_enum_arg('Mapping', 'vector_type', vector_type, 'mapping', ('POINT', 'TEXTURE', 'VECTOR', 'NORMAL'))
         node = Node('Mapping', sockets={'Vector': self, 'Location': location, 'Rotation': rotation, 'Scale': scale}, vector_type=vector_type)
         return node._out
-
+''',
+'normal': r'''
     def normal(self):
         """ > Node <&ShaderNode Normal>
 
@@ -1094,7 +1155,8 @@ class Vector(Socket):
         """
         node = Node('Normal', sockets={'Normal': self})
         return node._out
-
+''',
+'Tangent': r'''
     @classmethod
     def Tangent(cls, axis='Z', direction_type='RADIAL', uv_map=''):
         """ > Node <&ShaderNode Tangent>
@@ -1113,7 +1175,8 @@ class Vector(Socket):
         utils.check_enum_arg('Tangent', 'direction_type', direction_type, 'Tangent', ('RADIAL', 'UV_MAP'))
         node = Node('Tangent', sockets={}, axis=axis, direction_type=direction_type, uv_map=uv_map)
         return cls(node._out)
-
+''',
+'environment_texture': r'''
     def environment_texture(self, image=None, interpolation='Linear', projection='EQUIRECTANGULAR'):
         """ > Node <&ShaderNode Environment Texture>
 
@@ -1135,7 +1198,8 @@ class Vector(Socket):
         utils.check_enum_arg('Environment Texture', 'projection', projection, 'environment_texture', ('EQUIRECTANGULAR', 'MIRROR_BALL'))
         node = Node('Environment Texture', sockets={'Vector': self}, image=image, interpolation=interpolation, projection=projection)
         return node._out
-
+''',
+'ies_texture_internal': r'''
     def ies_texture_internal(self, strength=None, filepath='', ies=None):
         """ > Node <&ShaderNode IES Texture>
 
@@ -1156,7 +1220,8 @@ class Vector(Socket):
         """
         node = Node('IES Texture', sockets={'Vector': self, 'Strength': strength}, filepath=filepath, ies=ies, mode='INTERNAL')
         return node._out
-
+''',
+'ies_texture_external': r'''
     def ies_texture_external(self, strength=None, filepath='', ies=None):
         """ > Node <&ShaderNode IES Texture>
 
@@ -1177,7 +1242,8 @@ class Vector(Socket):
         """
         node = Node('IES Texture', sockets={'Vector': self, 'Strength': strength}, filepath=filepath, ies=ies, mode='EXTERNAL')
         return node._out
-
+''',
+'ies_texture': r'''
     def ies_texture(self, strength=None, filepath='', ies=None, mode='INTERNAL'):
         """ > Node <&ShaderNode IES Texture>
 
@@ -1199,7 +1265,8 @@ class Vector(Socket):
         utils.check_enum_arg('IES Texture', 'mode', mode, 'ies_texture', ('INTERNAL', 'EXTERNAL'))
         node = Node('IES Texture', sockets={'Vector': self, 'Strength': strength}, filepath=filepath, ies=ies, mode=mode)
         return node._out
-
+''',
+'image_texture': r'''
     def image_texture(self, extension='REPEAT', image=None, interpolation='Linear', projection='FLAT', projection_blend=0.0):
         """ > Node <&ShaderNode Image Texture>
 
@@ -1224,7 +1291,8 @@ class Vector(Socket):
         utils.check_enum_arg('Image Texture', 'projection', projection, 'image_texture', ('FLAT', 'BOX', 'SPHERE', 'TUBE'))
         node = Node('Image Texture', sockets={'Vector': self}, extension=extension, image=image, interpolation=interpolation, projection=projection, projection_blend=projection_blend)
         return node._out
-
+''',
+'point_density': r'''
     def point_density(self, interpolation='Linear', object=None, particle_color_source='PARTICLE_AGE', particle_system=None, point_source='PARTICLE_SYSTEM', radius=0.30000001192092896, resolution=100, space='OBJECT', vertex_attribute_name='', vertex_color_source='VERTEX_COLOR'):
         """ > Node <&ShaderNode Point Density>
 
@@ -1256,7 +1324,8 @@ class Vector(Socket):
         utils.check_enum_arg('Point Density', 'vertex_color_source', vertex_color_source, 'point_density', ('VERTEX_COLOR', 'VERTEX_WEIGHT', 'VERTEX_NORMAL'))
         node = Node('Point Density', sockets={'Vector': self}, interpolation=interpolation, object=object, particle_color_source=particle_color_source, particle_system=particle_system, point_source=point_source, radius=radius, resolution=resolution, space=space, vertex_attribute_name=vertex_attribute_name, vertex_color_source=vertex_color_source)
         return node._out
-
+''',
+'UvMap': r'''
     @classmethod
     def UvMap(cls, from_instancer=False, uv_map=''):
         """ > Node <&ShaderNode UV Map>
@@ -1272,7 +1341,8 @@ class Vector(Socket):
         """
         node = Node('UV Map', sockets={}, from_instancer=from_instancer, uv_map=uv_map)
         return cls(node._out)
-
+''',
+'vector_transform': r'''
     def vector_transform(self, convert_from='WORLD', convert_to='OBJECT', vector_type='VECTOR'):
         """ > Node <&ShaderNode Vector Transform>
 
@@ -1295,4 +1365,7 @@ class Vector(Socket):
         utils.check_enum_arg('Vector Transform', 'vector_type', vector_type, 'vector_transform', ('POINT', 'VECTOR', 'NORMAL'))
         node = Node('Vector Transform', sockets={'Vector': self}, convert_from=convert_from, convert_to=convert_to, vector_type=vector_type)
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Vector)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Vertex(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'corners': r'''
     @classmethod
     def corners(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Vertex>
@@ -23,7 +27,8 @@ class Vertex(Socket):
         """
         node = Node('Corners of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node
-
+''',
+'corner_index': r'''
     @classmethod
     def corner_index(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Vertex>
@@ -40,7 +45,8 @@ class Vertex(Socket):
         """
         node = Node('Corners of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.corner_index
-
+''',
+'corners_total': r'''
     @classmethod
     def corners_total(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Corners of Vertex>
@@ -57,7 +63,8 @@ class Vertex(Socket):
         """
         node = Node('Corners of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.total
-
+''',
+'edges': r'''
     @classmethod
     def edges(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Edges of Vertex>
@@ -74,7 +81,8 @@ class Vertex(Socket):
         """
         node = Node('Edges of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node
-
+''',
+'edge_index': r'''
     @classmethod
     def edge_index(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Edges of Vertex>
@@ -91,7 +99,8 @@ class Vertex(Socket):
         """
         node = Node('Edges of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.edge_index
-
+''',
+'edges_total': r'''
     @classmethod
     def edges_total(cls, vertex_index=None, weights=None, sort_index=None):
         """ > Node <&Node Edges of Vertex>
@@ -108,7 +117,8 @@ class Vertex(Socket):
         """
         node = Node('Edges of Vertex', sockets={'Vertex Index': vertex_index, 'Weights': weights, 'Sort Index': sort_index})
         return node.total
-
+''',
+'extrude': r'''
     def extrude(self, offset=None, offset_scale=None):
         """ > Node <&Node Extrude Mesh>
 
@@ -132,7 +142,8 @@ class Vertex(Socket):
         node = Node('Extrude Mesh', sockets={'Mesh': self, 'Selection': self._sel, 'Offset': offset, 'Offset Scale': offset_scale}, mode='VERTICES')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'neighbors': r'''
     @classmethod
     def neighbors(cls):
         """ > Node <&Node Vertex Neighbors>
@@ -143,7 +154,8 @@ class Vertex(Socket):
         """
         node = Node('Vertex Neighbors', sockets={})
         return node
-
+''',
+'neighbors_vertex_count': r'''
     @classmethod
     @property
     def neighbors_vertex_count(cls):
@@ -155,7 +167,8 @@ class Vertex(Socket):
         """
         node = Node('Vertex Neighbors', sockets={})
         return node.vertex_count
-
+''',
+'neighbors_face_count': r'''
     @classmethod
     @property
     def neighbors_face_count(cls):
@@ -167,7 +180,8 @@ class Vertex(Socket):
         """
         node = Node('Vertex Neighbors', sockets={})
         return node.face_count
-
+''',
+'to_points': r'''
     def to_points(self, position=None, radius=None):
         """ > Node <&Node Mesh to Points>
 
@@ -188,4 +202,7 @@ class Vertex(Socket):
         """
         node = Node('Mesh to Points', sockets={'Mesh': self, 'Selection': self._sel, 'Position': position, 'Radius': radius}, mode='VERTICES')
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Vertex)
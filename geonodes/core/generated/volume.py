@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class Volume(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'distribute_points_density_random': r'''
     def distribute_points_density_random(self, density=None, seed=None):
         """ > Node <&Node Distribute Points in Volume>
 
@@ -26,7 +30,8 @@ class Volume(Socket):
         """
         node = Node('Distribute Points in Volume', sockets={'Volume': self, 'Density': density, 'Seed': seed}, mode='DENSITY_RANDOM')
         return node._out
-
+''',
+'distribute_points_density_grid': r'''
     def distribute_points_density_grid(self, spacing=None, threshold=None):
         """ > Node <&Node Distribute Points in Volume>
 
@@ -46,7 +51,8 @@ class Volume(Socket):
         """
         node = Node('Distribute Points in Volume', sockets={'Volume': self, 'Spacing': spacing, 'Threshold': threshold}, mode='DENSITY_GRID')
         return node._out
-
+''',
+'distribute_points': r'''
     def distribute_points(self, density=None, seed=None, mode='DENSITY_RANDOM'):
         """ > Node <&Node Distribute Points in Volume>
 
@@ -67,7 +73,8 @@ class Volume(Socket):
         utils.check_enum_arg('Distribute Points in Volume', 'mode', mode, 'distribute_points', ('DENSITY_RANDOM', 'DENSITY_GRID'))
         node = Node('Distribute Points in Volume', sockets={'Volume': self, 'Density': density, 'Seed': seed}, mode=mode)
         return node._out
-
+''',
+'get_named_grid': r'''
     def get_named_grid(self, name=None, remove=None, data_type='FLOAT'):
         """ > Node <&Node Get Named Grid>
 
@@ -91,7 +98,8 @@ class Volume(Socket):
         node = Node('Get Named Grid', sockets={'Volume': self, 'Name': name, 'Remove': remove}, data_type=data_type)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'named_float_grid': r'''
     def named_float_grid(self, name=None, remove=None):
         """ > Node <&Node Get Named Grid>
 
@@ -114,7 +122,8 @@ class Volume(Socket):
         node = Node('Get Named Grid', sockets={'Volume': self, 'Name': name, 'Remove': remove}, data_type='FLOAT')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'named_vector_grid': r'''
     def named_vector_grid(self, name=None, remove=None):
         """ > Node <&Node Get Named Grid>
 
@@ -137,7 +146,8 @@ class Volume(Socket):
         node = Node('Get Named Grid', sockets={'Volume': self, 'Name': name, 'Remove': remove}, data_type='VECTOR')
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'store_named_grid': r'''
     def store_named_grid(self, name=None, grid=None):
         """ > Node <&Node Store Named Grid>
 
@@ -161,7 +171,8 @@ class Volume(Socket):
         node = Node('Store Named Grid', sockets={'Volume': self, 'Name': name, 'Grid': grid}, data_type=data_type)
         self._jump(node._out)
         return self._domain_to_geometry
-
+''',
+'Cube': r'''
     @classmethod
     def Cube(cls, density=None, background=None, min=None, max=None, resolution_x=None, resolution_y=None, resolution_z=None):
         """ > Node <&Node Volume Cube>
@@ -182,7 +193,8 @@ class Volume(Socket):
         """
         node = Node('Volume Cube', sockets={'Density': density, 'Background': background, 'Min': min, 'Max': max, 'Resolution X': resolution_x, 'Resolution Y': resolution_y, 'Resolution Z': resolution_z})
         return cls(node._out)
-
+''',
+'to_mesh': r'''
     def to_mesh(self, threshold=None, adaptivity=None, resolution_mode='GRID'):
         """ > Node <&Node Volume to Mesh>
 
@@ -203,7 +215,8 @@ class Volume(Socket):
         utils.check_enum_arg('Volume to Mesh', 'resolution_mode', resolution_mode, 'to_mesh', ('GRID', 'VOXEL_AMOUNT', 'VOXEL_SIZE'))
         node = Node('Volume to Mesh', sockets={'Volume': self, 'Threshold': threshold, 'Adaptivity': adaptivity}, resolution_mode=resolution_mode)
         return node._out
-
+''',
+'to_mesh_grid': r'''
     def to_mesh_grid(self, threshold=None, adaptivity=None):
         """ > Node <&Node Volume to Mesh>
 
@@ -223,7 +236,8 @@ class Volume(Socket):
         """
         node = Node('Volume to Mesh', sockets={'Volume': self, 'Threshold': threshold, 'Adaptivity': adaptivity}, resolution_mode='GRID')
         return node._out
-
+''',
+'to_mesh_voxel_amount': r'''
     def to_mesh_voxel_amount(self, voxel_amount=None, threshold=None, adaptivity=None):
         """ > Node <&Node Volume to Mesh>
 
@@ -244,7 +258,8 @@ class Volume(Socket):
         """
         node = Node('Volume to Mesh', sockets={'Volume': self, 'Voxel Amount': voxel_amount, 'Threshold': threshold, 'Adaptivity': adaptivity}, resolution_mode='VOXEL_AMOUNT')
         return node._out
-
+''',
+'to_mesh_voxel_size': r'''
     def to_mesh_voxel_size(self, voxel_size=None, threshold=None, adaptivity=None):
         """ > Node <&Node Volume to Mesh>
 
@@ -265,4 +280,7 @@ class Volume(Socket):
         """
         node = Node('Volume to Mesh', sockets={'Volume': self, 'Voxel Size': voxel_size, 'Threshold': threshold, 'Adaptivity': adaptivity}, resolution_mode='VOXEL_SIZE')
         return node._out
+''',
+}
 
+MethodTable(METHODS, globals()).install(Volume)
@@ -2,11 +2,15 @@ from .. socket_class import Socket
 from .. treeclass import Node, ColorRamp, NodeCurves
 from .. treeclass import utils
 from .. scripterror import NodeError
+from .. methodtable import MethodTable
 
 class VolumeShader(Socket):
     """"
     $DOC SET hidden
     """
+
+METHODS = {
+'Absorption': r'''
     @classmethod
     def Absorption(cls, color=None, density=None):
         """ > Node <&ShaderNode Volume Absorption>
@@ -22,7 +26,8 @@ class VolumeShader(Socket):
         """
         node = Node('Volume Absorption', sockets={'Color': color, 'Density': density})
         return cls(node._out)
-
+''',
+'info': r'''
     @classmethod
     def info(cls):
         """ > Node <&ShaderNode Volume Info>
@@ -33,7 +38,8 @@ class VolumeShader(Socket):
         """
         node = Node('Volume Info', sockets={})
         return node
-
+''',
+'Principled': r'''
     @classmethod
     def Principled(cls, color=None, color_attribute=None, density=None, density_attribute=None, anisotropy=None, absorption_color=None, emission_strength=None, emission_color=None, blackbody_intensity=None, blackbody_tint=None, temperature=None, temperature_attribute=None):
         """ > Node <&ShaderNode Principled Volume>
@@ -59,7 +65,8 @@ class VolumeShader(Socket):
         """
         node = Node('Principled Volume', sockets={'Color': color, 'Color Attribute': color_attribute, 'Density': density, 'Density Attribute': density_attribute, 'Anisotropy': anisotropy, 'Absorption Color': absorption_color, 'Emission Strength': emission_strength, 'Emission Color': emission_color, 'Blackbody Intensity': blackbody_intensity, 'Blackbody Tint': blackbody_tint, 'Temperature': temperature, 'Temperature Attribute': temperature_attribute})
         return cls(node._out)
-
+''',
+'Scatter': r'''
     @classmethod
     def Scatter(cls, color=None, density=None, anisotropy=None, phase='HENYEY_GREENSTEIN'):
         """ > Node <&ShaderNode Volume Scatter>
@@ -78,4 +85,7 @@ class VolumeShader(Socket):
         utils.check_enum_arg('Volume Scatter', 'phase', phase, 'Scatter', ('HENYEY_GREENSTEIN', 'FOURNIER_FORAND', 'DRAINE', 'RAYLEIGH', 'MIE'))
         node = Node('Volume Scatter', sockets={'Color': color, 'Density': density, 'Anisotropy': anisotropy}, phase=phase)
         return cls(node._out)
+''',
+}
 
+MethodTable(METHODS, globals()).install(VolumeShader)
@@ -43,6 +43,7 @@ __blender_version__ = "4.3.0"
 
 
 from inspect import Arguments
+import numpy as np
 import bpy
 
 from .scripterror import NodeError
@@ -52,6 +53,172 @@ from .treeclass import Tree, Node, Layout
 from .socket_class import NodeCache, Socket
 from . import generated
 
+# =============================================================================================================================
+# Selection compiler
+#
+# A tuple of indices is compiled into a boolean field:
+# - constant indices are sorted and merged into ranges
+# - one comparison per range, the comparisons are OR-ed by a balanced tree
+# - above MAX_SELECTION_RANGES ranges, a mask is stored in a point cloud object
+#   and the selection is read with a single Sample Index
+
+MAX_SELECTION_RANGES = 16
+
+def index_ranges(indices):
+    """ > Merge sorted indices into ranges
+
+    Arguments
+    ---------
+    - indices (list of ints) : indices
+
+    Returns
+    -------
+    - list of couples (first, last), last included
+    """
+    ranges = []
+    for i in sorted(set(indices)):
+        if ranges and i == ranges[-1][1] + 1:
+            ranges[-1][1] = i
+        else:
+            ranges.append([i, i])
+    return [tuple(r) for r in ranges]
+
+def range_selection(index, first, last):
+    """ > Boolean field true when index is in [first, last]
+
+    A range is tested with a single float comparison: |index - middle| <= half length + 1/2.
+    Since indices are integers, the tolerance of 1/2 selects exactly the range.
+
+    Arguments
+    ---------
+    - index (Integer) : index field
+    - first (int) : first index
+    - last (int) : last index, included
+
+    Returns
+    -------
+    - Boolean
+    """
+    from geonodes import Float
+
+    if first == last:
+        return index.equal(first)
+    return Float(index).equal((first + last)/2, epsilon=(last - first)/2 + .5)
+
+def or_tree(sockets):
+    """ > OR a list of Boolean sockets with a balanced tree
+
+    Arguments
+    ---------
+    - sockets (list of Booleans) : sockets to combine
+
+    Returns
+    -------
+    - Boolean
+    """
+    while len(sockets) > 1:
+        sockets = [sockets[i] | sockets[i + 1] if i + 1 < len(sockets) else sockets[i] for i in range(0, len(sockets), 2)]
+    return sockets[0]
+
+def lookup_selection(index, indices):
+    """ > Selection read in a mask stored in a point cloud object
+
+    An object with one vertex per index and a boolean point attribute 'selection'
+    is created once. Its name is built from the hash of the indices in order to
+    be shared by the trees using the same selection.
+
+    Arguments
+    ---------
+    - index (Integer) : index field
+    - indices (list of ints) : selected indices
+
+    Returns
+    -------
+    - Boolean
+    """
+    import hashlib
+    from geonodes import nd
+
+    indices = np.unique(np.asarray(indices, dtype=np.int64))
+    name = "GN Selection " + hashlib.md5(indices.tobytes()).hexdigest()[:12]
+
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        mask = np.zeros(indices[-1] + 1, bool)
+        mask[indices] = True
+
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(mask))
+        mesh.attributes.new('selection', 'BOOLEAN', 'POINT').data.foreach_set('value', mask)
+
+        obj = bpy.data.objects.new(name, mesh)
+        obj.hide_viewport = True
+        obj.hide_render = True
+        bpy.context.scene.collection.objects.link(obj)
+
+    geo = nd.object_info(obj).geometry_
+    return nd.sample_index(geo, nd.named_attribute('selection', data_type='BOOLEAN'), index, data_type='BOOLEAN', domain='POINT')
+
+def indices_selection(index, indices):
+    """ > Compile a tuple of indices into a Boolean field
+
+    Arguments
+    ---------
+    - index (Integer) : index field
+    - indices (tuple) : ints or Integer sockets
+
+    Returns
+    -------
+    - Boolean
+    """
+    constants_ = [int(i) for i in indices if isinstance(i, (int, np.integer))]
+    others = [i for i in indices if not isinstance(i, (int, np.integer))]
+
+    sockets = []
+    ranges = index_ranges(constants_)
+    if len(ranges) > MAX_SELECTION_RANGES and Tree.is_geonodes and min(constants_) >= 0:
+        sockets.append(lookup_selection(index, constants_))
+    else:
+        sockets.extend([range_selection(index, first, last) for first, last in ranges])
+
+    sockets.extend([index.equal(item) for item in others])
+
+    if not sockets:
+        raise NodeError(f"Selection error: empty tuple of indices")
+    return or_tree(sockets)
+
+def slice_selection(index, selection):
+    """ > Compile a slice into a Boolean field
+
+    Arguments
+    ---------
+    - index (Integer) : index field
+    - selection (slice) : slice with positive bounds
+
+    Returns
+    -------
+    - Boolean
+    """
+    start, stop, step = selection.start, selection.stop, selection.step
+    if (start is not None and start < 0) or (stop is not None and stop < 0) or (step is not None and step < 1):
+        raise NodeError(f"Selection error: negative values are not supported in slice {selection}")
+
+    start = 0 if start is None else start
+    if stop is None:
+        sel = index.greater_equal(start) if start > 0 else None
+    elif stop <= start:
+        return index.less_than(0)
+    else:
+        sel = range_selection(index, start, stop - 1)
+
+    if step is not None and step > 1:
+        step_sel = ((index - start) % step).equal(0)
+        sel = step_sel if sel is None else sel & step_sel
+
+    if sel is None:
+        sel = index.greater_equal(0)
+    return sel
+
 # =============================================================================================================================
 # =============================================================================================================================
 # Interface for Geometry and Domain
@@ -95,26 +262,11 @@ class GeoBase:
 
         if isinstance(selection, slice):
             with Layout(f"selection = {selection}", color='AUTO_GEN'):
-                if selection.start is None:
-                    selection = nd.index.less_than(selection.stop)
-                elif selection.stop is None:
-                    selection = nd.index.greater_equal(selection.start)
-                else:
-                    a = (selection.start + selection.stop)/2
-                    dist = a - selection.start + .1
-                    selection = Float(nd.index).equal(a, epsilon=dist)
+                selection = slice_selection(nd.index, selection)
 
         elif isinstance(selection, tuple):
             with Layout(f"selection = tuple", color='AUTO_GEN'):
-                sel = None
-                idx = nd.index
-                for item in selection:
-                    if sel is None:
-                        sel = idx.equal(item)
-                    else:
-                        sel |= idx.equal(item)
-
-                selection = sel
+                selection = indices_selection(nd.index, selection)
 
         else:
             socket_type = utils.get_socket_type(selection)
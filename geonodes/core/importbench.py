@@ -0,0 +1,317 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : importbench
+--------------------
+- import time and memory benchmark
+
+Each measure is made in a fresh background Blender process: the modules must not
+be already imported.
+
+<#check> measures `import geonodes` and fails if the import time exceeds a threshold, either absolute
+or relative to a baseline saved by a previous run. It also fails if the import loaded a module
+which must be loaded on demand (<!LAZY_MODULES>).
+
+The methods of the generated classes are compiled lazily by <!methodtable>. The benchmark
+compares the import of the lazy tables with the import followed by the compilation of all the methods,
+which is the cost of the fully expanded modules.
+
+``` bash
+blender --background --factory-startup --python geonodes/core/importbench.py -- --repeat 5
+```
+
+``` bash
+blender --background --factory-startup --python geonodes/core/importbench.py -- --check --baseline import_baseline.json
+```
+
+``` python
+from geonodes.core import importbench
+
+importbench.report(importbench.benchmark(repeat=5))
+```
+
+updates
+-------
+- creation : 2025/02/17
+- update :   2025/02/17 # import geonodes check with regression threshold
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+MARKER = "IMPORTBENCH:"
+
+# Max time of 'import geonodes' in a background process, bpy and numpy being already loaded
+MAX_IMPORT_TIME = 1.0
+
+# Relative tolerance when comparing with a baseline
+TOLERANCE = 1.25
+
+# Modules which 'import geonodes' must not load
+LAZY_MODULES = [
+    'geonodes.macros',
+    'geonodes.demos',
+    'geonodes.generation',
+    'geonodes.core.treeparallel',
+    'geonodes.core.treearrange',
+    'geonodes.core.treesimplify',
+    'geonodes.core.sock_shader',
+    'geonodes.core.shadernodes',
+    'geonodes.core.generated.gnmath',
+    'geonodes.core.tabulate',
+    'geonodes.core.generated.static_nd',
+    'geonodes.core.generated.static_snd',
+    ]
+
+# =============================================================================================================================
+# Probe executed in the child process
+
+PROBE = """
+import sys, json, time, tracemalloc, gc
+sys.path[:0] = {paths!r}
+
+def rss():
+    try:
+        import os
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+    except Exception:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*(1 if sys.platform == 'darwin' else 1024)
+
+for name in {preload!r}:
+    __import__(name)
+
+modules = len(sys.modules)
+gc.collect()
+if {trace!r}:
+    tracemalloc.start()
+rss0 = rss()
+t0 = time.perf_counter()
+
+__import__({module!r})
+t1 = time.perf_counter()
+
+methods = 0
+if {materialize!r}:
+    from geonodes.core import methodtable
+    methods = methodtable.materialize()
+t2 = time.perf_counter()
+
+res = {{
+    'import'      : t1 - t0,
+    'materialize' : t2 - t1,
+    'rss'         : rss() - rss0,
+    'traced'      : tracemalloc.get_traced_memory()[0] if {trace!r} else None,
+    'modules'     : len(sys.modules) - modules,
+    'methods'     : methods,
+    'loaded'      : [name for name in {watch!r} if name in sys.modules],
+    }}
+print({marker!r} + json.dumps(res))
+"""
+
+def measure(module='geonodes.core.generated', materialize=False, trace=True, preload=('bpy', 'numpy'), watch=(), blender=None, timeout=None):
+    """ > Import a module in a fresh Blender process
+
+    Arguments
+    ---------
+    - module (str = 'geonodes.core.generated') : module to import
+    - materialize (bool = False) : compile all the lazy methods after the import
+    - trace (bool = True) : measure the allocated memory with tracemalloc (slows the import down)
+    - preload (tuple of str) : modules imported before the measure
+    - watch (tuple of str) : modules to check in sys.modules after the import
+    - blender (str = None) : Blender executable, current executable if None
+    - timeout (float = None) : max duration of the process
+
+    Returns
+    -------
+    - dict : 'import', 'materialize' (s), 'rss', 'traced' (bytes), 'modules', 'methods', 'loaded'
+    """
+    if blender is None:
+        import bpy
+        blender = bpy.app.binary_path
+
+    paths = [str(Path(__file__).parents[2])]
+    expr = PROBE.format(paths=paths, preload=list(preload), module=module, materialize=materialize, trace=trace,
+                        watch=list(watch), marker=MARKER)
+
+    cmd = [blender, '--background', '--factory-startup', '--python-exit-code', '1', '--python-expr', expr]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+    for line in result.stdout.splitlines():
+        if line.startswith(MARKER):
+            return json.loads(line[len(MARKER):])
+
+    raise RuntimeError(f"Import benchmark of '{module}' failed:\n{result.stderr[-2000:]}")
+
+# =============================================================================================================================
+# Benchmark
+
+def _best(runs):
+    res = dict(runs[0])
+    for key in ('import', 'materialize'):
+        res[key] = min(run[key] for run in runs)
+    for key in ('rss', 'traced'):
+        values = [run[key] for run in runs if run[key] is not None]
+        res[key] = min(values) if values else None
+    return res
+
+def benchmark(module='geonodes.core.generated', repeat=3, blender=None, timeout=None):
+    """ > Compare the lazy import with the fully compiled methods
+
+    Times are measured without tracemalloc, memory with tracemalloc.
+    The best of **repeat** runs is kept.
+
+    Arguments
+    ---------
+    - module (str = 'geonodes.core.generated') : module to import
+    - repeat (int = 3) : number of processes per measure
+    - blender (str = None) : Blender executable
+    - timeout (float = None) : max duration of a process
+
+    Returns
+    -------
+    - dict : 'lazy' and 'expanded' measures
+    """
+    res = {}
+    for key, materialize in [('lazy', False), ('expanded', True)]:
+        times  = [measure(module, materialize=materialize, trace=False, blender=blender, timeout=timeout) for _ in range(repeat)]
+        memory = measure(module, materialize=materialize, trace=True, blender=blender, timeout=timeout)
+
+        m = _best(times)
+        m['traced'] = memory['traced']
+        res[key] = m
+
+    res['module'] = module
+    return res
+
+def report(res):
+    """ > Print the result of <#benchmark>
+
+    Arguments
+    ---------
+    - res (dict) : benchmark result
+    """
+    def mb(v):
+        return "-" if v is None else f"{v/1024/1024:7.2f} MB"
+
+    print(f"Import benchmark: {res['module']}")
+    print(f"{'':10s} {'import':>10s} {'total':>10s} {'rss':>10s} {'traced':>10s} {'methods':>8s}")
+    for key in ('lazy', 'expanded'):
+        m = res[key]
+        total = m['import'] + m['materialize']
+        print(f"{key:10s} {m['import']*1000:7.1f} ms {total*1000:7.1f} ms {mb(m['rss'])} {mb(m['traced'])} {m['methods']:8d}")
+
+# =============================================================================================================================
+# Regression check
+
+def check(max_time=MAX_IMPORT_TIME, baseline=None, tolerance=TOLERANCE, update=False, repeat=5, blender=None, timeout=None):
+    """ > Check the time of 'import geonodes'
+
+    The best time of **repeat** processes is compared with **max_time** and with the time saved
+    in the **baseline** file multiplied by **tolerance**.
+
+    Arguments
+    ---------
+    - max_time (float = MAX_IMPORT_TIME) : max import time in seconds, no limit if None
+    - baseline (str = None) : json file with the reference time
+    - tolerance (float = TOLERANCE) : max ratio between the import time and the baseline
+    - update (bool = False) : write the measured time in the baseline file when the check is ok
+    - repeat (int = 5) : number of processes
+    - blender (str = None) : Blender executable
+    - timeout (float = None) : max duration of a process
+
+    Returns
+    -------
+    - dict : 'ok', 'time', 'limit', 'baseline', 'loaded', 'errors'
+    """
+    runs = [measure('geonodes', trace=False, watch=LAZY_MODULES, blender=blender, timeout=timeout) for _ in range(repeat)]
+    t = min(run['import'] for run in runs)
+    loaded = sorted({name for run in runs for name in run['loaded']})
+
+    ref = None
+    if baseline is not None and Path(baseline).exists():
+        ref = json.loads(Path(baseline).read_text()).get('import')
+
+    limits = []
+    if max_time is not None:
+        limits.append(max_time)
+    if ref is not None:
+        limits.append(ref*tolerance)
+    limit = min(limits) if limits else None
+
+    errors = []
+    if limit is not None and t > limit:
+        errors.append(f"import geonodes takes {t*1000:.1f} ms, limit is {limit*1000:.1f} ms")
+    if loaded:
+        errors.append(f"import geonodes loads modules which must be loaded on demand: {loaded}")
+
+    ok = not errors
+    if ok and update and baseline is not None:
+        Path(baseline).write_text(json.dumps({'import': t, 'modules': runs[0]['modules']}, indent=1))
+
+    return {'ok': ok, 'time': t, 'limit': limit, 'baseline': ref, 'loaded': loaded, 'errors': errors}
+
+# =============================================================================================================================
+# Command line
+
+def main(argv=None):
+    import argparse
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(description="geonodes import benchmark")
+    parser.add_argument('--module', default='geonodes.core.generated', help="module to import")
+    parser.add_argument('--repeat', type=int, default=3, help="number of processes per measure")
+    parser.add_argument('--json', default=None, help="json file where to write the results")
+    parser.add_argument('--check', action='store_true', help="check the time of 'import geonodes'")
+    parser.add_argument('--max-time', type=float, default=MAX_IMPORT_TIME, help="max import time in seconds")
+    parser.add_argument('--baseline', default=None, help="json file with the reference import time")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help="max ratio with the baseline")
+    parser.add_argument('--update', action='store_true', help="update the baseline if the check is ok")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        res = check(args.max_time, baseline=args.baseline, tolerance=args.tolerance, update=args.update, repeat=args.repeat)
+        limit = "-" if res['limit'] is None else f"{res['limit']*1000:.1f} ms"
+        print(f"import geonodes: {res['time']*1000:.1f} ms (limit {limit})")
+        for error in res['errors']:
+            print("FAILED:", error)
+        sys.exit(0 if res['ok'] else 1)
+
+    res = benchmark(args.module, repeat=args.repeat)
+    report(res)
+    if args.json is not None:
+        Path(args.json).write_text(json.dumps(res, indent=1))
+
+if __name__ == '__main__':
+    main()
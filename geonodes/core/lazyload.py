@@ -0,0 +1,87 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : lazyload
+-----------------
+- lazy attributes of packages
+
+A package declares the attributes it exposes without importing them: the module
+is imported at first access through the module level **__getattr__**.
+
+``` python
+from .core.lazyload import lazy_attributes
+
+LAZY = {
+    'gnmath'  : ('.core', 'gnmath'),  # attribute 'gnmath' of module '.core'
+    'demos'   : ('.demos', None),     # module '.demos'
+    }
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY)
+```
+
+updates
+-------
+- creation : 2025/02/17
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+from importlib import import_module
+
+def lazy_attributes(package, globals, lazy):
+    """ > Module level __getattr__ and __dir__ functions loading the attributes on demand
+
+    The loaded attribute is stored in the module globals: **__getattr__** is called
+    only once per attribute.
+
+    Arguments
+    ---------
+    - package (str) : name of the package, used to resolve relative module names
+    - globals (dict) : globals of the package
+    - lazy (dict) : attribute name -> (module name, attribute name in module or None for the module itself)
+
+    Returns
+    -------
+    - couple of functions : __getattr__, __dir__
+    """
+
+    def __getattr__(name):
+        if name not in lazy:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+
+        module_name, attr = lazy[name]
+        obj = import_module(module_name, package)
+        if attr is not None:
+            obj = getattr(obj, attr)
+
+        globals[name] = obj
+        return obj
+
+    def __dir__():
+        return sorted(set(globals.keys()) | set(lazy.keys()))
+
+    return __getattr__, __dir__
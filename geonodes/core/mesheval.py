@@ -0,0 +1,1016 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : mesheval
+-----------------
+- NumPy engine running simple Geometry Nodes trees on meshes and instances
+
+The engine evaluates the <&Node Group Output> of a tree without evaluating the modifier.
+Geometries are stored as structure of arrays: one dict of NumPy arrays per domain.
+Fields are evaluated per domain with <!fieldeval>.
+
+``` python
+from geonodes.core import mesheval
+
+with GeoNodes("Hello World") as tree:
+    ...
+
+outputs = mesheval.run(tree, inputs={'Resolution': 50})
+mesh = outputs['Geometry'].mesh
+print(mesh.position.shape)
+```
+
+Supported geometry nodes are listed in <!GEOMETRY_NODES>.
+
+Domain interpolation follows Blender for point <-> corner, point <-> face, point <-> edge
+and face <-> corner. Other interpolations pass through the point domain.
+
+updates
+-------
+- creation : 2025/02/13
+- update :   2025/02/17 # multi input order, check_join_order
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import numpy as np
+
+from .scripterror import NodeError
+from . import fieldeval
+
+# =============================================================================================================================
+# Utilities
+
+def euler_to_matrix(euler):
+    """ > Rotation matrices from XYZ euler angles
+
+    Arguments
+    ---------
+    - euler (array of vectors) : euler angles
+
+    Returns
+    -------
+    - array of 3x3 matrices
+    """
+    euler = np.reshape(euler, (-1, 3))
+    cx, cy, cz = np.cos(euler).T
+    sx, sy, sz = np.sin(euler).T
+
+    m = np.empty((len(euler), 3, 3))
+    m[:, 0, 0] = cy*cz
+    m[:, 0, 1] = sx*sy*cz - cx*sz
+    m[:, 0, 2] = cx*sy*cz + sx*sz
+    m[:, 1, 0] = cy*sz
+    m[:, 1, 1] = sx*sy*sz + cx*cz
+    m[:, 1, 2] = cx*sy*sz - sx*cz
+    m[:, 2, 0] = -sy
+    m[:, 2, 1] = sx*cy
+    m[:, 2, 2] = cx*cy
+    return m
+
+def _zeros_like(value, count):
+    value = np.asarray(value)
+    return np.zeros((count,) + value.shape[1:], dtype=value.dtype)
+
+def _concatenate(arrays, counts):
+    """ Concatenate arrays, None arrays are replaced by zeros"""
+    model = next((a for a in arrays if a is not None), None)
+    return np.concatenate([_zeros_like(model, n) if a is None else a for a, n in zip(arrays, counts)])
+
+def _mix(value, mean):
+    # Booleans : all for larger elements, any for points
+    value = np.asarray(value)
+    if value.dtype == bool:
+        return mean
+    if np.issubdtype(value.dtype, np.integer):
+        return np.rint(mean).astype(value.dtype)
+    return mean
+
+# =============================================================================================================================
+# Geometry data
+
+class MeshData:
+
+    DOMAINS = ('POINT', 'EDGE', 'FACE', 'CORNER')
+
+    def __init__(self, position=None, edges=None, corners=None, faces=None):
+        """ > Mesh stored as structure of arrays
+
+        Topology:
+        - edges : (m, 2) array of vertex indices
+        - corners : vertex index of each face corner
+        - faces : face sizes
+
+        Attributes are stored per domain in <#attributes>. Arrays are never
+        modified in place: they can be shared between copies.
+
+        Arguments
+        ---------
+        - position (array of vectors = None) : vertex positions
+        - edges (array of couples of ints = None) : edges
+        - corners (array of ints = None) : corners vertex indices
+        - faces (array of ints = None) : face sizes
+        """
+        self.attributes = {domain: {} for domain in self.DOMAINS}
+        self.edges   = np.zeros((0, 2), int) if edges is None else np.asarray(edges, dtype=int).reshape(-1, 2)
+        self.corners = np.zeros(0, int) if corners is None else np.asarray(corners, dtype=int)
+        self.faces   = np.zeros(0, int) if faces is None else np.asarray(faces, dtype=int)
+        self.attributes['POINT']['position'] = np.zeros((0, 3)) if position is None else np.asarray(position, dtype=float).reshape(-1, 3)
+        self.materials = []
+
+    def __str__(self):
+        return f"<MeshData: {self.domain_size('POINT')} points, {self.domain_size('EDGE')} edges, {self.domain_size('FACE')} faces>"
+
+    def copy(self):
+        mesh = MeshData(self.position, self.edges, self.corners, self.faces)
+        mesh.attributes = {domain: dict(attrs) for domain, attrs in self.attributes.items()}
+        mesh.materials = list(self.materials)
+        return mesh
+
+    @property
+    def position(self):
+        return self.attributes['POINT']['position']
+
+    @property
+    def face_offsets(self):
+        return np.concatenate(([0], np.cumsum(self.faces)))
+
+    def domain_size(self, domain):
+        if domain == 'POINT':
+            return len(self.position)
+        elif domain == 'EDGE':
+            return len(self.edges)
+        elif domain == 'FACE':
+            return len(self.faces)
+        elif domain == 'CORNER':
+            return len(self.corners)
+        return 0
+
+    # ----------------------------------------------------------------------------------------------------
+    # Domain interpolation
+
+    def _points_to_faces(self, value):
+        if len(self.faces) == 0:
+            return _zeros_like(value, 0)
+        sums = np.add.reduceat(np.asarray(value, dtype=float)[self.corners], self.face_offsets[:-1], axis=0)
+        sizes = self.faces.reshape((-1,) + (1,)*(sums.ndim - 1))
+        return sums/sizes
+
+    def _to_points(self, value, indices):
+        count = self.domain_size('POINT')
+        value = np.asarray(value, dtype=float)
+        sums = np.zeros((count,) + value.shape[1:])
+        np.add.at(sums, indices, value)
+        n = np.bincount(indices, minlength=count).reshape((-1,) + (1,)*(sums.ndim - 1))
+        return sums/np.maximum(n, 1)
+
+    def interpolate(self, value, from_domain, to_domain):
+        """ > Interpolate an attribute from one domain to another
+
+        Arguments
+        ---------
+        - value (array) : attribute on from_domain
+        - from_domain (str) : source domain
+        - to_domain (str) : target domain
+
+        Returns
+        -------
+        - array
+        """
+        if from_domain == to_domain:
+            return value
+
+        value = np.asarray(value)
+        is_bool = value.dtype == bool
+
+        if from_domain == 'POINT':
+            if to_domain == 'CORNER':
+                return value[self.corners]
+            if to_domain == 'EDGE':
+                mean = (value[self.edges[:, 0]].astype(float) + value[self.edges[:, 1]])/2
+            else:
+                mean = self._points_to_faces(value)
+            return _mix(value, mean >= 1 if is_bool else mean)
+
+        if from_domain == 'FACE' and to_domain == 'CORNER':
+            return np.repeat(value, self.faces, axis=0)
+
+        if from_domain == 'CORNER' and to_domain == 'FACE':
+            if len(self.faces) == 0:
+                return _zeros_like(value, 0)
+            mean = np.add.reduceat(value.astype(float), self.face_offsets[:-1], axis=0)/self.faces.reshape((-1,) + (1,)*(value.ndim - 1))
+            return _mix(value, mean >= 1 if is_bool else mean)
+
+        # ----- Through the point domain
+
+        if from_domain == 'CORNER':
+            mean = self._to_points(value, self.corners)
+        elif from_domain == 'FACE':
+            mean = self._to_points(np.repeat(value, self.faces, axis=0), self.corners)
+        elif from_domain == 'EDGE':
+            mean = self._to_points(np.concatenate((value, value)), np.concatenate((self.edges[:, 0], self.edges[:, 1])))
+        else:
+            raise NodeError(f"Mesh evaluation: invalid domain '{from_domain}'")
+
+        points = _mix(value, mean > 0 if is_bool else mean)
+        return self.interpolate(points, 'POINT', to_domain)
+
+    # ----------------------------------------------------------------------------------------------------
+    # Transformation
+
+    def transformed(self, translation=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1)):
+        mesh = self.copy()
+        m = euler_to_matrix(rotation)[0]
+        mesh.attributes['POINT']['position'] = (self.position*scale) @ m.T + translation
+        return mesh
+
+    # ----------------------------------------------------------------------------------------------------
+    # Join
+
+    @classmethod
+    def join(cls, meshes):
+        """ > Join meshes
+
+        Attributes missing in some meshes are set to zero.
+
+        Arguments
+        ---------
+        - meshes (list of MeshData) : meshes to join
+
+        Returns
+        -------
+        - MeshData
+        """
+        meshes = [mesh for mesh in meshes if mesh is not None]
+        if len(meshes) == 0:
+            return None
+        if len(meshes) == 1:
+            return meshes[0]
+
+        offsets = np.cumsum([0] + [mesh.domain_size('POINT') for mesh in meshes])[:-1]
+        mesh = cls(
+            edges   = np.concatenate([m.edges + ofs for m, ofs in zip(meshes, offsets)]),
+            corners = np.concatenate([m.corners + ofs for m, ofs in zip(meshes, offsets)]),
+            faces   = np.concatenate([m.faces for m in meshes]),
+            )
+        for domain in cls.DOMAINS:
+            counts = [m.domain_size(domain) for m in meshes]
+            names = {}
+            for m in meshes:
+                names.update(dict.fromkeys(m.attributes[domain]))
+            for name in names:
+                mesh.attributes[domain][name] = _concatenate([m.attributes[domain].get(name) for m in meshes], counts)
+        for m in meshes:
+            mesh.materials.extend([mat for mat in m.materials if mat not in mesh.materials])
+        return mesh
+
+    # ----------------------------------------------------------------------------------------------------
+    # Comparison
+
+    def allclose(self, other, rtol=1e-5, atol=1e-6):
+        """ > Compare two meshes
+
+        Arguments
+        ---------
+        - other (MeshData) : mesh to compare with
+        - rtol (float = 1e-5) : relative tolerance
+        - atol (float = 1e-6) : absolute tolerance
+
+        Returns
+        -------
+        - bool
+        """
+        if not (np.array_equal(self.edges, other.edges) and np.array_equal(self.corners, other.corners) and np.array_equal(self.faces, other.faces)):
+            return False
+        for domain in self.DOMAINS:
+            a, b = self.attributes[domain], other.attributes[domain]
+            if a.keys() != b.keys():
+                return False
+            for name in a:
+                if np.shape(a[name]) != np.shape(b[name]) or not np.allclose(a[name], b[name], rtol=rtol, atol=atol):
+                    return False
+        return True
+
+class InstancesData:
+
+    DOMAINS = ('INSTANCE',)
+
+    def __init__(self, references=None, position=None, rotation=None, scale=None, reference_index=None):
+        """ > Instances stored as structure of arrays
+
+        The transformation of the instances is stored in the 'position', 'rotation' (euler)
+        and 'scale' attributes.
+
+        Arguments
+        ---------
+        - references (list of GeometryData) : instanced geometries
+        - position (array of vectors = None) : instance positions
+        - rotation (array of vectors = None) : instance rotations
+        - scale (array of vectors = None) : instance scales
+        - reference_index (array of ints = None) : index in references
+        """
+        self.references = [] if references is None else list(references)
+        position = np.zeros((0, 3)) if position is None else np.asarray(position, dtype=float).reshape(-1, 3)
+        count = len(position)
+        self.attributes = {'INSTANCE': {
+            'position'        : position,
+            'rotation'        : np.zeros((count, 3)) if rotation is None else np.broadcast_to(rotation, (count, 3)),
+            'scale'           : np.ones((count, 3)) if scale is None else np.broadcast_to(scale, (count, 3)),
+            '.reference_index': np.zeros(count, int) if reference_index is None else np.broadcast_to(reference_index, (count,)),
+            }}
+
+    def __str__(self):
+        return f"<InstancesData: {len(self.position)} instances, {len(self.references)} references>"
+
+    def copy(self):
+        instances = InstancesData(self.references)
+        instances.attributes = {domain: dict(attrs) for domain, attrs in self.attributes.items()}
+        return instances
+
+    @property
+    def position(self):
+        return self.attributes['INSTANCE']['position']
+
+    def domain_size(self, domain):
+        return len(self.position) if domain == 'INSTANCE' else 0
+
+    def interpolate(self, value, from_domain, to_domain):
+        return value
+
+    @classmethod
+    def join(cls, instances):
+        instances = [inst for inst in instances if inst is not None]
+        if len(instances) == 0:
+            return None
+        if len(instances) == 1:
+            return instances[0]
+
+        res = cls()
+        for inst in instances:
+            res.references.extend(inst.references)
+        counts = [inst.domain_size('INSTANCE') for inst in instances]
+        names = {}
+        for inst in instances:
+            names.update(dict.fromkeys(inst.attributes['INSTANCE']))
+        for name in names:
+            res.attributes['INSTANCE'][name] = _concatenate([inst.attributes['INSTANCE'].get(name) for inst in instances], counts)
+
+        offsets = np.cumsum([0] + [len(inst.references) for inst in instances])[:-1]
+        res.attributes['INSTANCE']['.reference_index'] = np.concatenate(
+            [inst.attributes['INSTANCE']['.reference_index'] + ofs for inst, ofs in zip(instances, offsets)])
+        return res
+
+class GeometryData:
+
+    def __init__(self, mesh=None, instances=None):
+        """ > Geometry made of a mesh and instances components
+
+        Arguments
+        ---------
+        - mesh (MeshData = None) : mesh component
+        - instances (InstancesData = None) : instances component
+        """
+        self.mesh      = mesh
+        self.instances = instances
+
+    def __str__(self):
+        return f"<GeometryData: {self.mesh}, {self.instances}>"
+
+    def copy(self):
+        return GeometryData(
+            None if self.mesh is None else self.mesh.copy(),
+            None if self.instances is None else self.instances.copy())
+
+    def component(self, domain):
+        """ > Component owning a domain
+
+        Arguments
+        ---------
+        - domain (str) : domain name
+
+        Returns
+        -------
+        - MeshData, InstancesData or None
+        """
+        return self.instances if domain == 'INSTANCE' else self.mesh
+
+    @classmethod
+    def join(cls, geometries):
+        return cls(
+            MeshData.join([geo.mesh for geo in geometries]),
+            InstancesData.join([geo.instances for geo in geometries]))
+
+    def realized(self, selection=None):
+        """ > Realize the instances
+
+        Instance attributes are propagated to the points of the realized meshes.
+
+        Arguments
+        ---------
+        - selection (array of bools = None) : instances to realize
+
+        Returns
+        -------
+        - GeometryData
+        """
+        if self.instances is None or self.instances.domain_size('INSTANCE') == 0:
+            return self
+
+        insts = self.instances
+        attrs = insts.attributes['INSTANCE']
+        count = insts.domain_size('INSTANCE')
+        sel = np.ones(count, bool) if selection is None else np.broadcast_to(selection, (count,))
+
+        realized = [ref.realized() for ref in insts.references]
+        matrices = euler_to_matrix(attrs['rotation'])
+
+        meshes = [] if self.mesh is None else [self.mesh]
+        for i in np.flatnonzero(sel):
+            ref = realized[attrs['.reference_index'][i]]
+            if ref.mesh is None:
+                continue
+            mesh = ref.mesh.copy()
+            mesh.attributes['POINT']['position'] = (ref.mesh.position*attrs['scale'][i]) @ matrices[i].T + attrs['position'][i]
+            n = mesh.domain_size('POINT')
+            for name, value in attrs.items():
+                if name in ('position', 'rotation', 'scale') or name.startswith('.'):
+                    continue
+                mesh.attributes['POINT'][name] = np.repeat(np.asarray(value)[i:i+1], n, axis=0)
+            meshes.append(mesh)
+
+        instances = None
+        if not np.all(sel):
+            instances = insts.copy()
+            keep = ~sel
+            instances.attributes['INSTANCE'] = {name: np.asarray(value)[keep] for name, value in attrs.items()}
+
+        return GeometryData(MeshData.join(meshes), instances)
+
+# =============================================================================================================================
+# Attributes of a domain
+
+class DomainAttributes:
+
+    def __init__(self, component, domain):
+        """ > Read only mapping giving the attributes of a component on a domain
+
+        Attributes stored on another domain are interpolated.
+
+        Arguments
+        ---------
+        - component (MeshData or InstancesData) : the component
+        - domain (str) : the domain
+        """
+        self.component = component
+        self.domain    = domain
+
+    def _find(self, name):
+        if self.component is None:
+            return None
+        if name in self.component.attributes.get(self.domain, {}):
+            return self.domain
+        for domain, attrs in self.component.attributes.items():
+            if name in attrs:
+                return domain
+        return None
+
+    def __contains__(self, name):
+        return self._find(name) is not None
+
+    def __getitem__(self, name):
+        domain = self._find(name)
+        if domain is None:
+            raise KeyError(name)
+        return self.component.interpolate(self.component.attributes[domain][name], domain, self.domain)
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+# =============================================================================================================================
+# Field evaluation on a domain
+
+class DomainEvaluator(fieldeval.FieldEvaluator):
+
+    def __init__(self, engine, geometry, domain):
+        """ > Field evaluator on the domain of a geometry
+
+        Nodes computing values from a geometry, such as <&Node Attribute Statistic>, are
+        evaluated by the engine.
+
+        Arguments
+        ---------
+        - engine (Engine) : the engine
+        - geometry (GeometryData) : the geometry
+        - domain (str) : the domain
+        """
+        component = None if geometry is None else geometry.component(domain)
+        count = 1 if component is None else component.domain_size(domain)
+        attributes = DomainAttributes(component, domain)
+
+        if component is None:
+            position = np.zeros((count, 3))
+        elif domain == 'INSTANCE':
+            position = component.position
+        else:
+            position = component.interpolate(component.position, 'POINT', domain)
+
+        super().__init__(engine.btree, count=count, position=position, attributes=attributes, inputs=engine.inputs, links=engine.links)
+        self.engine = engine
+
+    def output(self, bsocket):
+        bnode = bsocket.node
+        bl_idname = bnode.bl_idname
+
+        if bl_idname == 'GeometryNodeCaptureAttribute':
+            key = Engine.capture_key(bnode, bsocket)
+            if key in self.attributes:
+                return self.attributes[key]
+            return np.zeros(3 if bsocket.type == 'VECTOR' else ())
+
+        if bl_idname in GEOMETRY_NODES:
+            return self.engine.output(bsocket)
+
+        return super().output(bsocket)
+
+# =============================================================================================================================
+# Geometry nodes
+
+def _mesh_grid(engine, bnode):
+    size_x, size_y, nx, ny = [engine.value(bnode.inputs[name]) for name in ('Size X', 'Size Y', 'Vertices X', 'Vertices Y')]
+    nx, ny = int(nx), int(ny)
+    if nx < 1 or ny < 1:
+        return {'Mesh': GeometryData()}
+
+    x = np.linspace(-size_x/2, size_x/2, nx) if nx > 1 else np.zeros(1)
+    y = np.linspace(-size_y/2, size_y/2, ny) if ny > 1 else np.zeros(1)
+    position = np.zeros((nx*ny, 3))
+    position[:, 0] = np.repeat(x, ny)
+    position[:, 1] = np.tile(y, nx)
+
+    index = np.arange(nx*ny).reshape(nx, ny)
+    edges = np.concatenate((
+        np.stack((index[:, :-1].ravel(), index[:, 1:].ravel()), axis=-1),
+        np.stack((index[:-1, :].ravel(), index[1:, :].ravel()), axis=-1)))
+
+    v0 = index[:-1, :-1].ravel()
+    corners = np.stack((v0, v0 + ny, v0 + ny + 1, v0 + 1), axis=-1).ravel()
+    faces = np.full(len(v0), 4)
+
+    return {'Mesh': GeometryData(MeshData(position, edges, corners, faces))}
+
+def _mesh_line(engine, bnode):
+    start = engine.value(bnode.inputs['Start Location'])
+    if bnode.mode == 'OFFSET':
+        count  = int(engine.value(bnode.inputs['Count']))
+        offset = engine.value(bnode.inputs['Offset'])
+        if bnode.count_mode != 'TOTAL':
+            raise NodeError(f"Mesh evaluation: Mesh Line count mode '{bnode.count_mode}' not supported in mode 'OFFSET'")
+        position = start + np.arange(max(count, 0))[:, None]*offset
+    else:
+        end = engine.value(bnode.inputs['End Location'])
+        if bnode.count_mode == 'TOTAL':
+            count = int(engine.value(bnode.inputs['Count']))
+        else:
+            resolution = engine.value(bnode.inputs['Resolution'])
+            count = int(np.linalg.norm(end - start)/resolution) + 1 if resolution > 0 else 0
+        if count == 1:
+            position = np.reshape(start, (1, 3))
+        else:
+            position = start + np.linspace(0, 1, max(count, 0))[:, None]*(end - start)
+
+    n = len(position)
+    edges = np.stack((np.arange(n - 1), np.arange(1, n)), axis=-1) if n > 1 else None
+    return {'Mesh': GeometryData(MeshData(position, edges))}
+
+def _set_position(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry']).copy()
+    for component, domain in ((geo.mesh, 'POINT'), (geo.instances, 'INSTANCE')):
+        if component is None or component.domain_size(domain) == 0:
+            continue
+        ev = DomainEvaluator(engine, geo, domain)
+        old = component.position
+        sel = ev.evaluate(bnode.inputs['Selection'])
+        bposition = bnode.inputs['Position']
+        position = ev.evaluate(bposition) if bposition.is_linked else old
+        offset = ev.evaluate(bnode.inputs['Offset'])
+        component.attributes[domain]['position'] = np.where(sel[:, None], position + offset, old)
+    return {'Geometry': geo}
+
+DATA_TYPES = {
+    'FLOAT'         : 'VALUE',
+    'INT'           : 'INT',
+    'FLOAT_VECTOR'  : 'VECTOR',
+    'FLOAT_COLOR'   : 'RGBA',
+    'BYTE_COLOR'    : 'RGBA',
+    'BOOLEAN'       : 'BOOLEAN',
+    'QUATERNION'    : 'ROTATION',
+    'FLOAT2'        : 'VECTOR',
+    'INT8'          : 'INT',
+}
+
+def _store(component, domain, name, value, sel):
+    """ Store an attribute with a selection"""
+    attrs = component.attributes[domain]
+    old = attrs.get(name)
+    if old is None or np.shape(old) != np.shape(value):
+        old = np.zeros_like(value)
+    sel = np.asarray(sel).reshape((-1,) + (1,)*(np.ndim(value) - 1))
+    attrs[name] = np.where(sel, value, old)
+
+def _store_named_attribute(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry']).copy()
+    domain = bnode.domain
+    component = geo.component(domain)
+    if component is None or component.domain_size(domain) == 0:
+        return {'Geometry': geo}
+
+    ev = DomainEvaluator(engine, geo, domain)
+    name = engine.value(bnode.inputs['Name'])
+    if not name:
+        return {'Geometry': geo}
+    sel = ev.evaluate(bnode.inputs['Selection'])
+    bvalue = next(bsocket for bsocket in bnode.inputs[3:] if bsocket.enabled)
+    value = fieldeval.convert(ev.evaluate(bvalue), bvalue.type, DATA_TYPES.get(bnode.data_type, bvalue.type))
+    _store(component, domain, name, value, sel)
+    return {'Geometry': geo}
+
+def _capture_attribute(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry']).copy()
+    domain = bnode.domain
+    component = geo.component(domain)
+    if component is not None and component.domain_size(domain):
+        ev = DomainEvaluator(engine, geo, domain)
+        for bin, bout in zip(bnode.inputs[1:], bnode.outputs[1:]):
+            if bin.type in ('CUSTOM', 'GEOMETRY'):
+                continue
+            component.attributes[domain][Engine.capture_key(bnode, bout)] = ev.evaluate(bin)
+    return {'Geometry': geo}
+
+def _attribute_statistic(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry'])
+    domain = bnode.domain
+    vector = bnode.data_type == 'FLOAT_VECTOR'
+    battr = next(bsocket for bsocket in bnode.inputs[2:] if bsocket.enabled)
+
+    component = geo.component(domain)
+    if component is None or component.domain_size(domain) == 0:
+        values = np.zeros((0, 3) if vector else 0)
+    else:
+        ev = DomainEvaluator(engine, geo, domain)
+        sel = ev.evaluate(bnode.inputs['Selection'])
+        values = ev.evaluate(battr).astype(float)[sel]
+
+    zero = np.zeros(3 if vector else ())
+    if len(values) == 0:
+        stats = dict.fromkeys(('Mean', 'Median', 'Sum', 'Min', 'Max', 'Range', 'Standard Deviation', 'Variance'), zero)
+    else:
+        vmin, vmax = np.min(values, axis=0), np.max(values, axis=0)
+        stats = {
+            'Mean'               : np.mean(values, axis=0),
+            'Median'             : np.median(values, axis=0),
+            'Sum'                : np.sum(values, axis=0),
+            'Min'                : vmin,
+            'Max'                : vmax,
+            'Range'              : vmax - vmin,
+            'Standard Deviation' : np.std(values, axis=0),
+            'Variance'           : np.var(values, axis=0),
+            }
+    return stats
+
+def _domain_size(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry'])
+    mesh, insts = geo.mesh, geo.instances
+    return {
+        'Point Count'       : np.array(0 if mesh is None else mesh.domain_size('POINT')),
+        'Edge Count'        : np.array(0 if mesh is None else mesh.domain_size('EDGE')),
+        'Face Count'        : np.array(0 if mesh is None else mesh.domain_size('FACE')),
+        'Face Corner Count' : np.array(0 if mesh is None else mesh.domain_size('CORNER')),
+        'Spline Count'      : np.array(0),
+        'Instance Count'    : np.array(0 if insts is None else insts.domain_size('INSTANCE')),
+        'Layer Count'       : np.array(0),
+        }
+
+def _instance_on_points(engine, bnode):
+    points = engine.geometry(bnode.inputs['Points'])
+    instance = engine.geometry(bnode.inputs['Instance'])
+
+    if engine.value(bnode.inputs['Pick Instance']):
+        raise NodeError("Mesh evaluation: 'Pick Instance' option of Instance on Points is not supported")
+
+    mesh = points.mesh
+    if mesh is None or mesh.domain_size('POINT') == 0:
+        return {'Instances': GeometryData(instances=InstancesData())}
+
+    ev = DomainEvaluator(engine, points, 'POINT')
+    sel = ev.evaluate(bnode.inputs['Selection'])
+    rotation = ev.evaluate(bnode.inputs['Rotation'])[sel]
+    scale = ev.evaluate(bnode.inputs['Scale'])[sel]
+
+    insts = InstancesData([instance], mesh.position[sel], rotation, scale)
+    for name, value in mesh.attributes['POINT'].items():
+        if name != 'position' and not name.startswith('.'):
+            insts.attributes['INSTANCE'][name] = np.asarray(value)[sel]
+
+    return {'Instances': GeometryData(instances=insts)}
+
+def _realize_instances(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry'])
+    if geo.instances is None:
+        return {'Geometry': geo}
+    sel = DomainEvaluator(engine, geo, 'INSTANCE').evaluate(bnode.inputs['Selection'])
+    return {'Geometry': geo.realized(sel)}
+
+def _join_geometry(engine, bnode):
+    return {'Geometry': GeometryData.join(engine.geometries(bnode.inputs['Geometry']))}
+
+def _transform_geometry(engine, bnode):
+    if getattr(bnode, 'mode', 'COMPONENTS') != 'COMPONENTS':
+        raise NodeError("Mesh evaluation: only 'COMPONENTS' mode of Transform Geometry is supported")
+    geo = engine.geometry(bnode.inputs['Geometry'])
+    t, r, s = [engine.value(bnode.inputs[name]) for name in ('Translation', 'Rotation', 'Scale')]
+    res = GeometryData(None if geo.mesh is None else geo.mesh.transformed(t, r, s))
+    if geo.instances is not None:
+        insts = res.instances = geo.instances.copy()
+        attrs = insts.attributes['INSTANCE']
+        attrs['position'] = (attrs['position']*s) @ euler_to_matrix(r)[0].T + t
+        attrs['scale'] = attrs['scale']*s
+        if np.any(r != 0):
+            if np.any(attrs['rotation'] != 0):
+                raise NodeError("Mesh evaluation: rotation of rotated instances is not supported")
+            attrs['rotation'] = np.broadcast_to(r, attrs['rotation'].shape)
+    return {'Geometry': res}
+
+def _set_shade_smooth(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry']).copy()
+    domain = getattr(bnode, 'domain', 'FACE')
+    if geo.mesh is not None and geo.mesh.domain_size(domain):
+        ev = DomainEvaluator(engine, geo, domain)
+        sel = ev.evaluate(bnode.inputs['Selection'])
+        sharp = ~ev.evaluate(bnode.inputs['Shade Smooth'])
+        _store(geo.mesh, domain, 'sharp_face' if domain == 'FACE' else 'sharp_edge', sharp, sel)
+    return {'Geometry': geo}
+
+def _set_material(engine, bnode):
+    geo = engine.geometry(bnode.inputs['Geometry']).copy()
+    mesh = geo.mesh
+    if mesh is not None and mesh.domain_size('FACE'):
+        material = bnode.inputs['Material'].default_value
+        if material not in mesh.materials:
+            mesh.materials.append(material)
+        ev = DomainEvaluator(engine, geo, 'FACE')
+        sel = ev.evaluate(bnode.inputs['Selection'])
+        _store(mesh, 'FACE', 'material_index', np.full(mesh.domain_size('FACE'), mesh.materials.index(material)), sel)
+    return {'Geometry': geo}
+
+def _group_input(engine, bnode):
+    return {bsocket.name: engine.inputs.get(bsocket.name, GeometryData()) for bsocket in bnode.outputs if bsocket.type == 'GEOMETRY'}
+
+GEOMETRY_NODES = {
+    'GeometryNodeMeshGrid'            : _mesh_grid,
+    'GeometryNodeMeshLine'            : _mesh_line,
+    'GeometryNodeSetPosition'         : _set_position,
+    'GeometryNodeStoreNamedAttribute' : _store_named_attribute,
+    'GeometryNodeCaptureAttribute'    : _capture_attribute,
+    'GeometryNodeAttributeStatistic'  : _attribute_statistic,
+    'GeometryNodeAttributeDomainSize' : _domain_size,
+    'GeometryNodeInstanceOnPoints'    : _instance_on_points,
+    'GeometryNodeRealizeInstances'    : _realize_instances,
+    'GeometryNodeJoinGeometry'        : _join_geometry,
+    'GeometryNodeTransform'           : _transform_geometry,
+    'GeometryNodeSetShadeSmooth'      : _set_shade_smooth,
+    'GeometryNodeSetMaterial'         : _set_material,
+}
+
+# =============================================================================================================================
+# Engine
+
+class Engine:
+    def __init__(self, btree, inputs=None):
+        """ > Evaluate a Geometry Nodes tree with NumPy
+
+        Arguments
+        ---------
+        - btree (NodeTree) : the tree
+        - inputs (dict = None) : group input values, geometries are <!GeometryData>
+        """
+        self.btree  = btree
+        self.inputs = {} if inputs is None else dict(inputs)
+        self.links  = fieldeval.FieldEvaluator.links_index(btree)
+
+        # Multi input sockets : input socket pointer -> output sockets
+        self.multi_links = {}
+        for link in btree.links:
+            if link.is_valid and not link.is_muted and link.to_socket.is_multi_input:
+                self.multi_links.setdefault(link.to_socket.as_pointer(), []).append((link.multi_input_sort_id, link.from_socket))
+
+        self._cache = {}
+
+    @staticmethod
+    def capture_key(bnode, bsocket):
+        """ Anonymous attribute name of a captured value"""
+        index = list(bnode.outputs).index(bsocket)
+        return f".capture_{bnode.as_pointer()}_{index}"
+
+    # ----------------------------------------------------------------------------------------------------
+    # Node outputs
+
+    def output(self, bsocket):
+        """ > Value of an output socket of a geometry node
+
+        Arguments
+        ---------
+        - bsocket (NodeSocket) : output socket
+
+        Returns
+        -------
+        - GeometryData or array
+        """
+        bnode = bsocket.node
+        if bnode.bl_idname == 'NodeReroute':
+            return self.geometry(bnode.inputs[0])
+
+        key = bnode.as_pointer()
+        values = self._cache.get(key)
+        if values is None:
+            if bnode.bl_idname == 'NodeGroupInput':
+                f = _group_input
+            else:
+                f = GEOMETRY_NODES.get(bnode.bl_idname)
+            if f is None:
+                raise NodeError(f"Mesh evaluation: node '{bnode.name}' ({bnode.bl_idname}) is not supported")
+            if bnode.mute:
+                raise NodeError(f"Mesh evaluation: muted node '{bnode.name}' is not supported")
+            with np.errstate(all='ignore'):
+                values = f(self, bnode)
+            self._cache[key] = values
+
+        if bsocket.name not in values:
+            raise NodeError(f"Mesh evaluation: output socket '{bsocket.name}' of node '{bnode.name}' is not supported")
+        return values[bsocket.name]
+
+    def geometry(self, bsocket):
+        """ > Geometry plugged into an input socket
+
+        Arguments
+        ---------
+        - bsocket (NodeSocket) : input socket
+
+        Returns
+        -------
+        - GeometryData
+        """
+        if bsocket.is_multi_input:
+            return GeometryData.join(self.geometries(bsocket))
+        from_socket = self.links.get(bsocket.as_pointer())
+        if from_socket is None:
+            return GeometryData()
+        return self.output(from_socket)
+
+    def geometries(self, bsocket):
+        # Blender evaluates the multi input links from the highest sort id down
+        links = sorted(self.multi_links.get(bsocket.as_pointer(), []), key=lambda link: link[0], reverse=True)
+        return [self.output(from_socket) for _, from_socket in links]
+
+    def value(self, bsocket):
+        """ > Single value of an input socket
+
+        Arguments
+        ---------
+        - bsocket (NodeSocket) : input socket
+
+        Returns
+        -------
+        - value
+        """
+        value = DomainEvaluator(self, None, 'POINT').input(bsocket)
+        if isinstance(value, str):
+            return value
+        value = np.asarray(value)
+        if bsocket.type in ('VECTOR', 'RGBA', 'ROTATION'):
+            return value.reshape(-1, value.shape[-1])[0] if value.ndim > 1 else value
+        return value.ravel()[0] if value.ndim else value.item()
+
+    # ----------------------------------------------------------------------------------------------------
+    # Run
+
+    def run(self):
+        """ > Evaluate the group output node
+
+        Returns
+        -------
+        - dict : output socket name -> GeometryData or value
+        """
+        bnode = None
+        for node in self.btree.nodes:
+            if node.bl_idname == 'NodeGroupOutput' and (bnode is None or node.is_active_output):
+                bnode = node
+        if bnode is None:
+            raise NodeError(f"Mesh evaluation: tree '{self.btree.name}' has no Group Output node")
+
+        outputs = {}
+        for bsocket in bnode.inputs:
+            if bsocket.type == 'CUSTOM':
+                continue
+            if bsocket.type == 'GEOMETRY':
+                outputs[bsocket.name] = self.geometry(bsocket)
+            else:
+                outputs[bsocket.name] = self.value(bsocket)
+        return outputs
+
+def run(tree, inputs=None):
+    """ > Evaluate a Geometry Nodes tree with NumPy
+
+    See <!Engine>
+
+    Arguments
+    ---------
+    - tree (Tree or NodeTree) : the tree
+    - inputs (dict = None) : group input values, geometries are <!GeometryData>
+
+    Returns
+    -------
+    - dict : output socket name -> GeometryData or value
+    """
+    if hasattr(tree, 'flush_links'):
+        tree.flush_links()
+    return Engine(getattr(tree, '_btree', tree), inputs=inputs).run()
+
+# =============================================================================================================================
+# Check against Blender
+
+def check_join_order():
+    """ > Compare the order of the joined geometries with Blender
+
+    Two different grids are joined. The tree is evaluated by the engine and by a modifier
+    on a temporary object: the positions and the topology must be the same.
+
+    ``` python
+    from geonodes.core import mesheval
+
+    assert mesheval.check_join_order()
+    ```
+
+    Returns
+    -------
+    - bool
+    """
+    import bpy
+    from geonodes import GeoNodes, Geometry, Mesh
+
+    with GeoNodes("Mesheval Join Order") as tree:
+        small = Mesh.Grid(size_x=1, size_y=1, vertices_x=2, vertices_y=2)
+        large = Mesh.Grid(size_x=4, size_y=2, vertices_x=4, vertices_y=3)
+        Geometry.Join(small, large).out()
+
+    mesh = run(tree)['Geometry'].mesh
+
+    obj = bpy.data.objects.new("Mesheval Join Order", bpy.data.meshes.new("Mesheval Join Order"))
+    bpy.context.scene.collection.objects.link(obj)
+    try:
+        obj.modifiers.new("Geometry Nodes", 'NODES').node_group = tree._btree
+        eval_obj = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        bmesh = eval_obj.to_mesh()
+
+        position = np.empty(3*len(bmesh.vertices))
+        bmesh.vertices.foreach_get('co', position)
+        edges = np.empty(2*len(bmesh.edges), int)
+        bmesh.edges.foreach_get('vertices', edges)
+        corners = np.empty(len(bmesh.loops), int)
+        bmesh.loops.foreach_get('vertex_index', corners)
+        faces = np.empty(len(bmesh.polygons), int)
+        bmesh.polygons.foreach_get('loop_total', faces)
+
+        ref = MeshData(position, edges, corners, faces)
+        eval_obj.to_mesh_clear()
+
+    finally:
+        mesh_data = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh_data)
+
+    return (np.allclose(mesh.position, ref.position, atol=1e-6) and np.array_equal(mesh.edges, ref.edges)
+        and np.array_equal(mesh.corners, ref.corners) and np.array_equal(mesh.faces, ref.faces))
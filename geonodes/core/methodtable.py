@@ -0,0 +1,275 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : methodtable
+--------------------
+- lazy factory for the methods of the generated classes
+
+The modules in <!generated> don't define their methods: they declare a table
+'method name -> source code' which is installed in the class (or in the module for <!gnmath>).
+
+The source code of a method is compiled on first attribute access, the resulting function
+replaces the lazy placeholder in the class: the next accesses are direct.
+
+The sources are registered in <*linecache> under a pseudo file name: <*inspect.getsource>
+and the tracebacks work as with regular modules.
+
+``` python
+from .. socket_class import Socket
+from .. methodtable import MethodTable
+
+METHODS = {
+'less_than': r'''
+    def less_than(self, b=None):
+        ...
+''',
+}
+
+class Float(Socket):
+    pass
+
+MethodTable(METHODS, globals()).install(Float)
+```
+
+updates
+-------
+- creation : 2025/02/17
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import linecache
+from textwrap import dedent
+
+TABLES = []
+
+# =============================================================================================================================
+# Lazy members
+
+class LazyMethod:
+    """ Placeholder for a method, a class method or a static method
+
+    Non data descriptor: the placeholder is replaced by the compiled function at first access.
+    """
+
+    def __init__(self, table, cls, name):
+        self.table = table
+        self.cls   = cls
+        self.name  = name
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def build(self):
+        obj = self.table.build(self.name)
+        if self.cls.__dict__.get(self.name) is self:
+            setattr(self.cls, self.name, obj)
+        return obj
+
+    def __get__(self, instance, owner=None):
+        obj = self.build()
+        if hasattr(obj, '__get__'):
+            return obj.__get__(instance, self.cls if owner is None else owner)
+        return obj
+
+class LazyProperty(LazyMethod):
+    """ Placeholder for a property
+
+    Data descriptor: it must be found before the instance dict, even for a setting
+    before the first reading.
+    """
+
+    def __set__(self, instance, value):
+        self.build().__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.build().__delete__(instance)
+
+# =============================================================================================================================
+# Method table
+
+class MethodTable:
+
+    def __init__(self, sources, globals):
+        """ > Table of the source codes of the methods of a generated module
+
+        Arguments
+        ---------
+        - sources (dict) : method name -> source code
+        - globals (dict) : globals of the module where to compile the methods
+        """
+        self.sources = sources
+        self.globals = globals
+        self.module  = globals.get('__name__', 'generated')
+        self.classes = []
+
+        TABLES.append(self)
+
+    def __len__(self):
+        return len(self.sources)
+
+    def __str__(self):
+        return f"<MethodTable {self.module}: {len(self.sources)} methods>"
+
+    # ----------------------------------------------------------------------------------------------------
+    # Compile a method
+
+    def build(self, name):
+        """ > Compile the source code of a method
+
+        The source code of the methods is indented as in a class: it is compiled in an 'if' block
+        to keep the docstrings unchanged. The source code is registered in <*linecache>.
+
+        Arguments
+        ---------
+        - name (str) : method name
+
+        Returns
+        -------
+        - function, classmethod or property
+        """
+        source = self.sources[name].lstrip("\n").rstrip() + "\n"
+        if source[:1] in (' ', '\t'):
+            source = "if True:\n" + source
+
+        file_name = f"<{self.module}.{name}>"
+        linecache.cache[file_name] = (len(source), None, source.splitlines(True), file_name)
+
+        ns = {}
+        exec(compile(source, file_name, 'exec'), self.globals, ns)
+
+        return ns[name]
+
+    # ----------------------------------------------------------------------------------------------------
+    # Install in a class
+
+    def install(self, cls):
+        """ > Install lazy placeholders for all the methods in a class
+
+        Arguments
+        ---------
+        - cls (class) : the generated class
+
+        Returns
+        -------
+        - class
+        """
+        for name, source in self.sources.items():
+            if dedent(source).lstrip().startswith('@property'):
+                setattr(cls, name, LazyProperty(self, cls, name))
+            else:
+                setattr(cls, name, LazyMethod(self, cls, name))
+
+        self.classes.append(cls)
+        return cls
+
+    # ----------------------------------------------------------------------------------------------------
+    # Module level functions
+
+    def module_getattr(self, name):
+        """ > Module level __getattr__ for modules of functions
+
+        ``` python
+        __getattr__ = MethodTable(FUNCTIONS, globals()).module_getattr
+        ```
+
+        Arguments
+        ---------
+        - name (str) : function name
+
+        Returns
+        -------
+        - function
+        """
+        if name not in self.sources:
+            raise AttributeError(f"module '{self.module}' has no attribute '{name}'")
+
+        func = self.build(name)
+        self.globals[name] = func
+        return func
+
+    def module_dir(self):
+        """ > Module level __dir__ for modules of functions
+        """
+        return sorted(set(self.globals.keys()) | set(self.sources.keys()))
+
+    # ----------------------------------------------------------------------------------------------------
+    # Compile everything
+
+    def materialize(self):
+        """ > Compile all the lazy methods
+
+        Used by tools which read the class dictionaries, such as the documentation generator.
+        """
+        for cls in self.classes:
+            for name in self.sources:
+                member = cls.__dict__.get(name)
+                if isinstance(member, LazyMethod):
+                    member.build()
+
+        if not self.classes:
+            for name in self.sources:
+                if name not in self.globals:
+                    self.module_getattr(name)
+
+def materialize(load=True):
+    """ > Compile all the lazy methods of all the tables
+
+    Arguments
+    ---------
+    - load (bool = True) : load first all the generated modules
+
+    Returns
+    -------
+    - int : number of methods
+    """
+    if load:
+        from . import generated
+        for name in generated.LAZY:
+            getattr(generated, name)
+
+    count = 0
+    for table in TABLES:
+        table.materialize()
+        count += len(table)
+    return count
+
+def stats():
+    """ > Number of compiled methods per module
+
+    Returns
+    -------
+    - dict : module -> (compiled, total)
+    """
+    res = {}
+    for table in TABLES:
+        if table.classes:
+            compiled = sum(1 for cls in table.classes for name in table.sources if not isinstance(cls.__dict__.get(name), LazyMethod))
+        else:
+            compiled = sum(1 for name in table.sources if name in table.globals)
+        res[table.module] = (compiled, len(table))
+    return res
@@ -0,0 +1,512 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : nodespec
+-----------------
+- snapshot of the node specifications for a Blender version
+
+The snapshot is written once per Blender version by <!specexport> which instantiates every node
+type under every combination of its enum and boolean parameters. It is a dict which is saved as
+compressed json in the folder 'specs':
+
+``` python
+{
+    'format'          : 1,
+    'blender_version' : [4, 3, 0],
+    'std_attrs'       : [attributes shared by all the nodes],
+    'trees'           : {tree type: {bl_idname: node spec}},
+}
+```
+
+A node spec has the following structure:
+
+``` python
+{
+    'name'    : node name,
+    'label'   : node label,
+    'attrs'   : [node specific attribute names],
+    'params'  : {parameter name: default value},  # sets of enum flags as {'set': [values]}
+    'enums'   : {enum parameter name: [valid values]},
+    'drivers' : [parameters which drive the sockets],
+    'sockets' : [[name, identifier, type, label, is_multi_input], ...],
+    'layouts' : [{'inputs': [[socket, enabled], ...], 'outputs': [[socket, enabled], ...]}, ...],
+    'states'  : {state key: [layout, {enum parameter name: [valid values]} or None]},
+    'default' : state key of the default parameters,
+}
+```
+
+The state key is made of the values of the driving parameters, see <#state_key>.
+
+<!SpecTree>, <!SpecNode> and <!SpecSocket> mimic the Blender RNA classes from the snapshot:
+changing a driving parameter of a <!SpecNode> updates its sockets as the Blender node would do.
+They allow to run the code generator without instantiating Blender nodes.
+
+``` python
+from geonodes.core import nodespec
+
+specs = nodespec.load()
+tree  = nodespec.SpecTree(specs, 'GeometryNodeTree')
+node  = tree.nodes.new(type='ShaderNodeMath')
+node.operation = 'MULTIPLY_ADD'
+print([socket.name for socket in node.inputs if socket.enabled])
+```
+
+<#predict> gives the socket layout of a Blender node from the snapshot of the running version:
+only the driving parameters are read from RNA. It is used by <!Node> to resolve the socket names
+(see <!Node#PREDICT_SOCKETS>).
+
+updates
+-------
+- creation : 2025/02/17
+- update :   2025/02/17 # socket layout prediction
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import gzip
+import json
+from pathlib import Path
+
+from .scripterror import NodeError
+
+FORMAT = 1
+
+SPECS_FOLDER = Path(__file__).parent / 'specs'
+
+# Loaded snapshots: file name -> specs
+_CACHE = {}
+
+# =============================================================================================================================
+# Files
+
+def current_version():
+    """ > Running Blender version
+
+    Returns
+    -------
+    - tuple of ints
+    """
+    import bpy
+    return tuple(bpy.app.version)
+
+def spec_file(version=None):
+    """ > Snapshot file for a Blender version
+
+    Patch versions share the same snapshot.
+
+    Arguments
+    ---------
+    - version (tuple = None) : Blender version, running version if None
+
+    Returns
+    -------
+    - Path
+    """
+    if version is None:
+        version = current_version()
+    return SPECS_FOLDER / f"nodes_{version[0]}_{version[1]}.json.gz"
+
+def save(specs, file_name=None):
+    """ > Save a snapshot
+
+    Arguments
+    ---------
+    - specs (dict) : the snapshot
+    - file_name (str = None) : file name, <#spec_file> of the snapshot version if None
+
+    Returns
+    -------
+    - Path
+    """
+    path = Path(spec_file(specs['blender_version']) if file_name is None else file_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    s = json.dumps(specs, separators=(',', ':'))
+    if path.suffix == '.gz':
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(s)
+    else:
+        path.write_text(s, encoding='utf-8')
+
+    _CACHE.pop(str(path), None)
+    return path
+
+def load(file_name=None, version=None, halt=True):
+    """ > Load a snapshot
+
+    The loaded snapshots are cached.
+
+    Arguments
+    ---------
+    - file_name (str = None) : file name, <#spec_file> of the version if None
+    - version (tuple = None) : Blender version, running version if None
+    - halt (bool = True) : raise an error if the file doesn't exist, return None otherwise
+
+    Returns
+    -------
+    - dict : the snapshot
+    """
+    path = Path(spec_file(version) if file_name is None else file_name)
+    key = str(path)
+    if key in _CACHE:
+        return _CACHE[key]
+
+    if not path.exists():
+        if halt:
+            raise NodeError(f"Node specifications file '{path}' not found: export it with generation.specexport.export()")
+        return None
+
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            specs = json.load(f)
+    else:
+        specs = json.loads(path.read_text(encoding='utf-8'))
+
+    if specs.get('format') != FORMAT:
+        raise NodeError(f"Node specifications file '{path}' has format {specs.get('format')}, {FORMAT} is expected")
+
+    _CACHE[key] = specs
+    return specs
+
+# =============================================================================================================================
+# States
+
+def state_key(spec, values):
+    """ > Key of the state of a node
+
+    The key joins the values of the driving parameters in the order of spec['drivers'].
+
+    Arguments
+    ---------
+    - spec (dict) : node spec
+    - values (dict) : parameter name -> value, the default values are used for the missing ones
+
+    Returns
+    -------
+    - str
+    """
+    params = spec['params']
+    return "|".join(str(values.get(name, params[name])) for name in spec['drivers'])
+
+def node_spec(specs, tree_type, bl_idname):
+    """ > Spec of a node
+
+    Arguments
+    ---------
+    - specs (dict) : the snapshot
+    - tree_type (str) : tree type
+    - bl_idname (str) : node type
+
+    Returns
+    -------
+    - dict or None
+    """
+    return specs['trees'].get(tree_type, {}).get(bl_idname)
+
+# =============================================================================================================================
+# RNA stand-ins
+
+class SpecSocket:
+
+    __slots__ = ('name', 'identifier', 'type', 'label', 'is_multi_input', 'enabled', 'is_output', 'node')
+
+    def __init__(self, record, enabled, is_output, node):
+        self.name, self.identifier, self.type, self.label, self.is_multi_input = record
+        self.enabled   = bool(enabled)
+        self.is_output = is_output
+        self.node      = node
+
+    def __str__(self):
+        return f"<SpecSocket {self.name} ({self.identifier}, {self.type}{'' if self.enabled else ', disabled'})>"
+
+    def __repr__(self):
+        return str(self)
+
+class SpecSockets(list):
+    """ List of sockets accessible by index or by name as Blender collections"""
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for socket in self:
+                if socket.name == key:
+                    return socket
+            raise KeyError(f"bpy_prop_collection[key]: key \"{key}\" not found")
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        for socket in self:
+            if socket.name == key:
+                return socket
+        return default
+
+class Opaque:
+    """ Attribute which is not a parameter (pointer or collection)"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return f"<{self.name}>"
+
+class SpecNode:
+
+    def __init__(self, spec, bl_idname, std_attrs=()):
+        """ > Node built from its spec
+
+        Arguments
+        ---------
+        - spec (dict) : node spec
+        - bl_idname (str) : node type
+        - std_attrs (list) : attributes shared by all the nodes
+        """
+        d = self.__dict__
+        d['_spec']      = spec
+        d['_std_attrs'] = std_attrs
+        d['_values']    = {name: set(value['set']) if isinstance(value, dict) else value for name, value in spec['params'].items()}
+        d['_enums']     = spec['enums']
+        d['_state']     = None
+        d['bl_idname']  = bl_idname
+        d['name']       = spec['name']
+        d['label']      = spec['label']
+        d['inputs']     = SpecSockets()
+        d['outputs']    = SpecSockets()
+
+        self._update()
+
+    def __str__(self):
+        return f"<SpecNode {self.name} ({self.bl_idname})>"
+
+    def __repr__(self):
+        return str(self)
+
+    def __dir__(self):
+        return list(self._std_attrs) + list(self._spec['attrs'])
+
+    @property
+    def is_known_state(self):
+        """ The parameters correspond to a state recorded in the snapshot"""
+        return self._state is not None
+
+    # ----------------------------------------------------------------------------------------------------
+    # Parameters
+
+    def __getattr__(self, name):
+        values = self.__dict__['_values']
+        if name in values:
+            return values[name]
+        if name in self.__dict__['_spec']['attrs']:
+            return Opaque(name)
+        raise AttributeError(f"'{self.bl_idname}' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        if name not in self._values:
+            self.__dict__[name] = value
+            return
+
+        enums = self._enums.get(name)
+        if enums is not None and value not in enums:
+            raise TypeError(f"bpy_struct: item.attr = val: enum \"{value}\" not found in {tuple(enums)!r}")
+
+        self._values[name] = value
+        if name in self._spec['drivers']:
+            self._update()
+
+    # ----------------------------------------------------------------------------------------------------
+    # Sockets
+
+    def _update(self):
+        """ Update the sockets and the enum lists from the current state
+
+        An unknown state keeps the previous sockets.
+        """
+        spec  = self._spec
+        key   = state_key(spec, self._values)
+        state = spec['states'].get(key)
+
+        self.__dict__['_state'] = None if state is None else key
+        if state is None:
+            return
+
+        layout, enums = state
+        self.__dict__['_enums'] = spec['enums'] if enums is None else {**spec['enums'], **enums}
+
+        sockets = spec['sockets']
+        layout  = spec['layouts'][layout]
+        for in_out, is_output in (('inputs', False), ('outputs', True)):
+            coll = self.__dict__[in_out]
+            coll.clear()
+            coll.extend(SpecSocket(sockets[index], enabled, is_output, self) for index, enabled in layout[in_out])
+
+class SpecNodes(list):
+    """ Nodes of a <!SpecTree>"""
+
+    def __init__(self, tree):
+        super().__init__()
+        self.tree = tree
+
+    def new(self, type):
+        spec = self.tree.tree_specs.get(type)
+        if spec is None:
+            raise RuntimeError(f"NodeTree.nodes.new(): Node type {type} undefined")
+        node = SpecNode(spec, type, self.tree.specs['std_attrs'])
+        self.append(node)
+        return node
+
+    def remove(self, node):
+        super().remove(node)
+
+class SpecTree:
+
+    def __init__(self, specs, tree_type='GeometryNodeTree', name='Specs'):
+        """ > Node tree built from a snapshot
+
+        Arguments
+        ---------
+        - specs (dict) : the snapshot
+        - tree_type (str = 'GeometryNodeTree') : tree type
+        - name (str = 'Specs') : tree name
+        """
+        if tree_type not in specs['trees']:
+            raise NodeError(f"Node specifications: tree type '{tree_type}' not in the snapshot", valids=list(specs['trees'].keys()))
+
+        self.specs      = specs
+        self.tree_specs = specs['trees'][tree_type]
+        self.bl_idname  = tree_type
+        self.name       = name
+        self.nodes      = SpecNodes(self)
+
+    def __str__(self):
+        return f"<SpecTree {self.name} ({self.bl_idname}), {len(self.nodes)} nodes>"
+
+    @property
+    def node_types(self):
+        """ bl_idnames of the nodes available in the tree"""
+        return list(self.tree_specs.keys())
+
+# =============================================================================================================================
+# Socket layout prediction
+
+# Snapshot of the running version, False if not available
+_RUNTIME = None
+
+# Predictable nodes: (tree type, bl_idname) -> node spec or False
+_PREDICTABLE = {}
+
+# Predicted layouts: (tree type, bl_idname, state key) -> (inputs, outputs) or False
+_LAYOUTS = {}
+
+# Nodes with dynamic sockets: sockets created from items, from a paired node or from a tree interface
+DYNAMIC_ATTRS = ('active_item', 'paired_output', 'node_tree')
+DYNAMIC_NODES = ('NodeGroupInput', 'NodeGroupOutput')
+
+def is_dynamic(spec, bl_idname):
+    """ > The sockets of the node don't only depend on its parameters
+
+    Arguments
+    ---------
+    - spec (dict) : node spec
+    - bl_idname (str) : node type
+
+    Returns
+    -------
+    - bool
+    """
+    if bl_idname in DYNAMIC_NODES:
+        return True
+    return any(name in DYNAMIC_ATTRS or name.endswith('_items') for name in spec['attrs'])
+
+def runtime_specs():
+    """ > Snapshot of the running Blender version
+
+    Returns
+    -------
+    - dict or None if the snapshot doesn't exist
+    """
+    global _RUNTIME
+
+    if _RUNTIME is None:
+        try:
+            _RUNTIME = load(halt=False) or False
+        except Exception as e:
+            print(f"Node specifications snapshot not loaded: {e}")
+            _RUNTIME = False
+
+    return _RUNTIME or None
+
+def predict(bnode, tree_type):
+    """ > Socket layout of a Blender node predicted from its driving parameters
+
+    Only the driving parameters are read from the node, the sockets are given by the snapshot.
+    The sockets are given as tuples (index, name, identifier, type, label, enabled).
+
+    The layout of nodes with dynamic sockets (see <#is_dynamic>) is not predicted.
+
+    Arguments
+    ---------
+    - bnode (Node) : Blender node
+    - tree_type (str) : tree type
+
+    Returns
+    -------
+    - tuple (state key, input sockets, output sockets) or None if the layout is unknown
+    """
+    specs = runtime_specs()
+    if specs is None:
+        return None
+
+    bl_idname = bnode.bl_idname
+    node_key  = (tree_type, bl_idname)
+
+    spec = _PREDICTABLE.get(node_key)
+    if spec is None:
+        spec = node_spec(specs, tree_type, bl_idname)
+        if spec is None or is_dynamic(spec, bl_idname):
+            spec = False
+        _PREDICTABLE[node_key] = spec
+    if spec is False:
+        return None
+
+    key = state_key(spec, {name: getattr(bnode, name) for name in spec['drivers']})
+    cache_key = (tree_type, bl_idname, key)
+
+    layout = _LAYOUTS.get(cache_key)
+    if layout is None:
+        state = spec['states'].get(key)
+        if state is None:
+            layout = False
+        else:
+            sockets = spec['sockets']
+            lay = spec['layouts'][state[0]]
+            layout = tuple(
+                tuple((i, *sockets[index][:4], bool(enabled)) for i, (index, enabled) in enumerate(lay[in_out]))
+                for in_out in ('inputs', 'outputs'))
+        _LAYOUTS[cache_key] = layout
+
+    if layout is False:
+        return None
+
+    return (key, *layout)
@@ -25,14 +25,230 @@ module : pyswitch
 
 Mimic if else elif python syntax
 
+Index switches over python constants are replaced by a lookup table, see <#lookup_switch>.
+
 updates
 -------
 - creation : 2025/01/15
+- update :   2025/02/17 # lookup tables for constant options
 """
 
+import hashlib
+import numpy as np
+
 from . import utils
 from . scripterror import NodeError
 
+# Min number of constant options to read the options in a lookup table rather than in a Index Switch
+LOOKUP_MIN = 8
+
+# Socket type -> attribute data type, attribute property, value size
+LOOKUP_TYPES = {
+    'VALUE'   : ('FLOAT',        'value',  1),
+    'INT'     : ('INT',          'value',  1),
+    'BOOLEAN' : ('BOOLEAN',      'value',  1),
+    'VECTOR'  : ('FLOAT_VECTOR', 'vector', 3),
+    'RGBA'    : ('FLOAT_COLOR',  'color',  4),
+    }
+
+# =============================================================================================================================
+# Lookup tables
+
+def is_constant(value):
+    """ > The option is a python constant
+
+    None is the default value of an option which is not plugged.
+
+    Arguments
+    ---------
+    - value (any) : option
+
+    Returns
+    -------
+    - bool
+    """
+    import bpy
+    from .socket_class import Socket
+
+    if value is None or isinstance(value, (bool, int, float, np.number)):
+        return True
+    if isinstance(value, (str, Socket, bpy.types.NodeSocket)):
+        return False
+    try:
+        a = np.asarray(value, dtype=float)
+    except Exception:
+        return False
+    return a.ndim == 1 and len(a) in (3, 4)
+
+def _table_attributes(socket_type, values, slots=None):
+    """ Point attributes of a lookup table
+
+    The option values are stored in the 'value' attribute. When some options are sockets,
+    the 'slot' attribute gives 1 + their index in the real switch, 0 for the constant options.
+
+    Arguments
+    ---------
+    - socket_type (str) : key of LOOKUP_TYPES
+    - values (list) : python constants, None for the options which are not constant
+    - slots (list of ints = None) : slot per option
+
+    Returns
+    -------
+    - dict : attribute name -> (data type, property, array)
+    """
+    data_type, prop, size = LOOKUP_TYPES[socket_type]
+
+    a = np.zeros((len(values), size), float)
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        value = np.asarray(value, dtype=float).ravel()
+        if socket_type == 'RGBA' and len(value) != 4:
+            a[i] = tuple(np.resize(value, 3)) + (1.,)
+        else:
+            a[i] = np.resize(value, size)
+
+    if data_type == 'BOOLEAN':
+        a = a[:, 0] != 0
+    elif data_type == 'INT':
+        a = np.round(a[:, 0]).astype(np.int32)
+    elif size == 1:
+        a = a[:, 0].astype(np.float32)
+    else:
+        a = a.astype(np.float32)
+
+    attributes = {'value': (data_type, prop, a)}
+    if slots is not None:
+        attributes['slot'] = ('INT', 'value', np.asarray(slots, dtype=np.int32))
+
+    return attributes
+
+def table_object(name, attributes, rewrite=False):
+    """ > Hidden object with one vertex per option and the table point attributes
+
+    The object is shipped with the tree by <!treeserial>.
+
+    Arguments
+    ---------
+    - name (str) : object name, less than 64 characters
+    - attributes (dict) : attribute name -> (data type, property, array)
+    - rewrite (bool = False) : rewrite the mesh if the object already exists
+
+    Returns
+    -------
+    - Object
+    """
+    import bpy
+
+    obj = bpy.data.objects.get(name)
+    if obj is not None and not rewrite:
+        return obj
+
+    if obj is None:
+        obj = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+        obj.hide_viewport = True
+        obj.hide_render = True
+        bpy.context.scene.collection.objects.link(obj)
+
+    write_table(obj, attributes)
+
+    return obj
+
+def write_table(obj, attributes):
+    """ > Write the table point attributes in the mesh of an object
+
+    Arguments
+    ---------
+    - obj (Object) : mesh object
+    - attributes (dict) : attribute name -> (data type, property, array)
+    """
+    mesh = obj.data
+    mesh.clear_geometry()
+    for attr_name in attributes:
+        if attr_name in mesh.attributes:
+            mesh.attributes.remove(mesh.attributes[attr_name])
+
+    count = len(attributes['value'][2])
+    mesh.vertices.add(count)
+    for attr_name, (data_type, prop, a) in attributes.items():
+        mesh.attributes.new(attr_name, data_type, 'POINT').data.foreach_set(prop, a.ravel())
+    mesh.update()
+
+def _sample(geometry, name, data_type, index):
+    from geonodes import nd
+    return nd.sample_index(geometry, nd.named_attribute(name, data_type=data_type), index, data_type=data_type, domain='POINT')
+
+def lookup_switch(socket_class, values, index):
+    """ > Index Switch reading the constant options in a lookup table
+
+    When at least **LOOKUP_MIN** options are python constants, they are stored as point attribute of
+    a hidden object and read with a single <&Node Sample Index>. The name of the object is built
+    from the hash of the table in order to be shared by the trees using the same options.
+
+    The options which are sockets are plugged in a real <&Node Index Switch>, the 'slot' attribute
+    of the table selects between the two.
+
+    As with the Index Switch, an out of range index gives the default value.
+
+    Arguments
+    ---------
+    - socket_class (type) : class of the switch result
+    - values (list) : options
+    - index (Integer) : option index
+
+    Returns
+    -------
+    - Socket or None if the options can't be read in a lookup table
+    """
+    from geonodes import Tree
+
+    socket_type = getattr(socket_class, 'SOCKET_TYPE', None)
+    if socket_type not in LOOKUP_TYPES or not Tree.is_geonodes:
+        return None
+
+    consts = [is_constant(value) for value in values]
+    if sum(consts) < LOOKUP_MIN:
+        return None
+
+    sockets = [value for value, const in zip(values, consts) if not const]
+    slots = None
+    if sockets:
+        slots = np.cumsum(np.logical_not(consts))*np.logical_not(consts)
+
+    attributes = _table_attributes(socket_type, [value if const else None for value, const in zip(values, consts)], slots)
+
+    h = hashlib.md5(socket_type.encode())
+    for attr_name, (_, _, a) in attributes.items():
+        h.update(attr_name.encode())
+        h.update(a.tobytes())
+    obj = table_object("GN Switch " + h.hexdigest()[:12], attributes)
+
+    return _lookup_sockets(socket_class, obj, index, sockets)
+
+def _lookup_sockets(socket_class, obj, index, sockets=None, real=None):
+    """ Read the lookup table and select between the table and the real switch
+
+    Returns
+    -------
+    - Socket
+    """
+    from geonodes import nd
+
+    data_type = LOOKUP_TYPES[socket_class.SOCKET_TYPE][0]
+
+    geo = nd.object_info(obj).geometry_
+    value = socket_class(_sample(geo, 'value', data_type, index))
+    if not sockets and real is None:
+        return value
+
+    slot = _sample(geo, 'slot', 'INT', index)
+    if real is None:
+        real = socket_class.IndexSwitch(*sockets, index=slot - 1)
+    else:
+        real.node["Index"] = slot - 1
+
+    return socket_class.Switch(slot.greater_than(0), false=value, true=real)
+
 # =============================================================================================================================
 # Root class
 
@@ -56,7 +272,7 @@ class IfElse:
 # If class
 
 class If(IfElse):
-    def __init__(self, socket_class, selector, name="Menu", tip=""):
+    def __init__(self, socket_class, selector, name="Menu", tip="", lookup=False):
         """ Initialize If syntax mimicing
 
         This class, together with <!Else> and <!Elif> classes, propose and alternative
@@ -143,6 +359,21 @@ class If(IfElse):
         geo.out()
         ```
 
+        ### Lookup table
+
+        When the options are python constants, **lookup** argument stores them in a lookup table
+        read by a single "Sample Index" node rather than in the "Index Switch" node (see <#lookup_switch>).
+        The options which are sockets are still plugged in the "Index Switch".
+
+        ``` python
+        with If(Integer, digit, lookup=True) as segments:
+            segments.option = 0b1111110
+
+        for code in (0b0110000, 0b1101101, 0b1111001, 0b0110011, 0b1011011, 0b1011111, 0b1110000, 0b1111111, 0b1111011):
+            with Elif(segments):
+                segments.option = code
+        ```
+
         ### Menu Switch
 
         A "Menu Switch" works similarily by initializing the ***If*** with a ***python string**.
@@ -187,9 +418,10 @@ class If(IfElse):
           str: name of the first option in the menu
         - name (str = "Menu") : name of menu socket
         - tip (str = "") : user tip (used in menu creation and in Layout names)
+        - lookup (bool = False) : store the constant options of an "Index Switch" in a lookup table
         """
 
-        from geonodes import Node
+        from geonodes import Node, Tree
 
         self.socket_class = socket_class
         self.selector     = selector
@@ -197,6 +429,7 @@ class If(IfElse):
         self.current      = 0
         self.name         = name
         self.tip          = tip
+        self.lookup       = False
 
         if self.sel_type == 'BOOLEAN':
             self.node_name = "Switch"
@@ -214,6 +447,19 @@ class If(IfElse):
             self.enum_items = self.node._bnode.index_switch_items
             self.enum_items.clear()
 
+            # The Index Switch only receives the socket options, the table is rewritten at each option
+            self.lookup = lookup and getattr(socket_class, 'SOCKET_TYPE', None) in LOOKUP_TYPES and Tree.is_geonodes
+            if self.lookup:
+                self.lookup_values = []
+                self.lookup_slots  = []
+                # Blender names are limited to 63 characters
+                key = f"{Tree.current_tree._btree.name}/{self.node._bnode.name}"
+                self.lookup_name   = "GN Switch " + hashlib.md5(key.encode()).hexdigest()[:12]
+                self.lookup_obj    = None
+                self._update_table()
+
+                self.socket = _lookup_sockets(self.socket_class, self.lookup_obj, self.selector, real=self.socket)
+
             self.layout_name = f"Index Switch (0) - {tip}"
 
         elif isinstance(selector, str):
@@ -232,6 +478,20 @@ class If(IfElse):
 
         self.socket._if = self
 
+    # ----------------------------------------------------------------------------------------------------
+    # Lookup table
+
+    def _update_table(self):
+        """ Write the options in the lookup table object
+        """
+        values = self.lookup_values if self.lookup_values else [None]
+        slots  = self.lookup_slots if self.lookup_slots else [0]
+        attributes = _table_attributes(self.socket_class.SOCKET_TYPE, values, slots)
+        if self.lookup_obj is None:
+            self.lookup_obj = table_object(self.lookup_name, attributes, rewrite=True)
+        else:
+            write_table(self.lookup_obj, attributes)
+
     # ----------------------------------------------------------------------------------------------------
     # Set option
 
@@ -258,8 +518,23 @@ class If(IfElse):
 
         elif self.node_name == "Index Switch":
 
-            self.enum_items.new()
-            self.node[1 + self.current] = socket
+            if self.lookup:
+                n = self.current + 1
+                self.lookup_values.extend([None]*(n - len(self.lookup_values)))
+                self.lookup_slots.extend([0]*(n - len(self.lookup_slots)))
+
+                if is_constant(socket):
+                    self.lookup_values[self.current] = socket
+                else:
+                    self.enum_items.new()
+                    self.node[len(self.enum_items)] = socket
+                    self.lookup_slots[self.current] = len(self.enum_items)
+
+                self._update_table()
+
+            else:
+                self.enum_items.new()
+                self.node[1 + self.current] = socket
 
         elif self.node_name == "Menu Switch":
 
@@ -0,0 +1,321 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : quadrature
+-------------------
+- quadrature rules used by <!macros#integrals> and <!macros#double_integrals>
+
+The rules are computed with numpy when the tree is built: the nodes are given in the unit
+interval (or unit square) and the weights sum to 1. The macros store them as point positions and
+a weight attribute, the integral is the weighted sum multiplied by the size of the domain.
+
+Methods:
+- 'riemann' : count + 1 evenly spaced points with equal weights (historical behavior)
+- 'simpson' : composite Simpson rule on count intervals (rounded to the upper even number)
+- 'gauss' : composite Gauss-Legendre rule on count points (rounded to the upper multiple of **order**), panels of **order** points
+- 'adaptive' : Gauss-Legendre panels. The error of a panel is estimated by comparing the rule
+  on the panel with the rule on its halves; the panels with a too large error are refined
+
+<#integrate> is the numpy reference of the macros. <#benchmark> compares the accuracy of the
+methods against analytic integrals:
+
+``` python
+from geonodes.core import quadrature
+
+quadrature.report(quadrature.benchmark())
+```
+
+updates
+-------
+- creation : 2025/02/17
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import math
+import numpy as np
+
+METHODS = ('riemann', 'simpson', 'gauss', 'adaptive')
+
+# Points per panel and per axis of the Gauss-Legendre rules
+GAUSS_ORDER = 5
+
+# Sub panels per axis of the refined panels
+REFINE = 4
+
+# =============================================================================================================================
+# Rules
+
+def gauss_legendre(order):
+    """ > Gauss-Legendre rule on the unit interval
+
+    Arguments
+    ---------
+    - order (int) : number of points
+
+    Returns
+    -------
+    - couple of arrays : nodes, weights summing to 1
+    """
+    x, w = np.polynomial.legendre.leggauss(order)
+    return (x + 1)/2, w/2
+
+def rule_1d(method, count, order=GAUSS_ORDER):
+    """ > One dimensional rule on the unit interval
+
+    The meaning of **count** depends on the method:
+    - 'riemann' and 'simpson' : number of intervals, the rule has count + 1 points
+      (count is rounded to the upper even number for 'simpson')
+    - 'gauss' : number of points, rounded to the upper multiple of **order** when count > order
+
+    Arguments
+    ---------
+    - method (str in ('riemann', 'simpson', 'gauss')) : quadrature method
+    - count (int) : number of intervals ('riemann', 'simpson') or of points ('gauss')
+    - order (int = GAUSS_ORDER) : number of points of the Gauss-Legendre panels
+
+    Returns
+    -------
+    - couple of arrays : nodes, weights summing to 1
+    """
+    count = max(1, int(count))
+
+    if method == 'riemann':
+        return np.linspace(0, 1, count + 1), np.full(count + 1, 1/(count + 1))
+
+    elif method == 'simpson':
+        n = count + count % 2
+        w = np.ones(n + 1)
+        w[1:-1:2] = 4
+        w[2:-1:2] = 2
+        return np.linspace(0, 1, n + 1), w/(3*n)
+
+    elif method == 'gauss':
+        order  = min(order, count)
+        panels = max(1, math.ceil(count/order))
+        u, w = gauss_legendre(order)
+        u = ((np.arange(panels)[:, None] + u[None])/panels).ravel()
+        w = np.tile(w/panels, panels)
+        return u, w
+
+    raise ValueError(f"Unknown quadrature method '{method}', valid methods are {METHODS[:-1]}")
+
+def rule(method, counts, order=GAUSS_ORDER):
+    """ > Tensor product of one dimensional rules
+
+    Arguments
+    ---------
+    - method (str) : quadrature method, see <#rule_1d>
+    - counts (tuple of ints) : number of intervals or points per axis, see <#rule_1d>
+
+    Returns
+    -------
+    - couple of arrays : nodes (shape (n, dims)), weights summing to 1
+    """
+    rules = [rule_1d(method, count, order) for count in counts]
+
+    grids = np.meshgrid(*[u for u, _ in rules], indexing='ij')
+    weights = np.ones(1)
+    for _, w in rules:
+        weights = np.multiply.outer(weights, w)
+
+    return np.stack([g.ravel() for g in grids], axis=-1), weights.ravel()
+
+def panel_rule(panels, dims, split=1, order=GAUSS_ORDER):
+    """ > Gauss-Legendre rule on panels of the unit box
+
+    The points of a panel are contiguous.
+
+    Arguments
+    ---------
+    - panels (int) : number of panels per axis
+    - dims (int) : number of dimensions
+    - split (int = 1) : the panels are split in split^dims sub panels
+    - order (int = GAUSS_ORDER) : points per sub panel and per axis
+
+    Returns
+    -------
+    - triplet of arrays : nodes (shape (n, dims)), weights summing to 1, panel index
+    """
+    u, w = rule('gauss', (order*split,)*dims, order)
+
+    # Panel local rule
+    u = u/panels
+
+    corners = np.stack(np.meshgrid(*[np.arange(panels)]*dims, indexing='ij'), axis=-1).reshape(-1, dims)/panels
+    n = len(corners)
+
+    nodes   = (corners[:, None] + u[None]).reshape(-1, dims)
+    weights = np.tile(w/n, n)
+    panel   = np.repeat(np.arange(n), len(w))
+
+    return nodes, weights, panel
+
+def adaptive_layout(count, dims, order=GAUSS_ORDER, refine=REFINE):
+    """ > Points of the adaptive method
+
+    The first level contains, for each panel, the points of the rule on the whole panel (part 0)
+    followed by the points of the rule on its halves (part 1). The second level contains
+    the points of the refined panels.
+
+    Arguments
+    ---------
+    - count (int) : number of points per axis of the rule on the whole domain, gives the number of panels
+    - dims (int) : number of dimensions
+    - order (int = GAUSS_ORDER) : points per panel and per axis
+    - refine (int = REFINE) : sub panels per axis of the refined panels
+
+    Returns
+    -------
+    - dict : 'panels', 'per_panel', 'level1' (nodes, weights, panel, part), 'level2' (nodes, weights, panel)
+    """
+    panels = max(1, int(count)//order)
+
+    u0, w0, p0 = panel_rule(panels, dims, 1, order)
+    u1, w1, p1 = panel_rule(panels, dims, 2, order)
+
+    n = panels**dims
+    k0, k1 = len(w0)//n, len(w1)//n
+
+    nodes   = np.concatenate([u0.reshape(n, k0, dims), u1.reshape(n, k1, dims)], axis=1).reshape(-1, dims)
+    weights = np.concatenate([w0.reshape(n, k0), w1.reshape(n, k1)], axis=1).ravel()
+    panel   = np.repeat(np.arange(n), k0 + k1)
+    part    = np.tile(np.concatenate([np.zeros(k0), np.ones(k1)]), n)
+
+    return {
+        'panels'    : panels,
+        'per_panel' : k0 + k1,
+        'level1'    : (nodes, weights, panel, part),
+        'level2'    : panel_rule(panels, dims, refine, order),
+        }
+
+# =============================================================================================================================
+# Numpy reference
+
+def integrate(func, bounds, method='gauss', count=100, order=GAUSS_ORDER, refine=REFINE, tolerance=1e-6):
+    """ > Integral computed as the macros do
+
+    Arguments
+    ---------
+    - func (function) : vectorized function of the coordinates
+    - bounds (list of couples) : integration interval per axis
+    - method (str = 'gauss') : quadrature method
+    - count (int = 100) : number of intervals or points per axis, see <#rule_1d>
+    - order (int = GAUSS_ORDER) : Gauss-Legendre order
+    - refine (int = REFINE) : sub panels per axis of the refined panels
+    - tolerance (float = 1e-6) : absolute tolerance of the adaptive method
+
+    Returns
+    -------
+    - couple : integral, number of evaluated points
+    """
+    lo = np.array([b[0] for b in bounds], float)
+    hi = np.array([b[1] for b in bounds], float)
+    size = float(np.prod(hi - lo))
+    dims = len(bounds)
+
+    def f(u):
+        x = lo + u*(hi - lo)
+        return func(*[x[:, i] for i in range(dims)])
+
+    if method != 'adaptive':
+        u, w = rule(method, (count,)*dims, order)
+        return size*np.sum(f(u)*w), len(w)
+
+    layout = adaptive_layout(count, dims, order, refine)
+    u1, w1, p1, part = layout['level1']
+    u2, w2, p2 = layout['level2']
+    n = layout['panels']**dims
+
+    v1 = f(u1)*w1
+    error = np.abs(np.bincount(p1, v1*(1 - 2*part), minlength=n))*abs(size)
+    flag = error > tolerance/n
+
+    keep = flag[p2]
+    value = np.sum(v1[(part == 1) & ~flag[p1]]) + np.sum(f(u2[keep])*w2[keep])
+
+    return size*value, len(w1) + int(np.sum(keep))
+
+# =============================================================================================================================
+# Benchmark
+
+CASES_1D = [
+    ("x on [0, 1]",             lambda x: x,                 [(0, 1)],        .5),
+    ("sin on [0, pi]",          np.sin,                      [(0, np.pi)],    2.),
+    ("exp on [0, 1]",           np.exp,                      [(0, 1)],        math.e - 1),
+    ("sqrt on [0, 1]",          np.sqrt,                     [(0, 1)],        2/3),
+    ("1/(1+25x2) on [-1, 1]",   lambda x: 1/(1 + 25*x**2),   [(-1, 1)],       .4*math.atan(5)),
+    ]
+
+CASES_2D = [
+    ("x.y on [0, 1]2",          lambda x, y: x*y,                   [(0, 1), (0, 1)],                 .25),
+    ("x.cos(y)",                lambda x, y: x*np.cos(y),           [(0, 10), (-np.pi/2, np.pi/2)],   100.),
+    ("exp(-r2) on [-2, 2]2",    lambda x, y: np.exp(-x**2 - y**2),  [(-2, 2), (-2, 2)],               np.pi*math.erf(2)**2),
+    ]
+
+def benchmark(counts=(4, 8, 16, 32, 64, 128), methods=METHODS, tolerance=1e-8):
+    """ > Accuracy versus number of points of the quadrature methods
+
+    Arguments
+    ---------
+    - counts (tuple of ints) : number of intervals or points per axis, see <#rule_1d>
+    - methods (tuple of str = METHODS) : methods to compare
+    - tolerance (float = 1e-8) : tolerance of the adaptive method
+
+    Returns
+    -------
+    - list of dicts : 'case', 'method', 'count', 'points', 'value', 'error'
+    """
+    res = []
+    for case, func, bounds, ref in CASES_1D + CASES_2D:
+        for method in methods:
+            for count in counts:
+                if len(bounds) == 2 and count > 64:
+                    continue
+                value, points = integrate(func, bounds, method, count, tolerance=tolerance)
+                res.append({'case': case, 'method': method, 'count': count, 'points': points,
+                            'value': float(value), 'error': abs(float(value) - ref)})
+    return res
+
+def report(res):
+    """ > Print the result of <#benchmark>
+
+    Arguments
+    ---------
+    - res (list of dicts) : benchmark result
+    """
+    case = None
+    for r in res:
+        if r['case'] != case:
+            case = r['case']
+            print()
+            print(case)
+            print(f"{'method':10s} {'count':>6s} {'points':>8s} {'error':>10s}")
+        print(f"{r['method']:10s} {r['count']:6d} {r['points']:8d} {r['error']:10.2e}")
+
+if __name__ == '__main__':
+    report(benchmark())
@@ -26,11 +26,15 @@ module : scripterror
 
 NodeError has specific behaviors and features
 
+The message is formatted when the error is displayed. Values which are expensive
+to compute can be passed as <!Lazy> values.
+
 updates
 -------
 - creation : 2024/07/23
 - update :   2024/09/04
 - update :   2025/01/12
+- update :   2025/02/16 # lazy formatting
 """
 
 __author__ = "Alain Bernard"
@@ -42,7 +46,8 @@ __blender_version__ = "4.3.0"
 
 
 from pprint import pprint
-import inspect
+import sys
+import traceback
 from pathlib import Path
 import bpy
 
@@ -50,64 +55,145 @@ FULL_PATH = False
 NO_STACK_ON_KEYWORD = True
 NO_STACK = True
 
+# Max number of frames read in the stack
+MAX_FRAMES = 30
+
+# Source files lines : file name -> (modification time, lines)
+_source_cache = {}
+
+class Lazy:
+    def __init__(self, func):
+        """ Value computed only when the error message is formatted
+
+        ``` python
+        raise NodeError("Invalid value", valids=Lazy(lambda: compute_valids()))
+        ```
+
+        Arguments
+        ---------
+        - func (function) : function without argument returning the value
+        """
+        self.func = func
+
+    def __str__(self):
+        return str(self.func())
+
 class NodeError(Exception):
 
     def __init__(self, *messages, keyword=None, **kwargs):
-        self.message = "Geometry nodes error\n"
+        """ Geometry nodes error
+
+        The message and the stack are formatted only when the error is displayed:
+        raising and catching a NodeError is cheap.
+        """
+        super().__init__(*messages)
+
+        self._messages = messages
+        self._keyword  = keyword
+        self._kwargs   = kwargs
+        self._message  = None
+
+        # ----- Raw stack, source lines are read when formatting
+
+        if keyword is None and NO_STACK:
+            self._frames = None
+        else:
+            self._frames = traceback.StackSummary.extract(traceback.walk_stack(sys._getframe(1)), limit=MAX_FRAMES, lookup_lines=False)
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = self.format_message()
+        return self._message
+
+    def __str__(self):
+        return self.message
+
+    # ----------------------------------------------------------------------------------------------------
+    # Format the message
 
-        if messages:
-            self.message += '-'*100 + "\n"
+    def format_message(self):
 
-            for msg in messages:
+        message = "Geometry nodes error\n"
+
+        if self._messages:
+            message += '-'*100 + "\n"
+
+            for msg in self._messages:
                 if isinstance(msg, dict):
                     n = max([len(k) for k in msg.keys()])
                     for k, v in msg.items():
-                        self.message += f"- {k:{n}s} : {v}\n"
+                        message += f"- {k:{n}s} : {v}\n"
                 else:
-                    self.message += f"{msg}\n"
+                    message += f"{msg}\n"
 
-        if kwargs:
-            self.message += "\n"
+        if self._kwargs:
+            message += "\n"
 
-            n = max([len(k) for k in kwargs.keys()])
-            for k, v in kwargs.items():
-                self.message += f"- {k:{n}s} : {v}\n"
+            n = max([len(k) for k in self._kwargs.keys()])
+            for k, v in self._kwargs.items():
+                message += f"- {k:{n}s} : {v}\n"
 
-        self.message += '-'*100 + "\n"
+        message += '-'*100 + "\n"
 
-        self.message += "\n"
+        message += "\n"
 
         # ----- stack
 
-        stack_lines = self.stack_lines()
+        keyword = self._keyword
+        stack_lines = []
 
         if keyword is None:
-
-            if NO_STACK:
-                stack_lines = []
+            if not NO_STACK:
+                stack_lines = self.stack_lines()
 
         else:
             item = self.find_keyword(keyword)
 
             if item is None:
-                if NO_STACK or NO_STACK_ON_KEYWORD:
-                    stack_lines = []
+                if not (NO_STACK or NO_STACK_ON_KEYWORD):
+                    stack_lines = self.stack_lines()
 
             else:
                 file_name = item['file_name']
                 lineno = item['lineno']
                 stack_lines = [f"File '{file_name}', line {lineno}", item['code']]
 
-        self.message += "\n".join(stack_lines)
+        message += "\n".join(stack_lines)
 
-    def __str__(self):
-        return self.message
+        return message
 
     # ----------------------------------------------------------------------------------------------------
-    # Loop on the stack
+    # Source lines
 
     @staticmethod
-    def get_stack():
+    def source_lines(file_name):
+        """ Lines of a source file
+
+        The lines are cached, the cache is refreshed when the file is modified.
+        """
+        try:
+            mtime = Path(file_name).stat().st_mtime
+        except OSError:
+            return None
+
+        cached = _source_cache.get(file_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            with open(file_name, 'r') as f:
+                lines = f.readlines()
+        except Exception:
+            return None
+
+        _source_cache[file_name] = (mtime, lines)
+        return lines
+
+    # ----------------------------------------------------------------------------------------------------
+    # Loop on the stack
+
+    def get_stack(self):
 
         # List of dict:
         # - file_name
@@ -115,22 +201,25 @@ class NodeError(Exception):
         # - code
 
         stack = []
+        if self._frames is None:
+            return stack
 
-        for i_frame, frame_info in enumerate(inspect.stack()):
+        # Most recent call first
+        for frame in self._frames:
 
             # ----- Generated source code
 
-            if frame_info.filename == '<string>':
+            if frame.filename == '<string>':
                 continue
 
-            path = Path(frame_info.filename)
+            path = Path(frame.filename)
 
             # ----- Python embedded in a blend file
             # "file.blend/text_name" or "/text_name"" if the file is not saved
 
-            if len(frame_info.filename.split('/')) == 2:
+            if len(frame.filename.split('/')) == 2:
                 blend_text = True
-                text_key   = frame_info.filename[1:]
+                text_key   = frame.filename[1:]
             else:
                 blend_file = path.parents[0]
                 blend_text = blend_file.exists() and not blend_file.is_dir()
@@ -139,11 +228,12 @@ class NodeError(Exception):
 
             # ----- Read from blend text or from the file
 
-            code_line0 = frame_info.lineno - 1
-            code_line1 = frame_info.positions.end_lineno
+            code_line0 = frame.lineno - 1
+            code_line1 = getattr(frame, 'end_lineno', None) or frame.lineno
             code_lines = []
             if blend_text:
-                lines = bpy.data.texts[text_key].lines
+                text = bpy.data.texts.get(text_key)
+                lines = [] if text is None else text.lines
                 code_lines = []
                 for i in range(code_line0, code_line1):
                     try:
@@ -151,15 +241,13 @@ class NodeError(Exception):
                     except:
                         pass
             else:
-                try:
-                    with open(frame_info.filename, 'r') as f:
-                        lines = f.readlines()
-                        code_lines = [f"{i+1}> {lines[i]}" for i in range(code_line0, code_line1)]
-                        if True:
-                            # lines are terminated by \n
-                            code_lines = [("".join(code_lines))[:-1]]
-                except:
-                    code_lines = [f"Impossible to open '{frame_info.filename}'"]
+                lines = NodeError.source_lines(frame.filename)
+                if lines is None:
+                    code_lines = [f"Impossible to open '{frame.filename}'"]
+                else:
+                    code_lines = [f"{i+1}> {lines[i]}" for i in range(code_line0, min(code_line1, len(lines)))]
+                    # lines are terminated by \n
+                    code_lines = [("".join(code_lines))[:-1]]
 
             # ----- Track
 
@@ -170,7 +258,7 @@ class NodeError(Exception):
 
             stack.append({
                 'file_name': file_name,
-                'lineno'    : frame_info.lineno,
+                'lineno'    : frame.lineno,
                 'code'      : "\n".join(code_lines)
 
             })
@@ -180,12 +268,11 @@ class NodeError(Exception):
     # ----------------------------------------------------------------------------------------------------
     # Loop on the stack
 
-    @staticmethod
-    def stack_lines():
+    def stack_lines(self):
 
         stack = ["Traceback (most recent call last):\n"]
 
-        for item in NodeError.get_stack()[2:]:
+        for item in self.get_stack():
             file_name = item['file_name']
             lineno = item['lineno']
             stack.append(f"File '{file_name}', line {lineno}")
@@ -197,8 +284,7 @@ class NodeError(Exception):
     # ----------------------------------------------------------------------------------------------------
     # Search a keyword in the stack
 
-    @staticmethod
-    def find_keyword(keyword):
+    def find_keyword(self, keyword):
 
         if keyword is None:
             return None
@@ -208,8 +294,9 @@ class NodeError(Exception):
         else:
             kws = keyword
 
+        stack = self.get_stack()
         for kw in kws:
-            for item in NodeError.get_stack()[2:]:
+            for item in stack:
                 if item['code'].find("raise") >= 0:
                     continue
                 if item['code'].find(kw) >= 0:
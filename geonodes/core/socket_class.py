@@ -41,6 +41,7 @@ updates
 - creation : 2024/07/23
 - update :   2024/09/04
 - update :   2025/01/12
+- update :   2025/02/17 # IndexSwitch on constant values reads a lookup table
 """
 
 __author__ = "Alain Bernard"
@@ -79,16 +80,44 @@ class NodeCache:
     # The cache is erased with _reset
     # The cache is optionnally erased when a jump occurs
     # It is up to the true class to call _cache_reset
+    #
+    # When no cache_name is given, the key is built from the node name, the input sockets
+    # and the parameters. Sockets are identified by the pointer of the Blender socket:
+    # after a jump, the key of the geometry changes and the cached nodes can't be reused.
 
     def _cache_reset(self):
         self._cached_nodes = {}
 
+    @staticmethod
+    def _cache_key(value):
+
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+
+        if isinstance(value, dict):
+            return tuple((k, NodeCache._cache_key(v)) for k, v in value.items())
+
+        if isinstance(value, (tuple, list)):
+            return tuple(NodeCache._cache_key(v) for v in value)
+
+        # Domain -> geometry
+        value = getattr(value, '_domain_to_geometry', value)
+
+        bsocket = utils.get_bsocket(value)
+        if bsocket is not None:
+            return ('SOCKET', bsocket.as_pointer())
+
+        if hasattr(value, 'as_pointer'):
+            return ('ID', value.as_pointer())
+
+        return repr(value)
+
     def _cache(self, name, sockets={}, cache_name=None, **parameters):
 
         # build a node if not in cache
 
         if cache_name is None:
-            cache_name = name
+            cache_name = (name, self._cache_key(sockets), self._cache_key(parameters))
 
         # ----- Is the node already in cache
         node = self._cached_nodes.get(cache_name)
@@ -737,6 +766,10 @@ class Socket(NodeCache, PropLocker):
             pick_geo.out()
         ```
 
+        > [!NOTE]
+        > When at least <!pyswitch#LOOKUP_MIN> values are python constants, they are read
+        > in a lookup table by a single "Sample Index" node, see <!pyswitch#lookup_switch>.
+
         Arguments
         ---------
         - *values : list of Sockets to select into
@@ -747,6 +780,14 @@ class Socket(NodeCache, PropLocker):
         - Socket
         """
 
+        # ----- Constant values : lookup table
+
+        from . import pyswitch
+
+        socket = pyswitch.lookup_switch(cls, values, index)
+        if socket is not None:
+            return socket
+
         # ----- Create the nodes
 
         node = Node('Index Switch', data_type=cls.input_type())
@@ -0,0 +1,234 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : tabulate
+-----------------
+- replace a chain of math nodes by a lookup node, exposed as <!gnmath#tabulate>
+
+The python version of a function of one bounded scalar is sampled with numpy when the tree is built.
+A piecewise linear interpolation with as few knots as possible is fitted, then written
+in a <&Node Float Curve> for scalar functions or in a <&Node Color Ramp> for vector functions.
+
+``` python
+from geonodes import gnmath
+
+# Envelope evaluated with one Float Curve node
+env = gnmath.tabulate(lambda t: np.exp(-3*t)*np.sin(10*t)**2, t, 0, 1, tolerance=1e-3)
+```
+
+Blender evaluates the Float Curve through a table of <!TABLE> + 1 samples. The knots are placed
+on this table so that the interpolation computed by <#fit> is exactly the one of the node.
+
+updates
+-------
+- creation : 2025/02/17
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import numpy as np
+
+from .scripterror import NodeError
+from .treeclass import Node, ColorRamp, NodeCurves
+
+# Size of the evaluation table of the Float Curve (CM_TABLE in Blender)
+TABLE = 256
+
+# Samples per table interval used to measure the error
+SAMPLES = 8
+
+# Max number of stops of a Color Ramp
+MAX_STOPS = 32
+
+# =============================================================================================================================
+# Numpy fit
+
+def sample(func, lo, hi, count=TABLE*SAMPLES + 1):
+    """ > Sample a function on an interval
+
+    The function is called once with an array. If it is not vectorized, it is called once per sample.
+
+    Arguments
+    ---------
+    - func (function) : function of a float returning a float or a vector
+    - lo (float) : interval start
+    - hi (float) : interval end
+    - count (int = TABLE*SAMPLES + 1) : number of samples
+
+    Returns
+    -------
+    - couple of arrays : x (shape (count,)), values (shape (count, dims))
+    """
+    x = np.linspace(lo, hi, count)
+
+    try:
+        y = np.asarray(func(x), dtype=float)
+    except Exception:
+        y = None
+
+    if y is None or y.size not in (count, 3*count):
+        y = np.asarray([func(v) for v in x], dtype=float)
+
+    if y.ndim == 1:
+        y = y[:, None]
+    elif y.shape[0] != count:
+        y = y.T
+
+    if y.shape != (count, 1) and y.shape != (count, 3):
+        raise NodeError(f"tabulate: the function must return a float or a 3-vector, not an array of shape {y.shape}.")
+
+    return x, y
+
+def fit(y, tolerance, max_knots=TABLE + 1):
+    """ > Piecewise linear fit with a minimal number of knots
+
+    The knots are taken among the table positions, every **SAMPLES** samples.
+    Starting from a knot, the next one is the farthest table position such that the segment
+    between them is within the tolerance. When more than **max_knots** knots are required,
+    the tolerance is increased until the knots fit.
+
+    Arguments
+    ---------
+    - y (array of shape (n, dims)) : samples on the unit interval, n = TABLE*SAMPLES + 1
+    - tolerance (float) : max absolute error
+    - max_knots (int = TABLE + 1) : max number of knots
+
+    Returns
+    -------
+    - couple : knot indices in the samples (array of ints), max error (float)
+    """
+    n = len(y)
+    step = (n - 1)//TABLE if (n - 1) % TABLE == 0 else 1
+
+    def seg_error(a, b):
+        t = np.linspace(0, 1, b - a + 1)[:, None]
+        return np.max(np.abs(y[a] + t*(y[b] - y[a]) - y[a:b + 1]))
+
+    def knots_for(tol):
+        knots = [0]
+        while knots[-1] < n - 1:
+            a = knots[-1]
+            b = min(a + step, n - 1)
+            while b < n - 1 and seg_error(a, min(b + step, n - 1)) <= tol:
+                b = min(b + step, n - 1)
+            knots.append(b)
+            if len(knots) > max_knots:
+                return None
+        return knots
+
+    knots = knots_for(tolerance)
+
+    # ----- Too many knots : dichotomy on the tolerance
+
+    if knots is None:
+        lo_tol, hi_tol = tolerance, seg_error(0, n - 1)
+        knots = [0, n - 1]
+        for _ in range(30):
+            tol = (lo_tol + hi_tol)/2
+            res = knots_for(tol)
+            if res is None:
+                lo_tol = tol
+            else:
+                knots, hi_tol = res, tol
+
+    err = max(seg_error(a, b) for a, b in zip(knots[:-1], knots[1:]))
+
+    return np.array(knots), float(err)
+
+# =============================================================================================================================
+# Node
+
+def tabulate(func, x, lo=0., hi=1., tolerance=1e-4, max_knots=None, return_error=False):
+    """ > Replace a function by a lookup node
+
+    The python version of **func** is sampled on the interval [**lo**, **hi**] when the tree is built.
+    The result is a <&Node Float Curve> if **func** returns a float or a <&Node Color Ramp>
+    if it returns a 3-vector. Outside the interval, the value at the nearest bound is returned.
+
+    The maximum error on the interval is printed if it exceeds **tolerance** (the number of knots is limited),
+    it is returned with the socket if **return_error** is True.
+
+    ``` python
+    # Chain of math nodes
+    a = gnmath.exp(-2*t)*gnmath.cos(6*t)
+
+    # One Float Curve node
+    a = gnmath.tabulate(lambda t: np.exp(-2*t)*np.cos(6*t), t, 0, 2, tolerance=1e-3)
+
+    # Vector function
+    v = gnmath.tabulate(lambda t: (np.cos(t), np.sin(t), t/10), t, 0, 2*np.pi)
+    ```
+
+    Arguments
+    ---------
+    - func (function) : numpy function of a float returning a float or a 3-vector
+    - x (Float) : function argument
+    - lo (float = 0.) : interval start
+    - hi (float = 1.) : interval end
+    - tolerance (float = 1e-4) : max absolute error
+    - max_knots (int = None) : max number of knots, TABLE + 1 for Float Curve, MAX_STOPS for Color Ramp if None
+    - return_error (bool = False) : return the max error with the socket
+
+    Returns
+    -------
+    - Float or Vector, (Float or Vector, float) if return_error is True
+    """
+    if not hi > lo:
+        raise NodeError(f"tabulate: the interval [{lo}, {hi}] is empty.")
+
+    _, y = sample(func, lo, hi)
+    is_vector = y.shape[1] == 3
+
+    if max_knots is None:
+        max_knots = MAX_STOPS if is_vector else TABLE + 1
+    elif is_vector and max_knots > MAX_STOPS:
+        raise NodeError(f"tabulate: a Color Ramp has at most {MAX_STOPS} stops, max_knots={max_knots} is not valid.")
+
+    knots, err = fit(y, tolerance, max_knots=max(2, max_knots))
+    if err > tolerance:
+        print(f"tabulate: tolerance {tolerance:.1e} not reached with {len(knots)} knots, max error is {err:.2e}")
+
+    # Both the curve and the ramp work in the unit square
+
+    pos = knots/(len(y) - 1)
+    y_min, y_max = y.min(axis=0), y.max(axis=0)
+    scale = np.where(y_max > y_min, y_max - y_min, 1.)
+    vals = (y[knots] - y_min)/scale
+
+    u = Node('Math', sockets={'Value': x, 'Value_001': 1/(hi - lo), 'Value_002': -lo/(hi - lo)}, operation='MULTIPLY_ADD')._out
+
+    if is_vector:
+        ramp = ColorRamp(fac=u, stops=[(float(p), tuple(float(c) for c in v)) for p, v in zip(pos, vals)])
+        node = Node('Vector Math', sockets={'Vector': ramp._out, 'Vector_001': tuple(float(s) for s in scale), 'Vector_002': tuple(float(v) for v in y_min)}, operation='MULTIPLY_ADD')
+    else:
+        curve = NodeCurves('Float Curve', sockets={'Value': u})
+        curve.set_curve([(float(p), float(v[0]), 'VECTOR') for p, v in zip(pos, vals)])
+        node = Node('Math', sockets={'Value': curve._out, 'Value_001': float(scale[0]), 'Value_002': float(y_min[0])}, operation='MULTIPLY_ADD')
+
+    if return_error:
+        return node._out, err
+    return node._out
@@ -35,6 +35,10 @@ updates
 - update :   2024/09/04
 - update :   2025/01/12
 - update :   2025/01/18 : bug when deleting temp frames
+- update :   2025/02/17 : iterative traversals and column placement
+- update :   2025/02/17 : node dimensions cache and calibration
+- update :   2025/02/17 : incremental arrangement
+- update :   2025/02/17 : batched reroutes
 """
 
 __author__ = "Alain Bernard"
@@ -45,6 +49,9 @@ __version__ = "3.0.1"
 __blender_version__ = "4.3.0"
 
 
+import json
+from pathlib import Path
+
 import bpy
 
 X_SEPA = 60
@@ -52,6 +59,109 @@ Y_SEPA = 40
 ZONE_INPUTS  = ['GeometryNodeRepeatInput', 'GeometryNodeSimulationInput', 'GeometryNodeForeachGeometryElementInput']
 ZONE_OUTPUTS = ['GeometryNodeRepeatOutput', 'GeometryNodeSimulationOutput', 'GeometryNodeForeachGeometryElementOutput']
 
+# =============================================================================================================================
+# Node dimensions calibration
+#
+# Without node editor, the node dimensions are estimated from the sockets.
+# When the tree is displayed in a node editor, the true dimensions are recorded per node signature
+# and saved in the Blender config folder to be used by the next arrangements, including headless ones.
+
+CALIBRATION = None
+CALIBRATION_CHANGED = False
+
+def calibration_file():
+    """ Calibration file in Blender config folder
+
+    Returns
+    -------
+    - Path : file name, None if the config folder is not available
+    """
+    try:
+        folder = bpy.utils.user_resource('CONFIG')
+    except Exception:
+        return None
+    if not folder:
+        return None
+    return Path(folder) / "geonodes_node_dims.json"
+
+def load_calibration(file_name=None):
+    """ Load the calibration table
+
+    Arguments
+    ---------
+    - file_name (str = None) : json file, default calibration file if None
+
+    Returns
+    -------
+    - dict : node signature -> (width, height)
+    """
+    global CALIBRATION, CALIBRATION_CHANGED
+
+    CALIBRATION = {}
+    CALIBRATION_CHANGED = False
+
+    file_name = calibration_file() if file_name is None else Path(file_name)
+    if file_name is not None and file_name.exists():
+        try:
+            CALIBRATION = {sig: tuple(dims) for sig, dims in json.loads(file_name.read_text()).items()}
+        except (OSError, ValueError):
+            print(f"treearrange: invalid calibration file '{file_name}' ignored")
+
+    return CALIBRATION
+
+def save_calibration(file_name=None):
+    """ Save the calibration table
+
+    Arguments
+    ---------
+    - file_name (str = None) : json file, default calibration file if None
+    """
+    global CALIBRATION_CHANGED
+
+    file_name = calibration_file() if file_name is None else Path(file_name)
+    if file_name is None or CALIBRATION is None:
+        return
+    try:
+        file_name.parent.mkdir(parents=True, exist_ok=True)
+        file_name.write_text(json.dumps(CALIBRATION, indent=0))
+        CALIBRATION_CHANGED = False
+    except OSError:
+        print(f"treearrange: impossible to write the calibration file '{file_name}'")
+
+def calibrate(signature, dims):
+    """ Record true node dimensions
+    """
+    global CALIBRATION_CHANGED
+
+    if CALIBRATION is None:
+        load_calibration()
+
+    dims = (float(dims[0]), float(dims[1]))
+    if dims[0] <= 0 or dims[1] <= 0:
+        return
+    if CALIBRATION.get(signature) != dims:
+        CALIBRATION[signature] = dims
+        CALIBRATION_CHANGED = True
+
+def find_node_editor(btree):
+    """ Look for a node editor displaying the tree
+
+    Returns
+    -------
+    - bool : True if a node editor displays the tree
+    """
+    screen = getattr(bpy.context, 'screen', None)
+    if screen is None:
+        return False
+
+    for area in screen.areas:
+        if area.type == 'NODE_EDITOR':
+            for space in area.spaces:
+                if space.type == 'NODE_EDITOR' and space.node_tree == btree:
+                    return True
+
+    return False
+
 # =============================================================================================================================
 # A link
 
@@ -128,6 +238,7 @@ class Link:
         if index1 is not None:
             self.index1 = index1
         self.blink = self.tree.btree.links.new(self.socket0, self.socket1)
+        self.tree.invalidate()
 
     def replace_from(self, node0, index0=None):
         """ Replace node 0
@@ -144,6 +255,7 @@ class Link:
         if index0 is not None:
             self.index0 = index0
         self.blink = self.tree.btree.links.new(self.socket0, self.socket1)
+        self.tree.invalidate()
 
     def insert_reroute(self, frame):
         """ Insert a reroute node
@@ -220,6 +332,16 @@ class Node:
     def is_layout(self):
         return self.bnode.bl_idname in ['NodeReroute', 'NodeFrame']
 
+    @property
+    def is_dirty(self):
+        """ The node must be arranged
+
+        Returns
+        -------
+        - bool : True if the arrangement is not incremental or if the node is in the dirty frames
+        """
+        return self.tree.dirty is None or self in self.tree.dirty
+
     @property
     def parent(self):
         bparent = self.bnode.parent
@@ -234,16 +356,11 @@ class Node:
     @property
     def has_node_editor(self):
 
-        if not self.tree.get_true_dims:
-            return False
+        tree = self.tree
+        if tree._node_editor is None:
+            tree._node_editor = tree.get_true_dims and find_node_editor(tree.btree)
 
-        for area in bpy.context.screen.areas:
-            if area.type == 'NODE_EDITOR':
-                for space in area.spaces:
-                    if space.type == 'NODE_EDITOR' and space.node_tree == self.tree.btree:
-                        return True
-
-        return False
+        return tree._node_editor
 
     @classmethod
     def wait(cls):
@@ -251,11 +368,42 @@ class Node:
             bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
 
     @property
-    def dimensions(self):
-        """ Node dimensions
+    def signature(self):
+        """ Node signature
 
-        Node dimensions are read from bnode if it is available in 'NODE_EDITOR' area.
-        Otherwise, dimensions are approximated
+        Nodes sharing the same signature have the same dimensions.
+
+        Returns
+        -------
+        - str : bl_idname, enabled input and output sockets and number of unlinked vector sockets
+        """
+        bnode = self.bnode
+
+        inputs = []
+        vectors = 0
+        for bsock in bnode.inputs:
+            if not bsock.enabled:
+                continue
+            inputs.append(bsock.identifier)
+            if bsock.type == 'VECTOR' and not bsock.is_linked:
+                vectors += 1
+
+        outputs = [bsock.identifier for bsock in bnode.outputs if bsock.enabled]
+
+        name = bnode.bl_idname
+        node_tree = getattr(bnode, 'node_tree', None)
+        if node_tree is not None:
+            name += ':' + node_tree.name
+
+        return f"{name}|{','.join(inputs)}|{','.join(outputs)}|{vectors}"
+
+    @staticmethod
+    def estimate_dimensions(signature):
+        """ Estimate the dimensions of a node from its signature
+
+        Arguments
+        ---------
+        - signature (str) : node signature
 
         Returns
         -------
@@ -268,36 +416,54 @@ class Node:
         PARAM_HEIGHT         = 53
         VECTOR_SOCKET_HEIGHT = 164
 
-        if self.has_node_editor:
-            return self.bnode.dimensions
+        _, inputs, outputs, vectors = signature.rsplit('|', 3)
+        inputs  = len(inputs.split(',')) if inputs else 0
+        outputs = len(outputs.split(',')) if outputs else 0
+        vectors = int(vectors)
 
         height = BASE_HEIGHT*2
+        height += (inputs - vectors)*SOCKET_HEIGHT + vectors*VECTOR_SOCKET_HEIGHT
+        height += outputs*SOCKET_HEIGHT
 
-        # ----- Input sockets
-
-        count = 0
-        for bsock in self.bnode.inputs:
-            if not bsock.enabled:
-                continue
+        return (BASE_WIDTH, height/2)
 
-            if bsock.type == 'VECTOR' and not bsock.is_linked:
-                height += VECTOR_SOCKET_HEIGHT
-            else:
-                height += SOCKET_HEIGHT
+    @property
+    def dimensions(self):
+        """ Node dimensions
 
-            count += 1
+        Node dimensions are read from bnode if it is available in 'NODE_EDITOR' area
+        and recorded in the calibration table.
+        Otherwise, dimensions are read from the calibration table or approximated.
 
-        # ----- Output sockets
+        Dimensions are computed once per arrangement and shared by the nodes with the same
+        <#signature>.
 
-        for bsock in self.bnode.outputs:
-            if not bsock.enabled:
-                continue
+        Returns
+        -------
+        - couple of floats : node dimensions
+        """
+        dims = self.__dict__.get('_dims')
+        if dims is not None:
+            return dims
 
-            height += SOCKET_HEIGHT
+        signature = self.signature
 
-            count += 1
+        if self.has_node_editor:
+            dims = tuple(self.bnode.dimensions)
+            calibrate(signature, dims)
 
-        return (BASE_WIDTH, height/2)
+        else:
+            dims = self.tree._dims_cache.get(signature)
+            if dims is None:
+                if CALIBRATION is None:
+                    load_calibration()
+                dims = CALIBRATION.get(signature)
+                if dims is None:
+                    dims = self.estimate_dimensions(signature)
+                self.tree._dims_cache[signature] = dims
+
+        self._dims = dims
+        return dims
 
     @property
     def width(self):
@@ -330,11 +496,7 @@ class Node:
         -------
         - list of Nodes : nodes linked to one input socket of the node
         """
-        in_nodes = []
-        for link in self.tree.links:
-            if link.node1 == self:
-                in_nodes.append(link.node0)
-        return in_nodes
+        return [link.node0 for link in self.tree.links_to(self)]
 
     @property
     def out_nodes(self):
@@ -344,12 +506,7 @@ class Node:
         -------
         - list of Nodes : nodes linked to one output socket of the node
         """
-        out_nodes = []
-        for link in self.tree.links:
-            if link.node0 == self:
-                out_nodes.append(link.node1)
-
-        return out_nodes
+        return [link.node1 for link in self.tree.links_from(self)]
 
     # =============================================================================================================================
     # Hierarchy
@@ -361,12 +518,12 @@ class Node:
         -------
         - bool : True if the frame belongs to the parents hierarchy
         """
-        if self.parent is None:
-            return False
-        elif self.parent == frame:
-            return True
-        else:
-            return self.parent.is_child_of(frame)
+        node = self.parent
+        while node is not None:
+            if node == frame:
+                return True
+            node = node.parent
+        return False
 
     # =============================================================================================================================
     # Peer / outside
@@ -411,6 +568,34 @@ class Node:
     # =============================================================================================================================
     # Forward / backward iterators
 
+    def walk(self, starts, forwards=True):
+        """ Iterate on the nodes reachable from the starting nodes
+
+        The nodes are visited depth first, in the links order, each node being visited once.
+
+        Arguments
+        ---------
+        - starts (list of Nodes) : starting nodes, included in the iteration
+        - forwards (bool = True) : follow the links forwards or backwards
+
+        Returns
+        -------
+        - Node
+        """
+        visited = set()
+        stack = list(reversed(starts))
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            yield node
+
+            if forwards:
+                stack.extend(link.node1 for link in reversed(self.tree.links_from(node)))
+            else:
+                stack.extend(link.node0 for link in reversed(self.tree.links_to(node)))
+
     def forwards(self):
         """ Iterate forwards
 
@@ -420,11 +605,7 @@ class Node:
         -------
         - Node
         """
-        for link in self.tree.links:
-            if link.node0 == self:
-                yield link.node1
-                for node in link.node1.forwards():
-                    yield node
+        return self.walk(self.out_nodes, forwards=True)
 
     def backwards(self):
         """ Iterate backwards
@@ -435,11 +616,7 @@ class Node:
         -------
         - Node
         """
-        for link in self.tree.links:
-            if link.node1 == self:
-                yield link.node0
-                for node in link.node0.backwards():
-                    yield node
+        return self.walk(self.in_nodes, forwards=False)
 
     # =============================================================================================================================
     # Is in zone
@@ -559,7 +736,7 @@ class Frame(Node):
         -------
         - list of Nodes : the nodes directly parented to the frame
         """
-        return [node for node in self.tree.nodes.values() if node.bnode.parent == self.bnode]
+        return list(self.tree.children_index.get(self, []))
 
     @property
     def all_children(self):
@@ -569,7 +746,15 @@ class Frame(Node):
         -------
         - list of Nodes : the nodes parented, directly or not, to the frame
         """
-        return [node for node in self.tree.nodes.values() if node.is_child_of(self)]
+        index = self.tree.children_index
+        nodes = []
+        stack = [self]
+        while stack:
+            for node in index.get(stack.pop(), []):
+                nodes.append(node)
+                if node.is_frame:
+                    stack.append(node)
+        return nodes
 
     # =============================================================================================================================
     # Forward / backward iterators
@@ -583,14 +768,10 @@ class Frame(Node):
         -------
         - Node
         """
-        for link in self.tree.links:
-            if link.node0.is_child_of(self):
-                if link.node1.is_child_of(self):
-                    continue
-                yield link.node1
-                for node in link.node1.forwards():
-                    if not node.is_child_of(self):
-                        yield node
+        starts = [link.node1 for link in self.tree.links if link.node0.is_child_of(self) and not link.node1.is_child_of(self)]
+        for node in self.walk(starts, forwards=True):
+            if not node.is_child_of(self):
+                yield node
 
     def backwards(self):
         """ Iterate backwards
@@ -601,14 +782,10 @@ class Frame(Node):
         -------
         - Node
         """
-        for link in self.tree.links:
-            if link.node1.is_child_of(self):
-                if link.node0.is_child_of(self):
-                    continue
-                yield link.node0
-                for node in link.node0.backwards():
-                    if not node.is_child_of(self):
-                        yield node
+        starts = [link.node0 for link in self.tree.links if link.node1.is_child_of(self) and not link.node0.is_child_of(self)]
+        for node in self.walk(starts, forwards=False):
+            if not node.is_child_of(self):
+                yield node
 
     # =============================================================================================================================
     # Frame dimension
@@ -656,11 +833,12 @@ class Frame(Node):
         -------
         - list of Nodes : the frame input nodes
         """
-        in_nodes = []
+        in_nodes, done = [], set()
         for child in self.children:
             for node in child.in_nodes:
-                if node in in_nodes:
+                if node in done:
                     continue
+                done.add(node)
 
                 if not node.is_child_of(self):
                     in_nodes.append(node)
@@ -677,11 +855,12 @@ class Frame(Node):
         -------
         - list of Nodes : the frame output nodes
         """
-        out_nodes = []
+        out_nodes, done = [], set()
         for child in self.children:
             for node in child.out_nodes:
-                if node in out_nodes:
+                if node in done:
                     continue
+                done.add(node)
 
                 if not node.is_child_of(self):
                     out_nodes.append(node)
@@ -694,20 +873,33 @@ class Frame(Node):
     # Build frame inputs as reroute nodes
 
     def frame_reroutes(self):
+        """ Insert reroute nodes at the frame boundaries
+
+        The links between a node inside the frame and a node outside the frame are grouped
+        by source socket: one reroute node per source socket and frame is created, all
+        the links of the group start from this reroute.
+
+        The reroutes are planned first, then created and linked in one pass.
+        """
 
         # ----- All the links between a node inside the frame and a node outside the frame
+        # grouped by source socket
+
+        inside = set(self.all_children)
 
-        in_links = []
-        out_links = []
+        in_groups  = {}
+        out_groups = {}
         for link in self.tree.links:
-            if link.node0.is_child_of(self):
-                if not link.node1.is_child_of(self):
-                    out_links.append(link)
-            else:
-                if link.node1.is_child_of(self):
-                    in_links.append(link)
+            in0 = link.node0 in inside
+            if in0 == (link.node1 in inside):
+                continue
+            groups = out_groups if in0 else in_groups
+            groups.setdefault((link.node0, link.index0), []).append(link)
+
+        if not in_groups and not out_groups:
+            return
 
-        # ----- Create input reroutes
+        # ----- Input reroutes : ordered bottom down on the left side
 
         x_sepa  = 30
         y_sepa  = 50
@@ -715,41 +907,16 @@ class Frame(Node):
         x = -self.width/2  - x_sepa
         y = -self.height/2 + y_sepa
 
-        source_nodes = {}
-        for link in in_links:
-            source_key = link.node0_key
-            reroute = source_nodes.get(source_key)
-            if reroute is None:
-                reroute = link.insert_reroute(self)
-                reroute.bnode.location = (x + 200, y)
-                # Order bottom down
-                if True:
-                    y -= y_sepa
-                else:
-                    y += y_sepa
-
-                source_nodes[source_key] = reroute
+        locations = [(x + 200, y - i*y_sepa) for i in range(len(in_groups))]
 
-            else:
-                link.replace_from(reroute, index0=0)
-
-        # ----- Create the output reroutes
+        # ----- Output reroutes
 
         x = 2*x_sepa
-        y = 0
-
-        source_nodes = {}
-        for link in out_links:
-            source_key = link.node0_key
-            reroute = source_nodes.get(source_key)
-            if reroute is None:
-                reroute = link.insert_reroute(self)
-                reroute.bnode.location = (x + 100, y)
-                y -= y_sepa
-                source_nodes[source_key] = reroute
+        locations += [(x + 100, -i*y_sepa) for i in range(len(out_groups))]
 
-            else:
-                link.replace_from(reroute, index0=0)
+        # ----- Create and link
+
+        self.tree.add_reroutes(self, list(in_groups.items()) + list(out_groups.items()), locations)
 
     # ====================================================================================================
     # Arrange
@@ -766,10 +933,16 @@ class Frame(Node):
         Once the columns are build, the are sorted vertically
 
         Then, the nodes can be placed using the location property of <!Node#bnode>.
+
+        When the arrangement is incremental, a frame which is not dirty is not arranged: it keeps
+        the locations of its children and is placed as a fixed size block.
         """
 
         # ----------------------------------------------------------------------------------------------------
-        # No child
+        # No child or unchanged frame
+
+        if not self.is_dirty:
+            return
 
         if len(self.children) == 0:
             return
@@ -810,11 +983,15 @@ class Frame(Node):
                 print(f"     {node.out_nodes}")
 
         # ----------------------------------------------------------------------------------------------------
-        # Column number computed recursively
+        # Column number computed from the right most nodes
+        #
+        # Depth first traversal of the peer output nodes with an explicit stack:
+        # a node column is computed once all its followers have a column.
+        # The column is set to -1 during the visit to break the cycles between intricated frames.
 
-        def place_in_col(node):
+        def enter(node):
 
-            node.col = -1 # To avoid infinite recursion
+            node.col = -1
             node.follower = None
             node.below    = False
 
@@ -822,17 +999,12 @@ class Frame(Node):
 
             if len(node.out_peers) == 0 or node == self.output_node:
                 node.col = 0
-                return
-
-            # ----- Get the left most following node
+                return None
 
-            left_most = None
-            for follower in node.out_peers:
-                if follower.col is None:
-                    place_in_col(follower)
+            # Node, index of the next follower to visit, left most follower
+            return [node, 0, None]
 
-                if left_most is None or left_most.col < follower.col:
-                    left_most = follower
+        def leave(node, left_most):
 
             node.follower = left_most
             node.col      = left_most.col + 1
@@ -867,6 +1039,34 @@ class Frame(Node):
                     node.col -= 1
                     node.follower = left_most.follower
 
+        def place_in_col(node):
+
+            item = enter(node)
+            stack = [] if item is None else [item]
+
+            while stack:
+                item = stack[-1]
+                node, index, left_most = item
+
+                if index < len(node.out_peers):
+                    follower = node.out_peers[index]
+
+                    # Visit the follower first
+                    if follower.col is None:
+                        sub = enter(follower)
+                        if sub is not None:
+                            stack.append(sub)
+                            continue
+
+                    # ----- Get the left most following node
+                    if left_most is None or left_most.col < follower.col:
+                        item[2] = follower
+                    item[1] = index + 1
+                    continue
+
+                stack.pop()
+                leave(node, left_most)
+
         # ----------------------------------------------------------------------------------------------------
         # Let's compute the column numbers
 
@@ -934,8 +1134,7 @@ class Frame(Node):
 
             # Extract below nodes
             belows = [node for node in col if node.below]
-            for node in belows:
-                del col[col.index(node)]
+            col = [node for node in col if not node.below]
 
             # Sort the nodes
 
@@ -1020,6 +1219,15 @@ class Tree(Frame):
         self.btree = btree
         self.get_true_dims = get_true_dims
 
+        # ----- Dimensions
+
+        self._node_editor = None
+        self._dims_cache = {} # Node signature -> dimensions
+
+        # ----- Frames to arrange, all if None
+
+        self.dirty = None
+
         # ----- Nodes
 
         self.nodes = {}
@@ -1038,6 +1246,8 @@ class Tree(Frame):
 
         # ----- Links
 
+        self._adjacency = None
+        self._children  = None
         self.links = [Link(self, blink) for blink in self.btree.links]
 
     def __str__(self):
@@ -1056,6 +1266,95 @@ class Tree(Frame):
     def parent(self):
         return None
 
+    # ====================================================================================================
+    # Adjacency
+
+    def invalidate(self):
+        """ The links or the nodes changed : the indices must be rebuilt
+        """
+        self._adjacency = None
+        self._children  = None
+
+    @property
+    def children_index(self):
+        """ Child nodes per frame
+
+        Returns
+        -------
+        - dict : frame (or the tree) -> list of child nodes
+        """
+        if self._children is None:
+            index = {}
+            for node in self.nodes.values():
+                index.setdefault(node.parent, []).append(node)
+            self._children = index
+        return self._children
+
+    @property
+    def adjacency(self):
+        """ Links per node
+
+        The index is built once and rebuilt after the links changed.
+
+        Returns
+        -------
+        - couple of dicts : node -> links to the node, node -> links from the node
+        """
+        if self._adjacency is None:
+            links_to, links_from = {}, {}
+            for link in self.links:
+                links_to.setdefault(link.node1, []).append(link)
+                links_from.setdefault(link.node0, []).append(link)
+            self._adjacency = (links_to, links_from)
+        return self._adjacency
+
+    def links_to(self, node):
+        """ Links ending at the node, in the links order
+        """
+        return self.adjacency[0].get(node, [])
+
+    def links_from(self, node):
+        """ Links starting from the node, in the links order
+        """
+        return self.adjacency[1].get(node, [])
+
+    # ====================================================================================================
+    # Incremental arrangement
+
+    def set_dirty(self, dirty):
+        """ Set the frames to arrange
+
+        The frames to arrange are the dirty frames, the frames containing a dirty node
+        and all their ancestors up to the tree.
+
+        Arguments
+        ---------
+        - dirty (list) : nodes or frames as bpy.types.Node, node names or Nodes, None for all
+
+        Returns
+        -------
+        - set of Frames : the frames to arrange, None if all
+        """
+        if dirty is None:
+            self.dirty = None
+            return None
+
+        self.dirty = set()
+        for item in dirty:
+            if isinstance(item, Node):
+                node = item
+            else:
+                node = self.nodes.get(item if isinstance(item, str) else item.name)
+                if node is None:
+                    continue
+
+            frame = node if node.is_frame else node.parent
+            while frame is not None and frame not in self.dirty:
+                self.dirty.add(frame)
+                frame = frame.parent
+
+        return self.dirty
+
     # ====================================================================================================
     # Nodes management
 
@@ -1070,6 +1369,8 @@ class Tree(Frame):
         if frame is not None:
             bnode.parent = frame.bnode
 
+        self.invalidate()
+
         return node
 
     def new_frame(self, frame=None):
@@ -1079,9 +1380,8 @@ class Tree(Frame):
         return self.new_node('NodeReroute', frame=frame)
 
     def del_node(self, node):
-        for link in self.links:
-            if link.node0 == node or link.node1 == node:
-                raise Exception(f"Impossible to delete  node {node}, links still exist")
+        if self.links_to(node) or self.links_from(node):
+            raise Exception(f"Impossible to delete  node {node}, links still exist")
 
         if self.input_node == node:
             self.input_node = None
@@ -1090,46 +1390,150 @@ class Tree(Frame):
 
         del self.nodes[node.bnode.name]
         self.btree.nodes.remove(node.bnode)
+        self.invalidate()
 
     def del_link(self, link):
         self.btree.links.remove(link.blink)
         self.links.remove(link)
+        self.invalidate()
 
     def new_link(self, node0, index0, node1, index1):
         blink = self.btree.links.new(node0.bnode.outputs[index0], node1.bnode.inputs[index1])
         link = Link(self, blink)
         self.links.append(link)
+        self.invalidate()
         return link
 
     # ====================================================================================================
-    # Delete the reroute nodes
+    # Reroute nodes
+
+    def _relink(self, link, node0, index0):
+        """ Change the starting socket of a link without updating the indices
+        """
+        to_socket = link.socket1
+        if to_socket.is_multi_input:
+            self.btree.links.remove(link.blink)
+        link.node0  = node0
+        link.index0 = index0
+        # A single input socket keeps only the new link
+        link.blink  = self.btree.links.new(link.socket0, to_socket)
+
+    def add_reroutes(self, frame, groups, locations):
+        """ Create reroute nodes in a frame
+
+        Each group is a source socket with the list of links starting from it. A reroute node
+        is created per group: the source socket is linked to the reroute and the links
+        of the group start from the reroute.
+
+        Arguments
+        ---------
+        - frame (Frame) : frame to create the reroutes in
+        - groups (list) : list of ((source node, source socket index), links)
+        - locations (list) : reroute locations, one per group
+
+        Returns
+        -------
+        - list of Nodes : the reroute nodes
+        """
+        new_link = self.btree.links.new
+
+        reroutes = []
+        new_links = []
+        for ((node0, index0), links), location in zip(groups, locations):
+
+            # ----- Create the reroute node
+
+            bnode = self.btree.nodes.new('NodeReroute')
+            bnode.parent = frame.bnode
+            bnode.location = location
+
+            node_lab = node0.bnode.label
+            if node_lab is None or node_lab == '':
+                bnode.label = node0.bnode.outputs[index0].name
+            else:
+                bnode.label = node_lab
+
+            reroute = Node(self, bnode)
+            self.nodes[bnode.name] = reroute
+            reroutes.append(reroute)
+
+            # ----- From source node to reroute
+
+            new_links.append(Link(self, new_link(node0.bnode.outputs[index0], bnode.inputs[0])))
+
+            # ----- From reroute to target nodes
+
+            for link in links:
+                self._relink(link, reroute, 0)
+
+        self.links.extend(new_links)
+        self.invalidate()
+
+        return reroutes
 
     def del_reroutes(self):
         """ > Delete reroute nodes
+
+        The links starting from reroute nodes are replaced by links from the source socket
+        of the reroute chain. The links ending to a reroute node and the reroute nodes are then
+        deleted in one pass.
         """
-        reroutes = [node for node in self.nodes.values() if node.is_reroute]
-        for reroute in reroutes:
-            in_links  = []
-            out_links = []
-            for link in self.links:
-                if link.node0 == reroute:
-                    out_links.append(link)
-                if link.node1 == reroute:
-                    in_links.append(link)
+        reroutes = {node for node in self.nodes.values() if node.is_reroute and node.parent.is_dirty}
+        if not reroutes:
+            return
 
-            if len(in_links) == 0:
-                for link in out_links:
-                    self.del_link(link)
+        # ----- Source socket of a reroute, following the reroute chains
 
-            else:
+        sources = {}
+        def source(reroute):
+            chain = []
+            src = None
+            node = reroute
+            while node in reroutes:
+                if node in sources:
+                    src = sources[node]
+                    break
+                chain.append(node)
+                in_links = self.links_to(node)
+                if not in_links:
+                    break
                 assert(len(in_links) == 1)
+                src = (in_links[0].node0, in_links[0].index0)
+                node = src[0]
 
-                for link in out_links:
-                    link.replace_from(in_links[0].node0, in_links[0].index0)
+            if src is not None and src[0] in reroutes:
+                src = None
+            for node in chain:
+                sources[node] = src
+            return src
 
-                self.del_link(in_links[0])
+        # ----- Relink the links starting from a reroute
 
-            self.del_node(reroute)
+        keep = []
+        for link in self.links:
+            if link.node1 in reroutes:
+                continue
+
+            if link.node0 in reroutes:
+                src = source(link.node0)
+                if src is None:
+                    continue
+                self._relink(link, *src)
+
+            keep.append(link)
+
+        # ----- Delete the reroute nodes with their remaining links
+
+        for reroute in reroutes:
+            if self.input_node == reroute:
+                self.input_node = None
+            if self.output_node == reroute:
+                self.output_node = None
+            del self.nodes[reroute.bnode.name]
+            self.btree.nodes.remove(reroute.bnode)
+
+        self.links = keep
+        self.invalidate()
 
     # =============================================================================================================================
     # Group input management
@@ -1173,14 +1577,21 @@ class Tree(Frame):
             self.input_node = None
 
         group_input.bnode.parent = None
+        self.invalidate()
 
     # -----------------------------------------------------------------------------------------------------------------------------
     # Create one group input per frame
 
     def group_input_per_frame(self):
         """ Create one group input node per frame linked to the group input
+
+        When the arrangement is incremental, only the links into the dirty frames are changed.
         """
 
+        if self.dirty is not None:
+            self.dirty_group_inputs()
+            return
+
         # ----- One single group input
 
         self.single_group_input()
@@ -1221,6 +1632,42 @@ class Tree(Frame):
         if not keep:
             self.del_node(group_input)
 
+    def dirty_group_inputs(self):
+        """ Group input node per dirty frame
+
+        The group inputs of the clean frames are kept as they are.
+        The links from a group input node out of a dirty frame into the dirty frame are replaced
+        by links from the group input of the frame.
+        """
+
+        frames = {}
+        for node in self.group_inputs:
+            if node.parent is not self and node.parent.is_dirty:
+                frames.setdefault(node.parent, node)
+
+        sources = set()
+        for link in list(self.links):
+            if link.node0.bnode.bl_idname != 'NodeGroupInput':
+                continue
+
+            frame = link.node1.parent
+            if frame is self or not frame.is_dirty or link.node0.parent == frame:
+                continue
+
+            frame_input = frames.get(frame)
+            if frame_input is None:
+                frame_input = self.new_node('NodeGroupInput', frame)
+                frames[frame] = frame_input
+
+            sources.add(link.node0)
+            link.replace_from(frame_input)
+
+        # ----- Group inputs without links in dirty frames
+
+        for node in sources:
+            if node.parent.is_dirty and node.parent is not self and not self.links_from(node):
+                self.del_node(node)
+
     # =============================================================================================================================
     # Zones in frames
 
@@ -1327,6 +1774,7 @@ class Tree(Frame):
             if iparent is not None:
                 frame.bnode.parent = frames[iparent].bnode
 
+        self.invalidate()
         self.wait()
 
     # =============================================================================================================================
@@ -1350,13 +1798,30 @@ class Tree(Frame):
 # ====================================================================================================
 # Arrange a tree
 
-def arrange(btree, reroutes=True, input_in_frames=True, get_true_dims=False):
+def arrange(btree, reroutes=True, input_in_frames=True, get_true_dims=False, dirty=None):
+    """ Arrange a tree
+
+    The arrangement is incremental when dirty is not None: only the frames containing
+    the dirty nodes and their ancestors are arranged. The other frames keep their internal
+    layout.
+
+    Arguments
+    ---------
+    - btree (bpy.types.NodeTree) : the tree to arrange
+    - reroutes (bool = True) : create reroute nodes at frame boundaries
+    - input_in_frames (bool = True) : one Group Input node per frame
+    - get_true_dims (bool = False) : read the dimensions from the node editor
+    - dirty (list = None) : nodes and frames which changed, all if None
+    """
 
     # Try to update node dimensions !
     Node.wait()
 
     tree = Tree(btree, get_true_dims=get_true_dims)
 
+    if dirty is not None and not tree.set_dirty(dirty):
+        return
+
     if reroutes:
         tree.del_reroutes()
 
@@ -1368,6 +1833,9 @@ def arrange(btree, reroutes=True, input_in_frames=True, get_true_dims=False):
     tree.arrange(reroutes=reroutes)
     tree.del_temp_frames()
 
+    if CALIBRATION_CHANGED:
+        save_calibration()
+
 # ====================================================================================================
 # UI
 
@@ -0,0 +1,796 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : treebench
+------------------
+- speed and quality benchmark of <!treearrange>
+
+Synthetic trees are built with a light stand-in of the bpy node tree API (nodes, sockets,
+links and frames) and arranged. For each tree, the benchmark reports:
+- time : arrangement duration in seconds
+- memory : peak python memory during the arrangement in Mb
+- crossings : number of link crossings, not counted above <!CROSSINGS_MAX_WORK>
+- length : total length of the links
+- overlaps : number of overlapping nodes
+
+The benchmark doesn't need Blender. Outside Blender, run the file as a script, a minimal
+**bpy** module is then installed to load <!treearrange>:
+
+```
+python geonodes/core/treebench.py --sizes 100 1000 10000
+```
+
+In Blender:
+
+``` python
+from geonodes.core import treebench
+
+treebench.report(treebench.benchmark(sizes=(100, 1000)))
+```
+
+An other layout engine can be compared by passing a function taking the tree as argument:
+
+``` python
+treebench.benchmark(engine=my_arrange)
+```
+
+Node rectangles follow the <!treearrange> convention: a node located at (x, y) with dimensions
+(w, h) covers [x - w/2, x] x [y - h/2, y]. Locations are relative to the parent frame.
+
+updates
+-------
+- creation : 2025/02/17
+- update :   2025/02/18 # crossings counted per slab, skipped above CROSSINGS_MAX_WORK
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import bisect
+import collections
+import importlib.util
+import itertools
+from pathlib import Path
+import random
+import sys
+from time import perf_counter
+import tracemalloc
+import types
+
+# =============================================================================================================================
+# Stand-in of the bpy tree API
+
+class Socket:
+    def __init__(self, node, name, socket_type, identifier, is_multi_input=False):
+        self.node           = node
+        self.name           = name
+        self.label          = ""
+        self.type           = socket_type
+        self.identifier     = identifier
+        self.enabled        = True
+        self.hide           = False
+        self.is_multi_input = is_multi_input
+        self.links          = []
+
+    def __repr__(self):
+        return f"<Socket [{self.node.name}]{self.name}>"
+
+    @property
+    def is_linked(self):
+        return len(self.links) > 0
+
+class BNode:
+    def __init__(self, btree, bl_idname, name, inputs=(), outputs=()):
+        self.id_data       = btree
+        self.bl_idname     = bl_idname
+        self.name          = name
+        self.label         = ""
+        self.parent        = None
+        self.location      = (0., 0.)
+        self.dimensions    = (0., 0.)
+        self.paired_output = None
+        self.select        = False
+        self.inputs  = [Socket(self, sname, stype, f"{sname}_{i}", multi) for i, (sname, stype, multi) in enumerate(inputs)]
+        self.outputs = [Socket(self, sname, stype, f"{sname}_{i}") for i, (sname, stype, _) in enumerate(outputs)]
+
+    def __repr__(self):
+        return f"<BNode '{self.name}' {self.bl_idname}>"
+
+class BLink:
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket   = to_socket
+        self.from_node   = from_socket.node
+        self.to_node     = to_socket.node
+
+class Nodes:
+    def __init__(self, btree):
+        self.btree  = btree
+        self._nodes = {}
+        self._count = {}
+
+    def __iter__(self):
+        return iter(list(self._nodes.values()))
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def new(self, type):
+        count = self._count.get(type, 0)
+        self._count[type] = count + 1
+        name = type if count == 0 else f"{type}.{count:03d}"
+
+        inputs, outputs = self.btree.socket_specs(type)
+        bnode = BNode(self.btree, type, name, inputs, outputs)
+        self._nodes[name] = bnode
+        return bnode
+
+    def remove(self, bnode):
+        for bsocket in bnode.inputs + bnode.outputs:
+            for blink in list(bsocket.links):
+                self.btree.links.remove(blink)
+        del self._nodes[bnode.name]
+
+class Links:
+    def __init__(self):
+        self._links = {}
+
+    def __iter__(self):
+        return iter(list(self._links.values()))
+
+    def __len__(self):
+        return len(self._links)
+
+    def new(self, from_socket, to_socket):
+        if not to_socket.is_multi_input:
+            for blink in list(to_socket.links):
+                self.remove(blink)
+        blink = BLink(from_socket, to_socket)
+        self._links[id(blink)] = blink
+        from_socket.links.append(blink)
+        to_socket.links.append(blink)
+        return blink
+
+    def remove(self, blink):
+        del self._links[id(blink)]
+        blink.from_socket.links.remove(blink)
+        blink.to_socket.links.remove(blink)
+
+class BTree:
+    """ Node tree stand-in
+
+    Nodes created with <#nodes.new> get sockets from <#SPECS>, 'NodeGroupInput' and 'NodeGroupOutput'
+    get the sockets of the tree interface.
+    """
+
+    SPECS = {
+        'NodeFrame'              : ([], []),
+        'NodeReroute'            : ([('Input', 'VALUE', False)], [('Output', 'VALUE', False)]),
+        'ShaderNodeMath'         : ([('Value', 'VALUE', False)]*3, [('Value', 'VALUE', False)]),
+        'ShaderNodeVectorMath'   : ([('Vector', 'VECTOR', False)]*2, [('Vector', 'VECTOR', False)]),
+        'GeometryNodeSetPosition': ([('Geometry', 'GEOMETRY', False), ('Selection', 'BOOLEAN', False), ('Position', 'VECTOR', False), ('Offset', 'VECTOR', False)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeInputPosition': ([], [('Position', 'VECTOR', False)]),
+        'GeometryNodeJoinGeometry' : ([('Geometry', 'GEOMETRY', True)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeRepeatInput'  : ([('Geometry', 'GEOMETRY', False)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeRepeatOutput' : ([('Geometry', 'GEOMETRY', False)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeSimulationInput'  : ([('Geometry', 'GEOMETRY', False)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeSimulationOutput' : ([('Geometry', 'GEOMETRY', False)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeForeachGeometryElementInput'  : ([('Geometry', 'GEOMETRY', False)], [('Geometry', 'GEOMETRY', False)]),
+        'GeometryNodeForeachGeometryElementOutput' : ([('Geometry', 'GEOMETRY', False)], [('Geometry', 'GEOMETRY', False)]),
+    }
+
+    def __init__(self, name, interface=(('Geometry', 'GEOMETRY'), ('Value', 'VALUE'))):
+        self.name      = name
+        self.bl_idname = 'GeometryNodeTree'
+        self.interface = [(sname, stype, False) for sname, stype in interface]
+        self.nodes     = Nodes(self)
+        self.links     = Links()
+
+    def __repr__(self):
+        return f"<BTree '{self.name}' {len(self.nodes)} nodes, {len(self.links)} links>"
+
+    def socket_specs(self, bl_idname):
+        if bl_idname == 'NodeGroupInput':
+            return [], self.interface
+        if bl_idname == 'NodeGroupOutput':
+            return self.interface, []
+        return self.SPECS.get(bl_idname, ([('Value', 'VALUE', False)]*2, [('Value', 'VALUE', False)]))
+
+    def new(self, bl_idname, parent=None):
+        bnode = self.nodes.new(bl_idname)
+        bnode.parent = parent
+        return bnode
+
+    def link(self, node0, node1, index0=0, index1=0):
+        return self.links.new(node0.outputs[index0], node1.inputs[index1])
+
+def stand_in():
+    """ Minimal bpy module
+
+    Installs in sys.modules a minimal **bpy** module exposing what <!treearrange> needs
+    at import time and at arrangement time. Does nothing if bpy is available.
+
+    Returns
+    -------
+    - bool : True if the stand-in has been installed
+    """
+    if 'bpy' in sys.modules or importlib.util.find_spec('bpy') is not None:
+        return False
+
+    bpy = types.ModuleType('bpy')
+
+    bpy.types = types.SimpleNamespace(
+        Operator     = type('Operator', (), {}),
+        Panel        = type('Panel', (), {}),
+        Node         = BNode,
+        NodeInternal = BNode,
+        NodeSocket   = Socket,
+        NodeTree     = BTree,
+        )
+
+    def user_resource(resource_type, path='', create=False):
+        return ''
+
+    def register_class(cls):
+        pass
+
+    bpy.utils   = types.SimpleNamespace(user_resource=user_resource, register_class=register_class, unregister_class=register_class)
+    bpy.context = types.SimpleNamespace(screen=None)
+    bpy.data    = types.SimpleNamespace(node_groups={})
+    bpy.app     = types.SimpleNamespace(version=(4, 3, 0), background=True)
+
+    sys.modules['bpy'] = bpy
+    return True
+
+def load_treearrange():
+    """ Load the module <!treearrange>
+
+    Within the geonodes package, the module is imported normally. When this file is run as a
+    script, the bpy stand-in is installed and the module is loaded from its file.
+
+    Returns
+    -------
+    - module
+    """
+    if __package__:
+        from . import treearrange
+        return treearrange
+
+    stand_in()
+    name = 'geonodes_treearrange'
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, Path(__file__).parent / 'treearrange.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+# =============================================================================================================================
+# Synthetic trees
+
+def chain(n, name="Chain"):
+    """ A chain of n math nodes between the group input and output
+
+    Returns
+    -------
+    - BTree
+    """
+    btree = BTree(name)
+    gin  = btree.new('NodeGroupInput')
+    gout = btree.new('NodeGroupOutput')
+
+    prev, index = gin, 1
+    for _ in range(n):
+        node = btree.new('ShaderNodeMath')
+        btree.link(prev, node, index, 0)
+        btree.link(gin, node, 1, 1)
+        prev, index = node, 0
+
+    btree.link(gin, gout, 0, 0)
+    btree.link(prev, gout, index, 1)
+    return btree
+
+def fan(n, name="Fan"):
+    """ Wide fan-out / fan-in
+
+    A single position node feeds n 'Set Position' nodes joined by a 'Join Geometry' node.
+
+    Returns
+    -------
+    - BTree
+    """
+    btree = BTree(name)
+    gin  = btree.new('NodeGroupInput')
+    gout = btree.new('NodeGroupOutput')
+    pos  = btree.new('GeometryNodeInputPosition')
+    join = btree.new('GeometryNodeJoinGeometry')
+
+    for _ in range(n):
+        node = btree.new('GeometryNodeSetPosition')
+        btree.link(gin, node, 0, 0)
+        btree.link(pos, node, 0, 2)
+        btree.link(node, join, 0, 0)
+
+    btree.link(join, gout, 0, 0)
+    return btree
+
+def frames(n, depth=3, breadth=3, name="Frames"):
+    """ Nested layout frames
+
+    Frames are nested on depth levels, each frame containing breadth sub frames. The n math nodes
+    are spread in the frames as chains linked from frame to frame.
+
+    Returns
+    -------
+    - BTree
+    """
+    btree = BTree(name)
+    gin  = btree.new('NodeGroupInput')
+    gout = btree.new('NodeGroupOutput')
+
+    leaves = []
+    def add_frames(parent, level):
+        for _ in range(breadth):
+            frame = btree.new('NodeFrame', parent)
+            frame.label = f"Level {level}"
+            if level == depth:
+                leaves.append(frame)
+            else:
+                add_frames(frame, level + 1)
+
+    add_frames(None, 1)
+
+    prev, index = gin, 1
+    per_frame = max(1, n // len(leaves))
+    for i in range(n):
+        node = btree.new('ShaderNodeMath', leaves[min(i // per_frame, len(leaves) - 1)])
+        btree.link(prev, node, index, 0)
+        btree.link(gin, node, 1, 1)
+        prev, index = node, 0
+
+    btree.link(gin, gout, 0, 0)
+    btree.link(prev, gout, index, 1)
+    return btree
+
+ZONES = {
+    'REPEAT'     : ('GeometryNodeRepeatInput', 'GeometryNodeRepeatOutput'),
+    'SIMULATION' : ('GeometryNodeSimulationInput', 'GeometryNodeSimulationOutput'),
+    'FOREACH'    : ('GeometryNodeForeachGeometryElementInput', 'GeometryNodeForeachGeometryElementOutput'),
+}
+
+def zones(n, zone_size=10, kinds=('REPEAT', 'SIMULATION', 'FOREACH'), name="Zones"):
+    """ Zones in sequence
+
+    Zones are chained, each zone containing zone_size nodes. The zone types alternate.
+
+    Returns
+    -------
+    - BTree
+    """
+    btree = BTree(name)
+    gin  = btree.new('NodeGroupInput')
+    gout = btree.new('NodeGroupOutput')
+
+    geo = gin
+    for izone in range(max(1, n // (zone_size + 2))):
+        zin_type, zout_type = ZONES[kinds[izone % len(kinds)]]
+        zin  = btree.new(zin_type)
+        zout = btree.new(zout_type)
+        zin.paired_output = zout
+
+        btree.link(geo, zin, 0, 0)
+        pos = btree.new('GeometryNodeInputPosition')
+        prev = zin
+        for _ in range(zone_size):
+            node = btree.new('GeometryNodeSetPosition')
+            btree.link(prev, node, 0, 0)
+            btree.link(pos, node, 0, 2)
+            prev = node
+        btree.link(prev, zout, 0, 0)
+        geo = zout
+
+    btree.link(geo, gout, 0, 0)
+    return btree
+
+def random_tree(n, frame_ratio=.01, window=50, seed=0, name="Random"):
+    """ Random DAG of n nodes
+
+    Each math node takes its inputs from two nodes randomly chosen among the window previous ones.
+    Consecutive nodes are grouped in frames.
+
+    Returns
+    -------
+    - BTree
+    """
+    rng = random.Random(seed)
+    btree = BTree(name)
+    gin  = btree.new('NodeGroupInput')
+    gout = btree.new('NodeGroupOutput')
+
+    frame_size = max(1, int(1/frame_ratio)) if frame_ratio else n + 1
+    nodes = [gin]
+    frame = None
+    for i in range(n):
+        if i % frame_size == 0 and frame_ratio:
+            frame = btree.new('NodeFrame')
+        node = btree.new('ShaderNodeMath', frame)
+        for index in range(2):
+            src = nodes[max(0, len(nodes) - 1 - rng.randrange(window))]
+            btree.link(src, node, 1 if src is gin else 0, index)
+        nodes.append(node)
+
+    btree.link(gin, gout, 0, 0)
+    btree.link(nodes[-1], gout, 1 if nodes[-1] is gin else 0, 1)
+    return btree
+
+GENERATORS = {
+    'chain'  : chain,
+    'fan'    : fan,
+    'frames' : frames,
+    'zones'  : zones,
+    'random' : random_tree,
+}
+
+# =============================================================================================================================
+# Layout quality
+
+SOCKET_PITCH = 22
+
+def rectangles(btree, treearrange=None):
+    """ Absolute rectangles of the nodes which are not frames
+
+    Arguments
+    ---------
+    - btree (BTree) : arranged tree
+    - treearrange (module = None) : module used to estimate the dimensions
+
+    Returns
+    -------
+    - dict : node name -> (x0, y0, x1, y1)
+    """
+    if treearrange is None:
+        treearrange = load_treearrange()
+
+    tree = treearrange.Tree(btree)
+    rects = {}
+    for bnode in btree.nodes:
+        if bnode.bl_idname == 'NodeFrame':
+            continue
+
+        x, y = bnode.location
+        parent = bnode.parent
+        while parent is not None:
+            x += parent.location[0]
+            y += parent.location[1]
+            parent = parent.parent
+
+        w, h = tree[bnode.name].dimensions
+        rects[bnode.name] = (x - w/2, y - h/2, x, y)
+
+    return rects
+
+def count_overlaps(rects):
+    """ Number of overlapping rectangle pairs
+
+    Sweep along x: only the rectangles overlapping in x are compared.
+
+    Returns
+    -------
+    - int
+    """
+    items = sorted(rects.values())
+    active = []
+    count = 0
+    for rect in items:
+        x0, y0, x1, y1 = rect
+        active = [r for r in active if r[2] > x0]
+        for r in active:
+            if r[1] < y1 and y0 < r[3]:
+                count += 1
+        active.append(rect)
+    return count
+
+def segments(btree, rects):
+    """ Link segments from the right side of the output node to the left side of the input node
+
+    Returns
+    -------
+    - list of ((x0, y0), (x1, y1))
+    """
+    segs = []
+    for blink in btree.links:
+        r0 = rects.get(blink.from_node.name)
+        r1 = rects.get(blink.to_node.name)
+        if r0 is None or r1 is None:
+            continue
+        i0 = blink.from_node.outputs.index(blink.from_socket)
+        i1 = blink.to_node.inputs.index(blink.to_socket)
+        segs.append(((r0[2], r0[3] - (i0 + 1)*SOCKET_PITCH), (r1[0], r1[3] - (i1 + 1 + len(blink.to_node.outputs))*SOCKET_PITCH)))
+    return segs
+
+def _cross(s0, s1):
+    (ax, ay), (bx, by) = s0
+    (cx, cy), (dx, dy) = s1
+
+    def orient(px, py, qx, qy, rx, ry):
+        v = (qx - px)*(ry - py) - (qy - py)*(rx - px)
+        return (v > 0) - (v < 0)
+
+    o1 = orient(ax, ay, bx, by, cx, cy)
+    o2 = orient(ax, ay, bx, by, dx, dy)
+    o3 = orient(cx, cy, dx, dy, ax, ay)
+    o4 = orient(cx, cy, dx, dy, bx, by)
+    return o1*o2 < 0 and o3*o4 < 0
+
+# Max work of the crossings count, see <#count_crossings>
+CROSSINGS_MAX_WORK = 5_000_000
+
+def _inversions(values):
+    """ Sorted values and number of pairs i < j with values[i] > values[j]"""
+
+    if len(values) < 2:
+        return values, 0
+
+    mid = len(values)//2
+    left, n_left   = _inversions(values[:mid])
+    right, n_right = _inversions(values[mid:])
+
+    merged = []
+    count = n_left + n_right
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if right[j] < left[i]:
+            merged.append(right[j])
+            count += len(left) - i
+            j += 1
+        else:
+            merged.append(left[i])
+            i += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+
+    return merged, count
+
+def count_crossings(segs, max_work=None):
+    """ Number of link crossings
+
+    The x axis is cut into slabs at the link end points. Within a slab, two links
+    cross if their vertical order at the left border is inverted at the right border:
+    the inversions are counted with a merge sort, slab per slab.
+    On a border, the links passing through the same point cross if their slopes differ
+    and a vertical link crosses the links passing strictly between its ends.
+
+    Links sharing an end point don't cross.
+
+    The work is the total number of slabs spanned by the links: it is small when the links are short,
+    it grows as the number of links times the number of slabs when many links cross the whole tree.
+
+    Arguments
+    ---------
+    - segs (list of ((x0, y0), (x1, y1))) : the links
+    - max_work (int = None) : don't count if the work exceeds this value, no limit if None
+
+    Returns
+    -------
+    - int or None if the work exceeds max_work
+    """
+    links, verticals = [], {}
+    for (x0, y0), (x1, y1) in segs:
+        if x0 == x1:
+            verticals.setdefault(x0, []).append((min(y0, y1), max(y0, y1)))
+        else:
+            links.append((x0, y0, x1, y1) if x0 < x1 else (x1, y1, x0, y0))
+
+    def y_at(link, x):
+        x0, y0, x1, y1 = link
+        if x == x0:
+            return y0
+        if x == x1:
+            return y1
+        return y0 + (y1 - y0)*(x - x0)/(x1 - x0)
+
+    xs = sorted({x for link in links for x in (link[0], link[2])} | set(verticals.keys()))
+    starts = {}
+    for link in links:
+        starts.setdefault(link[0], []).append(link)
+
+    if max_work is not None:
+        work = sum(bisect.bisect_left(xs, link[2]) - bisect.bisect_left(xs, link[0]) for link in links)
+        if work > max_work:
+            return None
+
+    count = 0
+    active = []
+    for i, x in enumerate(xs):
+
+        # ----- Links passing through the border
+
+        active = [link for link in active if link[2] > x]
+        passing = sorted((y_at(link, x), (link[3] - link[1])/(link[2] - link[0])) for link in active)
+
+        for y, group in itertools.groupby(passing, key=lambda item: item[0]):
+            slopes = [slope for _, slope in group]
+            if len(slopes) > 1:
+                same = sum(n*(n - 1)//2 for n in collections.Counter(slopes).values())
+                count += len(slopes)*(len(slopes) - 1)//2 - same
+
+        ys = [y for y, _ in passing]
+        for y0, y1 in verticals.get(x, []):
+            count += max(0, bisect.bisect_left(ys, y1) - bisect.bisect_right(ys, y0))
+
+        # ----- Slab up to the next border
+
+        if i == len(xs) - 1:
+            break
+
+        active += starts.get(x, [])
+        if len(active) < 2:
+            continue
+        xb = xs[i + 1]
+        ys = sorted((y_at(link, x), y_at(link, xb)) for link in active)
+        count += _inversions([yb for _, yb in ys])[1]
+
+    return count
+
+def edge_length(segs):
+    """ Total length of the links
+
+    Returns
+    -------
+    - float
+    """
+    return sum(((x1 - x0)**2 + (y1 - y0)**2)**.5 for (x0, y0), (x1, y1) in segs)
+
+def quality(btree, treearrange=None, crossings=True):
+    """ Quality of an arranged tree
+
+    Arguments
+    ---------
+    - btree (BTree) : arranged tree
+    - treearrange (module = None) : module used to estimate the dimensions
+    - crossings (bool = True) : count the crossings, if the work doesn't exceed <!CROSSINGS_MAX_WORK>
+
+    Returns
+    -------
+    - dict : crossings, length, overlaps
+    """
+    rects = rectangles(btree, treearrange)
+    segs  = segments(btree, rects)
+    return {
+        'crossings' : count_crossings(segs, max_work=CROSSINGS_MAX_WORK) if crossings else None,
+        'length'    : edge_length(segs),
+        'overlaps'  : count_overlaps(rects),
+        }
+
+# =============================================================================================================================
+# Benchmark
+
+def measure(btree, engine=None, crossings=True):
+    """ Arrange a tree and measure the arrangement
+
+    Arguments
+    ---------
+    - btree (BTree) : tree to arrange
+    - engine (function = None) : layout function taking the tree as argument, treearrange.arrange if None
+    - crossings (bool = True) : count the crossings
+
+    Returns
+    -------
+    - dict : nodes, links, time, memory, crossings, length, overlaps
+    """
+    treearrange = load_treearrange()
+    if engine is None:
+        engine = treearrange.arrange
+
+    # The estimated dimensions are measured, not the calibrated ones
+    calibration = treearrange.CALIBRATION
+    treearrange.CALIBRATION = {}
+    try:
+        tracemalloc.start()
+        t0 = perf_counter()
+        engine(btree)
+        duration = perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        res = {
+            'nodes'  : len(btree.nodes),
+            'links'  : len(btree.links),
+            'time'   : duration,
+            'memory' : peak/1024/1024,
+            }
+        res.update(quality(btree, treearrange, crossings=crossings))
+
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        treearrange.CALIBRATION = calibration
+
+    return res
+
+def benchmark(sizes=(100, 1000), generators=None, engine=None, crossings=True, verbose=False):
+    """ Run the benchmark
+
+    Arguments
+    ---------
+    - sizes (list of ints = (100, 1000)) : number of nodes of the synthetic trees
+    - generators (list of strs = None) : names of the generators in <#GENERATORS>, all if None
+    - engine (function = None) : layout function taking the tree as argument, treearrange.arrange if None
+    - crossings (bool = True) : count the crossings
+    - verbose (bool = False) : print the results as they are computed
+
+    Returns
+    -------
+    - list of dicts : one result per tree
+    """
+    if generators is None:
+        generators = list(GENERATORS.keys())
+
+    results = []
+    for gen_name in generators:
+        for size in sizes:
+            btree = GENERATORS[gen_name](size)
+            res = {'tree': gen_name, 'size': size}
+            res.update(measure(btree, engine=engine, crossings=crossings))
+            results.append(res)
+            if verbose:
+                report([res], header=len(results) == 1)
+
+    return results
+
+def report(results, header=True):
+    """ Print the results as a table
+    """
+    if header:
+        print(f"{'tree':8s} {'size':>7s} {'nodes':>7s} {'links':>7s} {'time (s)':>9s} {'mem (Mb)':>9s} {'crossings':>10s} {'length':>12s} {'overlaps':>9s}")
+    for res in results:
+        crossings = '-' if res['crossings'] is None else str(res['crossings'])
+        print(f"{res['tree']:8s} {res['size']:7d} {res['nodes']:7d} {res['links']:7d} {res['time']:9.3f} {res['memory']:9.2f} {crossings:>10s} {res['length']:12.0f} {res['overlaps']:9d}")
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Benchmark of the geonodes tree arrangement")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--trees', nargs='+', choices=list(GENERATORS.keys()), default=None)
+    parser.add_argument('--no-crossings', action='store_true', help="don't count the crossings")
+    parser.add_argument('--all-crossings', action='store_true', help="count the crossings even above CROSSINGS_MAX_WORK (slow on large trees)")
+    parser.add_argument('--json', default=None, help="save the results in a json file")
+    args = parser.parse_args(argv)
+
+    if args.all_crossings:
+        global CROSSINGS_MAX_WORK
+        CROSSINGS_MAX_WORK = None
+
+    results = benchmark(sizes=args.sizes, generators=args.trees, crossings=not args.no_crossings, verbose=True)
+    if args.json is not None:
+        Path(args.json).write_text(json.dumps(results, indent=1))
+
+if __name__ == '__main__':
+    main()
@@ -38,6 +38,7 @@ In addition, other classes are implemented:
 - Group         : Node Group creation
 - GroupF        : (deprecated) Utility class to call a group with python syntax
 - G             : An advanced feature to expose Groups as python methods
+- NodeArray     : Nodes created in batch by Node.batch
 
 updates
 -------
@@ -45,6 +46,10 @@ updates
 - update :   2024/09/04
 - update :   2025/01/12
 - update :   2025/01/18 # G as dynamic class
+- update :   2025/02/16 # Node.batch and NodeArray
+- update :   2025/02/16 # Deferred links
+- update :   2025/02/17 # treearrange and treesimplify imported on use
+- update :   2025/02/17 # socket names predicted from the node specifications snapshot
 """
 
 __author__ = "Alain Bernard"
@@ -59,10 +64,11 @@ import bpy
 from time import time
 
 from .scripterror import NodeError
-from . import treearrange
+from . import treeserial
 from . import constants
 from . import utils
 from .treeinterface import TreeInterface
+from . import nodespec
 
 
 # =============================================================================================================================
@@ -187,6 +193,12 @@ class Tree:
 
     STACK   = []
 
+    # Simplify math nodes when the tree is poped
+    SIMPLIFY = True
+
+    # Queue the links and create them when the tree is poped
+    DEFER_LINKS = True
+
     _total_nodes = 0
     _total_links = 0
     _total_time  = 0.
@@ -276,13 +288,17 @@ class Tree:
         self._nodes     = [] # List of nodes
         self._layouts   = [] # Stack of layouts
         self._panels    = [] # Stack of panels
+        self._links     = {} # Deferred links : key -> (out bsocket, in bsocket)
+        self._linked    = {} # Deferred links : socket pointer -> count
 
         # ----- Named attributes
 
         self._named_attrs = {}
 
         # ----- Clear the tree
+        # If the tree is not cleared, only the new nodes are arranged
 
+        self._incremental = not clear
         if clear:
             self.clear()
 
@@ -446,6 +462,7 @@ class Tree:
 
     @property
     def _str_stats(self):
+        self.flush_links()
         return f"{len(self._btree.nodes)} nodes, {len(self._btree.links)} links"
 
     def clear(self):
@@ -456,6 +473,8 @@ class Tree:
 
         to_clear = []
         self._nodes.clear()
+        self._links.clear()
+        self._linked.clear()
         self._btree.links.clear()
         self._btree.nodes.clear()
 
@@ -506,14 +525,26 @@ class Tree:
         if tree != self:
             raise NodeError(f"Error in tree stack management")
 
+        # ----- Create the deferred links
+
+        self.flush_links()
+
         # ----- Clean the interface
 
         if clean and tree._interface is not None:
             tree._interface.clear(False)
 
+        # ----- Simplify
+
+        if Tree.SIMPLIFY:
+            self.simplify()
+
         # ----- Arrange
 
-        self.arrange()
+        dirty = None
+        if self._incremental and len(self._nodes) < len(self._btree.nodes):
+            dirty = [node._bnode for node in self._nodes]
+        self.arrange(dirty=dirty)
 
         # ----- Stats
 
@@ -577,22 +608,66 @@ class Tree:
         node = Node("Named Attribute", sockets={'Name': attr_name}, data_type=data_type)
         return node._out
 
+    # =============================================================================================================================
+    # Simplify math nodes
+
+    def simplify(self):
+        """ > Simplify the math nodes.
+
+        Apply a peephole pass on 'Math', 'Vector Math' and 'Integer Math' nodes:
+        strength reduction (x**2 -> x*x, x/c -> x*(1/c), x**.5 -> sqrt(x)), fusion of
+        a*b + c into 'MULTIPLY_ADD', removal of identity operations and double negations.
+
+        This method is called when the Tree is poped from the stack if <#SIMPLIFY> is True.
+        If the tree was not cleared when created, only the nodes created by the script are simplified:
+        the nodes placed by hand are kept as they are.
+
+        ``` python
+        # Keep the nodes as they are scripted
+        Tree.SIMPLIFY = False
+        ```
+
+        Returns
+        -------
+        - None
+        """
+
+        from . import treesimplify
+
+        self.flush_links()
+        nodes = None
+        if self._incremental and len(self._nodes) < len(self._btree.nodes):
+            nodes = [node._bnode for node in self._nodes]
+        removed = treesimplify.simplify(self._btree, nodes=nodes)
+        if removed:
+            self._nodes = [node for node in self._nodes if node._bnode.as_pointer() not in removed]
+
     # =============================================================================================================================
     # Arranges nodes
 
-    def arrange(self):
+    def arrange(self, dirty=None):
         """ > Arrange the nodes in the editor.
 
         Try to arrange properly the nodes from left to right.
 
-        This method is called when the Tree is poped from the stack.
+        This method is called when the Tree is poped from the stack. If the tree
+        was not cleared when created, only the frames containing the new nodes are arranged.
+
+        Arguments
+        ---------
+        - dirty (list of nodes = None) : arrange only the frames containing these nodes, all if None
 
         Returns
         -------
         - None
         """
 
-        treearrange.arrange(self._btree)
+        from . import treearrange
+
+        self.flush_links()
+        if dirty is not None:
+            dirty = [getattr(node, '_bnode', node) for node in dirty]
+        treearrange.arrange(self._btree, dirty=dirty)
 
     # =============================================================================================================================
     # Node colors
@@ -622,6 +697,21 @@ class Tree:
     def link(self, out_socket, in_socket):
         """ > Create a link between two sockets.
 
+        If <#DEFER_LINKS> is True, the link is queued and created when the tree is poped.
+        The queue is deduplicated: an input socket keeps only its last link, excepted the multi input
+        sockets which keep one link per output socket.
+
+        The socket types are checked in Geometry Nodes trees.
+
+        Use <#is_linked> rather than **NodeSocket.is_linked** to take the queued links into account.
+        The queue is flushed before the queries on the whole tree (<#arrange>, <#to_dict>...).
+        The queue refers to the sockets: use <#remove_node> to delete a node before the tree is poped.
+
+        ``` python
+        # Create the links immediately
+        Tree.DEFER_LINKS = False
+        ```
+
         Arguments
         ---------
         - out_socket (socket) : a node output socket
@@ -629,7 +719,7 @@ class Tree:
 
         Returns
         -------
-        - Link
+        - Link, None if the link is deferred
         """
 
         #if hasattr(out_socket, '_bsocket'):
@@ -640,7 +730,134 @@ class Tree:
         if '_bsocket' in dir(in_socket):
             in_socket = in_socket._bsocket
 
-        return self._btree.links.new(out_socket, in_socket)
+        self.check_link(out_socket, in_socket)
+
+        if not Tree.DEFER_LINKS:
+            return self._btree.links.new(out_socket, in_socket)
+
+        # ----- Deduplicate
+
+        in_ptr = in_socket.as_pointer()
+        key = (out_socket.as_pointer(), in_ptr) if in_socket.is_multi_input else in_ptr
+
+        prev = self._links.pop(key, None)
+        if prev is not None:
+            self._unqueue(prev)
+
+        self._links[key] = (out_socket, in_socket)
+        for ptr in (out_socket.as_pointer(), in_ptr):
+            self._linked[ptr] = self._linked.get(ptr, 0) + 1
+
+        return None
+
+    def _unqueue(self, link):
+        for bsocket in link:
+            ptr = bsocket.as_pointer()
+            self._linked[ptr] -= 1
+            if not self._linked[ptr]:
+                del self._linked[ptr]
+
+    def check_link(self, out_socket, in_socket):
+        """ > Check that two sockets can be linked
+
+        The check is done only in Geometry Nodes trees. Only the links known to be invalid are rejected:
+        geometry, shader and data block sockets (<!constants#LINK_EXCLUSIVE>) can only be linked
+        to a socket of the same type. The conversions between the other types are left to Blender.
+
+        Arguments
+        ---------
+        - out_socket (NodeSocket) : a node output socket
+        - in_socket (NodeSocket) : input socket from another node
+
+        Raises
+        ------
+        - NodeError : if the socket types are not compatible
+        """
+        if self._btree.bl_idname != 'GeometryNodeTree':
+            return
+
+        out_type, in_type = out_socket.type, in_socket.type
+        if out_type == in_type or 'CUSTOM' in (out_type, in_type):
+            return
+        if out_type not in constants.LINK_EXCLUSIVE and in_type not in constants.LINK_EXCLUSIVE:
+            return
+
+        raise NodeError(f"Impossible to link the socket '{out_socket.name}' ({out_type}) of node '{out_socket.node.name}' to the socket '{in_socket.name}' ({in_type}) of node '{in_socket.node.name}'.",
+            out_node = out_socket.node.name,
+            out_socket = out_socket.name,
+            out_type = out_type,
+            in_node = in_socket.node.name,
+            in_socket = in_socket.name,
+            in_type = in_type,
+            valids = (in_type,) if in_type in constants.LINK_EXCLUSIVE else [t for t in constants.VALID_SOCKET_TYPES['GeometryNodeTree'] if t not in constants.LINK_EXCLUSIVE],
+            )
+
+    def is_linked(self, socket):
+        """ > Socket is linked
+
+        Takes into account the deferred links.
+
+        Arguments
+        ---------
+        - socket (Socket or NodeSocket) : the socket
+
+        Returns
+        -------
+        - bool
+        """
+        bsocket = utils.get_bsocket(socket)
+        return bsocket.as_pointer() in self._linked or bsocket.is_linked
+
+    def flush_links(self):
+        """ > Create the deferred links
+
+        This method is called when the Tree is poped and before the queries on the whole tree.
+
+        The links already existing in multi input sockets are not duplicated.
+
+        Returns
+        -------
+        - int : number of created links
+        """
+        if not self._links:
+            return 0
+
+        links = list(self._links.values())
+        self._links.clear()
+        self._linked.clear()
+
+        new_link = self._btree.links.new
+        count = 0
+        for out_socket, in_socket in links:
+            if in_socket.is_multi_input and in_socket.is_linked:
+                out_ptr = out_socket.as_pointer()
+                if any(blink.from_socket.as_pointer() == out_ptr for blink in in_socket.links):
+                    continue
+            new_link(out_socket, in_socket)
+            count += 1
+
+        return count
+
+    def remove_node(self, node):
+        """ > Remove a node from the tree
+
+        The deferred links starting from or going to the node are dropped before the node is deleted.
+
+        Arguments
+        ---------
+        - node (Node or bpy.types.Node) : the node to remove
+        """
+        bnode = node._bnode if isinstance(node, Node) else node
+
+        ptrs = {bsocket.as_pointer() for bsocket in list(bnode.inputs) + list(bnode.outputs)}
+        for key, link in list(self._links.items()):
+            if link[0].as_pointer() in ptrs or link[1].as_pointer() in ptrs:
+                del self._links[key]
+                self._unqueue(link)
+
+        ptr = bnode.as_pointer()
+        self._nodes = [nd for nd in self._nodes if nd._bnode.as_pointer() != ptr]
+        self._btree.nodes.remove(bnode)
 
     # =============================================================================================================================
     # Tree Input / Output
@@ -988,7 +1205,7 @@ class Tree:
 
             # ----- Already linked
 
-            if to_socket.is_linked:
+            if self.is_linked(to_socket):
                 continue
 
             # ----------------------------------------------------------------------------------------------------
@@ -1082,6 +1299,7 @@ class Tree:
     # Dump content
 
     def dump(self):
+        self.flush_links()
         for bnode in self._btree.nodes:
             print(f"Node '{bnode.name}' ({bnode.bl_idname})")
             print("Inputs")
@@ -1092,6 +1310,58 @@ class Tree:
                 print(f"   - {bsock.name:20s} : {bsock.bl_idname}")
             print()
 
+    def to_dict(self):
+        """ > Serialize the tree into a dict
+
+        See <!treeserial> for the format.
+
+        Returns
+        -------
+        - dict
+        """
+        self.flush_links()
+        return treeserial.dump(self._btree)
+
+    def save(self, file_name, indent=None):
+        """ > Save the tree into a json file
+
+        The file is compressed if its name ends with '.gz'. Use an indentation
+        to get human readable diffs.
+
+        ``` python
+        with GeoNodes("Hello World") as tree:
+            ...
+
+        tree.save("hello.json", indent=1)
+        ```
+
+        Arguments
+        ---------
+        - file_name (str) : file name
+        - indent (int = None) : json indentation
+        """
+        self.flush_links()
+        treeserial.save(self._btree, file_name, indent=indent)
+
+    @staticmethod
+    def load(file_name, name=None, strict=False):
+        """ > Load a tree saved with <#save>
+
+        The tree is built directly from the file, without running the
+        python code which created it.
+
+        Arguments
+        ---------
+        - file_name (str) : file name
+        - name (str = None) : tree name, the saved name if None
+        - strict (bool = False) : raise an error if a referenced data block doesn't exist
+
+        Returns
+        -------
+        - NodeTree
+        """
+        return treeserial.load(file_name, name=name, strict=strict)
+
     def gen_node_headers(self, default_values=True):
         for node in self._btree.nodes:
             if default_values:
@@ -1107,6 +1377,16 @@ class Tree:
 # Node
 
 class Node:
+
+    # Socket names predicted from the node specifications snapshot rather than read from RNA
+    PREDICT_SOCKETS = True
+
+    # Debug mode: the predicted names are checked against the Blender sockets
+    VERIFY_SOCKETS = False
+
+    # Predicted names: (tree type, bl_idname, state, in_out, only_enabled, as_argument) -> (names, indices)
+    _PREDICTED = {}
+
     def __init__(self, node_name, sockets={}, _items={}, link_from=None, **parameters):
         """ Node wrapper.
 
@@ -1254,6 +1534,112 @@ class Node:
                 if isinstance(sockets['Name'], str):
                     self._tree.register_named_attribute(data_type=parameters['data_type'], attr_name=sockets['Name'])
 
+    # ====================================================================================================
+    # Batch creation
+
+    @staticmethod
+    def batch(node_name, n, sockets=None, _items={}, **parameters):
+        """ > Create n nodes of the same type
+
+        The node name is resolved and the parameters are validated once, on the first node.
+        The other nodes are created with the same parameters and dynamic sockets.
+
+        The input sockets are initialized per column: a column is either a single value plugged into
+        the socket of every node, or a list (or array) of n values, one per node.
+        Sockets can be passed as a dict keyed by socket name, identifier or index, or as a list of columns
+        in the order of the enabled input sockets.
+
+        Constant columns of numbers, vectors and colors are converted once with numpy before being
+        assigned as default values.
+
+        ``` python
+        with GeoNodes("Batch"):
+
+            # 10 'Combine XYZ' nodes with x in 0, 1, ... 9, y = 0, z = 1
+            combines = Node.batch("Combine XYZ", 10, [list(range(10)), 0, 1])
+
+            # 10 Vector Math nodes adding a constant vector
+            adds = Node.batch("Vector Math", 10, {0: combines.vector, 1: (1, 2, 3)}, operation='ADD')
+
+            # Outputs can be zipped
+            for v, c in zip(adds.vector, combines.vector):
+                pass
+        ```
+
+        > [!CAUTION]
+        > A tuple is a single value, a list is a column: use a tuple to plug the same vector in all the nodes
+
+        Arguments
+        ---------
+        - node_name (str) : Node name
+        - n (int) : number of nodes to create
+        - sockets (dict or list = None) : columns of values for the input sockets
+        - _items (dict = {}) : dynamic sockets to create, shared by the nodes
+        - **parameters : node parameters, shared by the nodes
+
+        Returns
+        -------
+        - NodeArray
+        """
+
+        n = int(n)
+        if n < 0:
+            raise NodeError(f"Node.batch: the number of nodes can't be negative ({n}).", node_name=node_name)
+        if n == 0:
+            return NodeArray([])
+
+        # ----------------------------------------------------------------------------------------------------
+        # First node : name resolution and parameters validation
+
+        first = Node(node_name, _items=_items, **parameters)
+
+        tree  = first._tree
+        btree = tree._btree
+        bl_idname = first._bnode.bl_idname
+        params = {name: value for name, value in parameters.items() if value is not None and (name != 'domain' or hasattr(first._bnode, 'domain'))}
+
+        # ----------------------------------------------------------------------------------------------------
+        # Other nodes
+
+        nodes = [first]
+        for _ in range(n - 1):
+            node = Node.__new__(Node)
+            node._tree  = tree
+            node._bnode = btree.nodes.new(type=bl_idname)
+            node._bnode.select = False
+            tree.check_node_validity(node._bnode)
+            for name, value in params.items():
+                setattr(node._bnode, name, value)
+            node._set_items(_items)
+            tree.register_node(node)
+            nodes.append(node)
+
+        array = NodeArray(nodes)
+
+        # ----------------------------------------------------------------------------------------------------
+        # Plug the columns
+
+        if sockets is None:
+            sockets = {}
+        if isinstance(sockets, dict):
+            for key, values in sockets.items():
+                if values is not None:
+                    array.plug(key, values)
+        else:
+            for index, values in enumerate(sockets):
+                if values is not None:
+                    array.plug(index, values)
+
+        # ----------------------------------------------------------------------------------------------------
+        # Particular cases
+
+        if node_name == 'Store Named Attribute' and isinstance(sockets, dict) and 'Name' in sockets and 'data_type' in parameters:
+            for name in array._column(sockets['Name']):
+                if isinstance(name, str):
+                    tree.register_named_attribute(data_type=parameters['data_type'], attr_name=name)
+
+        return array
+
     def __str__(self):
         return f"<Node '{self._bnode.name}' {self._bnode.bl_idname}>"
 
@@ -1538,6 +1924,27 @@ class Node:
 
         # ---- Not a group
 
+        names, bsockets = None, None
+        if Node.PREDICT_SOCKETS:
+            predicted = self._predicted_names(in_out, only_enabled, as_argument)
+            if predicted is not None:
+                names, bsockets = predicted
+
+        if names is None:
+            names, bsockets = self._rna_names(in_out, only_enabled, as_argument)
+
+        if in_out == 'INPUT':
+            return {name: bsocket for name, bsocket in zip(names, bsockets)}
+        else:
+            return {name: self.data_socket(bsocket) for name, bsocket in zip(names, bsockets)}
+
+    def _rna_names(self, in_out, only_enabled=True, as_argument=True):
+        """ Unique socket names read from the Blender sockets
+
+        Returns
+        -------
+        - couple (list of names, list of Blender sockets)
+        """
         names    = []
         bsockets = []
 
@@ -1555,12 +1962,75 @@ class Node:
             names.append(utils.snake_case(label) if as_argument else label)
             bsockets.append(bsock)
 
-        names = utils.ensure_uniques(names, single_digit=True)
+        return utils.ensure_uniques(names, single_digit=True), bsockets
 
-        if in_out == 'INPUT':
-            return {name: bsocket for name, bsocket in zip(names, bsockets)}
-        else:
-            return {name: self.data_socket(bsocket) for name, bsocket in zip(names, bsockets)}
+    def _predicted_layout(self, in_out):
+        """ Sockets predicted by <!nodespec#predict>
+
+        The prediction is rejected if the number of sockets doesn't match.
+
+        Returns
+        -------
+        - couple (state key, sockets) or None
+        """
+        bnode = self._bnode
+        predicted = nodespec.predict(bnode, self._tree._btree.bl_idname)
+        if predicted is None:
+            return None
+
+        key, inputs, outputs = predicted
+        sockets = inputs if in_out == 'INPUT' else outputs
+        if len(sockets) != len(bnode.inputs if in_out == 'INPUT' else bnode.outputs):
+            return None
+
+        return key, sockets
+
+    def _predicted_names(self, in_out, only_enabled=True, as_argument=True):
+        """ Unique socket names predicted from the node specifications snapshot
+
+        The names are computed once per node type and state. In debug mode (<#VERIFY_SOCKETS>),
+        they are compared with the names read from the Blender sockets.
+
+        Returns
+        -------
+        - couple (list of names, list of Blender sockets) or None if the layout can't be predicted
+        """
+        layout = self._predicted_layout(in_out)
+        if layout is None:
+            return None
+
+        state, sockets = layout
+        cache_key = (self._tree._btree.bl_idname, self._bnode.bl_idname, state, in_out, only_enabled, as_argument)
+
+        predicted = Node._PREDICTED.get(cache_key)
+        if predicted is None:
+            names   = []
+            indices = []
+            for index, name, identifier, socket_type, label, enabled in sockets:
+                if socket_type == 'CUSTOM':
+                    continue
+                if only_enabled and not enabled:
+                    continue
+                label = name if label == "" else label
+                names.append(utils.snake_case(label) if as_argument else label)
+                indices.append(index)
+
+            predicted = Node._PREDICTED[cache_key] = (utils.ensure_uniques(names, single_digit=True), indices)
+
+        names, indices = predicted
+        bsocks = self._bnode.inputs if in_out == 'INPUT' else self._bnode.outputs
+        bsockets = [bsocks[index] for index in indices]
+
+        if Node.VERIFY_SOCKETS:
+            rna_names, rna_bsockets = self._rna_names(in_out, only_enabled, as_argument)
+            if rna_names != names or [b.identifier for b in rna_bsockets] != [b.identifier for b in bsockets]:
+                raise NodeError(f"Socket names predicted for node '{self._bnode.name}' don't match the Blender sockets",
+                    in_out    = in_out,
+                    state     = state,
+                    predicted = names,
+                    actual    = rna_names)
+
+        return names, bsockets
 
     # ----------------------------------------------------------------------------------------------------
     # Valid names
@@ -1595,6 +2065,20 @@ class Node:
 
         if candidates:
             bsockets = self._bnode.inputs if in_out == 'INPUT' else self._bnode.outputs
+
+            # Predicted layout : only the matching sockets are read
+            layout = self._predicted_layout(in_out) if Node.PREDICT_SOCKETS and not Node.VERIFY_SOCKETS else None
+            if layout is not None:
+                matching = []
+                for index, socket_name, identifier, socket_type, label, enabled in layout[1]:
+                    if (not enabled and only_enabled) or socket_type == 'CUSTOM':
+                        continue
+                    label = socket_name if label == "" else label
+                    if (utils.snake_case(label) if as_argument else label) == name:
+                        bsocket = bsockets[index]
+                        matching.append(bsocket if in_out == 'INPUT' else self.data_socket(bsocket))
+                return matching
+
             matching = []
             for bsocket in bsockets:
                 if not bsocket.enabled and only_enabled:
@@ -1995,7 +2479,7 @@ class Node:
 
         out_socket = utils.get_bsocket(value)
         if out_socket is not None:
-            link = self._tree.link(out_socket, in_socket)
+            self._tree.link(out_socket, in_socket)
             return
 
         # ----------------------------------------------------------------------------------------------------
@@ -2217,6 +2701,227 @@ class Node:
     def pin_gizmo(self, value):
         self._bnode.inputs[0].pin_gizmo = value
 
+# =============================================================================================================================
+# Array of nodes
+
+class NodeArray:
+    def __init__(self, nodes):
+        """ > Lightweight view on nodes sharing the same type and parameters
+
+        A NodeArray is returned by <#Node.batch>. Since the nodes share the same parameters,
+        their sockets are resolved once on the first node and read by index on the other ones.
+
+        - Indexing with an int returns the <!Node>, indexing with a slice returns a NodeArray
+        - Indexing with a str or getting an attribute returns the list of the output sockets, one per node
+        - Setting an attribute plugs a column of values into the input sockets, AttributeError is raised
+          if the name is not an input socket of the nodes
+
+        ``` python
+        nodes = Node.batch("Math", 5, {0: [1, 2, 3, 4, 5], 1: 10}, operation='MULTIPLY')
+        values = nodes.value           # List of 5 Float sockets
+        nodes[1] = Float(2).sqrt()     # Plug the same socket into the 5 nodes
+        ```
+
+        Arguments
+        ---------
+        - nodes (list of Nodes) : nodes with the same type and parameters
+        """
+        super().__setattr__('_nodes', list(nodes))
+
+    def __str__(self):
+        if not len(self._nodes):
+            return "<NodeArray empty>"
+        return f"<NodeArray {len(self._nodes)} x {self._nodes[0]._bnode.bl_idname}>"
+
+    def __repr__(self):
+        return str(self)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    # ====================================================================================================
+    # Columns of values
+
+    def _column(self, values):
+        """ Per node values : a list or an array of len n, the value repeated otherwise"""
+
+        n = len(self._nodes)
+        if isinstance(values, (list, np.ndarray)) and len(values) == n:
+            return list(values)
+        return [values]*n
+
+    @staticmethod
+    def _constants(values, socket_type):
+        """ Values as a numpy array if the column can be assigned as default values"""
+
+        if socket_type not in ('VALUE', 'INT', 'BOOLEAN') and socket_type not in constants.ARRAY_TYPES:
+            return None
+
+        for value in values:
+            if utils.has_bsocket(value) or isinstance(value, str):
+                return None
+        try:
+            a = np.asarray(values, dtype=float)
+        except (TypeError, ValueError):
+            return None
+
+        n = len(values)
+        if socket_type in ('VALUE', 'INT', 'BOOLEAN'):
+            return a if a.shape == (n,) else None
+
+        size = int(np.prod(constants.ARRAY_TYPES[socket_type]['shape']))
+        if a.shape == (n,):
+            return np.repeat(a[:, None], size, axis=1)
+        if socket_type == 'RGBA' and a.shape == (n, 3):
+            return np.column_stack((a, np.ones(n)))
+        if a.size != n*size:
+            return None
+        return np.reshape(a, (n, size))
+
+    def _plug_index(self, index, values):
+        """ Plug a column of values into the input socket at index in bnode.inputs, disabled sockets included"""
+
+        if not len(self._nodes):
+            return
+
+        values = self._column(values)
+        bsocket = self._nodes[0]._bnode.inputs[index]
+
+        a = None
+        if not (bsocket.hide_value or bsocket.is_multi_input):
+            a = self._constants(values, bsocket.type)
+
+        if a is None:
+            for node, value in zip(self._nodes, values):
+                node.plug_value_into_socket(value, node._bnode.inputs[index])
+            return
+
+        if bsocket.type == 'VALUE':
+            a = [float(v) for v in a]
+        elif bsocket.type == 'INT':
+            a = [int(v) for v in a]
+        elif bsocket.type == 'BOOLEAN':
+            a = [bool(v) for v in a]
+        else:
+            a = a.tolist()
+
+        try:
+            for node, value in zip(self._nodes, a):
+                node._bnode.inputs[index].default_value = value
+        except Exception as e:
+            raise NodeError(f"Impossible to use the values as default values for socket '{bsocket.name}' of nodes '{bsocket.node.bl_idname}'.",
+                in_socket = bsocket.name,
+                in_socket_type = bsocket.type,
+                values = values,
+                original_error = str(e),
+                )
+
+    @staticmethod
+    def _socket_index(bsockets, bsocket):
+        ptr = bsocket.as_pointer()
+        for index, bsock in enumerate(bsockets):
+            if bsock.as_pointer() == ptr:
+                return index
+        raise NodeError(f"Socket '{bsocket.name}' not found in node.")
+
+    def plug(self, name, values):
+        """ > Plug a column of values into an input socket of the nodes
+
+        An int is the index of the socket among the enabled input sockets.
+
+        Arguments
+        ---------
+        - name (str or int) : socket name, identifier or index
+        - values : single value or list of n values
+        """
+        if not len(self._nodes):
+            return
+
+        bsocket = self._input_bsocket(name)
+        self._plug_index(self._socket_index(self._nodes[0]._bnode.inputs, bsocket), values)
+
+    def _input_bsocket(self, name, halt=True):
+        """ Input socket of the first node, by enabled index, name or identifier"""
+
+        first = self._nodes[0]
+        if isinstance(name, int):
+            sockets = first.get_socket_names('INPUT')
+            if not -len(sockets) <= name < len(sockets):
+                if halt:
+                    raise NodeError(f"Socket index {name} out of range for node '{first._bnode.name}' ({len(sockets)} enabled input sockets).")
+                return None
+            return sockets[list(sockets.keys())[name]]
+
+        bsocket = first.by_name('INPUT', name, as_argument=False, halt=False)
+        if bsocket is None:
+            bsocket = first.by_name('INPUT', name, as_argument=True, halt=halt)
+        return bsocket
+
+    # ====================================================================================================
+    # Output sockets
+
+    def outputs(self, name=None):
+        """ > Output sockets of the nodes
+
+        Arguments
+        ---------
+        - name (str = None) : output socket name, identifier or python name, first enabled output if None
+
+        Returns
+        -------
+        - list of Sockets : one socket per node
+        """
+        if not len(self._nodes):
+            return []
+
+        first = self._nodes[0]
+        if name is None:
+            socket = first._out
+            if socket is None:
+                raise NodeError(f"The node '{first._bnode.name}' has no enabled output socket.")
+        else:
+            socket = first.by_name('OUTPUT', name, as_argument=True, halt=False)
+            if socket is None:
+                socket = first.by_name('OUTPUT', name, as_argument=False)
+
+        index = self._socket_index(first._bnode.outputs, utils.get_bsocket(socket))
+        return [socket] + [Node.data_socket(node._bnode.outputs[index]) for node in self._nodes[1:]]
+
+    @property
+    def _out(self):
+        return self.outputs()
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self.outputs(index)
+        elif isinstance(index, slice):
+            return NodeArray(self._nodes[index])
+        else:
+            return self._nodes[index]
+
+    def __setitem__(self, name, values):
+        self.plug(name, values)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if len(name) > 1 and name[-1] == '_' and name[-2] != '_':
+            name = name[:-1]
+        return self.outputs(name)
+
+    def __setattr__(self, name, values):
+        if not len(self._nodes):
+            return
+        sname = name
+        if len(name) > 1 and name[-1] == '_' and name[-2] != '_':
+            sname = name[:-1]
+        if name.startswith('_') or self._input_bsocket(sname, halt=False) is None:
+            raise AttributeError(f"'{self}' has no input socket named '{name}'.")
+        self.plug(sname, values)
+
 # =============================================================================================================================
 # Group
 
@@ -0,0 +1,324 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : treeparallel
+---------------------
+- parallel build of trees in background Blender processes
+
+Tree functions are executed in background Blender processes, one process per function.
+The trees they create are serialized with <!treeserial> and loaded in the current Blender session.
+
+The work is split per function, not per group: all the groups created by a function are built
+in the same process. Split a large function into several ones to spread its groups on the workers.
+
+``` python
+from geonodes import build_parallel
+from geonodes.demos import fractal
+
+build_parallel([fractal.random_normal, fractal.camera_culling, fractal.sierpinski], workers=4,
+    depends={fractal.camera_culling: [fractal.random_normal]})
+```
+
+The functions must be importable module level functions. A function using groups created
+by another function must be declared in the **depends** argument, or discovered from a previous
+run by passing a **manifest** file: the manifest records the groups created and used by
+each function.
+
+Only the trees are transferred: objects and modifiers created by the functions are lost, except
+the hidden objects storing the lookup tables read by the trees which are shipped by <!treeserial>.
+
+updates
+-------
+- creation : 2025/02/15
+- update :   2025/02/17 # helper objects are shipped with the trees
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+from time import time
+
+import bpy
+
+from .scripterror import NodeError
+from . import treeserial
+
+GROUP_NODES = ('GeometryNodeGroup', 'ShaderNodeGroup')
+
+# =============================================================================================================================
+# Dependencies
+
+def func_key(func):
+    """ > Unique key of a function
+
+    Arguments
+    ---------
+    - func (function) : module level function
+
+    Returns
+    -------
+    - str : 'module:name'
+    """
+    if isinstance(func, str):
+        return func
+    if '<' in func.__qualname__:
+        raise NodeError(f"Parallel build: function '{func.__qualname__}' is not a module level function")
+    return f"{func.__module__}:{func.__qualname__}"
+
+def levels(keys, depends):
+    """ > Sort the functions in levels of independant functions
+
+    Arguments
+    ---------
+    - keys (list of str) : function keys
+    - depends (dict) : key -> list of keys the function depends on
+
+    Returns
+    -------
+    - list of lists of keys
+    """
+    remaining = {key: {dep for dep in depends.get(key, ()) if dep in keys and dep != key} for key in keys}
+    res = []
+    while remaining:
+        level = [key for key, deps in remaining.items() if not deps]
+        if not level:
+            raise NodeError(f"Parallel build: circular dependencies between {list(remaining.keys())}")
+        res.append(level)
+        for key in level:
+            del remaining[key]
+        for deps in remaining.values():
+            deps.difference_update(level)
+    return res
+
+def _manifest_depends(manifest):
+    """ Dependencies deduced from the groups created and used by each function"""
+
+    providers = {}
+    for key, info in manifest.items():
+        for name in info['provides']:
+            providers[name] = key
+
+    depends = {}
+    for key, info in manifest.items():
+        depends[key] = {providers[name] for name in info['requires'] if name in providers and providers[name] != key}
+    return depends
+
+def _tree_order(trees):
+    """ Order the trees in order for the groups to be loaded before the trees using them"""
+
+    order = []
+    done = set()
+
+    def visit(name, path):
+        if name in done or name not in trees:
+            return
+        if name in path:
+            raise NodeError(f"Parallel build: circular group references with tree '{name}'")
+        path.add(name)
+        for req in trees[name]['requires']:
+            visit(req, path)
+        path.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in trees:
+        visit(name, set())
+    return order
+
+# =============================================================================================================================
+# Worker
+
+def _worker(job_file):
+    """ Executed in the background Blender process"""
+
+    job = json.loads(Path(job_file).read_text())
+
+    # ----- Load the groups produced by the dependencies
+
+    loaded = set()
+    for info in job['load']:
+        loaded.add(treeserial.load(info['file'], name=info['name']).name)
+
+    # ----- Run the function
+
+    module_name, func_name = job['key'].split(':')
+    func = importlib.import_module(module_name)
+    for name in func_name.split('.'):
+        func = getattr(func, name)
+    func()
+
+    # ----- Serialize the new trees
+
+    out_dir = Path(job['out'])
+    trees = []
+    for i, btree in enumerate(bpy.data.node_groups):
+        if btree.name in loaded:
+            continue
+        requires = {bnode.node_tree.name for bnode in btree.nodes if bnode.bl_idname in GROUP_NODES and bnode.node_tree is not None}
+        file_name = out_dir / f"{job['index']}_{i}.json"
+        treeserial.save(btree, file_name)
+        trees.append({'name': btree.name, 'file': str(file_name), 'requires': sorted(requires - {btree.name})})
+
+    Path(job['report']).write_text(json.dumps({'trees': trees}))
+
+def _run_job(blender, job_file, paths, timeout):
+
+    expr = f"import sys; sys.path[:0] = {paths!r}; from geonodes.core import treeparallel; treeparallel._worker({str(job_file)!r})"
+    cmd = [blender, '--background', '--factory-startup', '--python-exit-code', '1', '--python-expr', expr]
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+# =============================================================================================================================
+# Parallel build
+
+def build_parallel(funcs, workers=None, depends=None, manifest=None, blender=None, timeout=None, verbose=True):
+    """ > Build trees in parallel
+
+    Each function is executed, without arguments, in its own background Blender process: the unit of work
+    is the function, the groups it creates are not distributed. Functions are executed by levels: a function
+    is executed once the functions it depends on are done. The groups they created are loaded in the process
+    before the function is called.
+
+    The created trees are then loaded in the current session, groups first.
+
+    Arguments
+    ---------
+    - funcs (list of functions) : module level functions without arguments creating trees
+    - workers (int = None) : number of parallel processes, number of cpus if None
+    - depends (dict = None) : function -> list of functions it depends on
+    - manifest (str = None) : json file recording the groups created and used by each function
+    - blender (str = None) : Blender executable, current executable if None
+    - timeout (float = None) : max duration of a process in seconds
+    - verbose (bool = True) : print the progress
+
+    Returns
+    -------
+    - dict : function key -> list of the names of the created trees
+    """
+    t0 = time()
+
+    keys = [func_key(func) for func in funcs]
+    if len(set(keys)) != len(keys):
+        raise NodeError("Parallel build: functions must be unique", functions=keys)
+
+    workers = os.cpu_count() if workers is None else max(1, workers)
+    blender = bpy.app.binary_path if blender is None else blender
+
+    # ----- Dependencies
+
+    deps = {key: set() for key in keys}
+    if manifest is not None and Path(manifest).exists():
+        for key, d in _manifest_depends(json.loads(Path(manifest).read_text())).items():
+            if key in deps:
+                deps[key].update(d)
+    if depends is not None:
+        for func, funcs_ in depends.items():
+            key = func_key(func)
+            if key not in deps:
+                raise NodeError(f"Parallel build: function '{key}' in depends is not in the list of functions")
+            deps[key].update(func_key(f) for f in funcs_)
+    for key in keys:
+        deps[key] &= set(keys) - {key}
+
+    # ----- Python paths for the workers
+
+    paths = [str(Path(__file__).parents[2])] + [p for p in sys.path if p and Path(p).is_dir()]
+
+    reports = {}
+    with tempfile.TemporaryDirectory(prefix="geonodes_") as tmp:
+        tmp = Path(tmp)
+
+        # Trees produced by a function and its dependencies
+        def needed(key, res):
+            for dep in deps[key]:
+                if dep not in res:
+                    res.add(dep)
+                    needed(dep, res)
+            return res
+
+        for level in levels(keys, deps):
+
+            jobs = []
+            for key in level:
+                index = keys.index(key)
+                load = {}
+                for dep in needed(key, set()):
+                    for tree in reports[dep]['trees']:
+                        load[tree['name']] = tree
+                trees = {name: {'requires': tree['requires']} for name, tree in load.items()}
+                job = {
+                    'key'    : key,
+                    'index'  : index,
+                    'load'   : [load[name] for name in _tree_order(trees)],
+                    'out'    : str(tmp),
+                    'report' : str(tmp / f"report_{index}.json"),
+                    }
+                job_file = tmp / f"job_{index}.json"
+                job_file.write_text(json.dumps(job))
+                jobs.append((key, job, job_file))
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda j: _run_job(blender, j[2], paths, timeout), jobs))
+
+            for (key, job, _), result in zip(jobs, results):
+                if result.returncode != 0:
+                    raise NodeError(f"Parallel build: function '{key}' failed", stderr=result.stderr[-2000:])
+                reports[key] = json.loads(Path(job['report']).read_text())
+                if verbose:
+                    print(f"Parallel build: '{key}' -> {len(reports[key]['trees'])} trees")
+
+        # ----- Load the trees in the current session
+
+        all_trees = {}
+        for key in keys:
+            for tree in reports[key]['trees']:
+                all_trees[tree['name']] = tree
+
+        for name in _tree_order(all_trees):
+            treeserial.load(all_trees[name]['file'], name=name)
+
+    # ----- Manifest
+
+    if manifest is not None:
+        info = {}
+        for key in keys:
+            trees = reports[key]['trees']
+            provides = [tree['name'] for tree in trees]
+            requires = sorted({req for tree in trees for req in tree['requires']} - set(provides))
+            info[key] = {'provides': provides, 'requires': requires}
+        Path(manifest).write_text(json.dumps(info, indent=1))
+
+    if verbose:
+        print(f"Parallel build: {len(all_trees)} trees built by {len(keys)} functions in {time() - t0:.1f} s")
+
+    return {key: [tree['name'] for tree in reports[key]['trees']] for key in keys}
@@ -0,0 +1,661 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : treeserial
+-------------------
+- serialization of a tree into a compact versioned dict
+- loading of a serialized tree into a Blender tree
+
+The serialized format is a dict which can be saved as json:
+
+``` python
+{
+    'format'    : 'geonodes',
+    'version'   : 2,
+    'name'      : tree name,
+    'type'      : tree bl_idname,
+    'interface' : [interface items],
+    'nodes'     : [nodes],
+    'links'     : [[from node, from socket, to node, to socket], ...],
+    'objects'   : {name: helper object},
+}
+```
+
+Nodes and sockets are referenced by their index. Socket default values are written
+only for the unlinked sockets.
+
+The hidden objects created by the library to store tables (<!HELPER_OBJECTS>) are shipped
+with the tree: their vertices and point attributes are written in 'objects' and the objects
+are created again at loading time.
+
+Loading is done in one pass:
+0. helper objects
+1. interface items
+2. nodes, created per bl_idname
+3. parameters, items, zone pairing and socket default values
+4. links
+
+``` python
+from geonodes.core import treeserial
+
+treeserial.save(bpy.data.node_groups['Hello World'], "hello.json.gz")
+treeserial.load("hello.json.gz")
+```
+
+updates
+-------
+- creation : 2025/02/14
+- update :   2025/02/17 # zero interface values, missing data blocks, multi input links order
+- update :   2025/02/17 # version 2 : helper objects
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+import gzip
+import json
+from pathlib import Path
+
+import numpy as np
+import bpy
+
+from .scripterror import NodeError
+from . import constants
+from . import utils
+
+FORMAT  = 'geonodes'
+VERSION = 2
+
+# Name prefixes of the hidden objects storing the lookup tables read by Object Info nodes
+HELPER_OBJECTS = ('GN Switch ', 'GN Selection ', 'GN Quadrature ')
+
+# Point attribute data type -> foreach property, size, dtype
+ATTRIBUTE_PROPS = {
+    'FLOAT'        : ('value',  1, np.float32),
+    'INT'          : ('value',  1, np.int32),
+    'BOOLEAN'      : ('value',  1, bool),
+    'FLOAT_VECTOR' : ('vector', 3, np.float32),
+    'FLOAT_COLOR'  : ('color',  4, np.float32),
+    }
+
+# Node properties which are not parameters
+NODE_PROPERTIES = {prop.identifier for prop in bpy.types.Node.bl_rna.properties} | {
+    'bl_idname', 'bl_label', 'bl_description', 'bl_icon', 'bl_static_type', 'bl_width_default', 'bl_width_min',
+    'bl_width_max', 'bl_height_default', 'bl_height_min', 'bl_height_max', 'active_item', 'active_index',
+    'paired_output', 'inspection_index',
+    }
+
+# Data blocks which can be referenced by a parameter or a socket
+ID_COLLECTIONS = {
+    'Material'      : 'materials',
+    'Object'        : 'objects',
+    'Collection'    : 'collections',
+    'Image'         : 'images',
+    'Texture'       : 'textures',
+    'GeometryNodeTree' : 'node_groups',
+    'ShaderNodeTree'   : 'node_groups',
+    'Font'          : 'fonts',
+    }
+
+# Items with a data type (Capture Attribute for instance) are created with a socket type
+ITEM_TYPES = {data_type: constants.INPUT_TYPES[socket_type] for socket_type, data_type in constants.DATA_TYPES.items() if socket_type in constants.INPUT_TYPES}
+
+# =============================================================================================================================
+# Values conversion
+
+def _to_json(value):
+    """ Convert a Blender value into a json compatible value"""
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, bpy.types.ID):
+        return {'id': value.bl_rna.identifier, 'name': value.name}
+
+    if hasattr(value, '__len__'):
+        # Sets of enum flags
+        if isinstance(value, set):
+            return {'set': sorted(value)}
+        # Matrices
+        if len(value) and hasattr(value[0], '__len__'):
+            return [[_to_json(v) for v in row] for row in value]
+        return [_to_json(v) for v in value]
+
+    raise NodeError(f"Serialization: impossible to serialize value {value} of type {type(value).__name__}")
+
+def _from_json(value, missing=None):
+    """ Convert a json value into a Blender value
+
+    The data blocks which don't exist in the file are None, their description is appended to **missing**.
+    """
+
+    if isinstance(value, dict):
+        if 'set' in value:
+            return set(value['set'])
+        coll_name = ID_COLLECTIONS.get(value['id'])
+        block = None if coll_name is None else getattr(bpy.data, coll_name).get(value['name'])
+        if block is None and missing is not None:
+            missing.append(f"{value['id']} '{value['name']}'")
+        return block
+
+    if isinstance(value, list) and len(value) and isinstance(value[0], list):
+        return [tuple(row) for row in value]
+
+    return value
+
+def _rna_values(obj, exclude=set()):
+    """ Writable properties of an RNA struct"""
+
+    values = {}
+    for prop in obj.bl_rna.properties:
+        name = prop.identifier
+        if name in exclude or prop.is_readonly or prop.type == 'COLLECTION':
+            continue
+        if prop.type == 'POINTER' and not issubclass(type(getattr(obj, name)), (bpy.types.ID, type(None))):
+            continue
+        values[name] = _to_json(getattr(obj, name))
+    return values
+
+# =============================================================================================================================
+# Dump
+
+def _dump_interface(btree):
+
+    items = []
+    for item in btree.interface.items_tree:
+        parent = item.parent.name if item.parent is not None and item.parent.name else None
+        if item.item_type == 'PANEL':
+            d = {'panel': item.name, 'description': item.description, 'default_closed': item.default_closed}
+        else:
+            d = {'socket': item.name, 'in_out': item.in_out, 'socket_type': item.socket_type}
+            for prop_name in constants.INTERFACE_SOCKET_PROPERTIES:
+                if hasattr(item, prop_name):
+                    value = _to_json(getattr(item, prop_name))
+                    # Note: 0 == False, the numeric values must be kept
+                    if value is None or value is False or (isinstance(value, str) and value == ''):
+                        continue
+                    d[prop_name] = value
+        if parent is not None:
+            d['parent'] = parent
+        items.append(d)
+    return items
+
+def _dump_helper(obj):
+
+    mesh = obj.data
+    co = np.empty(3*len(mesh.vertices), np.float32)
+    mesh.vertices.foreach_get('co', co)
+
+    attributes = {}
+    for attr in mesh.attributes:
+        if attr.domain != 'POINT' or attr.name == 'position' or attr.name.startswith('.'):
+            continue
+        spec = ATTRIBUTE_PROPS.get(attr.data_type)
+        if spec is None:
+            continue
+        prop, size, dtype = spec
+        a = np.empty(size*len(attr.data), dtype)
+        attr.data.foreach_get(prop, a)
+        attributes[attr.name] = [attr.data_type, a.tolist()]
+
+    return {'vertices': co.tolist(), 'attributes': attributes}
+
+def _helper_objects(bnodes, linked):
+
+    objects = {}
+    for bnode in bnodes:
+        for i, bsocket in enumerate(bnode.inputs):
+            if (bnode.as_pointer(), i) in linked:
+                continue
+            obj = getattr(bsocket, 'default_value', None)
+            if isinstance(obj, bpy.types.Object) and obj.type == 'MESH' and obj.name.startswith(HELPER_OBJECTS):
+                objects[obj.name] = _dump_helper(obj)
+    return objects
+
+def _items_collections(bnode):
+    return [name for name in dir(bnode) if name.endswith('_items') and isinstance(getattr(bnode, name), bpy.types.bpy_prop_collection)]
+
+def _dump_node(bnode, nodes_index, linked):
+
+    d = {'type': bnode.bl_idname, 'name': bnode.name}
+
+    if bnode.label:
+        d['label'] = bnode.label
+    d['location'] = [round(bnode.location.x, 1), round(bnode.location.y, 1)]
+    if bnode.parent is not None:
+        d['parent'] = nodes_index[bnode.parent.name]
+    if bnode.hide:
+        d['hide'] = True
+    if bnode.mute:
+        d['mute'] = True
+    if bnode.use_custom_color:
+        d['color'] = _to_json(bnode.color)
+    if bnode.bl_idname == 'NodeFrame':
+        d['size'] = [round(bnode.width, 1), round(bnode.height, 1)]
+
+    # ----- Parameters
+
+    params = _rna_values(bnode, NODE_PROPERTIES)
+    if params:
+        d['params'] = params
+
+    # ----- Items
+
+    items = {}
+    for coll_name in _items_collections(bnode):
+        a = []
+        for item in getattr(bnode, coll_name):
+            d_item = {name: _to_json(getattr(item, name)) for name in ('name', 'socket_type', 'description') if hasattr(item, name)}
+            if 'socket_type' not in d_item and hasattr(item, 'data_type'):
+                d_item['data_type'] = item.data_type
+            a.append(d_item)
+        items[coll_name] = a
+    if items:
+        d['items'] = items
+
+    # ----- Zone pairing
+
+    paired = getattr(bnode, 'paired_output', None)
+    if paired is not None:
+        d['paired_output'] = nodes_index[paired.name]
+
+    # ----- Color ramp and curves
+
+    if hasattr(bnode, 'color_ramp'):
+        d['color_ramp'] = {
+            'interpolation' : bnode.color_ramp.interpolation,
+            'color_mode'    : bnode.color_ramp.color_mode,
+            'stops'         : [[pos, list(color)] for pos, color in utils.color_ramp_get_stops(bnode)],
+            }
+    if hasattr(bnode, 'mapping') and hasattr(bnode.mapping, 'curves'):
+        d['curves'] = [[list(point) for point in curve] for curve in utils.curves_to_list(bnode.mapping.curves)]
+
+    # ----- Socket default values
+
+    inputs = {}
+    for i, bsocket in enumerate(bnode.inputs):
+        if (bnode.as_pointer(), i) in linked or not hasattr(bsocket, 'default_value'):
+            continue
+        inputs[str(i)] = _to_json(bsocket.default_value)
+    if inputs:
+        d['inputs'] = inputs
+
+    outputs = {}
+    if bnode.bl_idname in ('ShaderNodeValue', 'ShaderNodeRGB'):
+        outputs['0'] = _to_json(bnode.outputs[0].default_value)
+    if outputs:
+        d['outputs'] = outputs
+
+    return d
+
+def dump(btree):
+    """ > Serialize a tree into a dict
+
+    Arguments
+    ---------
+    - btree (NodeTree) : the tree to serialize
+
+    Returns
+    -------
+    - dict
+    """
+    # Frames are written first in order for the parents to exist at loading time
+    bnodes = sorted(btree.nodes, key=lambda bnode: bnode.bl_idname != 'NodeFrame')
+    nodes_index = {bnode.name: i for i, bnode in enumerate(bnodes)}
+
+    # Socket indices
+    sockets_index = {}
+    for bnode in bnodes:
+        ptr = bnode.as_pointer()
+        for i, bsocket in enumerate(bnode.inputs):
+            sockets_index[bsocket.as_pointer()] = (ptr, i)
+        for i, bsocket in enumerate(bnode.outputs):
+            sockets_index[bsocket.as_pointer()] = (ptr, i)
+    node_pointers = {bnode.as_pointer(): i for i, bnode in enumerate(bnodes)}
+
+    # Links of multi input sockets are created in the order of their sort id
+    links = []
+    linked = set()
+    for link in sorted(btree.links, key=lambda link: getattr(link, 'multi_input_sort_id', 0)):
+        from_ptr, from_index = sockets_index[link.from_socket.as_pointer()]
+        to_ptr, to_index = sockets_index[link.to_socket.as_pointer()]
+        links.append([node_pointers[from_ptr], from_index, node_pointers[to_ptr], to_index])
+        linked.add((to_ptr, to_index))
+
+    res = {
+        'format'    : FORMAT,
+        'version'   : VERSION,
+        'blender'   : bpy.app.version_string,
+        'name'      : btree.name,
+        'type'      : btree.bl_idname,
+        'interface' : _dump_interface(btree),
+        'nodes'     : [_dump_node(bnode, nodes_index, linked) for bnode in bnodes],
+        'links'     : links,
+        }
+
+    objects = _helper_objects(bnodes, linked)
+    if objects:
+        res['objects'] = objects
+
+    return res
+
+def dumps(btree, indent=None):
+    """ > Serialize a tree into a json string
+
+    Arguments
+    ---------
+    - btree (NodeTree) : the tree to serialize
+    - indent (int = None) : json indentation, use an indentation for human readable diffs
+
+    Returns
+    -------
+    - str
+    """
+    return json.dumps(dump(btree), indent=indent, separators=None if indent else (',', ':'))
+
+def save(btree, file_name, indent=None):
+    """ > Save a tree into a json file
+
+    The file is compressed if its name ends with '.gz'.
+
+    Arguments
+    ---------
+    - btree (NodeTree) : the tree to serialize
+    - file_name (str) : file name
+    - indent (int = None) : json indentation
+    """
+    s = dumps(btree, indent=indent)
+    path = Path(file_name)
+    if path.suffix == '.gz':
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(s)
+    else:
+        path.write_text(s, encoding='utf-8')
+
+# =============================================================================================================================
+# Load
+
+def _load_helper(name, d):
+
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        obj = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+        obj.hide_viewport = True
+        obj.hide_render = True
+        bpy.context.scene.collection.objects.link(obj)
+
+    mesh = obj.data
+    mesh.clear_geometry()
+    for attr_name in d['attributes']:
+        if attr_name in mesh.attributes:
+            mesh.attributes.remove(mesh.attributes[attr_name])
+
+    co = np.asarray(d['vertices'], np.float32)
+    mesh.vertices.add(len(co)//3)
+    mesh.vertices.foreach_set('co', co)
+    for attr_name, (data_type, values) in d['attributes'].items():
+        prop, _, dtype = ATTRIBUTE_PROPS[data_type]
+        mesh.attributes.new(attr_name, data_type, 'POINT').data.foreach_set(prop, np.asarray(values, dtype))
+    mesh.update()
+
+    return obj
+
+def _load_interface(btree, items, missing=None):
+
+    interface = btree.interface
+    interface.clear()
+    panels = {}
+    for d in items:
+        parent = panels.get(d.get('parent'))
+        if 'panel' in d:
+            panels[d['panel']] = interface.new_panel(d['panel'], description=d.get('description', ""), default_closed=d.get('default_closed', False))
+            if parent is not None:
+                interface.move_to_parent(panels[d['panel']], parent, len(parent.interface_items))
+        else:
+            socket = interface.new_socket(d['socket'], in_out=d['in_out'], socket_type=d['socket_type'], parent=parent)
+            for prop_name in constants.INTERFACE_SOCKET_PROPERTIES:
+                if prop_name in d and hasattr(socket, prop_name):
+                    setattr(socket, prop_name, _from_json(d[prop_name], missing))
+
+def _set_items(bnode, coll_name, items):
+
+    coll = getattr(bnode, coll_name)
+    coll.clear()
+    for item in items:
+        socket_type = item.get('socket_type')
+        if socket_type is None and 'data_type' in item:
+            socket_type = ITEM_TYPES.get(item['data_type'], item['data_type'])
+        if socket_type is not None:
+            new_item = coll.new(socket_type, item.get('name', ""))
+        elif 'name' in item:
+            new_item = coll.new(item['name'])
+        else:
+            new_item = coll.new()
+        if 'description' in item:
+            new_item.description = item['description']
+
+def _set_params(bnode, params, missing=None):
+
+    for name, value in params.items():
+        try:
+            setattr(bnode, name, _from_json(value, missing))
+        except (AttributeError, TypeError, ValueError) as e:
+            raise NodeError(f"Loading error: impossible to set parameter '{name}' of node '{bnode.name}'", value=value, error=str(e))
+
+def _missing_blocks(data):
+    """ Data blocks referenced by serialized data which don't exist, helper objects excepted"""
+
+    helpers = data.get('objects', {})
+    missing = []
+
+    def check(value):
+        if isinstance(value, dict) and 'id' in value:
+            if not (value['id'] == 'Object' and value['name'] in helpers):
+                _from_json(value, missing)
+
+    for d in data['interface']:
+        for prop_name in constants.INTERFACE_SOCKET_PROPERTIES:
+            if prop_name in d:
+                check(d[prop_name])
+
+    for d in data['nodes']:
+        for key in ('params', 'inputs', 'outputs'):
+            for value in d.get(key, {}).values():
+                check(value)
+
+    return sorted(set(missing))
+
+def load_into(data, btree, strict=False):
+    """ > Load a serialized tree into an existing tree
+
+    The content of the tree is cleared.
+
+    The data blocks (objects, materials, node groups...) are referenced by their name.
+    The ones which don't exist in the file are listed in a warning, or raise an error if **strict** is True.
+    In strict mode, the data blocks are checked before the tree is cleared: the tree is left unchanged.
+
+    Raises
+    ------
+    - NodeError : if **strict** and some data blocks don't exist
+
+    Arguments
+    ---------
+    - data (dict) : serialized tree
+    - btree (NodeTree) : the tree to load into
+    - strict (bool = False) : raise an error if a data block doesn't exist
+
+    Returns
+    -------
+    - NodeTree
+    """
+    if data.get('format') != FORMAT:
+        raise NodeError("Loading error: data are not a serialized tree")
+    if data.get('version', 0) > VERSION:
+        raise NodeError(f"Loading error: version {data['version']} is not supported, max version is {VERSION}")
+
+    if strict:
+        missing = _missing_blocks(data)
+        if missing:
+            raise NodeError(f"Loading error: tree '{btree.name}' references data blocks which don't exist", missing=missing)
+
+    btree.links.clear()
+    btree.nodes.clear()
+
+    missing = []
+
+    for name, d in data.get('objects', {}).items():
+        _load_helper(name, d)
+
+    _load_interface(btree, data['interface'], missing)
+
+    # ----- Create the nodes per bl_idname
+
+    nodes = data['nodes']
+    bnodes = [None]*len(nodes)
+
+    by_type = {}
+    for i, d in enumerate(nodes):
+        by_type.setdefault(d['type'], []).append(i)
+
+    new_node = btree.nodes.new
+    for bl_idname, indices in by_type.items():
+        for i in indices:
+            bnodes[i] = new_node(bl_idname)
+
+    # ----- Node properties
+
+    for bnode, d in zip(bnodes, nodes):
+        bnode.name = d['name']
+        if 'label' in d:
+            bnode.label = d['label']
+        if 'parent' in d:
+            bnode.parent = bnodes[d['parent']]
+        bnode.location = d['location']
+        if d.get('hide'):
+            bnode.hide = True
+        if d.get('mute'):
+            bnode.mute = True
+        if 'color' in d:
+            bnode.use_custom_color = True
+            bnode.color = d['color']
+        if 'size' in d:
+            bnode.width, bnode.height = d['size']
+
+        # Group tree first since it defines the sockets
+        params = d.get('params', {})
+        if 'node_tree' in params:
+            bnode.node_tree = _from_json(params['node_tree'], missing)
+        _set_params(bnode, {k: v for k, v in params.items() if k != 'node_tree'}, missing)
+
+    # ----- Zones, items, ramps and curves
+
+    for bnode, d in zip(bnodes, nodes):
+        if 'paired_output' in d:
+            bnode.pair_with_output(bnodes[d['paired_output']])
+
+        for coll_name, items in d.get('items', {}).items():
+            _set_items(bnode, coll_name, items)
+
+        if 'color_ramp' in d:
+            ramp = d['color_ramp']
+            bnode.color_ramp.interpolation = ramp['interpolation']
+            bnode.color_ramp.color_mode = ramp['color_mode']
+            utils.color_ramp_set_stops(bnode, *[(pos, tuple(color)) for pos, color in ramp['stops']])
+
+        if 'curves' in d:
+            utils.list_to_curves([[tuple(point) for point in curve] for curve in d['curves']], bnode.mapping.curves)
+            bnode.mapping.update()
+
+    # ----- Default values
+
+    for bnode, d in zip(bnodes, nodes):
+        if 'inputs' in d:
+            bsockets = bnode.inputs
+            for i, value in d['inputs'].items():
+                bsockets[int(i)].default_value = _from_json(value, missing)
+        if 'outputs' in d:
+            bsockets = bnode.outputs
+            for i, value in d['outputs'].items():
+                bsockets[int(i)].default_value = _from_json(value, missing)
+
+    # ----- Links
+
+    inputs  = [list(bnode.inputs) for bnode in bnodes]
+    outputs = [list(bnode.outputs) for bnode in bnodes]
+    new_link = btree.links.new
+    for from_node, from_socket, to_node, to_socket in data['links']:
+        new_link(outputs[from_node][from_socket], inputs[to_node][to_socket])
+
+    # ----- Missing data blocks
+
+    if missing:
+        missing = sorted(set(missing))
+        if strict:
+            raise NodeError(f"Loading error: tree '{btree.name}' references data blocks which don't exist", missing=missing)
+        print(f"CAUTION: tree '{btree.name}' loaded without the data blocks which don't exist: {', '.join(missing)}")
+
+    return btree
+
+def loads(data, name=None, strict=False):
+    """ > Create a tree from serialized data
+
+    Arguments
+    ---------
+    - data (dict or str) : serialized tree or json string
+    - name (str = None) : tree name, the serialized name if None
+    - strict (bool = False) : raise an error if a data block doesn't exist
+
+    Returns
+    -------
+    - NodeTree
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+    btree = utils.get_tree(data['name'] if name is None else name, tree_type=data['type'])
+    return load_into(data, btree, strict=strict)
+
+def load(file_name, name=None, strict=False):
+    """ > Create a tree from a json file
+
+    The file is decompressed if its name ends with '.gz'.
+
+    Arguments
+    ---------
+    - file_name (str) : file name
+    - name (str = None) : tree name, the serialized name if None
+    - strict (bool = False) : raise an error if a data block doesn't exist
+
+    Returns
+    -------
+    - NodeTree
+    """
+    path = Path(file_name)
+    if path.suffix == '.gz':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+    else:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    return loads(data, name=name, strict=strict)
@@ -0,0 +1,475 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : treesimplify
+---------------------
+- peephole simplification of the math nodes of a tree
+
+Formulas written with operators or with gnmath produce general operations which
+can be replaced by cheaper ones:
+- x**2 -> x*x
+- x**0.5 -> sqrt(x), x**-0.5 -> inverse_sqrt(x)
+- x/c -> x*(1/c) when c is a constant
+- a*b + c -> multiply_add(a, b, c)
+- x + 0, x - 0, x*1, x/1, x**1 are removed
+- -(-x) is replaced by x
+
+The pass works on 'Math', 'Vector Math' and 'Integer Math' nodes. As <!treearrange>, it
+is independant from node generation and can be used on any tree.
+
+Nodes with a label are never removed since the label is supposed to be read in the editor.
+The pass can be restricted to a set of nodes, the other ones being left untouched: a tree which is
+not cleared when built only gets its new nodes simplified.
+
+updates
+-------
+- creation : 2025/02/10
+- update :   2025/02/18 # simplification restricted to the nodes of the current build
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+MAX_PASSES = 10
+
+# Math nodes : bl_idname -> kind of value
+MATH_NODES = {
+    'ShaderNodeMath'          : 'FLOAT',
+    'ShaderNodeVectorMath'    : 'VECTOR',
+    'FunctionNodeIntegerMath' : 'INT',
+}
+
+# Input nodes providing a constant value
+CONSTANT_NODES = ['ShaderNodeValue', 'FunctionNodeInputInt', 'FunctionNodeInputVector']
+
+# =============================================================================================================================
+# Links index
+
+class Graph:
+    def __init__(self, btree, nodes=None):
+        """ > Index of the links of a tree
+
+        Reading <!bpy.types.NodeTree#links> for each socket is slow. The index
+        gives direct access to the link plugged into an input socket and to the links
+        starting from an output socket.
+
+        The edition methods keep the index up to date.
+
+        Arguments
+        ---------
+        - btree (bpy.types.NodeTree) : the tree to index
+        - nodes (list of bpy.types.Node = None) : the nodes which can be changed, all if None
+        """
+        self.btree     = btree
+        self.in_links  = {}
+        self.out_links = {}
+        self.nodes     = None if nodes is None else {bnode.as_pointer() for bnode in nodes}
+
+        for blink in btree.links:
+            self._index(blink)
+
+        self.removed = set()
+
+    def _index(self, blink):
+        self.in_links[blink.to_socket.as_pointer()] = blink
+        self.out_links.setdefault(blink.from_socket.as_pointer(), []).append(blink)
+
+    def _forget(self, blink):
+        ptr = blink.as_pointer()
+        self.in_links.pop(blink.to_socket.as_pointer(), None)
+        links = self.out_links.get(blink.from_socket.as_pointer(), [])
+        links[:] = [bl for bl in links if bl.as_pointer() != ptr]
+
+    def in_link(self, bsocket):
+        return self.in_links.get(bsocket.as_pointer())
+
+    def links_from(self, bsocket):
+        return self.out_links.get(bsocket.as_pointer(), [])
+
+    def editable(self, bnode):
+        return self.nodes is None or bnode.as_pointer() in self.nodes
+
+    def source(self, bsocket):
+        """ Output socket linked to an input socket
+
+        Returns
+        -------
+        - NodeSocket or None
+        """
+        blink = self.in_link(bsocket)
+        return None if blink is None else blink.from_socket
+
+    # ====================================================================================================
+    # Constant value of an input socket
+
+    def constant(self, bsocket):
+        """ Constant value of an input socket
+
+        The socket is constant either when it is not linked or when it is linked to
+        an input node such as 'Value' or 'Integer'.
+
+        Returns
+        -------
+        - float, int, tuple or None if the value is not constant
+        """
+        blink = self.in_link(bsocket)
+
+        if blink is None:
+            value = bsocket.default_value
+
+        else:
+            bnode = blink.from_node
+            if bnode.bl_idname not in CONSTANT_NODES:
+                return None
+
+            if bnode.bl_idname == 'FunctionNodeInputInt':
+                value = bnode.integer
+            elif bnode.bl_idname == 'FunctionNodeInputVector':
+                value = bnode.vector
+            else:
+                value = bnode.outputs[0].default_value
+
+        if hasattr(value, '__len__'):
+            return tuple(value)
+        return value
+
+    # ====================================================================================================
+    # Edition
+
+    def new_link(self, from_socket, to_socket):
+        blink = self.btree.links.new(from_socket, to_socket)
+        self._index(blink)
+        return blink
+
+    def remove_link(self, blink):
+        self._forget(blink)
+        self.btree.links.remove(blink)
+
+    def remove_node(self, bnode):
+        for bsocket in bnode.inputs:
+            blink = self.in_link(bsocket)
+            if blink is not None:
+                self._forget(blink)
+        for bsocket in bnode.outputs:
+            for blink in list(self.links_from(bsocket)):
+                self._forget(blink)
+
+        self.removed.add(bnode.as_pointer())
+        self.btree.nodes.remove(bnode)
+
+    def relink_outputs(self, bnode, bsocket):
+        """ Plug the sockets fed by the node output into another output socket
+        """
+        for blink in list(self.links_from(bnode.outputs[0])):
+            to_socket = blink.to_socket
+            self.remove_link(blink)
+            self.new_link(bsocket, to_socket)
+
+    def set_constant(self, bsocket, value):
+        """ Unlink an input socket and set its default value
+
+        The constant input node the socket was linked to is removed if it is no more used.
+        """
+        blink = self.in_link(bsocket)
+        if blink is not None:
+            const_node = blink.from_node
+            self.remove_link(blink)
+            if const_node.label == "" and self.editable(const_node) and not self.links_from(const_node.outputs[0]):
+                self.remove_node(const_node)
+
+        bsocket.default_value = value
+
+# =============================================================================================================================
+# Utilities
+
+def _equal(value, target):
+    if value is None:
+        return False
+    if isinstance(value, tuple):
+        return all(v == target for v in value)
+    return value == target
+
+def _non_zero(value):
+    if value is None:
+        return False
+    if isinstance(value, tuple):
+        return all(v != 0 for v in value)
+    return value != 0
+
+def _inverse(value):
+    if isinstance(value, tuple):
+        return tuple(1/v for v in value)
+    return 1/value
+
+def _no_clamp(bnode):
+    return not getattr(bnode, 'use_clamp', False)
+
+def _removable(graph, bnode):
+    """ The node can be removed if it has no label and if it doesn't feed multi input sockets
+
+    Multi input sockets are excluded because relinking them changes the order of the links.
+    """
+    if bnode.label != "":
+        return False
+
+    for bsocket in bnode.outputs[1:]:
+        if bsocket.is_linked:
+            return False
+
+    for blink in graph.links_from(bnode.outputs[0]):
+        if blink.to_socket.is_multi_input:
+            return False
+
+    return True
+
+def _bypass(graph, bnode, bsocket):
+    """ Remove an identity node
+
+    The links starting from the node are plugged into the output socket feeding the node.
+
+    Returns
+    -------
+    - bool : True if the node has been removed
+    """
+    if bsocket is None or not _removable(graph, bnode) or not _no_clamp(bnode):
+        return False
+
+    # Don't change the type of the value read by the target sockets
+    if bsocket.type != bnode.outputs[0].type:
+        return False
+
+    graph.relink_outputs(bnode, bsocket)
+    graph.remove_node(bnode)
+
+    return True
+
+def _is_negation(graph, bnode):
+    """ The node is a negation : -x
+
+    Negation is either a 'NEGATE' operation or a multiplication by -1
+    (<!Float> and <!Vector> negation operators produce a multiplication and a scale by -1)
+    """
+    if bnode.bl_idname not in MATH_NODES or not _no_clamp(bnode):
+        return False
+
+    if bnode.operation == 'NEGATE':
+        return True
+
+    if bnode.operation == 'MULTIPLY':
+        return _equal(graph.constant(bnode.inputs[1]), -1) and graph.in_link(bnode.inputs[0]) is not None
+
+    if bnode.operation == 'SCALE':
+        return _equal(graph.constant(bnode.inputs[3]), -1) and graph.in_link(bnode.inputs[0]) is not None
+
+    return False
+
+# =============================================================================================================================
+# Rules
+
+# ----------------------------------------------------------------------------------------------------
+# Identity operations : x + 0, x - 0, x*1, x/1, x**1
+
+def simplify_identity(graph, bnode, kind):
+
+    op = bnode.operation
+
+    if op in ('ADD', 'MULTIPLY'):
+        neutral = 0 if op == 'ADD' else 1
+        for i, j in [(0, 1), (1, 0)]:
+            if _equal(graph.constant(bnode.inputs[j]), neutral):
+                return _bypass(graph, bnode, graph.source(bnode.inputs[i]))
+
+    elif op in ('SUBTRACT', 'DIVIDE', 'POWER'):
+        neutral = 0 if op == 'SUBTRACT' else 1
+        if _equal(graph.constant(bnode.inputs[1]), neutral):
+            return _bypass(graph, bnode, graph.source(bnode.inputs[0]))
+
+    elif op == 'SCALE':
+        if _equal(graph.constant(bnode.inputs[3]), 1):
+            return _bypass(graph, bnode, graph.source(bnode.inputs[0]))
+
+    return False
+
+# ----------------------------------------------------------------------------------------------------
+# Strength reduction : x**2, x**0.5, x**-0.5, x/c
+
+def reduce_strength(graph, bnode, kind):
+
+    op = bnode.operation
+
+    if op == 'POWER':
+        exponent = graph.constant(bnode.inputs[1])
+        base     = graph.source(bnode.inputs[0])
+
+        # Base is constant : cheap enough
+        if base is None:
+            return False
+
+        if _equal(exponent, 2):
+            graph.set_constant(bnode.inputs[1], 0)
+            bnode.operation = 'MULTIPLY'
+            graph.new_link(base, bnode.inputs[1])
+            return True
+
+        if kind == 'FLOAT' and _equal(exponent, .5):
+            bnode.operation = 'SQRT'
+            return True
+
+        if kind == 'FLOAT' and _equal(exponent, -.5):
+            bnode.operation = 'INVERSE_SQRT'
+            return True
+
+    elif op == 'DIVIDE' and kind != 'INT':
+        divisor = graph.constant(bnode.inputs[1])
+        if _non_zero(divisor) and not _equal(divisor, 1):
+            graph.set_constant(bnode.inputs[1], _inverse(divisor))
+            bnode.operation = 'MULTIPLY'
+            return True
+
+    return False
+
+# ----------------------------------------------------------------------------------------------------
+# Double negation : -(-x)
+
+def fold_negations(graph, bnode, kind):
+
+    if not _is_negation(graph, bnode):
+        return False
+
+    inner = graph.in_link(bnode.inputs[0]).from_node
+    if inner.bl_idname != bnode.bl_idname or not _is_negation(graph, inner):
+        return False
+
+    source = graph.source(inner.inputs[0])
+    if not _bypass(graph, bnode, source):
+        return False
+
+    if _removable(graph, inner) and graph.editable(inner) and not graph.links_from(inner.outputs[0]):
+        graph.remove_node(inner)
+
+    return True
+
+# ----------------------------------------------------------------------------------------------------
+# Multiply then add : a*b + c
+
+def fuse_multiply_add(graph, bnode, kind):
+
+    if bnode.operation != 'ADD' or not _removable(graph, bnode):
+        return False
+
+    for i, j in [(0, 1), (1, 0)]:
+
+        blink = graph.in_link(bnode.inputs[i])
+        if blink is None:
+            continue
+
+        mult = blink.from_node
+        if mult.bl_idname != bnode.bl_idname or mult.operation != 'MULTIPLY' or not _no_clamp(mult):
+            continue
+
+        # A labeled product is kept as is
+        if mult.label != "" or not graph.editable(mult):
+            continue
+
+        # The product must only be used by the addition
+        if blink.from_socket != mult.outputs[0] or len(graph.links_from(mult.outputs[0])) != 1:
+            continue
+
+        # ----- Addend
+
+        addend = bnode.inputs[j]
+        source = graph.source(addend)
+
+        mult.operation = 'MULTIPLY_ADD'
+        if hasattr(mult, 'use_clamp'):
+            mult.use_clamp = bnode.use_clamp
+
+        if source is None:
+            mult.inputs[2].default_value = addend.default_value
+        else:
+            graph.new_link(source, mult.inputs[2])
+
+        # ----- Replace the addition by the product
+
+        graph.remove_link(blink)
+        graph.relink_outputs(bnode, mult.outputs[0])
+        graph.remove_node(bnode)
+
+        return True
+
+    return False
+
+RULES = [simplify_identity, fold_negations, reduce_strength, fuse_multiply_add]
+
+# =============================================================================================================================
+# Simplify a tree
+
+def simplify(btree, nodes=None, verbose=False):
+    """ Simplify the math nodes of a tree
+
+    The rules are applied until the tree doesn't change anymore. The links index is built once
+    and updated by the rules as they change the links around the nodes.
+
+    When **nodes** is given, the other nodes of the tree are neither changed nor removed.
+
+    Arguments
+    ---------
+    - btree (bpy.types.NodeTree) : the tree to simplify
+    - nodes (list of bpy.types.Node = None) : the nodes to simplify, all the nodes if None
+    - verbose (bool = False) : print the number of simplifications
+
+    Returns
+    -------
+    - set of ints : pointers (as_pointer()) of the removed nodes
+    """
+    graph = Graph(btree, nodes)
+    count = 0
+
+    for _ in range(MAX_PASSES):
+
+        changed = False
+        for bnode in list(btree.nodes):
+
+            if bnode.as_pointer() in graph.removed or not graph.editable(bnode):
+                continue
+
+            kind = MATH_NODES.get(bnode.bl_idname)
+            if kind is None:
+                continue
+
+            for rule in RULES:
+                if rule(graph, bnode, kind):
+                    changed = True
+                    count += 1
+                    break
+
+        if not changed:
+            break
+
+    if verbose:
+        print(f"Tree '{btree.name}' simplified: {count} math operations, {len(graph.removed)} nodes removed")
+
+    return graph.removed
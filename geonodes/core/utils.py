@@ -46,7 +46,7 @@ import numpy as np
 from pprint import pprint
 import bpy
 
-from .scripterror import NodeError
+from .scripterror import NodeError, Lazy
 from . import constants
 
 BUILD = False
@@ -641,7 +641,7 @@ def check_enum_arg(node_name: str, arg_name: str, arg_value: str, meth_name: str
 
     raise NodeError(f"Parameter error: '{arg_value}' is not a valid value for argument '{arg_name}' in method '{meth_name}'.",
         keyword = arg_value,
-        valids = get_enum_param_users(valids, node_name, arg_name, user_case=True),
+        valids = Lazy(lambda: get_enum_param_users(valids, node_name, arg_name, user_case=True)),
         parameter_values = valids)
 
 # =============================================================================================================================
@@ -28,6 +28,7 @@ updates
 -------
 - creation :   2024/08/03
 - update : 2025/01/16
+- update : 2025/02/17 # gravity computed with macros.pairwise_sum
 
 $ DOC START
 
@@ -53,6 +54,7 @@ gravity.demo()
 """
 
 from geonodes import *
+from geonodes import macros
 
 # ====================================================================================================
 # Newton's law simulation
@@ -126,19 +128,12 @@ def demo():
 
         with Simulation(planets=planets) as sim:
 
-            sim.planets.points._Acceleration = Vector()
-            with Repeat(planets=sim.planets, iterations=sim.planets.points.count) as rep:
-
-                center = sim.planets.points.sample_index(nd.position, index=rep.iteration)
-                M      = sim.planets.points.sample_index(Float("Mass"), index=rep.iteration)
-
-                v = center - nd.position
+            # Pairwise gravity with a Barnes-Hut approximation of the far planets
+            def gravity(v, M):
                 r = gnmath.max(v.length(), .01)
-                acc = v.scale(G*M*r**(-3))
-                #rep.planets.points[nd.index.not_equal(rep.iteration)]._Acceleration = Vector("Acceleration") + acc
-                rep.planets.points[nd.index.not_equal(rep.iteration)]._Acceleration += acc
+                return v.scale(G*M*r**(-3))
 
-            planets = rep.planets
+            planets = macros.pairwise_sum(sim.planets, gravity, weight=Float("Mass"), theta=.5, attribute="Acceleration")
 
             with Layout("Move the planets"):
                 old_speed = Vector("Speed")
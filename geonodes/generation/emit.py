@@ -0,0 +1,228 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : emit
+-------------
+- write the modules of core/generated
+
+Pure python: doesn't require Blender. The source code collected by <!gen_auto> is written
+as tables 'method name -> source code' compiled lazily by <!methodtable>.
+
+updates
+-------
+- creation : 2025/02/17
+- update :   2025/02/17 # unchanged files are not written
+- update :   2025/02/17 # hand written functions in gnmath (tabulate)
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+from pathlib import Path
+
+HEADER = (
+    "from .. socket_class import Socket\n"
+    "from .. treeclass import Node, ColorRamp, NodeCurves\n"
+    "from .. treeclass import utils\n"
+    "from .. scripterror import NodeError\n"
+    "from .. methodtable import MethodTable\n"
+    "\n"
+)
+
+STATIC_CLASSES = ('nd', 'snd')
+FUNCTIONS_MODULES = ('gnmath',)
+
+# Hand written functions exposed by the modules of functions : module name -> {function name: module}
+EXTRA_FUNCTIONS = {
+    'gnmath' : {'tabulate': 'tabulate'},
+    }
+
+# =============================================================================================================================
+# Table literal
+
+def source_literal(code):
+    """ > Python literal of a source code
+
+    Raw triple quoted string when possible, repr otherwise.
+
+    Arguments
+    ---------
+    - code (str) : source code
+
+    Returns
+    -------
+    - str
+    """
+    code = code.rstrip() + "\n"
+    if "'''" in code:
+        return repr(code)
+    return "r'''\n" + code + "'''"
+
+def table_literal(table_name, funcs):
+    """ > Python source of a table 'name -> source code'
+
+    Arguments
+    ---------
+    - table_name (str) : name of the variable
+    - funcs (dict) : function name -> source code
+
+    Returns
+    -------
+    - str
+    """
+    lines = [f"{table_name} = {{"]
+    for name, code in funcs.items():
+        lines.append(f"{name!r}: {source_literal(code)},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+# =============================================================================================================================
+# Module source
+
+def module_name(class_name):
+    if class_name in STATIC_CLASSES:
+        return f"static_{class_name}"
+    return class_name.lower()
+
+def module_source(class_name, funcs):
+    """ > Source code of a generated module
+
+    Arguments
+    ---------
+    - class_name (str) : class name or module name for modules of functions
+    - funcs (dict) : function name -> source code
+
+    Returns
+    -------
+    - str
+    """
+    code = HEADER
+
+    if class_name in FUNCTIONS_MODULES:
+        extra = EXTRA_FUNCTIONS.get(class_name, {})
+        for func_name, module in extra.items():
+            code += f"from .. {module} import {func_name}\n"
+        if extra:
+            code += "\n"
+        code += table_literal('FUNCTIONS', funcs)
+        code += "\n"
+        code += f"__all__ = list(FUNCTIONS.keys()) + {list(extra.keys())!r}\n\n"
+        code += "_table = MethodTable(FUNCTIONS, globals())\n"
+        code += "__getattr__ = _table.module_getattr\n"
+        code += "__dir__ = _table.module_dir\n"
+        return code
+
+    if class_name in STATIC_CLASSES:
+        code += f"class {class_name}:\n"
+        code +=  '    """" Static class\n\n'
+        code +=  "    Exposes all nodes as static methods:\n\n"
+        code +=  "    ``` python\n"
+        code += f"    a = {class_name}.math(1, 2, operation='ADD')\n"
+        code +=  "    ```\n"
+        code +=  '    """\n\n'
+    else:
+        code += f"class {class_name}(Socket):\n"
+        code += '    """"\n    $DOC SET hidden\n    """\n\n'
+
+    code += table_literal('METHODS', funcs)
+    code += "\n"
+    code += f"MethodTable(METHODS, globals()).install({class_name})\n"
+
+    return code
+
+def init_source(class_names):
+    """ > Source code of the __init__ file of generated
+
+    The classes are imported at first access.
+
+    Arguments
+    ---------
+    - class_names (list of str) : class names or module names
+
+    Returns
+    -------
+    - str
+    """
+    code  = "from ..lazyload import lazy_attributes\n\n"
+    code += "LAZY = {\n"
+    for class_name in class_names:
+        if class_name in FUNCTIONS_MODULES:
+            code += f"    {class_name!r}: ('.{class_name}', None),\n"
+        else:
+            code += f"    {class_name!r}: ('.{module_name(class_name)}', {class_name!r}),\n"
+    code += "}\n\n"
+    code += "__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY)\n"
+
+    return code
+
+# =============================================================================================================================
+# Write the files
+
+def write_file(file_name, code):
+    """ > Write a file if its content changed
+
+    Arguments
+    ---------
+    - file_name (Path) : file to write
+    - code (str) : content
+
+    Returns
+    -------
+    - bool : True if the file was written
+    """
+    file_name = Path(file_name)
+    if file_name.exists() and file_name.read_text() == code:
+        return False
+
+    file_name.write_text(code)
+    return True
+
+def write_modules(folder, sources):
+    """ > Write the generated modules and the __init__ file
+
+    The files which content didn't change are left untouched.
+
+    Arguments
+    ---------
+    - folder (str) : generated folder
+    - sources (dict) : class name -> dict[function name -> source code]
+
+    Returns
+    -------
+    - list of str : written files
+    """
+    path = Path(folder)
+    files = []
+    for class_name, funcs in sources.items():
+        file_name = path / f"{module_name(class_name)}.py"
+        if write_file(file_name, module_source(class_name, funcs)):
+            files.append(str(file_name))
+
+    file_name = path / "__init__.py"
+    if write_file(file_name, init_source(list(sources.keys()))):
+        files.append(str(file_name))
+
+    return files
@@ -1,10 +1,23 @@
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+import copy
+import hashlib
+import json
+import os
+import pickle
+import subprocess
+import tempfile
+
 import bpy
 
-from . node_explore import NodeInfo
+from . node_explore import NodeInfo, DEPRECATED_NODES
 from . import gen_auto_dicts
+from . import emit
 from . gen_auto_dicts import GEONODES, GEONODES_PROPS, SHADERNODES
 from .. core import constants
+from .. core import utils
+from .. core import nodespec
 
 from pprint import pprint, pformat
 
@@ -163,10 +176,20 @@ def build_manual_cross_ref(cross):
 # =============================================================================================================================
 # Generate
 
-def generate(folder):
+def generate(folder, specs=None):
+    """ Generate the modules of core/generated
+
+    Arguments
+    ---------
+    - folder (str) : core folder
+    - specs (dict or str or bool = None) : run from the node specifications snapshot, see NodeInfo.use_specs
+    """
 
     path = Path(folder) / "generated"
 
+    if specs is not None:
+        NodeInfo.use_specs(specs)
+
     # ====================================================================================================
     # Gen collects generation
     #
@@ -182,8 +205,11 @@ def generate(folder):
         print("Generate for tree_type", tree_type)
 
         tree_name = 'GENERATE'
-        tree = bpy.data.node_groups.get(tree_name)
-        tree = bpy.data.node_groups.new(tree_name, type=tree_type)
+        if NodeInfo.SPECS is None:
+            tree = bpy.data.node_groups.get(tree_name)
+            tree = bpy.data.node_groups.new(tree_name, type=tree_type)
+        else:
+            tree = NodeInfo.get_tree(tree_name, tree_type=tree_type)
         tree.nodes.clear()
 
         if tree_type == 'GeometryNodeTree':
@@ -226,50 +252,30 @@ def generate(folder):
 
     print('='*100)
 
-    imports = []
-    for class_name, funcs in gen['source'].items():
-
-        print("Create file", class_name)
-        if class_name in ['nd', 'snd']:
-            module = f"static_{class_name}"
-        else:
-            module = class_name.lower()
-
-        with open(path / f"{module}.py", 'w') as file:
-
-            file.write("from .. socket_class import Socket\n")
-            file.write("from .. treeclass import Node, ColorRamp, NodeCurves\n")
-            file.write("from .. treeclass import utils\n")
-            file.write("from .. scripterror import NodeError\n")
-            file.write("\n")
-
-            if class_name == 'gnmath':
-                imports.append(f"from . import gnmath")
+    write_files(path, gen)
 
-            elif class_name in ['nd', 'snd']:
-                file.write(f"class {class_name}:\n")
-                file.write( '    """" Static class\n\n')
-                file.write( "    Exposes all nodes as static methods:\n\n")
-                file.write( "    ``` python\n")
-                file.write(f"    a = {class_name}.math(1, 2, operation='ADD')\n")
-                file.write( "    ```\n")
-                file.write( '    """\n\n')
+    print("Done")
 
+def write_files(path, gen):
+    """ Write the generated modules and the cross reference
 
-                imports.append(f"from .{module} import {class_name}")
+    Only the files whose content changed are written.
 
-            else:
-                file.write(f"class {class_name}(Socket):\n")
-                file.write('    """"\n    $DOC SET hidden\n    """\n')
+    Arguments
+    ---------
+    - path (Path) : generated folder
+    - gen (dict) : generated source code and cross reference
 
-                imports.append(f"from .{module} import {class_name}")
+    Returns
+    -------
+    - list of str : written files
+    """
 
-            for name, code in funcs.items():
-                file.write(code + "\n")
+    # The methods are written as tables of source code compiled lazily at run time
 
-    # Init file
-    with open(path / "__init__.py", 'w') as file:
-        file.write("\n".join(imports))
+    files = emit.write_modules(path, gen['source'])
+    for file_name in files:
+        print("Create file", file_name)
 
     # ----------------------------------------------------------------------------------------------------
     # Complete auto reference with manual implementation
@@ -279,12 +285,366 @@ def generate(folder):
     build_manual_cross_ref(cross)
 
     # Cross reference
-    with open(path / "cross_reference.py", 'w') as file:
-        file.write("CROSS_REF = ")
-        file.write(pformat(cross))
+    if emit.write_file(path / "cross_reference.py", "CROSS_REF = " + pformat(cross)):
+        print("Create file", path / "cross_reference.py")
+        files.append(str(path / "cross_reference.py"))
 
+    return files
 
-    print("Done")
+# =============================================================================================================================
+# Cached and parallel generation
+#
+# The generation is split in two stages:
+# - extract : the node specifications snapshot of the Blender version, see specexport
+# - emit    : jobs generating the source code of one node from the snapshot, without Blender nodes
+#
+# Each job is hashed from its description, the specs of the nodes it uses and the source of the generator.
+# The result of a job is cached: only the jobs whose hash changed are run again, in parallel
+# in background Blender processes.
+
+CACHE_FILE = Path(__file__).parent / "gen_cache.pickle"
+CACHE_FORMAT = 2
+
+TREE_TYPES = ('GeometryNodeTree', 'ShaderNodeTree')
+
+# Modules generating the source code: a change invalidates all the cached jobs
+TEMPLATE_FILES = [
+    Path(__file__).parent / "node_explore.py",
+    Path(__file__).parent / "gen_auto_dicts.py",
+    Path(__file__).parents[1] / "core" / "constants.py",
+    Path(__file__).parents[1] / "core" / "utils.py",
+    ]
+
+WORKER = """
+import sys
+sys.path[:0] = {paths!r}
+from geonodes.generation import gen_auto
+gen_auto.run_worker({jobs_file!r}, {specs_file!r}, {out_file!r})
+"""
+
+def template_hash():
+    """ Hash of the source of the generator
+
+    Returns
+    -------
+    - str
+    """
+    h = hashlib.sha256()
+    for file_name in TEMPLATE_FILES:
+        h.update(Path(file_name).read_bytes())
+    return h.hexdigest()
+
+def _canonical(value):
+    # json compatible value independent from set ordering
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+# -----------------------------------------------------------------------------------------------------------------------------
+# Jobs
+
+def build_jobs(specs, tree_types=TREE_TYPES):
+    """ List of the generation jobs
+
+    A job is a dict with the keys:
+    - 'kind' : 'node' (node implementations), 'prop' (node as property) or 'static' (static class method)
+    - 'tree_type' : tree type
+    - 'node' : node name for 'node', bl_idname for 'static'
+    - 'impls' : list of implementations for 'node'
+    - 'prop' : property implementation for 'prop'
+    - 'nodes' : bl_idnames of the nodes used by the job
+
+    The order of the jobs is the order of <#generate>.
+
+    Arguments
+    ---------
+    - specs (dict) : node specifications snapshot
+    - tree_types (tuple of str) : tree types
+
+    Returns
+    -------
+    - list of dicts
+    """
+    jobs = []
+
+    for tree_type in tree_types:
+
+        def bl_idnames(*node_names):
+            return [utils.get_node_bl_idname(name, tree_type) for name in node_names if name is not None]
+
+        if tree_type == 'GeometryNodeTree':
+            nodes, props = GEONODES, GEONODES_PROPS
+        else:
+            nodes, props = SHADERNODES, []
+
+        for node_name, impls in nodes.items():
+            jobs.append({'kind': 'node', 'tree_type': tree_type, 'node': node_name, 'impls': impls, 'nodes': bl_idnames(node_name)})
+
+        for prop in props:
+            getter = prop.get('getter')
+            getters = list(getter.values()) if isinstance(getter, dict) else [getter]
+            jobs.append({'kind': 'prop', 'tree_type': tree_type, 'prop': prop, 'nodes': bl_idnames(prop['setter'], *getters)})
+
+        for bl_idname, spec in specs['trees'][tree_type].items():
+            if ('legacy' in spec['name'].lower()) or (spec['name'] in DEPRECATED_NODES):
+                continue
+            jobs.append({'kind': 'static', 'tree_type': tree_type, 'node': bl_idname, 'nodes': [bl_idname]})
+
+    return jobs
+
+def job_hash(job, specs, template):
+    """ Hash of a job
+
+    Arguments
+    ---------
+    - job (dict) : the job
+    - specs (dict) : node specifications snapshot
+    - template (str) : hash of the generator, see <#template_hash>
+
+    Returns
+    -------
+    - str
+    """
+    tree_specs = specs['trees'][job['tree_type']]
+    content = {
+        'template'  : template,
+        'job'       : _canonical(job),
+        'std_attrs' : specs['std_attrs'],
+        'specs'     : [tree_specs.get(bl_idname) for bl_idname in job['nodes']],
+        }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+def run_job(job, trees):
+    """ Run a job from the snapshot loaded in NodeInfo.SPECS
+
+    Arguments
+    ---------
+    - job (dict) : the job
+    - trees (dict) : tree type -> scratch tree, completed if necessary
+
+    Returns
+    -------
+    - dict : generation {'source': ..., 'cross': ...}
+    """
+    tree_type = job['tree_type']
+    tree = trees.get(tree_type)
+    if tree is None:
+        tree = trees[tree_type] = NodeInfo.get_tree('GENERATE', tree_type=tree_type)
+        if tree_type == 'GeometryNodeTree':
+            tree.is_modifier = True
+
+    gen = {'source': {}, 'cross': {}}
+    tree.nodes.clear()
+
+    if job['kind'] == 'node':
+        node_info = NodeInfo(tree, job['node'])
+        for impl in job['impls']:
+            node_info.source_code(gen, **impl)
+
+    elif job['kind'] == 'prop':
+        NodeInfo.property_code(tree, gen, **job['prop'])
+
+    else:
+        module = 'nd' if tree_type == 'GeometryNodeTree' else 'snd'
+        NodeInfo(tree, tree.nodes.new(type=job['node'])).static_code(gen, module)
+
+    return gen
+
+def run_worker(jobs_file, specs_file, out_file):
+    """ Worker process: run the jobs of a file and pickle the results
+
+    Arguments
+    ---------
+    - jobs_file (str) : pickled list of jobs
+    - specs_file (str) : node specifications snapshot
+    - out_file (str) : pickled list of generations
+    """
+    NodeInfo.use_specs(specs_file)
+    jobs = pickle.loads(Path(jobs_file).read_bytes())
+    trees = {}
+    Path(out_file).write_bytes(pickle.dumps([run_job(job, trees) for job in jobs]))
+
+def run_parallel(jobs, specs_file, workers=None, blender=None, timeout=None):
+    """ Run jobs in background Blender processes
+
+    Arguments
+    ---------
+    - jobs (list of dicts) : the jobs
+    - specs_file (str) : node specifications snapshot
+    - workers (int = None) : number of processes, number of cpus if None
+    - blender (str = None) : Blender executable, current executable if None
+    - timeout (float = None) : max duration of a process
+
+    Returns
+    -------
+    - list of dicts : generations in the order of the jobs
+    """
+    if blender is None:
+        blender = bpy.app.binary_path
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    # Contiguous chunks of similar sizes
+    bounds = [len(jobs)*i//workers for i in range(workers + 1)]
+    chunks = [jobs[bounds[i]:bounds[i + 1]] for i in range(workers)]
+
+    paths = [str(Path(__file__).parents[2])]
+
+    with tempfile.TemporaryDirectory() as folder:
+
+        def run(i):
+            jobs_file = Path(folder) / f"jobs_{i}.pickle"
+            out_file  = Path(folder) / f"gen_{i}.pickle"
+            jobs_file.write_bytes(pickle.dumps(chunks[i]))
+
+            expr = WORKER.format(paths=paths, jobs_file=str(jobs_file), specs_file=str(specs_file), out_file=str(out_file))
+            cmd = [blender, '--background', '--factory-startup', '--python-exit-code', '1', '--python-expr', expr]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+            if result.returncode != 0 or not out_file.exists():
+                raise RuntimeError(f"Generation worker {i} failed:\n{result.stderr[-2000:]}")
+
+            return pickle.loads(out_file.read_bytes())
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run, range(workers)))
+
+    return [gen for chunk in results for gen in chunk]
+
+def merge_gen(gen, part):
+    """ Merge the generation of a job
+
+    The parts are merged in the order of the jobs, as in the serial generation: a function already
+    defined by a previous job raises the error of NodeInfo.add_func, unless the job
+    created it with halt=False.
+
+    Arguments
+    ---------
+    - gen (dict) : target generation
+    - part (dict) : generation of a job
+    """
+    for class_name, funcs in part['source'].items():
+        target  = gen['source'].setdefault(class_name, {})
+        replace = part.get('replace', {}).get(class_name, set())
+        for func_name, code in funcs.items():
+            if func_name in target and func_name not in replace:
+                NodeInfo.duplicate_func(class_name, func_name, target[func_name], code)
+            target[func_name] = code
+
+    for bl_idname, classes in part['cross'].items():
+        target = gen['cross'].setdefault(bl_idname, {})
+        for class_name, refs in classes.items():
+            target.setdefault(class_name, []).extend(refs)
+
+# -----------------------------------------------------------------------------------------------------------------------------
+# Pipeline
+
+def load_cache(file_name=CACHE_FILE):
+    """ Cached job results: job hash -> generation"""
+
+    file_name = Path(file_name)
+    if not file_name.exists():
+        return {}
+    try:
+        cache = pickle.loads(file_name.read_bytes())
+    except Exception as e:
+        print(f"Generation cache not loaded: {e}")
+        return {}
+    if cache.get('format') != CACHE_FORMAT:
+        return {}
+    return cache['jobs']
+
+def save_cache(jobs, file_name=CACHE_FILE):
+    Path(file_name).write_bytes(pickle.dumps({'format': CACHE_FORMAT, 'jobs': jobs}))
+
+def generate_cached(folder, specs=True, workers=None, cache=CACHE_FILE, force=False, blender=None, timeout=None):
+    """ Generate the modules of core/generated from the node specifications snapshot
+
+    Extract stage: the snapshot of the running version is exported if it doesn't exist.
+
+    Emit stage: only the jobs whose hash is not in the cache are run, in **workers** background
+    Blender processes. With **workers** = 1, the jobs are run in the current process.
+
+    Arguments
+    ---------
+    - folder (str) : core folder
+    - specs (dict or str or bool = True) : snapshot, snapshot file or True for the running version
+    - workers (int = None) : number of processes, number of cpus if None
+    - cache (str = CACHE_FILE) : cache file, no cache if None
+    - force (bool = False) : ignore the cached results
+    - blender (str = None) : Blender executable for the workers
+    - timeout (float = None) : max duration of a worker
+
+    Returns
+    -------
+    - dict : 'jobs', 'cached', 'emitted', 'files', 'time'
+    """
+    t0 = time()
+    path = Path(folder) / "generated"
+
+    # ====================================================================================================
+    # Extract
+
+    specs_file = None
+    if specs is True:
+        specs_file = nodespec.spec_file()
+        if not specs_file.exists():
+            from . import specexport
+            specexport.export(specs_file)
+    elif isinstance(specs, (str, Path)):
+        specs_file = Path(specs)
+
+    specs = NodeInfo.use_specs(specs if specs_file is None else specs_file)
+
+    # ====================================================================================================
+    # Emit
+
+    template = template_hash()
+    jobs     = build_jobs(specs)
+    hashes   = [job_hash(job, specs, template) for job in jobs]
+
+    cached = {} if (cache is None or force) else load_cache(cache)
+    todo   = [i for i, h in enumerate(hashes) if h not in cached]
+
+    if todo:
+        todo_jobs = [jobs[i] for i in todo]
+        if workers == 1:
+            trees = {}
+            parts = [run_job(job, trees) for job in todo_jobs]
+        elif specs_file is None:
+            with tempfile.TemporaryDirectory() as tmp:
+                specs_file = Path(tmp) / "specs.json.gz"
+                nodespec.save(specs, specs_file)
+                parts = run_parallel(todo_jobs, specs_file, workers=workers, blender=blender, timeout=timeout)
+        else:
+            parts = run_parallel(todo_jobs, specs_file, workers=workers, blender=blender, timeout=timeout)
+
+        for i, part in zip(todo, parts):
+            cached[hashes[i]] = part
+
+    gen = {'source': {}, 'cross': {}}
+    for h in hashes:
+        merge_gen(gen, copy.deepcopy(cached[h]))
+
+    # ====================================================================================================
+    # Write
+
+    files = write_files(path, gen)
+
+    if cache is not None:
+        save_cache({h: cached[h] for h in hashes}, cache)
+
+    res = {'jobs': len(jobs), 'cached': len(jobs) - len(todo), 'emitted': len(todo), 'files': files, 'time': time() - t0}
+    print(f"Generation: {res['jobs']} jobs, {res['cached']} cached, {res['emitted']} emitted, "
+          f"{len(files)} files written in {res['time']:.1f} s")
+
+    return res
 
 # =============================================================================================================================
 # Build the dictionnary of node name -> bl_idname
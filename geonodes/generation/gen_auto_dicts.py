@@ -154,10 +154,10 @@ GEONODES = {
                                  {f: 'get', cache: True, ret: 'NODE', klass: 'Instances',    parameters: {'component': 'INSTANCES'}},
                                  {f: 'get', cache: True, ret: 'NODE', klass: 'GreasePencil', parameters: {'component': 'GREASEPENCIL'}},
                                 ],
-'Attribute Statistic' :         [{ret: 'NODE'}],
+'Attribute Statistic' :         [{ret: 'NODE', cache: True}],
 'Bake'               :          [{f: 'MANUAL'}],
 'Blur Attribute'     :          [{name: 'blur'}],
-'Bounding Box'       :          [{f: 'get'}],
+'Bounding Box'       :          [{f: 'get', cache: True}],
 'Capture Attribute'  :          [{f: 'MANUAL'}],
 'Collection Info'    :          [{name: 'info', cache: True}],
 'Convex Hull'        :          [{f: 'get'}],
@@ -331,7 +331,7 @@ GEONODES = {
 'Sample Curve'       :          [{name: 'sample'}],
 'Sample Grid'        :          [{}],
 'Sample Grid Index'  :          [{}],
-'Sample Index'       :          [{}],
+'Sample Index'       :          [{cache: True}],
 'Sample Nearest'     :          [{}],
 'Sample Nearest Surface' :      [{}],
 'Sample UV Surface'  :          [{}],
@@ -7,6 +7,10 @@ Created on Mon Sep 30 14:42:54 2024
 """
 
 from importlib import reload
+from pathlib import Path
+import hashlib
+import json
+import tempfile
 import requests
 import re
 
@@ -41,22 +45,29 @@ shader_ref = str(x.content)
 
 # ----- Regular expression to search by name
 
-ref_search = r'<a class="reference internal" href="(?P<url>[^"]*)">(NODE_NAME) Node</a>'
+ref_search = r'<a class="reference internal" href="(?P<url>[^"]*)">(?P<name>[^<]*) Node</a>'
+cref = re.compile(ref_search, flags=re.MULTILINE)
+
+# ----- Node name (lower case) -> url, the index is parsed once
+
+def node_urls(ref, base):
+    urls = {}
+    for m in cref.finditer(ref):
+        urls.setdefault(m.group('name').strip().lower(), base + m.group('url'))
+    return urls
+
+gnodes_urls = node_urls(gnodes_ref, gnodes_url)
+shader_urls = node_urls(shader_ref, shader_url)
 
 # ----- Return the url of the node
 
 def get_node_link(tree, name):
-    if tree == 'NODE':
-        ref  = gnodes_ref
-        base = gnodes_url
-    else:
-        ref  = shader_ref
-        base = shader_url
+    urls = gnodes_urls if tree == 'NODE' else shader_urls
 
-    m = re.search(ref_search.replace('NODE_NAME', name), ref, flags=re.MULTILINE | re.IGNORECASE)
-    if m is None:
+    url = urls.get(name.lower())
+    if url is None:
         return f"ERROR: Node '{name}' not found"
-    return f"[{name}]({base + m.group('url')})"
+    return f"[{name}]({url})"
 
 # =============================================================================================================================
 # Cross references
@@ -153,10 +164,102 @@ def bnode_replace(m, section):
     return get_node_link(tree, name)
 
 
+# =============================================================================================================================
+# Incremental build
+#
+# The manifest written in the doc folder stores the hash of the inputs of the documentation:
+# the source comment of each section and the node indexes of the Blender manual used for the cross references.
+# When nothing changed, the documentation is not rendered. Otherwise, the documentation is rendered
+# in a temporary folder and only the files which content changed are copied in the doc folder.
+
+MANIFEST = ".gendoc.json"
+
+def section_hashes(doc):
+    """ Hash of the source comment of each section
+
+    Returns
+    -------
+    - dict : section path -> hash
+    """
+    hashes = {}
+    child_iter = doc.top_section.all_values()
+    for section in child_iter:
+
+        if section.is_hidden:
+            child_iter.no_child()
+            continue
+
+        titles = []
+        s = section
+        while s is not None:
+            titles.append(str(s.title))
+            s = s.parent
+        key = "/".join(reversed(titles))
+
+        # Homonyms
+        base, i = key, 1
+        while key in hashes:
+            key = f"{base}#{i}"
+            i += 1
+
+        content = f"{section.is_transparent}|{section.comment}"
+        hashes[key] = hashlib.sha256(content.encode()).hexdigest()
+
+    return hashes
+
+def inputs_hash(hashes):
+    """ Global hash of the documentation inputs"""
+
+    h = hashlib.sha256()
+    for key in sorted(hashes):
+        h.update(key.encode())
+        h.update(hashes[key].encode())
+    h.update(gnodes_ref.encode())
+    h.update(shader_ref.encode())
+    return h.hexdigest()
+
+def load_manifest(folder):
+    file_name = Path(folder) / MANIFEST
+    if not file_name.exists():
+        return None
+    try:
+        return json.loads(file_name.read_text())
+    except Exception:
+        return None
+
+def sync_folder(source, target):
+    """ Copy the files of source which are new or changed in target
+
+    Returns
+    -------
+    - list of Path : written files
+    """
+    source, target = Path(source), Path(target)
+    written = []
+    for file_name in sorted(source.rglob('*')):
+        if file_name.is_dir():
+            continue
+        dst  = target / file_name.relative_to(source)
+        data = file_name.read_bytes()
+        if dst.exists() and dst.read_bytes() == data:
+            continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.write_bytes(data)
+        written.append(dst)
+
+    return written
+
 # =============================================================================================================================
 # geonodes module documentation
 
-def geonodes_documentation(write_files=True):
+def geonodes_documentation(write_files=True, incremental=True):
+    """ Generate the documentation of geonodes
+
+    Arguments
+    ---------
+    - write_files (bool = True) : write the documentation files
+    - incremental (bool = True) : render only if the inputs changed, write only the changed files
+    """
 
     from importlib import reload
     from pathlib import Path
@@ -176,6 +279,11 @@ def geonodes_documentation(write_files=True):
     # Load the package
 
     print("Load package...")
+
+    # The methods of the generated classes are compiled lazily
+    from geonodes.core import methodtable
+    methodtable.materialize()
+
     doc = PackageDoc(geonodes)
 
     # -----------------------------------------------------------------------------------------------------------------------------
@@ -184,6 +292,26 @@ def geonodes_documentation(write_files=True):
 
     doc.top_section.find("Socket").hidden = False
 
+    # -----------------------------------------------------------------------------------------------------------------------------
+    # Incremental : changed sections
+
+    hashes = section_hashes(doc)
+    manifest = {'inputs': inputs_hash(hashes), 'sections': hashes}
+
+    if incremental and folder is not None:
+        previous = load_manifest(folder)
+        if previous is not None:
+            if previous.get('inputs') == manifest['inputs']:
+                print("Documentation is up to date")
+                return
+
+            old = previous.get('sections', {})
+            changed = [key for key, h in hashes.items() if old.get(key) != h]
+            removed = [key for key in old if key not in hashes]
+            print(f"Changed sections: {len(changed)}, removed sections: {len(removed)}")
+            for key in changed[:20]:
+                print("-", key)
+
     # -----------------------------------------------------------------------------------------------------------------------------
     # DEBUG
 
@@ -194,6 +322,10 @@ def geonodes_documentation(write_files=True):
     # Hooks to replace references to nodes and build cross references
 
     print("Replacements...")
+
+    g_nodes.clear()
+    s_nodes.clear()
+
     if True:
         child_iter = doc.top_section.all_values()
         for section in child_iter:
@@ -259,6 +391,13 @@ def geonodes_documentation(write_files=True):
     # Finally create documentation
 
     print("Create documentation files...")
-    doc.create_documentation(folder)
+    if incremental and folder is not None:
+        with tempfile.TemporaryDirectory() as temp_folder:
+            doc.create_documentation(Path(temp_folder))
+            written = sync_folder(temp_folder, folder)
+        (Path(folder) / MANIFEST).write_text(json.dumps(manifest, indent=1))
+        print(f"{len(written)} files written")
+    else:
+        doc.create_documentation(folder)
 
     print("Done")
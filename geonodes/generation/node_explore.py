@@ -21,6 +21,7 @@ updates
 - update   : 2024/03/29
 - update   : 2024/07/31
 - update   : 2024/12/03
+- update   : 2025/02/17 # can run from the node specifications snapshot
 """
 
 from pprint import pprint, pformat
@@ -31,6 +32,7 @@ import bpy
 
 from ..core import constants
 from ..core import utils
+from ..core import nodespec
 from . import blendertree
 
 
@@ -59,6 +61,9 @@ class NodeInfo:
 
     STD_ATTRS = None
 
+    # Node specifications snapshot, see use_specs
+    SPECS = None
+
     def __init__(self, btree, bnode):
         """ Tree node vrapper.
 
@@ -124,16 +129,72 @@ class NodeInfo:
 
         self.data_type_sockets = self.get_data_type_sockets()
 
+    # =============================================================================================================================
+    # Node specifications snapshot
+
+    @classmethod
+    def use_specs(cls, specs=True):
+        """ Explore the nodes from the node specifications snapshot rather than from Blender nodes
+
+        Arguments
+        ---------
+        - specs (dict or str or bool = True) : snapshot, snapshot file name, True for the snapshot
+          of the running version, None or False to explore Blender nodes
+
+        Returns
+        -------
+        - dict : the snapshot or None
+        """
+        if specs is None or specs is False:
+            cls.SPECS = None
+        elif specs is True:
+            cls.SPECS = nodespec.load()
+        elif isinstance(specs, dict):
+            cls.SPECS = specs
+        else:
+            cls.SPECS = nodespec.load(specs)
+
+        cls.STD_ATTRS = None
+
+        return cls.SPECS
+
+    @classmethod
+    def get_tree(cls, name, tree_type='GeometryNodeTree'):
+        """ Scratch tree: Blender tree or tree built from the snapshot
+
+        Returns
+        -------
+        - NodeTree or SpecTree
+        """
+        if cls.SPECS is None:
+            return blendertree.get_tree(name, tree_type=tree_type, create=True)
+        else:
+            return nodespec.SpecTree(cls.SPECS, tree_type, name=name)
+
+    @staticmethod
+    def node_types(btree):
+        """ Candidate node types in a scratch tree"""
+
+        if isinstance(btree, nodespec.SpecTree):
+            return btree.node_types
+        else:
+            return dir(bpy.types)
+
+    @staticmethod
+    def del_tree(btree):
+        if not isinstance(btree, nodespec.SpecTree):
+            blendertree.del_tree(btree)
+
     # =============================================================================================================================
     # Load a specific node
 
     @classmethod
     def Load(cls, name, tree_type='GeometryNodeTree'):
 
-        btree = blendertree.get_tree("Temp", tree_type=tree_type, create=True)
+        btree = cls.get_tree("Temp", tree_type=tree_type)
         btree.nodes.clear()
 
-        for type_name in dir(bpy.types):
+        for type_name in cls.node_types(btree):
 
             try:
                 bnode = btree.nodes.new(type=type_name)
@@ -691,7 +752,7 @@ class NodeInfo:
     @classmethod
     def loop(cls, func, *args, tree_type='GeometryNodeTree', is_tool=False, **kwargs):
 
-        btree = blendertree.get_tree("Temp", tree_type=tree_type, create=True)
+        btree = cls.get_tree("Temp", tree_type=tree_type)
         if tree_type == 'GeometryNodeTree' and is_tool:
             btree.is_tool     = True
             btree.is_modifier = False
@@ -699,7 +760,7 @@ class NodeInfo:
 
         count = 0
 
-        for type_name in dir(bpy.types):
+        for type_name in cls.node_types(btree):
 
             try:
                 bnode = btree.nodes.new(type=type_name)
@@ -715,7 +776,7 @@ class NodeInfo:
 
             count += 1
 
-        blendertree.del_tree(btree)
+        cls.del_tree(btree)
 
         return count
 
@@ -1182,6 +1243,26 @@ class NodeInfo:
     # ====================================================================================================
     # Auto generation
 
+    # ====================================================================================================
+    # Function defined twice
+
+    @staticmethod
+    def duplicate_func(class_name, func_name, existing, code):
+
+        print('-'*100)
+        print("Class name:", class_name)
+        print("Function name:", func_name)
+        print()
+        print(">>>>> Existing code:")
+        print(existing)
+
+        print()
+        print(">>>>> New code:")
+        print(code)
+        print('-'*100)
+
+        raise Exception(f"Function name '{func_name}' already exists in class '{class_name}'")
+
     # ====================================================================================================
     # Add an entry to auto gen dict
 
@@ -1194,19 +1275,11 @@ class NodeInfo:
             gen['source'][class_name] = {}
 
         if func_name in gen['source'][class_name] and halt:
-            print('-'*100)
-            print("Class name:", class_name)
-            print("Function name:", func_name)
-            print()
-            print(">>>>> Existing code:")
-            print(gen[class_name][func_name])
-
-            print()
-            print(">>>>> New code:")
-            print(code)
-            print('-'*100)
-
-            raise Exception(f"Function name '{func_name}' already exists in class '{class_name}'")
+            NodeInfo.duplicate_func(class_name, func_name, gen['source'][class_name][func_name], code)
+
+        # Functions allowed to replace an existing one, read when the generations of parallel jobs are merged
+        if not halt:
+            gen.setdefault('replace', {}).setdefault(class_name, set()).add(func_name)
 
         gen['source'][class_name][func_name] = code
 
@@ -0,0 +1,340 @@
+"""
+This file is part of the geonodes distribution (https://github.com/al1brn/geonodes).
+Copyright (c) 2025 Alain Bernard.
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+$ DOC hidden
+
+-----------------------------------------------------
+Scripting Geometry Nodes
+-----------------------------------------------------
+
+module : specexport
+-------------------
+- export the node specifications snapshot of the running Blender version
+
+Every node type is instantiated and explored under every combination of its enum and
+boolean parameters. For each combination, the sockets (name, identifier, type, label, enabled)
+and the valid values of the enum parameters are recorded. See <!nodespec> for the format.
+
+When the number of combinations of a node exceeds **max_states**, the parameters are
+explored one at a time from their default values.
+
+To be run once per Blender version:
+
+``` python
+from geonodes.generation import specexport
+
+specexport.export()
+```
+
+updates
+-------
+- creation : 2025/02/17
+"""
+
+__author__ = "Alain Bernard"
+__email__  = "lesideesfroides@gmail.com"
+__copyright__ = "Copyright (c) 2025, Alain Bernard"
+__license__ = "GNU GPL V3"
+__version__ = "3.0.0"
+__blender_version__ = "4.3.0"
+
+from time import time
+
+import bpy
+
+from ..core import nodespec
+from . import blendertree
+
+TREE_TYPES = ('GeometryNodeTree', 'ShaderNodeTree')
+
+# Max number of parameter combinations per node
+MAX_STATES = 4096
+
+class _TooManyStates(Exception):
+    pass
+
+# =============================================================================================================================
+# Node exploration
+
+def std_attrs(btree):
+    """ > Attributes shared by all the nodes
+
+    Arguments
+    ---------
+    - btree (NodeTree) : a tree
+
+    Returns
+    -------
+    - list of str
+    """
+    ref_node = btree.nodes.new(type='ShaderNodeValue')
+    attrs = dir(ref_node)
+    btree.nodes.remove(ref_node)
+    return attrs + ['active_item', 'active_index']
+
+def enum_values(bnode, param):
+    """ > Valid values of an enum parameter in the current state of the node
+
+    Arguments
+    ---------
+    - bnode (Node) : the node
+    - param (str) : parameter name
+
+    Returns
+    -------
+    - list of str or None if the parameter is not an enum
+    """
+    try:
+        setattr(bnode, param, 'ERROR')
+    except TypeError as e:
+        msg = str(e)
+        i = msg.find('enum "ERROR" not found in')
+        if i < 0:
+            return None
+        vals = eval(msg[i + 26:])
+        # Only one possible value : ('VALUE') is evaluated as a str
+        if isinstance(vals, str):
+            vals = (vals,)
+        return list(vals)
+    except Exception:
+        return None
+
+    return None
+
+_SKIP = object()
+
+def _param_value(value):
+    """ json value of a parameter, _SKIP if the attribute is not a parameter
+
+    As in <!node_explore>, an attribute is a parameter if its string doesn't start with '<'.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if str(value).startswith('<'):
+        return _SKIP
+    if isinstance(value, set):
+        return {'set': sorted(value)}
+    try:
+        values = list(value)
+    except TypeError:
+        return _SKIP
+    if all(isinstance(v, (bool, int, float, str)) for v in values):
+        return values
+    return _SKIP
+
+def node_spec(bnode, attrs, max_states=MAX_STATES):
+    """ > Explore a node
+
+    Arguments
+    ---------
+    - bnode (Node) : the node to explore
+    - attrs (list of str) : attributes shared by all the nodes
+    - max_states (int = MAX_STATES) : max number of combinations
+
+    Returns
+    -------
+    - dict : node spec
+    """
+    spec_attrs = [name for name in dir(bnode) if name not in attrs]
+
+    # ----- Parameters
+
+    params = {}
+    for name in spec_attrs:
+        if name.endswith('_items'):
+            continue
+        try:
+            value = _param_value(getattr(bnode, name))
+        except Exception:
+            continue
+        if value is not _SKIP:
+            params[name] = value
+
+    enums = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            values = enum_values(bnode, name)
+            if values is not None:
+                enums[name] = values
+
+    # Writable enum and boolean parameters drive the sockets
+    rna = bnode.bl_rna.properties
+    drivers = sorted(name for name, value in params.items()
+        if (name in enums or isinstance(value, bool)) and not (name in rna and rna[name].is_readonly))
+
+    spec = {
+        'name'    : bnode.name,
+        'label'   : bnode.label,
+        'attrs'   : spec_attrs,
+        'params'  : params,
+        'enums'   : enums,
+        'drivers' : drivers,
+        'sockets' : [],
+        'layouts' : [],
+        'states'  : {},
+        'default' : None,
+        }
+
+    sockets = {}
+    layouts = {}
+
+    def socket_index(bsocket):
+        record = (bsocket.name, bsocket.identifier, bsocket.type, bsocket.label, bsocket.is_multi_input)
+        index = sockets.get(record)
+        if index is None:
+            index = sockets[record] = len(spec['sockets'])
+            spec['sockets'].append(list(record))
+        return index
+
+    def record():
+        if len(spec['states']) >= max_states:
+            raise _TooManyStates()
+
+        values = {name: getattr(bnode, name) for name in drivers}
+        key = nodespec.state_key(spec, values)
+        if key in spec['states']:
+            return
+
+        layout = {
+            'inputs'  : [[socket_index(bsocket), int(bsocket.enabled)] for bsocket in bnode.inputs],
+            'outputs' : [[socket_index(bsocket), int(bsocket.enabled)] for bsocket in bnode.outputs],
+            }
+        layout_key = str(layout)
+        index = layouts.get(layout_key)
+        if index is None:
+            index = layouts[layout_key] = len(spec['layouts'])
+            spec['layouts'].append(layout)
+
+        state_enums = {}
+        for name in enums:
+            values = enum_values(bnode, name)
+            if values is not None and values != enums[name]:
+                state_enums[name] = values
+
+        spec['states'][key] = [index, state_enums if state_enums else None]
+
+    def restore():
+        for name in drivers:
+            try:
+                setattr(bnode, name, params[name])
+            except Exception:
+                pass
+
+    def values_of(name):
+        if name in enums:
+            return enum_values(bnode, name) or []
+        return [False, True]
+
+    # ----- All the combinations
+
+    def explore(i):
+        if i == len(drivers):
+            record()
+            return
+
+        name = drivers[i]
+        for value in values_of(name):
+            try:
+                setattr(bnode, name, value)
+            except Exception:
+                continue
+            explore(i + 1)
+
+    record()
+    spec['default'] = nodespec.state_key(spec, params)
+
+    try:
+        explore(0)
+
+    # ----- Too many : one parameter at a time
+
+    except _TooManyStates:
+        restore()
+        default = spec['states'][spec['default']]
+        spec['states'] = {spec['default']: default}
+        for name in drivers:
+            for value in values_of(name):
+                try:
+                    setattr(bnode, name, value)
+                except Exception:
+                    continue
+                record()
+            restore()
+
+    restore()
+
+    return spec
+
+# =============================================================================================================================
+# Export
+
+def export(file_name=None, tree_types=TREE_TYPES, max_states=MAX_STATES, verbose=True):
+    """ > Export the node specifications of the running Blender version
+
+    Arguments
+    ---------
+    - file_name (str = None) : file name, <!nodespec#spec_file> if None
+    - tree_types (tuple of str) : tree types to explore
+    - max_states (int = MAX_STATES) : max number of parameter combinations per node
+    - verbose (bool = True) : print the progress
+
+    Returns
+    -------
+    - Path : the written file
+    """
+    t0 = time()
+
+    specs = {
+        'format'          : nodespec.FORMAT,
+        'blender_version' : list(bpy.app.version),
+        'std_attrs'       : None,
+        'trees'           : {},
+        }
+
+    for tree_type in tree_types:
+
+        btree = blendertree.get_tree("Specs", tree_type=tree_type, create=True)
+        if tree_type == 'GeometryNodeTree':
+            btree.is_modifier = True
+        btree.nodes.clear()
+
+        if specs['std_attrs'] is None:
+            specs['std_attrs'] = std_attrs(btree)
+        attrs = set(specs['std_attrs'])
+
+        tree_specs = {}
+        for type_name in dir(bpy.types):
+            try:
+                bnode = btree.nodes.new(type=type_name)
+            except RuntimeError:
+                continue
+
+            tree_specs[bnode.bl_idname] = node_spec(bnode, attrs, max_states=max_states)
+            btree.nodes.remove(bnode)
+
+        specs['trees'][tree_type] = tree_specs
+        blendertree.del_tree(btree)
+
+        if verbose:
+            n = sum(len(spec['states']) for spec in tree_specs.values())
+            print(f"Node specifications {tree_type}: {len(tree_specs)} nodes, {n} states")
+
+    path = nodespec.save(specs, file_name)
+
+    if verbose:
+        print(f"Node specifications of Blender {bpy.app.version_string} exported in {time() - t0:.1f} s: {path}")
+
+    return path
@@ -20,13 +20,20 @@ classes
 functions
 ---------
 - Solidify
+- pairwise_sum
 
 updates
 -------
 - creation : 2024/07/29
+- update :   2025/02/17 # pairwise_sum
+- update :   2025/02/17 # simpson, gauss and adaptive integration methods
 """
 
+import math
+
 from geonodes import *
+from geonodes.core import quadrature
+from geonodes.core.scripterror import NodeError
 
 # =============================================================================================================================
 # Solidify a mesh
@@ -107,15 +114,149 @@ def impulsion(value, from_min=0, from_max=1, amplitude=1., increase=.5, decrease
 
     return v
 
+# =============================================================================================================================
+# Quadrature
+
+def _capture(points, values):
+    """ Captured values keyed by name"""
+
+    capture = points.capture_attribute(**values)
+    if len(values) == 1:
+        return {name: capture for name in values}
+    return {name: capture[name] for name in values}
+
+def _points_object(nodes, **attributes):
+    """ Geometry of a hidden object with one vertex per node and float point attributes
+
+    The object is created once, its name is built from the hash of the data in order to be
+    shared by the trees using the same rule.
+
+    Arguments
+    ---------
+    - nodes (array of shape (n, dims)) : vertex coordinates
+    - attributes (arrays of shape (n,)) : float point attributes
+
+    Returns
+    -------
+    - Mesh
+    """
+    import hashlib
+    import bpy
+
+    nodes = np.asarray(nodes, dtype=np.float32)
+    co = np.zeros((len(nodes), 3), np.float32)
+    co[:, :nodes.shape[-1]] = nodes
+    data = {name: np.asarray(value, dtype=np.float32) for name, value in attributes.items()}
+
+    h = hashlib.md5(co.tobytes())
+    for name, value in data.items():
+        h.update(name.encode())
+        h.update(value.tobytes())
+    name = "GN Quadrature " + h.hexdigest()[:12]
+
+    obj = bpy.data.objects.get(name)
+    if obj is None:
+        mesh = bpy.data.meshes.new(name)
+        mesh.vertices.add(len(co))
+        mesh.vertices.foreach_set('co', co.ravel())
+        for attr_name, value in data.items():
+            mesh.attributes.new(attr_name, 'FLOAT', 'POINT').data.foreach_set('value', value)
+
+        obj = bpy.data.objects.new(name, mesh)
+        obj.hide_viewport = True
+        obj.hide_render = True
+        bpy.context.scene.collection.objects.link(obj)
+
+    return Mesh(nd.object_info(obj).geometry_)
+
+def _quadrature(bounds, counts, method, tolerance, values):
+    """ Integrals on a box with the precomputed rules of <!quadrature>
+
+    Arguments
+    ---------
+    - bounds (list of couples) : integration interval per axis (one or two axes)
+    - counts (tuple of ints) : number of intervals per axis
+    - method (str in ('simpson', 'gauss', 'adaptive')) : quadrature method
+    - tolerance (float) : absolute tolerance of the adaptive method
+    - values (dict) : named values
+
+    Returns
+    -------
+    - dict keyed by values keys : the integrals
+    """
+    dims = len(bounds)
+
+    size = 1
+    for lo, hi in bounds:
+        size = (hi - lo)*size
+
+    def to_domain(geo):
+        # The rule is defined on the unit box
+        coords = [lo + (hi - lo)*u for (lo, hi), u in zip(bounds, (nd.position.x, nd.position.y))]
+        geo.points.position = Vector((*coords, *[0]*(3 - dims)))
+
+    # ----------------------------------------------------------------------------------------------------
+    # Fixed rule
+
+    if method != 'adaptive':
+        nodes, weights = quadrature.rule(method, counts)
+
+        cloud = _points_object(nodes, Weight=weights)
+        to_domain(cloud)
+        capture = _capture(cloud.points, values)
+
+        return {name: (cloud.points.attribute_statistic(capture[name]*Float("Weight")).sum*size)._lc(name) for name in values}
+
+    # ----------------------------------------------------------------------------------------------------
+    # Adaptive : the panels with a too large error are refined
+
+    layout = quadrature.adaptive_layout(max(counts), dims)
+    panels = layout['panels']**dims
+
+    with Layout("Panels: whole and halves"):
+        nodes, weights, panel, part = layout['level1']
+        level1 = _points_object(nodes, Weight=weights, Panel=panel, Part=part)
+        to_domain(level1)
+        capture1 = _capture(level1.points, values)
+
+        group = Float("Panel").to_integer()
+        sign  = 1 - 2*Float("Part")
+        error = 0
+        for name in values:
+            error = error + gnmath.abs(Point.accumulate_field(capture1[name]*Float("Weight")*sign, group_id=group).total_)
+        level1.points.store("Refine", gnmath.abs(error*size).greater_than(tolerance/panels))
+
+    with Layout("Refined panels"):
+        nodes, weights, panel = layout['level2']
+        level2 = _points_object(nodes, Weight=weights, Panel=panel)
+        refine = level1.points.sample_index(Boolean("Refine"), index=Float("Panel").to_integer()*layout['per_panel'])
+        level2.points[refine.bnot()].delete()
+        to_domain(level2)
+        capture2 = _capture(level2.points, values)
+
+    coarse = Float("Part").greater_than(.5).band(Boolean("Refine").bnot())
+
+    return {name: ((level1.points[coarse].attribute_statistic(capture1[name]*Float("Weight")).sum +
+                    level2.points.attribute_statistic(capture2[name]*Float("Weight")).sum)*size)._lc(name) for name in values}
+
 # =============================================================================================================================
 # Integral
 
-def integrals(x0=0, x1=1, count=100, **values):
+def integrals(x0=0, x1=1, count=100, method='riemann', tolerance=1e-6, **values):
     """ Compute integrals of a function on the interval [x0, x1]
 
     Plural version : several integrals are computed by the same macro
     Values are computed using nd.position.x
 
+    Methods (see <!quadrature>):
+    - 'riemann' : sum on count + 1 evenly spaced points
+    - 'simpson' : composite Simpson rule
+    - 'gauss' : composite Gauss-Legendre rule, much fewer points for the same accuracy
+    - 'adaptive' : Gauss-Legendre panels refined where the estimated error is greater than the tolerance
+
+    The nodes and weights of the 'simpson', 'gauss' and 'adaptive' methods are computed when
+    the tree is built and stored in a hidden object: **count** must be an int.
+
     For instance:
     ``` python
     count = 100
@@ -140,6 +281,8 @@ def integrals(x0=0, x1=1, count=100, **values):
     - x0 (Float = 0) : Left bound of the integration interval
     - x1 (Float = 1) : Right bound of the integration interval
     - count (Integer = 100) : number of intervals
+    - method (str in ('riemann', 'simpson', 'gauss', 'adaptive') = 'riemann') : quadrature method
+    - tolerance (float = 1e-6) : absolute tolerance of the 'adaptive' method
     - values (keyword arguments) : named argument
 
     Returns
@@ -147,24 +290,30 @@ def integrals(x0=0, x1=1, count=100, **values):
     - dict keyed by values keys : the integrals
     """
 
+    if method not in quadrature.METHODS:
+        raise NodeError(f"Integrals: unknown method '{method}'", valids=quadrature.METHODS)
+
     with Layout("Macro - Integrals", color='MACRO'):
 
+        if method != 'riemann':
+            return _quadrature([(x0, x1)], (count,), method, tolerance, values)
+
         cloud = Mesh.LineEndPoints(count=count + 1, start_location=(x0, 0, 0), end_location=(x1, 0, 0))
 
-        capture = cloud.points.capture_attribute(**{name: value for name, value in values.items()})
+        capture = _capture(cloud.points, values)
 
         factor = (x1 - x0)/(count + 1)
 
         return {name: (cloud.points.attribute_statistic(capture[name]).sum*factor)._lc(name) for name in values.keys()}
 
-def integral(value, x0=0, x1=1, count=100):
+def integral(value, x0=0, x1=1, count=100, method='riemann', tolerance=1e-6):
 
-    return integrals(x0=x0, x1=x1, count=count, integral=value)['integral']
+    return integrals(x0=x0, x1=x1, count=count, method=method, tolerance=tolerance, integral=value)['integral']
 
 # =============================================================================================================================
 # Double integral
 
-def double_integrals(x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100, **values):
+def double_integrals(x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100, method='riemann', tolerance=1e-6, **values):
     """ Compute double integrals of a function on the intervals [x0, x1], [y0, y1]
 
     Plural version : several integrals are computed by the same macro
@@ -172,6 +321,9 @@ def double_integrals(x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100, **values)
     - variable 1 : nd.position.x
     - variable 2 : nd.position.y
 
+    The methods are the ones of <#integrals>. The rules are the products of the one dimensional
+    rules. The 'adaptive' method uses the same number of panels on both axes, given by the larger count.
+
     For instance:
     ``` python
     count = 100
@@ -202,6 +354,8 @@ def double_integrals(x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100, **values)
     - y1 (Float = 1) : Right bound of the y integration interval
     - count_x (Integer = 100) : number of intervals on x
     - count_y (Integer = 100) : number of intervals on y
+    - method (str in ('riemann', 'simpson', 'gauss', 'adaptive') = 'riemann') : quadrature method
+    - tolerance (float = 1e-6) : absolute tolerance of the 'adaptive' method
     - values (keyword arguments) : named argument
 
     Returns
@@ -209,20 +363,193 @@ def double_integrals(x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100, **values)
     - dict keyed by values keys : the integrals
     """
 
+    if method not in quadrature.METHODS:
+        raise NodeError(f"Double integrals: unknown method '{method}'", valids=quadrature.METHODS)
+
     with Layout("Macro - Double integrals", color='MACRO'):
 
+        if method != 'riemann':
+            return _quadrature([(x0, x1), (y0, y1)], (count_x, count_y), method, tolerance, values)
+
         delta_x = x1 - x0
         delta_y = y1 - y0
 
         grid = Mesh.Grid(size_x=delta_x, size_y=delta_y, vertices_x=count_x, vertices_y=count_y)
         grid.points.offset = (x0 + delta_x/2, y0 + delta_y/2, 0)
 
-        capture = grid.points.capture_attribute(**{name: value for name, value in values.items()})
+        capture = _capture(grid.points, values)
 
         factor = delta_x*delta_y/count_x/count_y
 
         return {name: (grid.points.attribute_statistic(capture[name]).sum*factor)._lc(name) for name in values.keys()}
 
-def double_integral(value, x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100):
+def double_integral(value, x0=0, x1=1, y0=0, y1=1, count_x=100, count_y=100, method='riemann', tolerance=1e-6):
+
+    return double_integrals(x0=x0, x1=x1, y0=y0, y1=y1, count_x=count_x, count_y=count_y, method=method, tolerance=tolerance, integral2=value)['integral2']
+
+# =============================================================================================================================
+# Pairwise sum
+
+def pairwise_sum(cloud, kernel, weight=1., cutoff=None, theta=.5, resolution=16, attribute="Pairwise Sum"):
+    """ Sum a pairwise interaction over the points of a cloud
+
+    For each point, computes the sum over the other points of kernel(v, w), where v is the vector
+    from the point to the other point and w is the weight of the other point.
+
+    The points are binned in a grid of cells. The pairs are found with a lookup cloud where
+    each point is located at (cell id, rank in the cell, 0): the point of a given rank in a neighbour cell
+    is found with a <&Node Sample Nearest>. The Repeat zone loops on the neighbour cells and the ranks
+    rather than on the points:
+    - with **cutoff**, the kernel is supposed to be null beyond the cutoff distance: the cell size is
+      the cutoff and the pairs in the adjacent cells are summed exactly
+    - without cutoff, the pairs in the cells closer than 1/**theta** cells are summed exactly and each
+      far cell is summed as one body located at its barycenter with the total weight of the cell
+      (Barnes-Hut approximation)
+
+    The number of iterations is the number of neighbour cells times the max number of points in a cell
+    plus the number of non empty cells, instead of the number of points.
+
+    For instance, the gravity between planets:
+    ``` python
+    def gravity(v, mass):
+        return v.scale(G*mass*gnmath.max(v.length(), .01)**(-3))
+
+    planets = macros.pairwise_sum(planets, gravity, weight=Float("Mass"), theta=.5, attribute="Acceleration")
+    speed = Vector("Speed") + Vector("Acceleration")*sim.delta_time
+    ```
+
+    Arguments
+    ---------
+    - cloud (Cloud) : the points
+    - kernel (function) : function(v, weight) returning a Float or a Vector, written with gnmath
+    - weight (Float = 1.) : weight of the points, the weights of a far cell are added
+    - cutoff (Float = None) : range of the kernel, unlimited if None
+    - theta (float = .5) : Barnes-Hut opening ratio, ignored if **cutoff** is not None
+    - resolution (int = 16) : number of cells along the largest dimension, ignored if **cutoff** is not None
+    - attribute (str = "Pairwise Sum") : name of the point attribute where the sum is stored
+
+    Returns
+    -------
+    - Cloud : the cloud with the sum stored in the point attribute
+    """
+
+    # Temporary attributes
+    tmp = "Pairwise Temp "
+
+    # Neighbour cells which are summed exactly
+    ring = 1 if cutoff is not None else max(1, math.ceil(1/theta - 1e-6))
+
+    with Layout("Macro - Pairwise Sum", color='MACRO'):
+
+        cloud = Cloud(cloud)
+        cloud.remove_named_attribute(attribute)
+
+        # ----------------------------------------------------------------------------------------------------
+        # Grid of cells
+
+        with Layout("Grid"):
+            stats = cloud.points.attribute_statistic(nd.position)
+            bmin = stats.min
+            size = stats.range
+
+            if cutoff is None:
+                cell_size = gnmath.max(gnmath.max(size.x, size.y), size.z)/resolution
+            else:
+                cell_size = Float(cutoff)
+            cell_size = gnmath.max(cell_size, 1e-6)
+
+            dims = size.scale(1/cell_size).floor() + (1, 1, 1)
+
+            def cell_id(cell):
+                return cell.x + dims.x*(cell.y + dims.y*cell.z)
+
+            cloud.points.store(tmp + "Cell", (nd.position - bmin).scale(1/cell_size).floor())
+            cloud.points.store(tmp + "ID", cell_id(Vector(tmp + "Cell")))
+            cloud.points.store(tmp + "Weight", Float(weight))
+
+        # ----------------------------------------------------------------------------------------------------
+        # Rank of the points in their cell and cells totals
+
+        with Layout("Cells"):
+            group = Float(tmp + "ID").to_integer()
+            w = Float(tmp + "Weight")
+
+            cloud.points.store(tmp + "Rank", Point.accumulate_field(Float(1.), group_id=group) - 1)
+
+            aw = gnmath.abs(w) + 1e-6
+            total_aw  = Point.accumulate_field(aw, group_id=group).total_
+            total_awp = Point.accumulate_field(nd.position.scale(aw), group_id=group).total_
+            cloud.points.store(tmp + "Cell Weight", Point.accumulate_field(w, group_id=group).total_)
+            cloud.points.store(tmp + "Cell Center", total_awp.scale(1/total_aw))
+
+            occupancy = (cloud.points.attribute_statistic(Float(tmp + "Rank")).max + 1).to_integer()
+
+            cells = Cloud(cloud)
+            cells.points[Float(tmp + "Rank").greater_than(.5)].delete()
+
+        with Layout("Lookup cloud: points at (cell id, rank, 0)"):
+            keys = Cloud(cloud)
+            keys.points.position = Vector((Float(tmp + "ID"), Float(tmp + "Rank"), 0))
+
+        # ----------------------------------------------------------------------------------------------------
+        # Near field: the points of the neighbour cells
+
+        with Layout("Near field"):
+
+            # Neighbour cells along each axis, the grid can be smaller than the ring
+            k = 2*ring + 1
+            kx, ky, kz = [gnmath.min(k, 2*d - 1).to_integer() for d in (dims.x, dims.y, dims.z)]
+
+            with Repeat(cloud=cloud, iterations=kx*ky*kz*occupancy) as rep:
+
+                neighbour = rep.iteration // occupancy
+                rank      = rep.iteration % occupancy
+
+                offset = Vector((
+                    neighbour % kx - (kx - 1)//2,
+                    (neighbour // kx) % ky - (ky - 1)//2,
+                    neighbour // (kx*ky) - (kz - 1)//2))
+
+                cell = Vector(tmp + "Cell") + offset
+                valid = Boolean(True)
+                for c, d in ((cell.x, dims.x), (cell.y, dims.y), (cell.z, dims.z)):
+                    valid = valid.band(c.greater_equal(0)).band(c.less_than(d))
+
+                key = Vector((cell_id(cell), rank, 0))
+                index = keys.points.sample_nearest(key)
+                found = keys.points.sample_index(nd.position, index).distance(key).less_than(.25)
+                found = valid.band(found).band(index.not_equal(nd.index))
+
+                v = cloud.points.sample_index(nd.position, index) - nd.position
+                value = kernel(v, cloud.points.sample_index(Float(tmp + "Weight"), index))
+
+                value_class = type(value)
+                rep.cloud.points.store(attribute, value_class(attribute) + value_class().switch(found, value))
+
+            cloud = rep.cloud
+
+        # ----------------------------------------------------------------------------------------------------
+        # Far field: one body per cell
+
+        if cutoff is None:
+            with Layout("Far field"):
+
+                with Repeat(cloud=cloud, iterations=cells.points.count) as rep:
+
+                    center = cells.points.sample_index(Vector(tmp + "Cell Center"), rep.iteration)
+                    cell   = cells.points.sample_index(Vector(tmp + "Cell"), rep.iteration)
+                    w      = cells.points.sample_index(Float(tmp + "Cell Weight"), rep.iteration)
+
+                    d = cell - Vector(tmp + "Cell")
+                    far = gnmath.max(gnmath.max(gnmath.abs(d.x), gnmath.abs(d.y)), gnmath.abs(d.z)).greater_than(ring + .5)
+
+                    value = kernel(center - nd.position, w)
+
+                    value_class = type(value)
+                    rep.cloud.points.store(attribute, value_class(attribute) + value_class().switch(far, value))
+
+                cloud = rep.cloud
+
+        cloud.remove_named_attribute(tmp + "*", pattern_mode='WILDCARD')
 
-    return double_integrals(x0=x0, x1=x1, y0=y0, y1=y1, count_x=count_x, count_y=count_y, integral2=value)['integral2']
+        return cloud